@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2018, 2020.
+# (C) Copyright IBM 2018, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,11 +12,10 @@
 
 """The Maximum Likelihood Amplitude Estimation algorithm."""
 
-from typing import Optional, List, Union, Tuple, Callable, Dict, Any
+from typing import Optional, List, Union, Tuple, Callable, Dict, Any, Iterator, Sequence
 import warnings
 import logging
 import numpy as np
-from scipy.optimize import brute
 from scipy.stats import norm, chi2
 
 from qiskit.providers import BaseBackend
@@ -29,6 +28,9 @@ from .ae_algorithm import AmplitudeEstimationAlgorithm, AmplitudeEstimationAlgor
 
 logger = logging.getLogger(__name__)
 
+# the number of grid points times schedule entries of a chunk of the grid of the likelihood
+_CHUNK_SIZE = 2 ** 20
+
 
 class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
     """The Maximum Likelihood Amplitude Estimation algorithm.
@@ -40,6 +42,12 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
     Finally, the estimate is determined via a maximum likelihood estimation, which is why this
     class in named ``MaximumLikelihoodAmplitudeEstimation``.
 
+    The log-likelihood is evaluated on a grid of ``likelihood_evals`` angles at once, for all
+    the powers of the Grover operator, and its maximum on the grid is refined by a bracketed
+    Newton search. The static methods :meth:`compute_mle` and
+    :meth:`compute_likelihood_ratio_confint` estimate many independent problems, sharing an
+    evaluation schedule, at once, from their measured counts.
+
     References:
         [1]: Suzuki, Y., Uno, S., Raymond, R., Tanaka, T., Onodera, T., & Yamamoto, N. (2019).
              Amplitude Estimation without Phase Estimation.
@@ -263,16 +271,6 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
 
         return one_hits, all_hits
 
-    def _safe_min(self, array, default=0):
-        if len(array) == 0:
-            return default
-        return np.min(array)
-
-    def _safe_max(self, array, default=(np.pi / 2)):
-        if len(array) == 0:
-            return default
-        return np.max(array)
-
     def _compute_fisher_information(self, a: Optional[float] = None,
                                     num_sum_terms: Optional[int] = None,
                                     observed: bool = False) -> float:
@@ -375,33 +373,10 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
         if nevals is None:
             nevals = self._likelihood_evals
 
-        def loglikelihood(theta, one_counts, all_counts):
-            loglik = 0
-            for i, k in enumerate(self._evaluation_schedule):
-                loglik += np.log(np.sin((2 * k + 1) * theta) ** 2) * one_counts[i]
-                loglik += np.log(np.cos((2 * k + 1) * theta) ** 2) * (all_counts[i] - one_counts[i])
-            return loglik
-
         one_counts, all_counts = self._get_hits()
-
-        eps = 1e-15  # to avoid invalid value in log
-        thetas = np.linspace(0 + eps, np.pi / 2 - eps, nevals)
-        values = np.zeros(len(thetas))
-        for i, theta in enumerate(thetas):
-            values[i] = loglikelihood(theta, one_counts, all_counts)
-
-        loglik_mle = loglikelihood(self._ret['theta'], one_counts, all_counts)
-        chi2_quantile = chi2.ppf(1 - alpha, df=1)
-        thres = loglik_mle - chi2_quantile / 2
-
-        # the (outer) LR confidence interval
-        above_thres = thetas[values >= thres]
-
-        # it might happen that the `above_thres` array is empty,
-        # to still provide a valid result use safe_min/max which
-        # then yield [0, pi/2]
-        confint = [self._safe_min(above_thres, default=0),
-                   self._safe_max(above_thres, default=np.pi / 2)]
+        confint = self.compute_likelihood_ratio_confint(one_counts, all_counts,
+                                                        self._evaluation_schedule, alpha,
+                                                        nevals, theta=self._ret['theta'])
         mapped_confint = [self.post_processing(np.sin(bound) ** 2) for bound in confint]
 
         return mapped_confint
@@ -451,21 +426,94 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
         This is a stable approach if sufficient gridpoints are used.
         """
         one_hits, all_hits = self._get_hits()
+        return self.compute_mle(one_hits, all_hits, self._evaluation_schedule,
+                                self._likelihood_evals)
 
-        # search range
-        eps = 1e-15  # to avoid invalid value in log
-        search_range = [0 + eps, np.pi / 2 - eps]
+    @staticmethod
+    def compute_mle(one_hits: Union[Sequence[float], np.ndarray],
+                    all_hits: Union[Sequence[float], np.ndarray],
+                    evaluation_schedule: Sequence[int],
+                    likelihood_evals: int = 10000) -> Union[float, np.ndarray]:
+        """Compute the maximum likelihood estimator (MLE) of the angle theta of one or many
+        problems.
 
-        def loglikelihood(theta):
-            # loglik contains the first `it` terms of the full loglikelihood
-            loglik = 0
-            for i, k in enumerate(self._evaluation_schedule):
-                loglik += np.log(np.sin((2 * k + 1) * theta) ** 2) * one_hits[i]
-                loglik += np.log(np.cos((2 * k + 1) * theta) ** 2) * (all_hits[i] - one_hits[i])
-            return -loglik
+        The log-likelihood is evaluated on a grid of angles in :math:`(0, \\pi/2)`, for all the
+        problems at once, and its maximum on the grid is refined between the neighbouring grid
+        points.
 
-        est_theta = brute(loglikelihood, [search_range], Ns=self._likelihood_evals)[0]
-        return est_theta
+        Args:
+            one_hits: The good counts, or probabilities, per power of the Grover operator, of
+                shape (number of powers,), or (number of problems, number of powers) for many
+                problems.
+            all_hits: The total counts per power of the Grover operator, of the shape of
+                ``one_hits``.
+            evaluation_schedule: The powers of the Grover operator.
+            likelihood_evals: The number of grid points.
+
+        Returns:
+            The MLE of theta, or an array of the MLEs of the problems, the amplitudes being
+            :math:`a = \\sin^2(\\theta)`.
+        """
+        one_hits, all_hits, single = _as_problems(one_hits, all_hits, evaluation_schedule)
+        factors = 2 * np.asarray(evaluation_schedule, dtype=float) + 1
+
+        # the grid maxima, refined in the brackets of their neighbouring grid points
+        grid, best_index, _ = _grid_maxima(one_hits, all_hits, factors, likelihood_evals)
+        lower = grid[np.maximum(best_index - 1, 0)]
+        upper = grid[np.minimum(best_index + 1, len(grid) - 1)]
+        thetas = _refine_maxima(one_hits, all_hits, factors, grid[best_index], lower, upper)
+        return thetas[0] if single else thetas
+
+    @staticmethod
+    def compute_likelihood_ratio_confint(one_hits: Union[Sequence[float], np.ndarray],
+                                         all_hits: Union[Sequence[float], np.ndarray],
+                                         evaluation_schedule: Sequence[int],
+                                         alpha: float = 0.05,
+                                         likelihood_evals: int = 10000,
+                                         theta: Optional[Union[float, np.ndarray]] = None
+                                         ) -> np.ndarray:
+        """Compute the likelihood-ratio confidence interval of the angle theta of one or many
+        problems.
+
+        The interval is the outer interval of the angles of the grid whose log-likelihood is
+        above the log-likelihood of the MLE by at most half the :math:`1 - \\alpha` quantile of
+        the :math:`\\chi^2` distribution with one degree of freedom.
+
+        Args:
+            one_hits: The good counts, or probabilities, per power of the Grover operator, of
+                shape (number of powers,), or (number of problems, number of powers) for many
+                problems.
+            all_hits: The total counts per power of the Grover operator, of the shape of
+                ``one_hits``.
+            evaluation_schedule: The powers of the Grover operator.
+            alpha: The level of the confidence interval (< 0.5).
+            likelihood_evals: The number of grid points.
+            theta: The MLE of theta, or of the problems. Computed if not given.
+
+        Returns:
+            The lower and upper bounds of theta, or an array of shape (number of problems, 2).
+        """
+        one_hits, all_hits, single = _as_problems(one_hits, all_hits, evaluation_schedule)
+        factors = 2 * np.asarray(evaluation_schedule, dtype=float) + 1
+        if theta is None:
+            theta = MaximumLikelihoodAmplitudeEstimation.compute_mle(
+                one_hits, all_hits, evaluation_schedule, likelihood_evals)
+        thetas = np.broadcast_to(np.asarray(theta, dtype=float), (len(one_hits),))
+        loglik_mle = _loglikelihood(thetas[:, None], one_hits, all_hits, factors)[:, 0]
+        thresholds = loglik_mle - chi2.ppf(1 - alpha, df=1) / 2
+
+        # the first and last grid points above the threshold, [0, pi/2] if there is none
+        confint = np.tile([0, np.pi / 2], (len(one_hits), 1))
+        found = np.zeros(len(one_hits), dtype=bool)
+        for grid_chunk, values in _grid_chunks(one_hits, all_hits, factors, likelihood_evals):
+            above = values >= thresholds[:, None]
+            any_above = above.any(axis=1)
+            first = grid_chunk[np.argmax(above, axis=1)]
+            last = grid_chunk[len(grid_chunk) - 1 - np.argmax(above[:, ::-1], axis=1)]
+            confint[any_above & ~found, 0] = first[any_above & ~found]
+            confint[any_above, 1] = last[any_above]
+            found |= any_above
+        return confint[0] if single else confint
 
     def _run_mle(self) -> float:
         """Compute the maximum likelihood estimator (MLE) for the angle theta.
@@ -473,7 +521,6 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
         Returns:
             The MLE for the angle theta, related to the amplitude a via a = sin^2(theta)
         """
-        # TODO implement a **reliable**, fast method to find the maximum of the likelihood function
         return self._compute_mle_safe()
 
     def _run(self) -> 'MaximumLikelihoodAmplitudeEstimationResult':
@@ -534,6 +581,117 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
         return result
 
 
+def _as_problems(one_hits: Union[Sequence[float], np.ndarray],
+                 all_hits: Union[Sequence[float], np.ndarray],
+                 evaluation_schedule: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """Returns the counts as arrays of shape (number of problems, number of powers), and whether
+    they are the counts of a single problem."""
+    one_hits = np.asarray(one_hits, dtype=float)
+    all_hits = np.asarray(all_hits, dtype=float)
+    single = one_hits.ndim == 1
+    one_hits, all_hits = np.atleast_2d(one_hits), np.atleast_2d(all_hits)
+    if one_hits.shape != all_hits.shape or one_hits.shape[1] != len(evaluation_schedule):
+        raise AquaError('The counts of shapes {} and {} do not match the evaluation schedule of '
+                        'length {}.'.format(one_hits.shape, all_hits.shape,
+                                            len(evaluation_schedule)))
+    return one_hits, all_hits, single
+
+
+def _log_probabilities(angles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """The logs of the probabilities of measuring the good and bad states at the angles."""
+    # clipped to avoid invalid values in the log, where a probability vanishes
+    tiny = np.finfo(float).tiny
+    return (np.log(np.maximum(np.sin(angles) ** 2, tiny)),
+            np.log(np.maximum(np.cos(angles) ** 2, tiny)))
+
+
+def _loglikelihood(thetas: np.ndarray, one_hits: np.ndarray, all_hits: np.ndarray,
+                   factors: np.ndarray) -> np.ndarray:
+    """The log-likelihoods of the problems at their angles, of shape (problems, angles)."""
+    log_sin, log_cos = _log_probabilities(thetas[..., None] * factors)
+    return np.sum(log_sin * one_hits[:, None, :] + log_cos * (all_hits - one_hits)[:, None, :],
+                  axis=-1)
+
+
+def _grid_chunks(one_hits: np.ndarray, all_hits: np.ndarray, factors: np.ndarray,
+                 likelihood_evals: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yields the chunks of the grid of angles, and the log-likelihoods of the problems at their
+    angles, of shape (problems, angles of the chunk)."""
+    eps = 1e-15  # to avoid invalid value in log
+    grid = np.linspace(0 + eps, np.pi / 2 - eps, likelihood_evals)
+    chunk_size = max(1, _CHUNK_SIZE // len(factors))
+    for start in range(0, likelihood_evals, chunk_size):
+        grid_chunk = grid[start:start + chunk_size]
+        log_sin, log_cos = _log_probabilities(np.outer(grid_chunk, factors))
+        # the sums over the powers of the Grover operator, for all the problems at once
+        yield grid_chunk, one_hits.dot(log_sin.T) + (all_hits - one_hits).dot(log_cos.T)
+
+
+def _grid_maxima(one_hits: np.ndarray, all_hits: np.ndarray, factors: np.ndarray,
+                 likelihood_evals: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the grid, and the indices of the grid maxima of the log-likelihoods of the
+    problems, and their values."""
+    grid = []
+    best_index = np.zeros(len(one_hits), dtype=int)
+    best_value = np.full(len(one_hits), -np.inf)
+    offset = 0
+    for grid_chunk, values in _grid_chunks(one_hits, all_hits, factors, likelihood_evals):
+        index = np.argmax(values, axis=1)
+        value = values[np.arange(len(values)), index]
+        better = value > best_value
+        best_index[better] = offset + index[better]
+        best_value[better] = value[better]
+        grid.append(grid_chunk)
+        offset += len(grid_chunk)
+    return np.concatenate(grid), best_index, best_value
+
+
+def _refine_maxima(one_hits: np.ndarray, all_hits: np.ndarray, factors: np.ndarray,
+                   thetas: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                   maxiter: int = 50, tol: float = 1e-14) -> np.ndarray:
+    """Refines the maxima of the log-likelihoods of the problems in their brackets by a Newton
+    search on the derivative, falling back to bisection when a step leaves the bracket.
+
+    The log-likelihood is concave between its singularities, so its derivative is decreasing.
+    A refined maximum is only kept if it is above the grid maximum.
+    """
+    zero_hits = all_hits - one_hits
+
+    def derivatives(theta):
+        angles = theta[:, None] * factors
+        sin, cos = np.sin(angles), np.cos(angles)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            first = np.sum(2 * factors * (one_hits * cos / sin - zero_hits * sin / cos), axis=1)
+            second = -np.sum(2 * factors ** 2 * (one_hits / sin ** 2 + zero_hits / cos ** 2),
+                             axis=1)
+        return first, second
+
+    # a maximum inside the bracket, where the derivative changes its sign
+    lower_first, _ = derivatives(lower)
+    upper_first, _ = derivatives(upper)
+    active = (lower_first > 0) & (upper_first < 0)
+    refined = np.array(thetas, dtype=float)
+    low, high = np.array(lower, dtype=float), np.array(upper, dtype=float)
+    for _ in range(maxiter):
+        if not active.any():
+            break
+        first, second = derivatives(refined)
+        # the bracket of the root of the derivative shrinks around the current angle
+        low = np.where(active & (first > 0), refined, low)
+        high = np.where(active & (first <= 0), refined, high)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = refined - first / second
+        bisection = ~np.isfinite(step) | (step <= low) | (step >= high)
+        step = np.where(bisection, (low + high) / 2, step)
+        converged = np.abs(step - refined) <= tol * np.maximum(1, np.abs(refined))
+        refined = np.where(active, step, refined)
+        active &= ~converged
+
+    improved = _loglikelihood(refined[:, None], one_hits, all_hits, factors)[:, 0] \
+        >= _loglikelihood(thetas[:, None], one_hits, all_hits, factors)[:, 0]
+    return np.where(improved, refined, thetas)
+
+
 class MaximumLikelihoodAmplitudeEstimationResult(AmplitudeEstimationAlgorithmResult):
     """ MaximumLikelihoodAmplitudeEstimation Result."""
 
@@ -160,6 +160,8 @@ class _QSVM_Binary(_QSVM_ABC):
                            "between class names and labels. "
                            "Please setup them and save the model again "
                            "for further use. Error: %s", str(ex))
+        if self._qalgo.kernel_cache is not None:
+            self._qalgo.kernel_cache.from_dict(model_npz)
 
     def save_model(self, file_path):
         """ save model """
@@ -169,4 +171,6 @@ class _QSVM_Binary(_QSVM_ABC):
                  'yin': self._ret['svm']['yin'],
                  'class_to_label': self._qalgo.class_to_label,
                  'label_to_class': self._qalgo.label_to_class}
+        if self._qalgo.kernel_cache is not None:
+            model.update(self._qalgo.kernel_cache.to_dict())
         np.savez(file_path, **model)
@@ -0,0 +1,212 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The cache of the QSVM kernel."""
+
+import hashlib
+import logging
+
+import numpy as np
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import ParameterVector
+
+logger = logging.getLogger(__name__)
+
+# pylint: disable=invalid-name
+
+
+class _QSVM_KernelCache:
+    """
+    The kernel entries of the data points already seen, or their statevectors with a
+    statevector simulator, so that only the kernel entries of new data points are computed.
+
+    Data points are identified by a hash of their values. The cache is cleared when the
+    feature map or the settings of the quantum instance change, e.g. the backend, the noise
+    model, the coupling map, the number of shots or the measurement error mitigation.
+    """
+
+    def __init__(self):
+        self._context = None
+        self._index = {}
+        self._statevectors = np.zeros((0, 0), dtype=complex)
+        self._kernel = np.zeros((0, 0))
+
+    @property
+    def size(self):
+        """ Returns the number of data points in the cache. """
+        return len(self._index)
+
+    def clear(self, context=None):
+        """ Removes all the entries, and sets the context they are valid in. """
+        self._context = context
+        self._index = {}
+        self._statevectors = np.zeros((0, 0), dtype=complex)
+        self._kernel = np.zeros((0, 0))
+
+    def _indices(self, data):
+        """ Returns the indices of the data points in the cache, adding the new ones. """
+        indices = np.empty(len(data), dtype=int)
+        for i, row in enumerate(data):
+            key = hashlib.sha1(np.ascontiguousarray(row, dtype=float).tobytes()).digest()
+            indices[i] = self._index.setdefault(key, len(self._index))
+        return indices
+
+    def _grow_kernel(self):
+        """ Grows the kernel geometrically to cover all the data points, with NaN entries. """
+        if len(self._index) > len(self._kernel):
+            kernel = np.full((max(len(self._index), 2 * len(self._kernel)),) * 2, np.nan)
+            kernel[:len(self._kernel), :len(self._kernel)] = self._kernel
+            self._kernel = kernel
+
+    def kernel_matrix(self, quantum_instance, feature_map, x1_vec, x2_vec=None,
+                      enforce_psd=True, block_size=None):
+        """
+        Construct kernel matrix from the cache, computing the missing entries with
+        :meth:`QSVM.get_kernel_matrix`, see there for the arguments.
+
+        Returns:
+            numpy.ndarray: 2-D matrix, N1xN2
+        """
+        # pylint: disable=cyclic-import
+        from .qsvm import QSVM, _statevectors, _enforce_psd
+
+        is_statevector_sim = quantum_instance.is_statevector
+        context = '{}|{}'.format(_feature_map_key(feature_map),
+                                 _quantum_instance_key(quantum_instance))
+        if context != self._context:
+            self.clear(context)
+
+        is_symmetric = x2_vec is None
+        indices_x1 = self._indices(x1_vec)
+        indices_x2 = indices_x1 if is_symmetric else self._indices(x2_vec)
+
+        if is_statevector_sim:
+            num_known = len(self._statevectors)
+            if self.size > num_known:
+                data = np.empty((self.size - num_known, x1_vec.shape[1]))
+                for indices, vec in [(indices_x1, x1_vec), (indices_x2, x2_vec)]:
+                    new = indices >= num_known
+                    if vec is not None and np.any(new):
+                        data[indices[new] - num_known] = vec[new]
+                logger.debug("Computing %s statevectors of the kernel", len(data))
+                states = _statevectors([quantum_instance], feature_map, data)
+                self._statevectors = np.concatenate(
+                    (self._statevectors.reshape(num_known, states.shape[1]), states))
+            states_x1 = self._statevectors[indices_x1]
+            states_x2 = self._statevectors[indices_x2]
+            mat = np.abs(states_x1.conj() @ states_x2.T) ** 2
+            if is_symmetric:
+                np.fill_diagonal(mat, 1.)
+            return mat
+
+        # the kernel entries are only kept when they are measured
+        self._grow_kernel()
+        mat = self._kernel[np.ix_(indices_x1, indices_x2)]
+        logger.debug("Computing %s missing kernel entries", np.count_nonzero(np.isnan(mat)))
+        QSVM.get_kernel_matrix(quantum_instance, feature_map, x1_vec, x2_vec, enforce_psd=False,
+                               block_size=block_size, out=mat)
+        self._kernel[np.ix_(indices_x1, indices_x2)] = mat
+        self._kernel[np.ix_(indices_x2, indices_x1)] = mat.T
+        if enforce_psd and is_symmetric:
+            mat = _enforce_psd(mat)
+        return mat
+
+    def to_dict(self):
+        """ Returns the cache as arrays, to be saved with a model. """
+        keys = sorted(self._index, key=self._index.get)
+        model = {'kernel_cache_context': np.array(self._context or ''),
+                 'kernel_cache_keys': np.array(keys, dtype='S20')}
+        if len(self._statevectors):
+            model['kernel_cache_statevectors'] = self._statevectors
+        if len(self._kernel):
+            model['kernel_cache_kernel'] = self._kernel[:self.size, :self.size]
+        return model
+
+    def from_dict(self, model):
+        """ Restores the cache saved with a model, if there is one. """
+        if 'kernel_cache_keys' not in model:
+            return
+        context = str(model['kernel_cache_context'])
+        self.clear(context if context else None)
+        self._index = {bytes(key): i for i, key in enumerate(model['kernel_cache_keys'])}
+        if 'kernel_cache_statevectors' in model:
+            self._statevectors = model['kernel_cache_statevectors']
+        if 'kernel_cache_kernel' in model:
+            self._kernel = model['kernel_cache_kernel']
+
+
+def _feature_map_key(feature_map):
+    """ Returns a hash of the instructions, or of the settings, of the feature map. """
+    digest = hashlib.sha1()
+
+    def update(circuit):
+        for instruction, qargs, cargs in circuit.data:
+            digest.update('{}{}{}{}'.format(
+                instruction.name, [str(param) for param in instruction.params],
+                [circuit.find_bit(qubit).index for qubit in qargs]
+                if hasattr(circuit, 'find_bit') else [circuit.qubits.index(q) for q in qargs],
+                len(cargs)).encode())
+            if instruction.definition is not None and instruction.name not in ('u1', 'u2', 'u3'):
+                update(instruction.definition)
+
+    if isinstance(feature_map, QuantumCircuit):
+        update(feature_map)
+    elif feature_map.support_parameterized_circuit:
+        # the circuit of the data parameters
+        update(feature_map.construct_circuit(
+            ParameterVector('x', feature_map.feature_dimension),
+            QuantumRegister(feature_map.num_qubits, name='q')))
+    else:
+        digest.update('{}:{}'.format(type(feature_map).__qualname__,
+                                     _setting_key(vars(feature_map))).encode())
+    return digest.hexdigest()
+
+
+def _quantum_instance_key(quantum_instance):
+    """ Returns a hash of the settings of the quantum instance the kernel entries depend on. """
+    settings = {'backend': quantum_instance.backend_name,
+                'backend_options': quantum_instance.backend_options,
+                'noise': quantum_instance.noise_config,
+                'backend_config': quantum_instance.backend_config,
+                'compile_config': quantum_instance.compile_config}
+    if not quantum_instance.is_statevector:
+        settings['shots'] = quantum_instance.run_config.shots
+        if quantum_instance.measurement_error_mitigation_cls is not None:
+            settings['mitigation'] = (quantum_instance.measurement_error_mitigation_cls,
+                                      quantum_instance.measurement_error_mitigation_shots,
+                                      quantum_instance.cals_matrix_refresh_period)
+    return hashlib.sha1(_setting_key(settings).encode()).hexdigest()
+
+
+def _setting_key(value):
+    """ Returns a canonical string of a setting, stable across processes. """
+    if isinstance(value, type) or callable(value):
+        return '{}.{}'.format(getattr(value, '__module__', ''),
+                              getattr(value, '__qualname__', type(value).__qualname__))
+    if isinstance(value, np.ndarray):
+        value = ('array', value.shape, value.tolist())
+    elif hasattr(value, 'to_dict'):
+        # e.g. noise models
+        value = value.to_dict()
+    elif hasattr(value, 'get_edges'):
+        # coupling maps
+        value = sorted(value.get_edges())
+    elif hasattr(value, 'get_physical_bits'):
+        # layouts
+        value = sorted((phys, repr(virt)) for phys, virt in value.get_physical_bits().items())
+
+    if isinstance(value, dict):
+        return '{' + ','.join('{!r}:{}'.format(key, _setting_key(value[key]))
+                              for key in sorted(value, key=repr)) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_setting_key(item) for item in value) + ']'
+    return repr(value)
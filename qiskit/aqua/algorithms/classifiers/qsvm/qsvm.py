@@ -13,14 +13,15 @@
 """The Quantum SVM algorithm."""
 
 from typing import Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import queue
 import warnings
 import logging
-import sys
 
 import numpy as np
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.tools import parallel_map
-from qiskit.tools.events import TextProgressBar
 from qiskit.circuit import ParameterVector
 from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
@@ -34,6 +35,7 @@ from qiskit.aqua.components.multiclass_extensions import MulticlassExtension
 from ._qsvm_estimator import _QSVM_Estimator
 from ._qsvm_binary import _QSVM_Binary
 from ._qsvm_multiclass import _QSVM_Multiclass
+from ._qsvm_kernel_cache import _QSVM_KernelCache, _setting_key
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +84,8 @@ class QSVM(QuantumAlgorithm):
                  multiclass_extension: Optional[MulticlassExtension] = None,
                  lambda2: float = 0.001,
                  quantum_instance: Optional[
-                     Union[QuantumInstance, BaseBackend, Backend]] = None) -> None:
+                     Union[QuantumInstance, BaseBackend, Backend]] = None,
+                 kernel_cache: bool = False) -> None:
         """
         Args:
             feature_map: Feature map module, used to transform data
@@ -93,6 +96,11 @@ class QSVM(QuantumAlgorithm):
                 must be supplied, in the form of a multiclass extension.
             lambda2: L2 norm regularization factor
             quantum_instance: Quantum Instance or Backend
+            kernel_cache: Caches the kernel entries, or the statevectors when using
+                `statevector_simulator`, of the data points seen, so that training with more
+                data and predicting compute only the kernel entries of the new data points.
+                The cache is saved with the model. It grows with the number of distinct data
+                points, quadratically with a `qasm_simulator` or a device.
 
         Raises:
             AquaError: Multiclass extension not supplied when number of classes > 2
@@ -121,6 +129,7 @@ class QSVM(QuantumAlgorithm):
         self.setup_test_data(test_dataset)
         self.setup_datapoint(datapoints)
         self.lambda2 = lambda2
+        self.kernel_cache = _QSVM_KernelCache() if kernel_cache else None
 
         self.feature_map = feature_map
         self.num_qubits = self.feature_map.num_qubits
@@ -217,20 +226,30 @@ class QSVM(QuantumAlgorithm):
         return QSVM._construct_circuit((x1, x2), self.feature_map, measurement)
 
     @staticmethod
-    def get_kernel_matrix(quantum_instance, feature_map, x1_vec, x2_vec=None, enforce_psd=True):
+    def get_kernel_matrix(quantum_instance, feature_map, x1_vec, x2_vec=None, enforce_psd=True,
+                          block_size=None, out=None):
         """
         Construct kernel matrix, if x2_vec is None, self-innerproduct is conducted.
 
+        The kernel matrix is computed in square blocks, which are executed concurrently when a
+        list of quantum instances is given, one block per quantum instance at a time, and
+        written to `out` as they complete.
+
         Notes:
             When using `statevector_simulator`,
             we only build the circuits for Psi(x1)|0> rather than
-            Psi(x2)^dagger Psi(x1)|0>, and then we perform the inner product classically.
+            Psi(x2)^dagger Psi(x1)|0>, and then we perform the inner product classically,
+            as a matrix product of the statevectors of each block.
             That is, for `statevector_simulator`,
             the total number of circuits will be O(N) rather than
             O(N^2) for `qasm_simulator`.
 
         Args:
-            quantum_instance (QuantumInstance): quantum backend with all settings
+            quantum_instance (Union(QuantumInstance, list[QuantumInstance])): quantum backend
+                with all settings, or a pool of them to execute blocks concurrently in threads.
+                The quantum instances of a pool need distinct backend objects if the backend
+                is not thread safe, as for the BasicAer simulators. The circuits are transpiled
+                once for each distinct backend and transpilation settings of the pool.
             feature_map (FeatureMap): a feature map that maps data to feature space
             x1_vec (numpy.ndarray): data points, 2-D array, N1xD, where N1 is the number of data,
                                     D is the feature dimension
@@ -239,9 +258,21 @@ class QSVM(QuantumAlgorithm):
             enforce_psd (bool): enforces that the kernel matrix is positive semi-definite by setting
                                 negative eigenvalues to zero. This is only applied in the symmetric
                                 case, i.e., if `x2_vec == None`.
+            block_size (int): the number of rows and columns of the blocks. By default a block
+                has about `BATCH_SIZE` circuits, or `BATCH_SIZE` rows and columns when using
+                `statevector_simulator`.
+            out (Union(str, numpy.ndarray)): the path of a `.npy` file, opened as a memory map,
+                or an N1xN2 array to write the kernel matrix to. Only the entries which are NaN
+                are computed, so that a computation written to a file can be resumed.
         Returns:
             numpy.ndarray: 2-D matrix, N1xN2
+        Raises:
+            AquaError: `out` does not have the shape of the kernel matrix, or the quantum
+                instances mix statevector and other simulators
         """
+        quantum_instances = quantum_instance if isinstance(quantum_instance, list) \
+            else [quantum_instance]
+        quantum_instance = quantum_instances[0]
 
         if isinstance(feature_map, QuantumCircuit):
             use_parameterized_circuits = True
@@ -255,127 +286,114 @@ class QSVM(QuantumAlgorithm):
             is_symmetric = False
 
         is_statevector_sim = quantum_instance.is_statevector
+        if any(instance.is_statevector != is_statevector_sim for instance in quantum_instances):
+            raise AquaError('The quantum instances of a pool must all, or none, simulate '
+                            'statevectors.')
 
         measurement = not is_statevector_sim
         measurement_basis = '0' * feature_map.num_qubits
-        mat = np.ones((x1_vec.shape[0], x2_vec.shape[0]))
-
-        # get all indices
-        if is_symmetric:
-            mus, nus = np.triu_indices(x1_vec.shape[0], k=1)  # remove diagonal term
-        else:
-            mus, nus = np.indices((x1_vec.shape[0], x2_vec.shape[0]))
-            mus = np.asarray(mus.flat)
-            nus = np.asarray(nus.flat)
-
-        if is_statevector_sim:
+        mat = _kernel_matrix_output(out, (x1_vec.shape[0], x2_vec.shape[0]))
+
+        if block_size is None:
+            block_size = QSVM.BATCH_SIZE if is_statevector_sim \
+                else int(np.ceil(np.sqrt(QSVM.BATCH_SIZE)))
+        # in the symmetric case, the blocks below the diagonal are the transposed ones above
+        blocks = [(slice(row, row + block_size), slice(col, col + block_size))
+                  for row in range(0, x1_vec.shape[0], block_size)
+                  for col in range(row if is_symmetric else 0, x2_vec.shape[0], block_size)]
+        blocks = [block for block in blocks if np.isnan(mat[block]).any()]
+        logger.debug("Computing %s blocks of the kernel matrix", len(blocks))
+
+        if is_statevector_sim and blocks:
             if is_symmetric:
                 to_be_computed_data = x1_vec
             else:
                 to_be_computed_data = np.concatenate((x1_vec, x2_vec))
 
+            states = _statevectors(quantum_instances, feature_map, to_be_computed_data)
+            states_x1 = states[:len(x1_vec)]
+            states_x2 = states_x1 if is_symmetric else states[len(x1_vec):]
+
+            for rows, cols in blocks:
+                # |<0|Psi^daggar(y) x Psi(x)|0>|^2, take the amplitude
+                tile = np.abs(states_x1[rows].conj() @ states_x2[cols].T) ** 2
+                tile = np.where(np.isnan(mat[rows, cols]), tile, mat[rows, cols])
+                _write_kernel_block(mat, rows, cols, tile, is_symmetric)
+        elif blocks:
             if use_parameterized_circuits:
                 # build parameterized circuits, it could be slower for building circuit
                 # but overall it should be faster since it only transpile one circuit
-                feature_map_params = ParameterVector('x', feature_map.feature_dimension)
-                parameterized_circuit = QSVM._construct_circuit(
-                    (feature_map_params, feature_map_params), feature_map, measurement,
-                    is_statevector_sim=is_statevector_sim)
-                parameterized_circuit = quantum_instance.transpile(parameterized_circuit)[0]
-                circuits = [parameterized_circuit.assign_parameters({feature_map_params: x})
-                            for x in to_be_computed_data]
-            else:
-                #  the second x is redundant
-                to_be_computed_data_pair = [(x, x) for x in to_be_computed_data]
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug("Building circuits:")
-                    TextProgressBar(sys.stderr)
-                circuits = parallel_map(QSVM._construct_circuit,
-                                        to_be_computed_data_pair,
-                                        task_args=(feature_map, measurement, is_statevector_sim),
-                                        num_processes=aqua_globals.num_processes)
-
-            results = quantum_instance.execute(circuits,
-                                               had_transpiled=use_parameterized_circuits)
-
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug("Calculating overlap:")
-                TextProgressBar(sys.stderr)
-
-            offset = 0 if is_symmetric else len(x1_vec)
-            matrix_elements = parallel_map(QSVM._compute_overlap, list(zip(mus, nus + offset)),
-                                           task_args=(results,
-                                                      is_statevector_sim, measurement_basis),
-                                           num_processes=aqua_globals.num_processes)
-
-            for i, j, value in zip(mus, nus, matrix_elements):
-                mat[i, j] = value
+                feature_map_params_x = ParameterVector('x', feature_map.feature_dimension)
+                feature_map_params_y = ParameterVector('y', feature_map.feature_dimension)
+                parameterized_circuits = _transpile_per_instance(
+                    quantum_instances,
+                    QSVM._construct_circuit((feature_map_params_x, feature_map_params_y),
+                                            feature_map, measurement,
+                                            is_statevector_sim=is_statevector_sim))
+
+            def kernel_block(instance, block):
+                rows, cols = block
+                # only the missing entries are computed
+                tile = np.array(mat[block])
+                mus, nus = np.nonzero(np.isnan(tile))
+                mus, nus = mus + rows.start, nus + cols.start
                 if is_symmetric:
-                    mat[j, i] = mat[i, j]
-        else:
-            for idx in range(0, len(mus), QSVM.BATCH_SIZE):
-                to_be_computed_data_pair = []
-                to_be_computed_index = []
-                for sub_idx in range(idx, min(idx + QSVM.BATCH_SIZE, len(mus))):
-                    i = mus[sub_idx]
-                    j = nus[sub_idx]
-                    x1 = x1_vec[i]
-                    x2 = x2_vec[j]
-                    if not np.all(x1 == x2):
-                        to_be_computed_data_pair.append((x1, x2))
-                        to_be_computed_index.append((i, j))
+                    upper = mus < nus
+                    mus, nus = mus[upper], nus[upper]
+                to_be_computed = np.any(x1_vec[mus] != x2_vec[nus], axis=1)
+                tile[mus[~to_be_computed] - rows.start, nus[~to_be_computed] - cols.start] = 1.
+                mus, nus = mus[to_be_computed], nus[to_be_computed]
+                to_be_computed_data_pair = list(zip(x1_vec[mus], x2_vec[nus]))
 
                 if use_parameterized_circuits:
-                    # build parameterized circuits, it could be slower for building circuit
-                    # but overall it should be faster since it only transpile one circuit
-                    feature_map_params_x = ParameterVector('x', feature_map.feature_dimension)
-                    feature_map_params_y = ParameterVector('y', feature_map.feature_dimension)
-                    parameterized_circuit = QSVM._construct_circuit(
-                        (feature_map_params_x, feature_map_params_y), feature_map, measurement,
-                        is_statevector_sim=is_statevector_sim)
-                    parameterized_circuit = quantum_instance.transpile(parameterized_circuit)[0]
+                    parameterized_circuit = parameterized_circuits[id(instance)]
                     circuits = [parameterized_circuit.assign_parameters({feature_map_params_x: x,
                                                                          feature_map_params_y: y})
                                 for x, y in to_be_computed_data_pair]
                 else:
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug("Building circuits:")
-                        TextProgressBar(sys.stderr)
                     circuits = parallel_map(QSVM._construct_circuit,
                                             to_be_computed_data_pair,
                                             task_args=(feature_map, measurement),
                                             num_processes=aqua_globals.num_processes)
 
-                results = quantum_instance.execute(circuits,
-                                                   had_transpiled=use_parameterized_circuits)
-
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug("Calculating overlap:")
-                    TextProgressBar(sys.stderr)
-                matrix_elements = parallel_map(QSVM._compute_overlap, range(len(circuits)),
-                                               task_args=(results,
-                                                          is_statevector_sim, measurement_basis),
-                                               num_processes=aqua_globals.num_processes)
-
-                for (i, j), value in zip(to_be_computed_index, matrix_elements):
-                    mat[i, j] = value
-                    if is_symmetric:
-                        mat[j, i] = mat[i, j]
+                if circuits:
+                    results = instance.execute(circuits,
+                                               had_transpiled=use_parameterized_circuits)
+                    tile[mus - rows.start, nus - cols.start] = \
+                        [QSVM._compute_overlap(idx, results, is_statevector_sim,
+                                               measurement_basis)
+                         for idx in range(len(circuits))]
+                if is_symmetric and rows == cols:
+                    upper = np.triu_indices(len(tile), k=1)
+                    tile.T[upper] = tile[upper]
+                return block, tile
+
+            for (rows, cols), tile in _map_blocks(quantum_instances, kernel_block, blocks):
+                _write_kernel_block(mat, rows, cols, tile, is_symmetric)
 
         if enforce_psd and is_symmetric and not is_statevector_sim:
             # Find the closest positive semi-definite approximation to kernel matrix, in case it is
             # symmetric. The (symmetric) matrix should always be positive semi-definite by
             # construction, but this can be violated in case of noise, such as sampling noise, thus,
             # the adjustment is only done if NOT using the statevector simulation.
-            D, U = np.linalg.eig(mat)
-            mat = U @ np.diag(np.maximum(0, D)) @ U.transpose()
+            psd_mat = _enforce_psd(mat)
+            if out is None:
+                mat = psd_mat
+            else:
+                mat[...] = psd_mat
 
+        if isinstance(mat, np.memmap):
+            mat.flush()
         return mat
 
-    def construct_kernel_matrix(self, x1_vec, x2_vec=None, quantum_instance=None):
+    def construct_kernel_matrix(self, x1_vec, x2_vec=None, quantum_instance=None,
+                                block_size=None, out=None):
         """
         Construct kernel matrix, if x2_vec is None, self-innerproduct is conducted.
 
+        With the kernel cache, only the kernel entries of the data points not seen before are
+        computed, unless `out` is given.
+
         Notes:
             When using `statevector_simulator`, we only build
             the circuits for Psi(x1)|0> rather than
@@ -390,6 +408,10 @@ class QSVM(QuantumAlgorithm):
             x2_vec (numpy.ndarray): data points, 2-D array, N2xD, where N2 is the number of data,
                                     D is the feature dimension
             quantum_instance (QuantumInstance): quantum backend with all settings
+            block_size (int): the number of rows and columns of the blocks computed at once,
+                see :meth:`get_kernel_matrix`
+            out (Union(str, numpy.ndarray)): the path of a `.npy` file or an array to write
+                the kernel matrix to, see :meth:`get_kernel_matrix`
 
         Returns:
             numpy.ndarray: 2-D matrix, N1xN2
@@ -402,7 +424,11 @@ class QSVM(QuantumAlgorithm):
         if self._quantum_instance is None:
             raise AquaError("Either setup quantum instance or provide it in the parameter.")
 
-        return QSVM.get_kernel_matrix(self._quantum_instance, self.feature_map, x1_vec, x2_vec)
+        if self.kernel_cache is not None and out is None:
+            return self.kernel_cache.kernel_matrix(self._quantum_instance, self.feature_map,
+                                                   x1_vec, x2_vec, block_size=block_size)
+        return QSVM.get_kernel_matrix(self._quantum_instance, self.feature_map, x1_vec, x2_vec,
+                                      block_size=block_size, out=out)
 
     def train(self, data, labels, quantum_instance=None):
         """
@@ -537,6 +563,121 @@ class QSVM(QuantumAlgorithm):
             self.datapoints = datapoints
 
 
+def _kernel_matrix_output(out, shape):
+    """ Opens the array to write the kernel matrix to, filled with NaN values if new. """
+    if out is None:
+        return np.full(shape, np.nan)
+    if isinstance(out, str):
+        if os.path.exists(out):
+            mat = np.load(out, mmap_mode='r+')
+        else:
+            mat = np.lib.format.open_memmap(out, mode='w+', dtype=float, shape=shape)
+            mat[...] = np.nan
+    else:
+        mat = out
+    if mat.shape != shape:
+        raise AquaError('The kernel matrix has the shape {}, not {}.'.format(shape, mat.shape))
+    return mat
+
+
+def _statevectors(quantum_instances, feature_map, data):
+    """ Computes the statevectors Psi(x)|0> of the data points, in batches of `BATCH_SIZE`. """
+    if isinstance(feature_map, QuantumCircuit):
+        use_parameterized_circuits = True
+    else:
+        use_parameterized_circuits = feature_map.support_parameterized_circuit
+
+    if use_parameterized_circuits:
+        # build parameterized circuits, it could be slower for building circuit
+        # but overall it should be faster since it only transpile one circuit
+        feature_map_params = ParameterVector('x', feature_map.feature_dimension)
+        parameterized_circuits = _transpile_per_instance(
+            quantum_instances,
+            QSVM._construct_circuit((feature_map_params, feature_map_params), feature_map, False,
+                                    is_statevector_sim=True))
+
+    def statevectors(instance, batch):
+        if use_parameterized_circuits:
+            parameterized_circuit = parameterized_circuits[id(instance)]
+            circuits = [parameterized_circuit.assign_parameters({feature_map_params: x})
+                        for x in data[batch]]
+        else:
+            #  the second x is redundant
+            to_be_computed_data_pair = [(x, x) for x in data[batch]]
+            circuits = parallel_map(QSVM._construct_circuit,
+                                    to_be_computed_data_pair,
+                                    task_args=(feature_map, False, True),
+                                    num_processes=aqua_globals.num_processes)
+        results = instance.execute(circuits, had_transpiled=use_parameterized_circuits)
+        return batch, np.array([results.get_statevector(i) for i in range(len(circuits))])
+
+    batches = [slice(idx, idx + QSVM.BATCH_SIZE) for idx in range(0, len(data), QSVM.BATCH_SIZE)]
+    states = np.empty((len(data), 2 ** feature_map.num_qubits), dtype=complex)
+    for batch, batch_states in _map_blocks(quantum_instances, statevectors, batches):
+        states[batch] = batch_states
+    return states
+
+
+def _transpile_per_instance(quantum_instances, circuit):
+    """
+    Transpiles the circuit once per distinct transpilation settings of the quantum instances,
+    and returns the transpiled circuit of each quantum instance, by its id.
+    """
+    transpiled = {}  # type: Dict[str, QuantumCircuit]
+    circuits = {}  # type: Dict[int, QuantumCircuit]
+    for quantum_instance in quantum_instances:
+        key = _setting_key((quantum_instance.backend_name, quantum_instance.backend_config,
+                            quantum_instance.compile_config))
+        if key not in transpiled:
+            transpiled[key] = quantum_instance.transpile(circuit)[0]
+        circuits[id(quantum_instance)] = transpiled[key]
+    return circuits
+
+
+def _enforce_psd(mat):
+    """ Returns the closest positive semi-definite approximation to a symmetric matrix. """
+    # pylint: disable=invalid-name
+    D, U = np.linalg.eig(mat)
+    return U @ np.diag(np.maximum(0, D)) @ U.transpose()
+
+
+def _write_kernel_block(mat, rows, cols, tile, is_symmetric):
+    """ Writes a block of the kernel matrix, and its transpose in the symmetric case. """
+    if is_symmetric and rows == cols:
+        np.fill_diagonal(tile, 1.)
+    mat[rows, cols] = tile
+    if is_symmetric:
+        mat[cols, rows] = tile.T
+
+
+def _map_blocks(quantum_instances, task, blocks):
+    """
+    Runs `task(quantum_instance, block)` for each block, concurrently in threads when there are
+    several quantum instances, each of which runs one block at a time, and yields the results
+    as they complete.
+    """
+    if len(quantum_instances) == 1:
+        for block in blocks:
+            yield task(quantum_instances[0], block)
+        return
+
+    available = queue.Queue()
+    for quantum_instance in quantum_instances:
+        available.put(quantum_instance)
+
+    def run(block):
+        quantum_instance = available.get()
+        try:
+            return task(quantum_instance, block)
+        finally:
+            available.put(quantum_instance)
+
+    with ThreadPoolExecutor(max_workers=len(quantum_instances)) as executor:
+        futures = [executor.submit(run, block) for block in blocks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
 def _assign_parameters(circuit, params):
     if not hasattr(circuit, 'ordered_parameters'):
         raise AttributeError('Circuit needs the attribute `ordered_parameters`.')
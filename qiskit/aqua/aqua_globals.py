@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2019, 2020.
+# (C) Copyright IBM 2019, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,8 +12,10 @@
 
 """ Aqua Globals """
 
-from typing import Optional
+from typing import Optional, Iterator
 import logging
+import threading
+from contextlib import contextmanager
 
 import numpy as np
 from qiskit.util import local_hardware_info
@@ -35,6 +37,8 @@ class QiskitAquaGlobals:
         self._num_processes = QiskitAquaGlobals.CPU_COUNT
         self._random = None
         self._massive = False
+        # the generators seeded in the current thread only, see local_random_seed
+        self._local = threading.local()
 
     @property
     def random_seed(self) -> Optional[int]:
@@ -76,10 +80,33 @@ class QiskitAquaGlobals:
     @property
     def random(self) -> np.random.Generator:
         """Return a numpy np.random.Generator (default_rng)."""
+        local_random = getattr(self._local, 'random', None)
+        if local_random is not None:
+            return local_random
         if self._random is None:
             self._random = np.random.default_rng(self._random_seed)
         return self._random
 
+    @contextmanager
+    def local_random_seed(self, seed: Optional[int]) -> Iterator[np.random.Generator]:
+        """
+        Seeds the generator returned by :attr:`random` in the current thread only, within the
+        context, e.g. to seed the workers of a thread pool deterministically, whatever the
+        order in which they draw numbers.
+
+        Args:
+            seed: The seed of the generator of the thread.
+
+        Yields:
+            The generator of the thread.
+        """
+        previous = getattr(self._local, 'random', None)
+        self._local.random = np.random.default_rng(seed)
+        try:
+            yield self._local.random
+        finally:
+            self._local.random = previous
+
     @property
     def massive(self) -> bool:
         """Return massive to allow processing of large matrices or vectors."""
@@ -58,6 +58,15 @@ Local Optimizers
    SPSA
    TNC
 
+Any of the optimizers can be run from several initial points in parallel, with the following
+wrapper.
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   MultiStart
+
 Qiskit Aqua also provides the following optimizers, which are built-out using the optimizers from
 the `scikit-quant` package. The `scikit-quant` package is not installed by default but must be
 explicitly installed, if desired, by the user - the optimizers therein are provided under various
@@ -111,6 +120,7 @@ from .spsa import SPSA
 from .tnc import TNC
 from .aqgd import AQGD
 from .nft import NFT
+from .multi_start import MultiStart
 from .nlopts.crs import CRS
 from .nlopts.direct_l import DIRECT_L
 from .nlopts.direct_l_rand import DIRECT_L_RAND
@@ -135,5 +145,6 @@ __all__ = ['Optimizer',
            'SLSQP',
            'SPSA',
            'TNC',
+           'MultiStart',
            'CRS', 'DIRECT_L', 'DIRECT_L_RAND', 'ESCH', 'ISRES',
            'SNOBFIT', 'BOBYQA', 'IMFIL']
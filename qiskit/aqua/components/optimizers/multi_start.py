@@ -0,0 +1,398 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Parallel multi-start wrapper of an optimizer"""
+
+from typing import Optional, List, Tuple, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+import copy
+import logging
+import multiprocessing
+import threading
+
+import numpy as np
+
+from qiskit.aqua import aqua_globals
+from qiskit.aqua.utils.validation import validate_min
+from .optimizer import Optimizer, OptimizerSupportLevel
+
+logger = logging.getLogger(__name__)
+
+
+class MultiStart(Optimizer):
+    """
+    Parallel multi-start wrapper of an optimizer.
+
+    The wrapped optimizer is run from several initial points at the same time, on the workers of
+    a pool executor, and the best of the solutions is returned. The first start uses the given
+    initial point, if any, and the other ones random points within the variable bounds, or
+    within :math:`[-2\\pi, 2\\pi]` for unbounded variables, as for :class:`P_BFGS`. As a
+    wrapper, it can be used with any :class:`Optimizer`, and by any variational algorithm,
+    e.g. ``VQE(operator, var_form, MultiStart(COBYLA(), num_starts=4))``.
+
+    Each start is seeded deterministically, from :attr:`~qiskit.aqua.aqua_globals.random`, and
+    the wrapped optimizer of each start draws from its own seed of
+    :attr:`~qiskit.aqua.aqua_globals.random`, so that its steps do not depend on the
+    scheduling of the workers, unless starts are terminated early.
+
+    The best value of the objective function found so far by any start is shared by the
+    starts. With a ``termination_threshold``, a start whose best value is worse than the
+    shared best value by more than the threshold, after ``termination_patience`` evaluations,
+    is terminated early and returns its best point so far, leaving the workers to the other
+    starts.
+
+    By default, the starts run on a thread pool, and their evaluations of the objective
+    function are gathered: when all the running starts wait for an evaluation, or after
+    ``gather_timeout`` seconds, e.g. when the wrapped optimizer holds a lock, as SciPy's COBYLA
+    does, the waiting points are evaluated together, in groups of at most
+    ``max_evals_grouped`` points, see
+    :meth:`~qiskit.aqua.components.optimizers.Optimizer.set_max_evals_grouped`. The objective
+    function, e.g. of a variational algorithm sharing a quantum instance between the starts,
+    is thus never called concurrently, and the starts share its jobs. The waiting points are
+    ordered by start, so that the groups do not depend on the scheduling of the threads unless
+    the ``gather_timeout`` expires. A group holds the points of several starts though, so an
+    objective function drawing from :attr:`~qiskit.aqua.aqua_globals.random`, e.g. a
+    stochastic one, draws from a generator of the first start of the group, whatever the thread
+    evaluating it, and not from a generator of each start. A process pool, e.g. a
+    :class:`~concurrent.futures.ProcessPoolExecutor`, may be given instead to evaluate the
+    objective function of the starts concurrently, if it can be pickled.
+    """
+
+    def __init__(self,
+                 optimizer: Optimizer,
+                 num_starts: int = 4,
+                 max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None,
+                 termination_threshold: Optional[float] = None,
+                 termination_patience: int = 20,
+                 gather_timeout: float = 0.01) -> None:
+        """
+        Args:
+            optimizer: The optimizer run from each initial point.
+            num_starts: The number of initial points. It has a min. value of 1.
+            max_workers: The maximum number of starts run at the same time on the thread pool
+                of the optimizer. If None, all the starts run at the same time. Ignored if an
+                ``executor`` is given.
+            executor: Optional executor the starts are submitted to, e.g. a process pool. It is
+                not shut down by the optimizer.
+            termination_threshold: Optional difference to the best value found so far by any
+                start beyond which a start is terminated early.
+            termination_patience: The number of evaluations of the objective function of a
+                start before it can be terminated early. It has a min. value of 1.
+            gather_timeout: The time in seconds an evaluation of the objective function waits
+                for the evaluations of the other starts running on a thread pool.
+        """
+        validate_min('num_starts', num_starts, 1)
+        validate_min('termination_patience', termination_patience, 1)
+        if max_workers is not None:
+            validate_min('max_workers', max_workers, 1)
+        self._optimizer = optimizer
+        super().__init__()
+        self._num_starts = num_starts
+        self._max_workers = max_workers
+        self._executor = executor
+        self._termination_threshold = termination_threshold
+        self._termination_patience = termination_patience
+        self._gather_timeout = gather_timeout
+        self._start_results = []  # type: List[Tuple[np.ndarray, float, int, bool]]
+
+    def get_support_level(self):
+        """ return support level dictionary """
+        support_level = dict(self._optimizer.get_support_level())
+        # the initial points are drawn if none is given
+        if support_level['initial_point'] == OptimizerSupportLevel.required:
+            support_level['initial_point'] = OptimizerSupportLevel.supported
+        return support_level
+
+    def set_max_evals_grouped(self, limit):
+        """ Set max evals grouped """
+        super().set_max_evals_grouped(limit)
+        self._optimizer.set_max_evals_grouped(limit)
+
+    @property
+    def optimizer(self) -> Optimizer:
+        """ Returns the optimizer run from each initial point. """
+        return self._optimizer
+
+    @property
+    def start_results(self) -> List[Tuple[np.ndarray, float, int, bool]]:
+        """ Returns the results of the starts of the last optimization: their solution, value,
+        number of evaluations of the objective function, and whether they were terminated
+        early. """
+        return self._start_results
+
+    def optimize(self, num_vars, objective_function, gradient_function=None,
+                 variable_bounds=None, initial_point=None):
+        super().optimize(num_vars, objective_function, gradient_function,
+                         variable_bounds, initial_point)
+
+        # the seeds of the starts, drawn at once so they do not depend on the scheduling
+        seeds = aqua_globals.random.integers(2 ** 31, size=self._num_starts).tolist()
+        initial_points = self._initial_points(num_vars, variable_bounds, initial_point, seeds)
+
+        manager = None
+        batcher = None
+        if self._executor is None or isinstance(self._executor, ThreadPoolExecutor):
+            shared_best = _SharedBest(threading.Lock())
+            if self._executor is None:
+                max_workers = self._max_workers or self._num_starts
+            else:
+                # pylint: disable=protected-access
+                max_workers = getattr(self._executor, '_max_workers', self._num_starts)
+            batcher = _EvaluationBatcher(objective_function, gradient_function, num_vars,
+                                         self._max_evals_grouped, self._gather_timeout,
+                                         seeds, max_workers)
+            objective_function = batcher.objective
+            if gradient_function is not None:
+                gradient_function = batcher.gradient
+        else:
+            # the best value is shared with the processes through a manager
+            manager = multiprocessing.Manager()
+            shared_best = _SharedBest(manager.Lock(), manager.Value('d', np.inf))
+
+        executor = self._executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=self._max_workers or self._num_starts)
+        try:
+            starts = [(copy.deepcopy(self._optimizer), num_vars, objective_function,
+                       gradient_function, variable_bounds, start_point, seed, shared_best,
+                       self._termination_threshold, self._termination_patience)
+                      for start_point, seed in zip(initial_points, seeds)]
+            if batcher is not None:
+                futures = [executor.submit(batcher.run, index, *start)
+                           for index, start in enumerate(starts)]
+            else:
+                futures = [executor.submit(_run_start, *start) for start in starts]
+            self._start_results = [future.result() for future in futures]
+        finally:
+            if executor is not self._executor:
+                executor.shutdown()
+            if manager is not None:
+                manager.shutdown()
+
+        sol, opt, _, _ = min(self._start_results, key=lambda result: result[1])
+        nfev = sum(result[2] for result in self._start_results)
+        logger.debug('Best value %s of %s starts, %s of them terminated early', opt,
+                     self._num_starts, sum(result[3] for result in self._start_results))
+        return sol, opt, nfev
+
+    def _initial_points(self,
+                        num_vars: int,
+                        variable_bounds: Optional[List[Tuple[Optional[float], Optional[float]]]],
+                        initial_point: Optional[np.ndarray],
+                        seeds: List[int]) -> List[Optional[np.ndarray]]:
+        if self.is_initial_point_ignored:
+            return [None] * self._num_starts
+        threshold = 2 * np.pi
+        if variable_bounds is None:
+            variable_bounds = [(None, None)] * num_vars
+        low = [(l if l is not None else -threshold) for (l, u) in variable_bounds]
+        high = [(u if u is not None else threshold) for (l, u) in variable_bounds]
+        initial_points = [np.random.default_rng(seed).uniform(low, high) for seed in seeds]
+        if initial_point is not None:
+            initial_points[0] = np.asarray(initial_point)
+        return initial_points
+
+
+class _StartTerminated(Exception):
+    """ Raised by the objective function of a start terminated early. """
+
+
+class _SharedBest:
+    """ The best value of the objective function found by any start. """
+
+    def __init__(self, lock, value=None) -> None:
+        self._lock = lock
+        # a manager value shared with processes, or a local one
+        self._value = value if value is not None else _Value(np.inf)
+
+    @property
+    def value(self) -> float:
+        """ Returns the best value. """
+        return self._value.value
+
+    def update(self, value: float) -> None:
+        """ Updates the best value with a value found by a start. """
+        with self._lock:
+            if value < self._value.value:
+                self._value.value = value
+
+
+class _Value:
+    """ A value held locally, with the interface of a manager value. """
+
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+
+class _Request:
+    """ An evaluation waiting in the batcher: the start requesting it, its points, and their
+    values once evaluated. """
+
+    def __init__(self, index: int, points: np.ndarray) -> None:
+        self.index = index
+        self.points = points
+        self.values = np.empty(0)
+        self.error = None  # type: Optional[Exception]
+        self.done = False
+
+
+class _EvaluationBatcher:
+    """ Gathers the evaluations of the objective function of the starts running on threads, and
+    evaluates them when all the running starts wait, or after a timeout, so that the objective
+    function is never called concurrently. """
+
+    def __init__(self,
+                 objective_function: Callable,
+                 gradient_function: Optional[Callable],
+                 num_vars: int,
+                 max_evals_grouped: int,
+                 gather_timeout: float,
+                 seeds: List[int],
+                 max_workers: int) -> None:
+        self._objective_function = objective_function
+        self._gradient_function = gradient_function
+        self._num_vars = num_vars
+        self._max_evals_grouped = max_evals_grouped
+        self._gather_timeout = gather_timeout
+        self._num_unfinished = len(seeds)
+        self._max_workers = max_workers
+        self._condition = threading.Condition()
+        self._pending = []  # type: List[_Request]
+        # the generators of the objective function of the starts, apart from those of the
+        # optimizers so that these do not depend on the groups
+        self._randoms = [np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+                         for seed in seeds]
+        # the index of the start running in the current thread
+        self._local = threading.local()
+
+    def run(self, index: int, *args) -> Tuple[np.ndarray, float, int, bool]:
+        """ Runs a start, which no longer holds back the evaluations of the other ones once
+        finished. """
+        self._local.index = index
+        try:
+            return _run_start(*args)
+        finally:
+            with self._condition:
+                self._num_unfinished -= 1
+                self._evaluate(force=False)
+
+    def objective(self, x):
+        """ Evaluates the objective function at the points x, with the other starts. """
+        request = _Request(self._local.index, np.reshape(x, (-1, self._num_vars)))
+        with self._condition:
+            self._pending.append(request)
+            self._evaluate(force=False)
+            while not request.done:
+                if not self._condition.wait(self._gather_timeout) and not request.done:
+                    # some running starts do not evaluate, e.g. waiting for a lock
+                    self._evaluate(force=True)
+        if request.error is not None:
+            raise request.error
+        return request.values if len(request.points) > 1 else request.values[0]
+
+    def gradient(self, x):
+        """ Evaluates the gradient function at the point x, alone. """
+        with self._condition:
+            return self._gradient_function(x)
+
+    def _evaluate(self, force: bool) -> None:
+        """ Evaluates the waiting evaluations, if all the running starts wait or if forced. """
+        # the starts running at the same time, the other ones waiting for a worker
+        num_running = min(self._num_unfinished, self._max_workers)
+        if not self._pending or (len(self._pending) < num_running and not force):
+            return
+        pending, self._pending = sorted(self._pending, key=lambda request: request.index), []
+        # the evaluations are grouped, whole, in groups of at most max_evals_grouped points
+        groups = [[]]  # type: List[List[_Request]]
+        for request in pending:
+            group_size = sum(len(other.points) for other in groups[-1])
+            if groups[-1] and group_size + len(request.points) > self._max_evals_grouped:
+                groups.append([])
+            groups[-1].append(request)
+        for group in groups:
+            try:
+                points = np.concatenate([request.points for request in group])
+                seed = self._randoms[group[0].index].integers(2 ** 31)
+                with aqua_globals.local_random_seed(seed):
+                    values = np.atleast_1d(self._objective_function(
+                        points.ravel() if len(points) > 1 else points[0]))
+                start = 0
+                for request in group:
+                    request.values = values[start:start + len(request.points)]
+                    start += len(request.points)
+            except Exception as ex:  # pylint: disable=broad-except
+                for request in group:
+                    request.error = ex
+            for request in group:
+                request.done = True
+        self._condition.notify_all()
+
+
+class _TrackedObjective:
+    """ The objective function of a start, tracking its best point and terminating it early
+    when it is losing. """
+
+    def __init__(self,
+                 objective_function: Callable,
+                 num_vars: int,
+                 shared_best: _SharedBest,
+                 termination_threshold: Optional[float],
+                 termination_patience: int) -> None:
+        self._objective_function = objective_function
+        self._num_vars = num_vars
+        self._shared_best = shared_best
+        self._termination_threshold = termination_threshold
+        self._termination_patience = termination_patience
+        self.num_evals = 0
+        self.best_point = None
+        self.best_value = np.inf
+
+    def __call__(self, x):
+        values = self._objective_function(x)
+        # the objective function may be evaluated at a group of points
+        points = np.reshape(x, (-1, self._num_vars))
+        flat_values = np.real(np.atleast_1d(values))
+        self.num_evals += len(points)
+        best = int(np.argmin(flat_values))
+        if flat_values[best] < self.best_value:
+            self.best_point, self.best_value = np.array(points[best]), float(flat_values[best])
+            self._shared_best.update(self.best_value)
+        if self._termination_threshold is not None \
+                and self.num_evals >= self._termination_patience \
+                and self.best_value > self._shared_best.value + self._termination_threshold:
+            raise _StartTerminated()
+        return values
+
+
+def _run_start(optimizer: Optimizer,
+               num_vars: int,
+               objective_function: Callable,
+               gradient_function: Optional[Callable],
+               variable_bounds: Optional[List[Tuple[Optional[float], Optional[float]]]],
+               initial_point: Optional[np.ndarray],
+               seed: int,
+               shared_best: _SharedBest,
+               termination_threshold: Optional[float],
+               termination_patience: int) -> Tuple[np.ndarray, float, int, bool]:
+    """ Runs a start of the optimization, on a worker of the executor. """
+    objective = _TrackedObjective(objective_function, num_vars, shared_best,
+                                  termination_threshold, termination_patience)
+    with aqua_globals.local_random_seed(seed):
+        try:
+            sol, opt, _ = optimizer.optimize(num_vars, objective, gradient_function,
+                                             variable_bounds, initial_point)
+        except _StartTerminated:
+            logger.debug('Terminated a start at value %s after %s evaluations',
+                         objective.best_value, objective.num_evals)
+            return objective.best_point, objective.best_value, objective.num_evals, True
+    return np.asarray(sol), float(opt), objective.num_evals, False
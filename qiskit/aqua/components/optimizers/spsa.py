@@ -53,6 +53,14 @@ class SPSA(Optimizer):
     The optimization process includes a calibration phase, which requires additional
     functional evaluations.
 
+    The gradient can be averaged over several random perturbation directions per iteration
+    (``resamplings``), and the Hessian estimated with two more evaluations per direction, which
+    preconditions the update (2-SPSA, ``second_order``). With ``blocking``, updates increasing
+    the objective function by more than an allowed increase are rejected. The points evaluated
+    in an iteration, and in the calibration, are passed to the objective function at once, in
+    groups of at most ``max_evals_grouped`` points, see
+    :meth:`~qiskit.aqua.components.optimizers.Optimizer.set_max_evals_grouped`.
+
     For further details, please refer to https://arxiv.org/pdf/1704.05018v2.pdf#section*.11
     (Supplementary information Section IV.)
     """
@@ -71,7 +79,12 @@ class SPSA(Optimizer):
                  c3: float = 0.101,
                  c4: float = 0,
                  skip_calibration: bool = False,
-                 max_trials: Optional[int] = None) -> None:
+                 max_trials: Optional[int] = None,
+                 resamplings: int = 1,
+                 second_order: bool = False,
+                 regularization: float = 0.01,
+                 blocking: bool = False,
+                 allowed_increase: Optional[float] = None) -> None:
         """
         Args:
             maxiter: Maximum number of iterations to perform.
@@ -85,9 +98,22 @@ class SPSA(Optimizer):
             c4: The parameter used to control a as well.
             skip_calibration: Skip calibration and use provided c(s) as is.
             max_trials: Deprecated, use maxiter.
+            resamplings: The number of random perturbation directions the gradient, and the
+                Hessian, are averaged over at each iteration. It has a min. value of 1.
+            second_order: Whether the Hessian is estimated, with two more evaluations of the
+                objective function per direction, to precondition the update (2-SPSA).
+            regularization: The value added to the absolute eigenvalues of the estimated
+                Hessian to make it positive definite, with ``second_order``.
+            blocking: Whether updates increasing the objective function by more than
+                ``allowed_increase`` are rejected, which costs one more evaluation of the
+                objective function per iteration.
+            allowed_increase: The increase of the objective function allowed by ``blocking``.
+                If None, twice the standard deviation of the objective function at the initial
+                point, estimated with 25 evaluations, is allowed.
         """
         validate_min('save_steps', save_steps, 1)
         validate_min('last_avg', last_avg, 1)
+        validate_min('resamplings', resamplings, 1)
         super().__init__()
         if max_trials is not None:
             warnings.warn('The max_trials parameter is deprecated as of '
@@ -101,6 +127,11 @@ class SPSA(Optimizer):
         self._maxiter = maxiter
         self._parameters = np.array([c0, c1, c2, c3, c4])
         self._skip_calibration = skip_calibration
+        self._resamplings = resamplings
+        self._second_order = second_order
+        self._regularization = regularization
+        self._blocking = blocking
+        self._allowed_increase = allowed_increase
 
     def get_support_level(self):
         """ return support level dictionary """
@@ -171,31 +202,66 @@ class SPSA(Optimizer):
         cost_minus_save = []
         theta = initial_theta
         theta_best = np.zeros(initial_theta.shape)
+        num_vars = np.shape(initial_theta)[0]
+        hessian = np.zeros((num_vars, num_vars))
+        if self._blocking:
+            cost, allowed_increase = self._initial_cost(obj_fun, initial_theta)
         for k in range(maxiter):
             # SPSA Parameters
             a_spsa = float(self._parameters[0]) / np.power(k + 1 + self._parameters[4],
                                                            self._parameters[2])
             c_spsa = float(self._parameters[1]) / np.power(k + 1, self._parameters[3])
-            delta = 2 * aqua_globals.random.integers(2, size=np.shape(initial_theta)[0]) - 1
-            # plus and minus directions
-            theta_plus = theta + c_spsa * delta
-            theta_minus = theta - c_spsa * delta
-            # cost function for the two directions
-            if self._max_evals_grouped > 1:
-                cost_plus, cost_minus = obj_fun(np.concatenate((theta_plus, theta_minus)))
-            else:
-                cost_plus = obj_fun(theta_plus)
-                cost_minus = obj_fun(theta_minus)
+            # the plus and minus directions of all the perturbations, and with second order,
+            # the points perturbed again from the plus and minus directions
+            deltas = []
+            points = []
+            for _ in range(self._resamplings):
+                delta = 2 * aqua_globals.random.integers(2, size=num_vars) - 1
+                points += [theta + c_spsa * delta, theta - c_spsa * delta]
+                if self._second_order:
+                    delta2 = 2 * aqua_globals.random.integers(2, size=num_vars) - 1
+                    points += [points[-2] + c_spsa * delta2, points[-1] + c_spsa * delta2]
+                    deltas.append((delta, delta2))
+                else:
+                    deltas.append((delta, None))
+            costs = self._evaluate(obj_fun, points)
+            step = 4 if self._second_order else 2
+            cost_plus, cost_minus = costs[0], costs[1]
             # derivative estimate
-            g_spsa = (cost_plus - cost_minus) * delta / (2.0 * c_spsa)
+            g_spsa = np.zeros(num_vars)
+            hessian_estimate = np.zeros((num_vars, num_vars))
+            for i, (delta, delta2) in enumerate(deltas):
+                sample = costs[step * i:step * (i + 1)]
+                g_spsa += (sample[0] - sample[1]) * delta / (2.0 * c_spsa * self._resamplings)
+                if delta2 is not None:
+                    diff = (sample[2] - sample[0]) - (sample[3] - sample[1])
+                    outer = np.outer(delta, delta2)
+                    hessian_estimate += diff / (2 * c_spsa ** 2) * (outer + outer.T) / 2 \
+                        / self._resamplings
+            if self._second_order:
+                # the running average of the estimates, made positive definite
+                hessian = (k * hessian + hessian_estimate) / (k + 1)
+                eigenvalues, eigenvectors = np.linalg.eigh(hessian)
+                preconditioner = (eigenvectors * np.abs(eigenvalues)).dot(eigenvectors.T) \
+                    + self._regularization * np.identity(num_vars)
+                g_spsa = np.linalg.solve(preconditioner, g_spsa)
             # updated theta
-            theta = theta - a_spsa * g_spsa
+            theta_new = theta - a_spsa * g_spsa
+            if self._blocking:
+                cost_new = self._evaluate(obj_fun, [theta_new])[0]
+                if cost_new <= cost + allowed_increase:
+                    theta, cost = theta_new, cost_new
+                else:
+                    logger.debug('Rejected the update of step # %s, increasing the objective '
+                                 'function from %1.7f to %1.7f', k, cost, cost_new)
+            else:
+                theta = theta_new
             # saving
             if k % save_steps == 0:
                 logger.debug('Objective function at theta+ for step # %s: %1.7f', k, cost_plus)
                 logger.debug('Objective function at theta- for step # %s: %1.7f', k, cost_minus)
-                theta_plus_save.append(theta_plus)
-                theta_minus_save.append(theta_minus)
+                theta_plus_save.append(points[0])
+                theta_minus_save.append(points[1])
                 cost_plus_save.append(cost_plus)
                 cost_minus_save.append(cost_minus)
 
@@ -208,6 +274,35 @@ class SPSA(Optimizer):
         return [cost_final, theta_best, cost_plus_save, cost_minus_save,
                 theta_plus_save, theta_minus_save]
 
+    def _evaluate(self, obj_fun: Callable, points: List[np.ndarray]) -> np.ndarray:
+        """Evaluates obj_fun at the points, in groups of at most max_evals_grouped points.
+
+        Args:
+            obj_fun: the function to evaluate.
+            points: the points.
+
+        Returns:
+            the values of obj_fun at the points.
+        """
+        if self._max_evals_grouped <= 1:
+            return np.array([obj_fun(point) for point in points])
+        values = []
+        for start in range(0, len(points), self._max_evals_grouped):
+            group = points[start:start + self._max_evals_grouped]
+            values.extend(np.atleast_1d(obj_fun(np.concatenate(group))))
+        return np.array(values)
+
+    def _initial_cost(self, obj_fun: Callable, initial_theta: np.ndarray):
+        """Returns the value of obj_fun at initial_theta, and the increase allowed by blocking,
+        estimated from the standard deviation of obj_fun at initial_theta if it is not given."""
+        if self._allowed_increase is not None:
+            return self._evaluate(obj_fun, [initial_theta])[0], self._allowed_increase
+        costs = self._evaluate(obj_fun, [initial_theta] * 25)
+        allowed_increase = 2 * np.std(costs)
+        logger.debug('Allowed increase of the objective function when blocking: %.7f',
+                     allowed_increase)
+        return np.mean(costs), allowed_increase
+
     def _calibration(self,
                      obj_fun: Callable,
                      initial_theta: np.ndarray,
@@ -229,25 +324,20 @@ class SPSA(Optimizer):
 
         target_update = self._parameters[0]
         initial_c = self._parameters[1]
-        delta_obj = 0
         logger.debug("Calibration...")
-        for i in range(stat):
-            if i % 5 == 0:
-                logger.debug('calibration step # %s of %s', str(i), str(stat))
+        points = []
+        for _ in range(stat):
             delta = 2 * aqua_globals.random.integers(2, size=np.shape(initial_theta)[0]) - 1
-            theta_plus = initial_theta + initial_c * delta
-            theta_minus = initial_theta - initial_c * delta
-            if self._max_evals_grouped > 1:
-                obj_plus, obj_minus = obj_fun(np.concatenate((theta_plus, theta_minus)))
-            else:
-                obj_plus = obj_fun(theta_plus)
-                obj_minus = obj_fun(theta_minus)
-            delta_obj += np.absolute(obj_plus - obj_minus) / stat
+            points += [initial_theta + initial_c * delta, initial_theta - initial_c * delta]
+        # the plus and minus directions of all the calibration steps are evaluated at once
+        obj = self._evaluate(obj_fun, points)
+        delta_obj = np.mean(np.absolute(obj[0::2] - obj[1::2]))
 
         # only calibrate if delta_obj is larger than 0
         if delta_obj > 0:
             self._parameters[0] = target_update * 2 / delta_obj \
                 * self._parameters[1] * (self._parameters[4] + 1)
+        else:
             logger.debug('delta_obj is 0, not calibrating (since this would set c0 to inf)')
 
         logger.debug('Calibrated SPSA parameter c0 is %.7f', self._parameters[0])
@@ -13,12 +13,15 @@
 """AbelianGrouper Class"""
 
 import warnings
-from typing import List, Tuple, Dict, cast, Optional
+from typing import List, Tuple, Dict, Optional, Callable, Iterator, Any
 
 import numpy as np
 import retworkx as rx
 
+from qiskit.circuit import ParameterExpression
+from qiskit.tools import parallel_map
 from qiskit.aqua import AquaError
+from qiskit.aqua.utils.bit_packing import pack_bits
 from .converter_base import ConverterBase
 from ..list_ops.list_op import ListOp
 from ..list_ops.summed_op import SummedOp
@@ -38,15 +41,52 @@ class AbelianGrouper(ConverterBase):
     similarly, as in the case of Pauli Expectations, where commuting Paulis have the same
     diagonalizing circuit rotation, or Pauli Evolutions, where commuting Paulis can be
     diagonalized together.
+
+    Two Paulis are grouped together if they commute qubit-wise. The groups are found with one of
+    the following strategies:
+
+    * ``'greedy_color'`` (default): builds the graph of the non-commuting pairs and colors it
+      with ``retworkx.graph_greedy_color``. The edges are computed from bit-packed Paulis in
+      blocks of bounded memory, optionally in several processes, but the graph itself holds
+      all the non-commuting pairs.
+    * ``'largest_first'``: inserts the Paulis in order of decreasing number of non-commuting
+      Paulis into the first compatible group. The degrees are computed block by block and no
+      graph is built.
+    * ``'sorted_insertion'``: inserts the Paulis in order of decreasing absolute coefficient into
+      the first compatible group, without any pairwise comparison.
+
+    Since all the members of a group of qubit-wise commuting Paulis act on each qubit with the
+    same Pauli, the insertion strategies only compare a Pauli with the combined Pauli of each
+    group, and need memory linear in the number of Paulis. They are recommended for operators
+    with many thousands of terms.
     """
 
-    def __init__(self, traverse: bool = True) -> None:
+    def __init__(self,
+                 traverse: bool = True,
+                 strategy: str = 'greedy_color',
+                 num_processes: int = 1) -> None:
         """
         Args:
             traverse: Whether to convert only the Operator passed to ``convert``, or traverse
                 down that Operator.
+            strategy: The grouping strategy, one of ``'greedy_color'``, ``'largest_first'`` and
+                ``'sorted_insertion'``.
+            num_processes: The number of processes computing the blocks of the commutation
+                graph, or of the degrees, of the ``'greedy_color'`` and ``'largest_first'``
+                strategies.
+
+        Raises:
+            ValueError: invalid strategy.
         """
+        _validate_strategy(strategy)
         self._traverse = traverse
+        self._strategy = strategy
+        self._num_processes = num_processes
+
+    @property
+    def strategy(self) -> str:
+        """ Returns the grouping strategy. """
+        return self._strategy
 
     def convert(self, operator: OperatorBase) -> OperatorBase:
         """Check if operator is a SummedOp, in which case covert it into a sum of mutually
@@ -70,7 +110,8 @@ class AbelianGrouper(ConverterBase):
             if isinstance(operator, SummedOp) and all(isinstance(op, PauliOp)
                                                       for op in operator.oplist):
                 # For now, we only support graphs over Paulis.
-                return self.group_subops(operator)
+                return self.group_subops(operator, strategy=self._strategy,
+                                         num_processes=self._num_processes)
             elif self._traverse:
                 return operator.traverse(self.convert)
             else:
@@ -86,24 +127,31 @@ class AbelianGrouper(ConverterBase):
 
     @classmethod
     def group_subops(cls, list_op: ListOp, fast: Optional[bool] = None,
-                     use_nx: Optional[bool] = None) -> ListOp:
+                     use_nx: Optional[bool] = None, strategy: str = 'greedy_color',
+                     num_processes: int = 1) -> ListOp:
         """Given a ListOp, attempt to group into Abelian ListOps of the same type.
 
         Args:
             list_op: The Operator to group into Abelian groups
             fast: Ignored - parameter will be removed in future release
             use_nx: Ignored - parameter will be removed in future release
+            strategy: The grouping strategy, one of ``'greedy_color'``, ``'largest_first'`` and
+                ``'sorted_insertion'``.
+            num_processes: The number of processes computing the blocks of the commutation
+                graph, or of the degrees.
 
         Returns:
             The grouped Operator.
 
         Raises:
             AquaError: If any of list_op's sub-ops is not ``PauliOp``.
+            ValueError: invalid strategy.
         """
         if fast is not None or use_nx is not None:
             warnings.warn('Options `fast` and `use_nx` of `AbelianGrouper.group_subops` are '
                           'no longer used and are now deprecated and will be removed no '
                           'sooner than 3 months following the 0.8.0 release.')
+        _validate_strategy(strategy)
 
         # TODO: implement direct way
         if isinstance(list_op, PauliSumOp):
@@ -115,14 +163,25 @@ class AbelianGrouper(ConverterBase):
                     'Cannot determine Abelian groups if any Operator in list_op is not '
                     '`PauliOp`. E.g., {} ({})'.format(op, type(op)))
 
-        edges = cls._commutation_graph(list_op)
-        nodes = range(len(list_op))
-
-        graph = rx.PyGraph()
-        graph.add_nodes_from(nodes)
-        graph.add_edges_from_no_data(edges)
-        # Keys in coloring_dict are nodes, values are colors
-        coloring_dict = rx.graph_greedy_color(graph)
+        if strategy == 'greedy_color':
+            graph = rx.PyGraph()
+            graph.add_nodes_from(range(len(list_op)))
+            for rows, cols in _commutation_blocks(list_op, _commutation_edge_block,
+                                                  num_processes):
+                graph.add_edges_from_no_data(list(zip(rows.tolist(), cols.tolist())))
+            # Keys in coloring_dict are nodes, values are colors
+            coloring_dict = rx.graph_greedy_color(graph)
+        else:
+            x_words, z_words = _packed_paulis(list_op)
+            if strategy == 'largest_first':
+                degrees = np.concatenate(list(_commutation_blocks(list_op, _degree_block,
+                                                                  num_processes)))
+                order = np.argsort(-degrees, kind='stable')
+            else:
+                coeffs = np.array([0 if isinstance(op.coeff, ParameterExpression) else abs(op.coeff)
+                                   for op in list_op.oplist])
+                order = np.argsort(-coeffs, kind='stable')
+            coloring_dict = _insertion_coloring(x_words, z_words, order)
 
         groups = {}  # type: Dict
         # sort items so that the output is consistent with all options (fast and use_nx)
@@ -147,10 +206,100 @@ class AbelianGrouper(ConverterBase):
         Returns:
             A list of pairs of indices of the operators that are not commutable
         """
-        # convert a Pauli operator into int vector where {I: 0, X: 2, Y: 3, Z: 1}
-        mat1 = np.array([op.primitive.z + 2 * op.primitive.x for op in list_op], dtype=np.int8)
-        mat2 = mat1[:, None]
-        # mat3[i, j] is True if i and j are commutable with TPB
-        mat3 = (((mat1 * mat2) * (mat1 - mat2)) == 0).all(axis=2)
-        # return [(i, j) if mat3[i, j] is False and i < j]
-        return cast(List[Tuple[int, int]], list(zip(*np.where(np.triu(np.logical_not(mat3), k=1)))))
+        edges = []  # type: List[Tuple[int, int]]
+        for rows, cols in _commutation_blocks(list_op, _commutation_edge_block):
+            edges.extend(zip(rows.tolist(), cols.tolist()))
+        return edges
+
+
+# number of packed words compared at once when building the commutation graph
+_BLOCK_SIZE = 2 ** 21
+
+_STRATEGIES = ('greedy_color', 'largest_first', 'sorted_insertion')
+
+
+def _validate_strategy(strategy: str) -> None:
+    if strategy not in _STRATEGIES:
+        raise ValueError('Unknown grouping strategy {}, must be one of {}.'.format(
+            strategy, ', '.join(_STRATEGIES)))
+
+
+def _packed_paulis(list_op: ListOp) -> Tuple[np.ndarray, np.ndarray]:
+    """ The X and Z parts of the PauliOps packed into uint64 words. """
+    x_words = pack_bits(np.array([op.primitive.x for op in list_op.oplist], dtype=bool))
+    z_words = pack_bits(np.array([op.primitive.z for op in list_op.oplist], dtype=bool))
+    return x_words, z_words
+
+
+def _qubitwise_conflicts(x_words: np.ndarray, z_words: np.ndarray,
+                         other_x_words: np.ndarray, other_z_words: np.ndarray) -> np.ndarray:
+    """ Whether the Paulis differ on a qubit where both are not the identity, by broadcasting. """
+    return ((x_words | z_words) & (other_x_words | other_z_words) &
+            ((x_words ^ other_x_words) | (z_words ^ other_z_words))).any(axis=-1)
+
+
+def _commutation_blocks(list_op: ListOp,
+                        task: Callable[[int, np.ndarray, np.ndarray, int], Any],
+                        num_processes: int = 1) -> Iterator[Any]:
+    """ Apply ``task`` to the blocks of rows of the qubit-wise commutation matrix of the PauliOps,
+    each block using at most about ``_BLOCK_SIZE`` words of memory per intermediate array. The
+    results are yielded in order, computing ``num_processes`` blocks at a time. """
+    x_words, z_words = _packed_paulis(list_op)
+    num_ops, num_words = x_words.shape
+    block_rows = max(1, _BLOCK_SIZE // max(1, num_ops * num_words))
+    starts = list(range(0, num_ops, block_rows))
+    batch_size = max(1, num_processes)
+    for i in range(0, len(starts), batch_size):
+        yield from parallel_map(task, starts[i:i + batch_size],
+                                task_args=(x_words, z_words, block_rows),
+                                num_processes=num_processes)
+
+
+def _commutation_edge_block(start: int,
+                            x_words: np.ndarray,
+                            z_words: np.ndarray,
+                            block_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    stop = min(start + block_rows, len(x_words))
+    conflicts = _qubitwise_conflicts(x_words[start:stop, None], z_words[start:stop, None],
+                                     x_words[None, start:], z_words[None, start:])
+    rows, cols = np.nonzero(conflicts)
+    upper = cols > rows
+    return rows[upper] + start, cols[upper] + start
+
+
+def _degree_block(start: int,
+                  x_words: np.ndarray,
+                  z_words: np.ndarray,
+                  block_rows: int) -> np.ndarray:
+    stop = min(start + block_rows, len(x_words))
+    conflicts = _qubitwise_conflicts(x_words[start:stop, None], z_words[start:stop, None],
+                                     x_words[None, :], z_words[None, :])
+    return conflicts.sum(axis=1)
+
+
+def _insertion_coloring(x_words: np.ndarray,
+                        z_words: np.ndarray,
+                        order: np.ndarray) -> Dict[int, int]:
+    """ Insert the Paulis in the given order into the first group they commute with qubit-wise.
+    A group is represented by the Pauli combining its members, the only Pauli each member can
+    act with on each qubit. """
+    group_x = np.zeros((16, x_words.shape[1]), dtype=np.uint64)
+    group_z = np.zeros((16, x_words.shape[1]), dtype=np.uint64)
+    num_groups = 0
+    coloring = {}  # type: Dict[int, int]
+    for idx in order.tolist():
+        conflicts = _qubitwise_conflicts(x_words[idx], z_words[idx],
+                                         group_x[:num_groups], group_z[:num_groups])
+        compatible = np.flatnonzero(~conflicts)
+        if len(compatible):  # pylint: disable=len-as-condition
+            color = int(compatible[0])
+        else:
+            color = num_groups
+            num_groups += 1
+            if num_groups > len(group_x):
+                group_x = np.concatenate((group_x, np.zeros_like(group_x)))
+                group_z = np.concatenate((group_z, np.zeros_like(group_z)))
+        group_x[color] |= x_words[idx]
+        group_z[color] |= z_words[idx]
+        coloring[idx] = color
+    return coloring
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2020.
+# (C) Copyright IBM 2020, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,23 +12,32 @@
 
 """ CircuitSampler Class """
 
-from typing import Optional, Dict, List, Union, cast, Any, Tuple
+from typing import Optional, Dict, List, Union, cast, Any, Tuple, Callable
 import logging
+from collections import OrderedDict
 from functools import partial
 from time import time
+import types
 import numpy as np
 
 from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
 from qiskit.circuit import QuantumCircuit, Parameter, ParameterExpression
 from qiskit import QiskitError
+from qiskit.result import Result
+from qiskit.qobj import QasmQobj
+from qiskit.quantum_info import Pauli, SparsePauliOp, Operator, Statevector
 from qiskit.aqua import QuantumInstance, AquaError
 from qiskit.aqua.utils.backend_utils import is_aer_provider, is_statevector_backend
+from qiskit.aqua.utils.transpilation_cache import _circuit_fingerprint, _ordered_parameters
+from qiskit.aqua.utils.qobj_template import QobjTemplate
 from qiskit.aqua.operators.operator_base import OperatorBase
 from qiskit.aqua.operators.list_ops.list_op import ListOp
+from qiskit.aqua.operators.primitive_ops.primitive_op import PrimitiveOp
 from qiskit.aqua.operators.state_fns.state_fn import StateFn
 from qiskit.aqua.operators.state_fns.circuit_state_fn import CircuitStateFn
 from qiskit.aqua.operators.state_fns.dict_state_fn import DictStateFn
+from qiskit.aqua.operators.state_fns.cvar_measurement import CVaRMeasurement
 from qiskit.aqua.operators.converters.converter_base import ConverterBase
 
 logger = logging.getLogger(__name__)
@@ -45,15 +54,30 @@ class CircuitSampler(ConverterBase):
     state function, per the Born rule.
 
     The CircuitSampler aggressively caches transpiled circuits to handle re-parameterization of
-    the same circuit efficiently. If you are converting multiple different Operators,
-    you are better off using a different CircuitSampler for each Operator to avoid cache thrashing.
+    the same circuit efficiently. The reduced forms and the transpiled circuits of the most
+    recently converted Operators are kept, keyed on their structure (circuits, Pauli tables,
+    coefficients and ``Parameters``) rather than on their identity, so an Operator rebuilt equal
+    to one converted before, e.g. by an algorithm rebuilding its expectation value, is neither
+    reduced nor transpiled again. The transpiled circuits are shared by the Operators
+    containing the same circuits too.
+
+    Unless Aer's parameterized Qobj is used, see ``param_qobj``, the transpiled circuits are
+    assembled once into a :class:`~qiskit.aqua.utils.QobjTemplate`, whose instructions are
+    patched with the values of the parameters of each binding, instead of binding and
+    assembling the circuits again for each binding.
+
+    If the NumPy statevector simulation of the QuantumInstance is enabled, see its
+    ``numpy_statevector`` argument, the statevectors are simulated in the process instead of
+    being run on the backend, unless ``attach_results`` is set, since there are no backend
+    ``Results`` then.
     """
 
     def __init__(self,
                  backend: Union[Backend, BaseBackend, QuantumInstance],
                  statevector: Optional[bool] = None,
                  param_qobj: bool = False,
-                 attach_results: bool = False) -> None:
+                 attach_results: bool = False,
+                 cache_size: int = 8) -> None:
         """
         Args:
             backend: The quantum backend or QuantumInstance to use to sample the circuits.
@@ -65,10 +89,15 @@ class CircuitSampler(ConverterBase):
                 ``DictStateFn`` or ``VectorStateFn``.
             param_qobj: Whether to use Aer's parameterized Qobj capability to avoid re-assembling
                 the circuits.
+            cache_size: The maximum number of Operators whose reduced forms and transpiled
+                circuits are cached, the least recently converted ones being evicted first.
 
         Raises:
-            ValueError: Set statevector or param_qobj True when not supported by backend.
+            ValueError: Set statevector or param_qobj True when not supported by backend, or
+                invalid cache size.
         """
+        if cache_size < 1:
+            raise ValueError('cache_size must be at least 1, not {}.'.format(cache_size))
         self._quantum_instance = backend if isinstance(backend, QuantumInstance) else\
             QuantumInstance(backend=backend)
         self._statevector = statevector if statevector is not None \
@@ -85,7 +114,16 @@ class CircuitSampler(ConverterBase):
         self._transpiled_circ_cache = None  # type: Optional[List[Any]]
         self._transpiled_circ_templates = None  # type: Optional[List[Any]]
         self._transpile_before_bind = True
+        self._qobj_template = None  # type: Optional[QobjTemplate]
+        # the run configuration the Qobj template was built for
+        self._qobj_template_config = None  # type: Optional[Dict]
         self._binding_mappings = None
+        self._cache_size = cache_size
+        # the cached states of the operators, keyed on their fingerprints, and the transpiled
+        # circuits, keyed on the fingerprints of the circuits, least recently used first
+        self._operator_cache = OrderedDict()  # type: OrderedDict
+        self._operator_entry = None  # type: Optional[Dict[str, Any]]
+        self._transpiled_circs = OrderedDict()  # type: OrderedDict
 
     def _check_quantum_instance_and_modes_consistent(self) -> None:
         """ Checks whether the statevector and param_qobj settings are compatible with the
@@ -146,6 +184,11 @@ class CircuitSampler(ConverterBase):
             quantum_instance = QuantumInstance(quantum_instance)
         self._quantum_instance = quantum_instance
         self._check_quantum_instance_and_modes_consistent()
+        # the circuits transpiled for the previous backend must not be reused
+        self._last_op = None
+        self._operator_entry = None
+        self._operator_cache.clear()
+        self._transpiled_circs.clear()
 
     # pylint: disable=arguments-differ
     def convert(self,
@@ -169,13 +212,8 @@ class CircuitSampler(ConverterBase):
         Raises:
             AquaError: if extracted circuits are empty.
         """
-        if self._last_op is None or id(operator) != id(self._last_op):
-            # Clear caches
-            self._last_op = operator
-            self._reduced_op_cache = None
-            self._circuit_ops_cache = None
-            self._transpiled_circ_cache = None
-            self._transpile_before_bind = True
+        if self._last_op is None or operator is not self._last_op:
+            self._load_operator_entry(operator)
 
         if not self._reduced_op_cache:
             operator_dicts_replaced = operator.to_circuit_op()
@@ -226,6 +264,41 @@ class CircuitSampler(ConverterBase):
         else:
             return replace_circuits_with_dicts(self._reduced_op_cache, param_index=0)
 
+    def _load_operator_entry(self, operator: OperatorBase) -> None:
+        """ Saves the cached state of the last Operator and loads the one of ``operator``,
+        which is empty if no Operator with the same structure is cached. """
+        if self._operator_entry is not None:
+            self._operator_entry.update(
+                reduced_op=self._reduced_op_cache,
+                circuit_ops=self._circuit_ops_cache,
+                transpiled_circs=self._transpiled_circ_cache,
+                transpiled_templates=self._transpiled_circ_templates,
+                qobj_template=(self._qobj_template, self._qobj_template_config),
+                transpile_before_bind=self._transpile_before_bind)
+
+        key = _operator_fingerprint(operator)
+        entry = self._operator_cache.get(key)
+        if entry is None:
+            # the operator is kept alive, since its fingerprint may contain ids of its objects
+            entry = {'operator': operator, 'reduced_op': None, 'circuit_ops': None,
+                     'transpiled_circs': None, 'transpiled_templates': None,
+                     'qobj_template': (None, None), 'transpile_before_bind': True}
+            self._operator_cache[key] = entry
+            while len(self._operator_cache) > self._cache_size:
+                self._operator_cache.popitem(last=False)
+        else:
+            logger.debug('CircuitSampler reuses the cached conversion of an equal operator.')
+            self._operator_cache.move_to_end(key)
+
+        self._last_op = operator
+        self._operator_entry = entry
+        self._reduced_op_cache = entry['reduced_op']
+        self._circuit_ops_cache = entry['circuit_ops']
+        self._transpiled_circ_cache = entry['transpiled_circs']
+        self._transpiled_circ_templates = entry['transpiled_templates']
+        self._qobj_template, self._qobj_template_config = entry['qobj_template']
+        self._transpile_before_bind = entry['transpile_before_bind']
+
     def _extract_circuitstatefns(self, operator: OperatorBase) -> None:
         r"""
         Recursively extract the ``CircuitStateFns`` contained in operator into the
@@ -264,13 +337,16 @@ class CircuitSampler(ConverterBase):
 
         if circuit_sfns:
             self._transpiled_circ_templates = None
+            self._qobj_template = None
+            self._qobj_template_config = None
             if self._statevector:
                 circuits = [op_c.to_circuit(meas=False) for op_c in circuit_sfns]
             else:
                 circuits = [op_c.to_circuit(meas=True) for op_c in circuit_sfns]
 
             try:
-                self._transpiled_circ_cache = self.quantum_instance.transpile(circuits)
+                self._transpiled_circ_cache = self._transpile(circuits)
+                self._transpile_before_bind = True
             except QiskitError:
                 logger.debug(r'CircuitSampler failed to transpile circuits with unbound '
                              r'parameters. Attempting to transpile only when circuits are bound '
@@ -280,24 +356,70 @@ class CircuitSampler(ConverterBase):
         else:
             circuit_sfns = list(self._circuit_ops_cache.values())
 
+        if self._statevector and self.quantum_instance.numpy_statevector is not None \
+                and not self._attach_results:
+            # simulate the statevectors in the process, without qobj nor Result
+            start_time = time()
+            statevectors = self.quantum_instance.simulate_statevectors(
+                self._transpiled_circ_cache, param_bindings)
+            end_time = time()
+            logger.debug('NumPy statevector simulation %.5f (ms)', (end_time - start_time) * 1000)
+            with self.quantum_instance.metrics.measure(
+                    'post_processing', circuits=sum(map(len, statevectors))):
+                return {id(op_c): [StateFn(op_c.coeff * statevector,
+                                           is_measurement=op_c.is_measurement)
+                                   for statevector in circ_statevectors]
+                        for op_c, circ_statevectors in zip(circuit_sfns, statevectors)}
+
+        qobj = None
         if param_bindings is not None:
             if self._param_qobj:
                 start_time = time()
                 ready_circs = self._prepare_parameterized_run_config(param_bindings)
                 end_time = time()
                 logger.debug('Parameter conversion %.5f (ms)', (end_time - start_time) * 1000)
+                self.quantum_instance.metrics.record(
+                    'bind', end_time - start_time,
+                    circuits=len(self._transpiled_circ_cache) * len(param_bindings))
             else:
                 start_time = time()
-                ready_circs = [circ.assign_parameters(_filter_params(circ, binding))
-                               for circ in self._transpiled_circ_cache
-                               for binding in param_bindings]
+                qobj = self._bind_qobj_template(param_bindings)
+                if qobj is None:
+                    ready_circs = [circ.assign_parameters(_filter_params(circ, binding))
+                                   for circ in self._transpiled_circ_cache
+                                   for binding in param_bindings]
                 end_time = time()
                 logger.debug('Parameter binding %.5f (ms)', (end_time - start_time) * 1000)
+                self.quantum_instance.metrics.record(
+                    'bind', end_time - start_time,
+                    circuits=len(self._transpiled_circ_cache) * len(param_bindings))
         else:
             ready_circs = self._transpiled_circ_cache
 
-        results = self.quantum_instance.execute(ready_circs,
-                                                had_transpiled=self._transpile_before_bind)
+        reps = len(param_bindings) if param_bindings is not None else 1
+        sampled_statefns = {}  # type: Dict[int, StateFn]
+        # the time spent post-processing the results
+        post_processing_time = [0.]
+
+        def sample_partial_result(start_index, partial_result):
+            # post-process the circuits of a finished job while the other jobs are running
+            start = time()
+            for k in range(len(partial_result.results)):
+                circ_index = start_index + k
+                op_c = circuit_sfns[circ_index // reps]
+                sampled_statefns[circ_index] = self._build_statefn(partial_result, k, op_c)
+            post_processing_time[0] += time() - start
+
+        # the counts of partial results would not be mitigated
+        streaming = self.quantum_instance.measurement_error_mitigation_cls is None
+        if qobj is not None:
+            results = self.quantum_instance.execute_qobj(
+                qobj, result_callback=sample_partial_result if streaming else None)
+        else:
+            results = self.quantum_instance.execute(
+                ready_circs,
+                had_transpiled=self._transpile_before_bind,
+                result_callback=sample_partial_result if streaming else None)
 
         if param_bindings is not None and self._param_qobj:
             self._clean_parameterized_run_config()
@@ -305,42 +427,106 @@ class CircuitSampler(ConverterBase):
         # Wipe parameterizations, if any
         # self.quantum_instance._run_config.parameterizations = None
 
+        start_time = time()
         sampled_statefn_dicts = {}
         for i, op_c in enumerate(circuit_sfns):
             # Taking square root because we're replacing a statevector
             # representation of probabilities.
-            reps = len(param_bindings) if param_bindings is not None else 1
             c_statefns = []
             for j in range(reps):
                 circ_index = (i * reps) + j
-                circ_results = results.data(circ_index)
-
-                if 'expval_measurement' in circ_results.get('snapshots', {}).get(
-                        'expectation_value', {}):
-                    snapshot_data = results.data(circ_index)['snapshots']
-                    avg = snapshot_data['expectation_value']['expval_measurement'][0]['value']
-                    if isinstance(avg, (list, tuple)):
-                        # Aer versions before 0.4 use a list snapshot format
-                        # which must be converted to a complex value.
-                        avg = avg[0] + 1j * avg[1]
-                    # Will be replaced with just avg when eval is called later
-                    num_qubits = circuit_sfns[0].num_qubits
-                    result_sfn = DictStateFn('0' * num_qubits,
-                                             is_measurement=op_c.is_measurement) * avg
-                elif self._statevector:
-                    result_sfn = StateFn(op_c.coeff * results.get_statevector(circ_index),
-                                         is_measurement=op_c.is_measurement)
-                else:
-                    shots = self.quantum_instance._run_config.shots
-                    result_sfn = StateFn({b: (v / shots) ** 0.5 * op_c.coeff
-                                          for (b, v) in results.get_counts(circ_index).items()},
-                                         is_measurement=op_c.is_measurement)
-                if self._attach_results:
-                    result_sfn.execution_results = circ_results
+                result_sfn = sampled_statefns.get(circ_index)
+                if result_sfn is None:
+                    result_sfn = self._build_statefn(results, circ_index, op_c)
                 c_statefns.append(result_sfn)
             sampled_statefn_dicts[id(op_c)] = c_statefns
+        post_processing_time[0] += time() - start_time
+        self.quantum_instance.metrics.record('post_processing', post_processing_time[0],
+                                             circuits=len(circuit_sfns) * reps)
         return sampled_statefn_dicts
 
+    def _transpile(self, circuits: List[QuantumCircuit]) -> List[QuantumCircuit]:
+        """ Transpiles the circuits, reusing the ones transpiled for other Operators. """
+        # the circuits which cannot be described are transpiled, but not shared
+        keys = [_circuit_key(circuit) or ('circuit', i) for i, circuit in enumerate(circuits)]
+        missing = OrderedDict()  # type: OrderedDict
+        for key, circuit in zip(keys, circuits):
+            if key not in self._transpiled_circs:
+                missing.setdefault(key, circuit)
+        transpiled_missing = {}
+        if missing:
+            transpiled_missing = dict(zip(missing, self.quantum_instance.transpile(
+                list(missing.values()))))
+
+        transpiled_circs = []
+        for key, circuit in zip(keys, circuits):
+            if key in transpiled_missing:
+                transpiled_circ = transpiled_missing[key]
+                if key[0] != 'circuit':
+                    self._transpiled_circs[key] = transpiled_circ
+            else:
+                transpiled_circ = self._transpiled_circs[key]
+                self._transpiled_circs.move_to_end(key)
+            if transpiled_circ.name != circuit.name:
+                transpiled_circ = transpiled_circ.copy()
+                transpiled_circ.name = circuit.name
+            transpiled_circs.append(transpiled_circ)
+        # the least recently used transpiled circuits are evicted first
+        while len(self._transpiled_circs) > _CIRCUITS_PER_OPERATOR * self._cache_size:
+            self._transpiled_circs.popitem(last=False)
+        return transpiled_circs
+
+    def _bind_qobj_template(self, param_bindings: List[Dict[Parameter, float]]
+                            ) -> Optional[QasmQobj]:
+        """ Binds the Qobj template of the transpiled circuits, built on first use and for each
+        new run configuration, or returns None if the circuits are not bound in a template. """
+        if not self._transpile_before_bind:
+            return None
+        run_config = self.quantum_instance.run_config.to_dict()
+        if run_config != self._qobj_template_config:
+            self._qobj_template_config = run_config
+            try:
+                self._qobj_template = QobjTemplate(self._transpiled_circ_cache,
+                                                   self.quantum_instance.assemble,
+                                                   param_bindings[0])
+            except (AquaError, QiskitError) as ex:
+                logger.debug('CircuitSampler binds and assembles the circuits for each '
+                             'binding, they cannot be bound in a Qobj template: %s', ex)
+                self._qobj_template = None
+        if self._qobj_template is None:
+            return None
+        return self._qobj_template.bind(param_bindings)
+
+    def _build_statefn(self, results: Result, circ_index: int, op_c: CircuitStateFn) -> StateFn:
+        """ Build the StateFn replacing ``op_c`` from the ``circ_index``-th experiment result. """
+        circ_results = results.data(circ_index)
+
+        if 'expval_measurement' in circ_results.get('snapshots', {}).get(
+                'expectation_value', {}):
+            snapshot_data = results.data(circ_index)['snapshots']
+            avg = snapshot_data['expectation_value']['expval_measurement'][0]['value']
+            if isinstance(avg, (list, tuple)):
+                # Aer versions before 0.4 use a list snapshot format
+                # which must be converted to a complex value.
+                avg = avg[0] + 1j * avg[1]
+            # Will be replaced with just avg when eval is called later
+            num_qubits = op_c.num_qubits
+            result_sfn = DictStateFn('0' * num_qubits,
+                                     is_measurement=op_c.is_measurement) * avg
+        elif self._statevector:
+            result_sfn = StateFn(op_c.coeff * results.get_statevector(circ_index),
+                                 is_measurement=op_c.is_measurement)
+        else:
+            shots = self.quantum_instance._run_config.shots
+            counts = results.get_counts(circ_index)
+            amplitudes = np.sqrt(np.fromiter(counts.values(), dtype=float,
+                                             count=len(counts)) / shots) * op_c.coeff
+            result_sfn = DictStateFn.from_bitstrings(counts.keys(), amplitudes,
+                                                     is_measurement=op_c.is_measurement)
+        if self._attach_results:
+            result_sfn.execution_results = circ_results
+        return result_sfn
+
     def _build_aer_params(self,
                           circuit: QuantumCircuit,
                           building_param_tables: Dict[Tuple[int, int], List[float]],
@@ -407,3 +593,101 @@ class CircuitSampler(ConverterBase):
 def _filter_params(circuit, param_dict):
     """Remove all parameters from ``param_dict`` that are not in ``circuit``."""
     return {param: value for param, value in param_dict.items() if param in circuit.parameters}
+
+
+# the average number of transpiled circuits kept per cached operator
+_CIRCUITS_PER_OPERATOR = 32
+
+
+def _circuit_key(circuit: QuantumCircuit) -> Optional[Tuple]:
+    """ A hashable description of the circuit, including its ``Parameter`` instances, which are
+    bound by the users of the converted operators. The names of the registers, e.g. of the
+    classical registers generated for the measurements, are left out since the results are
+    looked up by the index of the circuit. None if the circuit cannot be described, e.g. if
+    the definition of a gate cannot be built with unbound parameters. """
+    try:
+        qregs, cregs, global_phase, data = _circuit_fingerprint(circuit)
+    except (QiskitError, TypeError, ValueError):
+        return None
+    return (tuple(size for _, size in qregs), tuple(size for _, size in cregs), global_phase,
+            data, tuple(_ordered_parameters(circuit)))
+
+
+def _value_key(value: Any) -> Any:  # pylint: disable=too-many-return-statements
+    """ A hashable description of a coefficient or of an argument of a recombination function.
+    """
+    if isinstance(value, ParameterExpression):
+        return str(value), tuple(sorted(value.parameters, key=lambda p: p.name))
+    if value is None or isinstance(value, (int, float, complex, str, np.number)):
+        return value
+    if isinstance(value, OperatorBase):
+        return _operator_fingerprint(value)
+    if isinstance(value, np.ndarray):
+        return _array_key(value)
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_value_key(item) for item in value)
+    if callable(value):
+        return _function_key(value)
+    return 'id', id(value)
+
+
+def _array_key(array: np.ndarray) -> Tuple:
+    array = np.asarray(array)
+    return array.shape, array.dtype.str, array.tobytes()
+
+
+def _function_key(function: Callable) -> Any:
+    """ A hashable description of a recombination function. Functions without state are
+    described by their code, so equal lambdas rebuilt for each ``ListOp`` are equal. """
+    if isinstance(function, partial):
+        return (partial, _function_key(function.func),
+                tuple(_value_key(arg) for arg in function.args),
+                tuple(sorted((name, _value_key(arg)) for name, arg in function.keywords.items())))
+    if isinstance(function, types.FunctionType):
+        if function.__closure__ is None and function.__defaults__ is None \
+                and not function.__kwdefaults__:
+            return function.__module__, function.__code__
+        return 'id', id(function)
+    if isinstance(function, (types.BuiltinFunctionType, np.ufunc)):
+        return function
+    return 'id', id(function)
+
+
+def _primitive_key(primitive: Any) -> Any:  # pylint: disable=too-many-return-statements
+    if isinstance(primitive, QuantumCircuit):
+        key = _circuit_key(primitive)
+        return key if key is not None else ('id', id(primitive))
+    if isinstance(primitive, OperatorBase):
+        return _operator_fingerprint(primitive)
+    if isinstance(primitive, SparsePauliOp):
+        return _array_key(primitive.table.array), _array_key(primitive.coeffs)
+    if isinstance(primitive, Pauli):
+        return _array_key(primitive.z), _array_key(primitive.x), primitive.phase
+    if isinstance(primitive, Operator):
+        return _array_key(primitive.data), primitive.input_dims(), primitive.output_dims()
+    if isinstance(primitive, Statevector):
+        return _array_key(primitive.data), primitive.dims()
+    if isinstance(primitive, np.ndarray):
+        return _array_key(primitive)
+    if isinstance(primitive, dict):
+        return tuple(sorted((key, _value_key(value)) for key, value in primitive.items()))
+    return 'id', id(primitive)
+
+
+def _operator_fingerprint(operator: OperatorBase) -> Tuple:
+    """ A hashable description of the structure of the operator. The parts which cannot be
+    described, e.g. sparse matrices or subclasses with additional state, are identified by their
+    ``id()``, so they only match themselves. """
+    if isinstance(operator, ListOp):
+        return (type(operator), _value_key(operator.coeff), operator.abelian,
+                _function_key(operator.combo_fn),
+                tuple(_operator_fingerprint(op) for op in operator.oplist))
+    if isinstance(operator, CVaRMeasurement):
+        return (type(operator), _value_key(operator.coeff), operator.alpha,
+                _primitive_key(operator.primitive))
+    if isinstance(operator, StateFn):
+        return (type(operator), _value_key(operator.coeff), operator.is_measurement,
+                _primitive_key(operator.primitive))
+    if isinstance(operator, PrimitiveOp):
+        return type(operator), _value_key(operator.coeff), _primitive_key(operator.primitive)
+    return 'id', id(operator)
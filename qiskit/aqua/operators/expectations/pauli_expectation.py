@@ -39,14 +39,18 @@ class PauliExpectation(ExpectationBase):
 
     """
 
-    def __init__(self, group_paulis: bool = True) -> None:
+    def __init__(self, group_paulis: bool = True, grouping_strategy: str = 'greedy_color') -> None:
         """
         Args:
             group_paulis: Whether to group the Pauli measurements into commuting sums, which all
                 have the same diagonalizing circuit.
+            grouping_strategy: The strategy of the :class:`AbelianGrouper` grouping the Pauli
+                measurements, one of ``'greedy_color'``, ``'largest_first'`` and
+                ``'sorted_insertion'``. The latter two need much less memory for observables with
+                many terms.
 
         """
-        self._grouper = AbelianGrouper() if group_paulis else None
+        self._grouper = AbelianGrouper(strategy=grouping_strategy) if group_paulis else None
 
     def convert(self, operator: OperatorBase) -> OperatorBase:
         """ Accepts an Operator and returns a new Operator with the Pauli measurements replaced by
@@ -15,8 +15,10 @@
 from .circuit_gradient import CircuitGradient
 from .lin_comb import LinComb
 from .param_shift import ParamShift
+from .adjoint_gradient import AdjointGradient
 
 __all__ = ['CircuitGradient',
            'LinComb',
-           'ParamShift'
+           'ParamShift',
+           'AdjointGradient'
            ]
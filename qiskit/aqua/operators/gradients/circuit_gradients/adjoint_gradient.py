@@ -0,0 +1,265 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The module to compute the gradient of an expectation value with the adjoint method."""
+
+from typing import Callable, Dict, List, Union, Optional, Tuple
+
+import numpy as np
+from qiskit.aqua import AquaError
+from qiskit.aqua.operators import OperatorBase, StateFn, CircuitStateFn, ComposedOp, ListOp
+from qiskit.circuit import ParameterExpression, ParameterVector
+from qiskit.circuit.library import RXGate, RYGate, RZGate, PhaseGate, UGate
+from qiskit.aqua.utils.numpy_statevector import apply_gate
+
+from .circuit_gradient import CircuitGradient
+from .param_shift import ParamShift
+from ..derivative_base import DerivativeBase
+
+# the gates exp(-i theta G / 2) with G^2 = 1, whose derivative is U(theta + pi) / 2
+_ROTATIONS = {'rx': RXGate, 'ry': RYGate, 'rz': RZGate}
+
+
+class AdjointGradient(CircuitGradient):
+    r"""Compute the gradient d⟨ψ(ω)|O|ψ(ω)〉/ dω of an expectation value with the adjoint method,
+    on a statevector simulated with NumPy.
+
+    The circuit is simulated once forward, to the state :math:`|ψ〉= U_N \cdots U_1|0〉`, and once
+    backward, applying the inverse of each gate :math:`U_k` to :math:`|ψ〉` and to
+    :math:`O|ψ〉`, which gives the derivatives with respect to the parameters of all the gates
+    from :math:`2 \mathrm{Re} ⟨ψ|O U_N \cdots U_{k+1} \partial U_k U_{k-1} \cdots U_1|0〉`.
+    The whole gradient thus costs about three simulations of the circuit, instead of a number of
+    circuit evaluations proportional to the number of parameters.
+
+    The gradient is evaluated in the process, the circuits are not run on a backend.
+    """
+
+    # pylint: disable=arguments-differ
+    def convert(self,
+                operator: OperatorBase,
+                params: Optional[Union[ParameterExpression, ParameterVector,
+                                       List[ParameterExpression],
+                                       Tuple[ParameterExpression, ParameterExpression],
+                                       List[Tuple[ParameterExpression,
+                                                  ParameterExpression]]]] = None) -> OperatorBase:
+        """
+        Args:
+            operator: The expectation value ``~StateFn(O) @ CircuitStateFn(ψ(ω))``, or a
+                ListOp of them, we are taking the gradient of. The observable O must not have
+                parameters.
+            params: The parameters we are taking the gradient wrt: ω
+
+        Returns:
+            An operator whose evaluation yields the gradient, once its parameters are bound.
+
+        Raises:
+            AquaError: If the operator is not an expectation value or the gradient is not a
+                first order one.
+        """
+        if isinstance(params, (ParameterExpression, ParameterVector)) or \
+                (isinstance(params, list)
+                 and all(isinstance(param, ParameterExpression) for param in params)):
+            return self._adjoint_gradient(operator, params)
+        raise AquaError('The adjoint gradient does only support the computation of 1st order '
+                        'gradients.')
+
+    def _adjoint_gradient(self,
+                          operator: OperatorBase,
+                          params: Union[ParameterExpression, ParameterVector, List]
+                          ) -> OperatorBase:
+        """
+        Args:
+            operator: The operator containing the expectation values.
+            params: The parameters we are taking the gradient wrt.
+
+        Returns:
+            An operator whose evaluation yields the gradient.
+
+        Raises:
+            AquaError: If the operator is not an expectation value.
+        """
+        if isinstance(operator, ListOp) and not isinstance(operator, ComposedOp):
+            return operator.traverse(lambda op: self._adjoint_gradient(op, params))
+
+        if not isinstance(operator, ComposedOp) or len(operator.oplist) != 2 \
+                or not isinstance(operator.oplist[1], CircuitStateFn) \
+                or not operator.oplist[0].is_measurement \
+                or isinstance(operator.oplist[0], CircuitStateFn):
+            raise AquaError('The adjoint gradient is only supported for expectation values '
+                            '~StateFn(O) @ CircuitStateFn(ψ(ω)).')
+        measurement, state = operator.oplist
+        if measurement.parameters or any(isinstance(op.coeff, ParameterExpression)
+                                         for op in [operator, measurement, state]):
+            raise AquaError('The adjoint gradient is only supported for observables and '
+                            'coefficients without parameters.')
+
+        circuit = ParamShift._unroll_to_supported_operations(state.primitive)
+        observable = _observable_matrix(measurement)
+        circuit_params = sorted(circuit.parameters, key=lambda param: param.name)
+        is_single = isinstance(params, ParameterExpression)
+        grad_params = [params] if is_single else list(params)
+        # the gates, and the expressions of their parameters and their derivatives
+        gates = []
+        for inst, qargs, _ in circuit.data:
+            if inst.name == 'barrier':
+                continue
+            if inst.name in ('measure', 'reset'):
+                raise AquaError('The adjoint gradient is only supported for unitary circuits.')
+            qubits = [circuit.find_bit(qubit).index if hasattr(circuit, 'find_bit')
+                      else circuit.qubits.index(qubit) for qubit in qargs]
+            expr_grads = [[DerivativeBase.parameter_expression_grad(expr, param)
+                           for param in grad_params] for expr in inst.params]
+            gates.append((inst, qubits, expr_grads))
+        num_qubits = circuit.num_qubits
+        fixed_coeff = operator.coeff * measurement.coeff * np.abs(state.coeff) ** 2
+
+        def gradient_fn(binds):
+            grad = fixed_coeff * _adjoint_sweep(gates, binds, observable, num_qubits,
+                                                len(grad_params))
+            return grad[0] if is_single else grad
+
+        return _AdjointGradientOp(gradient_fn, circuit_params)
+
+
+class _AdjointGradientOp(ListOp):
+    """ The gradient of an expectation value, evaluated with the adjoint method once the values of
+    the parameters of the circuit are assigned. """
+
+    def __init__(self,
+                 gradient_fn: Callable,
+                 params: List[ParameterExpression],
+                 binds: Optional[Dict[ParameterExpression, float]] = None,
+                 coeff: Union[int, float, complex] = 1.0) -> None:
+        """
+        Args:
+            gradient_fn: The function returning the gradient for the values of the parameters.
+            params: The parameters of the circuit.
+            binds: The values assigned to the parameters so far.
+            coeff: A coefficient multiplying the gradient.
+        """
+        super().__init__([], coeff=coeff)
+        self._gradient_fn = gradient_fn
+        self._params = params
+        self._binds = binds or {}
+
+    @property
+    def num_qubits(self) -> int:
+        return 0
+
+    @property
+    def parameters(self):
+        return {param for param in self._params if param not in self._binds}
+
+    def assign_parameters(self, param_dict: dict) -> OperatorBase:
+        unrolled_dict = self._unroll_param_dict(param_dict)
+        if isinstance(unrolled_dict, list):
+            return ListOp([self.assign_parameters(param_dict) for param_dict in unrolled_dict])
+        binds = dict(self._binds)
+        binds.update({param: float(np.real(value)) for param, value in unrolled_dict.items()
+                      if param in self._params})
+        return _AdjointGradientOp(self._gradient_fn, self._params, binds, self.coeff)
+
+    def mul(self, scalar: Union[int, float, complex, ParameterExpression]) -> OperatorBase:
+        if isinstance(scalar, ParameterExpression):
+            raise AquaError('The adjoint gradient does not support parameters in coefficients.')
+        return _AdjointGradientOp(self._gradient_fn, self._params, self._binds,
+                                  scalar * self.coeff)
+
+    def reduce(self) -> OperatorBase:
+        return self
+
+    def equals(self, other: OperatorBase) -> bool:
+        return isinstance(other, _AdjointGradientOp) \
+            and self._gradient_fn is other._gradient_fn and self._binds == other._binds \
+            and self.coeff == other.coeff
+
+    def eval(self,
+             front: Optional[Union[str, Dict[str, complex], OperatorBase]] = None
+             ) -> Union[float, np.ndarray]:
+        if front is not None:
+            raise AquaError('The adjoint gradient is evaluated without a front.')
+        if self.parameters:
+            raise AquaError('The values of the parameters {} of the adjoint gradient are not '
+                            'assigned.'.format(self.parameters))
+        return self.coeff * self._gradient_fn(self._binds)
+
+    def __str__(self) -> str:
+        main_string = 'AdjointGradient({})'.format(
+            ', '.join(str(param) for param in self._params))
+        if self.coeff != 1.0:
+            main_string = '{} * '.format(self.coeff) + main_string
+        return main_string
+
+    def __repr__(self) -> str:
+        return '{}({}, binds={}, coeff={})'.format(self.__class__.__name__, self._params,
+                                                   self._binds, self.coeff)
+
+
+def _observable_matrix(measurement: StateFn):
+    """ Returns the (sparse) matrix of the observable measured. """
+    primitive = measurement.primitive
+    try:
+        return primitive.to_spmatrix()
+    except (AttributeError, NotImplementedError, TypeError):
+        return primitive.to_matrix()
+
+
+def _bind(expr, binds):
+    """ Returns the value of a parameter expression. """
+    if not isinstance(expr, ParameterExpression):
+        return expr
+    return complex(expr.bind({param: binds[param] for param in expr.parameters})).real
+
+
+def _gate_matrices(inst, values):
+    """ Returns the matrix of a gate and its derivatives with respect to its parameters. """
+    if inst.name in _ROTATIONS:
+        gate = _ROTATIONS[inst.name]
+        return gate(values[0]).to_matrix(), [gate(values[0] + np.pi).to_matrix() / 2]
+    if inst.name == 'p':
+        matrix = PhaseGate(values[0]).to_matrix()
+        return matrix, [np.diag([0, 1j]) @ matrix]
+    if inst.name == 'u':
+        matrix = UGate(*values).to_matrix()
+        return matrix, [UGate(values[0] + np.pi, *values[1:]).to_matrix() / 2,
+                        np.diag([0, 1j]) @ matrix, matrix @ np.diag([0, 1j])]
+    if values:
+        raise AquaError('The adjoint gradient does not support the gate {}.'.format(inst.name))
+    return inst.to_matrix(), []
+
+
+def _adjoint_sweep(gates, binds, observable, num_qubits, num_params):
+    """ Returns the gradient of ⟨ψ|O|ψ〉 with respect to the parameters, by a forward and a
+    backward simulation of the gates. """
+    shape = (2,) * num_qubits
+    state = np.zeros(2 ** num_qubits, dtype=complex)
+    state[0] = 1
+    state = state.reshape(shape)
+    matrices = []
+    for inst, qubits, _ in gates:
+        values = [_bind(expr, binds) for expr in inst.params]
+        matrix, derivatives = _gate_matrices(inst, values)
+        matrices.append((matrix, derivatives))
+        state = apply_gate(matrix, state, qubits)
+
+    # lam = O|psi>, and the gates are undone one by one on both states
+    lam = (observable @ state.reshape(-1)).reshape(shape)
+    grad = np.zeros(num_params)
+    for (_, qubits, expr_grads), (matrix, derivatives) in reversed(list(zip(gates, matrices))):
+        state = apply_gate(matrix.conj().T, state, qubits)
+        for derivative, param_grads in zip(derivatives, expr_grads):
+            if all(param_grad == 0 for param_grad in param_grads):
+                continue
+            d_value = 2 * np.real(np.vdot(lam, apply_gate(derivative, state, qubits)))
+            grad += d_value * np.array([_bind(param_grad, binds) for param_grad in param_grads])
+        lam = apply_gate(matrix.conj().T, lam, qubits)
+    return grad
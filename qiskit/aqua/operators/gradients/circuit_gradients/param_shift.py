@@ -15,18 +15,19 @@
 from collections.abc import Iterable
 from copy import deepcopy
 from functools import partial
-from typing import List, Union, Optional, Tuple, Dict
+from typing import Callable, Iterable as IterableType, List, Union, Optional, Tuple, Dict
 
 import numpy as np
 from qiskit import transpile, QuantumCircuit
-from qiskit.aqua import AquaError
+from qiskit.aqua import AquaError, QuantumInstance
 from qiskit.aqua.operators import (OperatorBase, StateFn, Zero, One, CircuitStateFn,
-                                   CircuitOp)
+                                   CircuitOp, CircuitSampler, PauliExpectation)
 from qiskit.aqua.operators import SummedOp, ListOp, ComposedOp, DictStateFn, VectorStateFn
 from qiskit.aqua.operators.gradients.circuit_gradients.circuit_gradient \
     import CircuitGradient
 from qiskit.aqua.operators.gradients.derivative_base import DerivativeBase
 from qiskit.circuit import Parameter, ParameterExpression, ParameterVector
+from qiskit.providers import BaseBackend
 
 
 class ParamShift(CircuitGradient):
@@ -116,6 +117,154 @@ class ParamShift(CircuitGradient):
             raise AquaError('The linear combination gradient does only support the computation '
                             'of 1st gradients and 2nd order gradients.')
 
+    def gradient_wrapper(self,
+                         operator: OperatorBase,
+                         bind_params: Union[ParameterExpression, ParameterVector,
+                                            List[ParameterExpression]],
+                         grad_params: Optional[Union[ParameterExpression, ParameterVector,
+                                                     List[ParameterExpression]]] = None,
+                         backend: Optional[Union[BaseBackend, QuantumInstance]] = None) \
+            -> Callable[[IterableType], np.ndarray]:
+        """Get a callable function which provides the gradient of an expectation value
+        ⟨ψ(ω)|O|ψ(ω)〉, or of the sampling probabilities of a state |ψ(ω)〉, given by a single
+        circuit for given parameter values.
+
+        Instead of a shifted copy of the operator for each occurrence of each parameter, each
+        occurrence is replaced by a new parameter in a single circuit, and all the shifted points
+        are evaluated as one batch of parameter bindings of this circuit by a
+        :class:`~qiskit.aqua.operators.CircuitSampler`, which transpiles it once.
+
+        Args:
+            operator: The operator ``~StateFn(O) @ CircuitStateFn(ψ(ω))`` or the state
+                ``CircuitStateFn(ψ(ω))``.
+            bind_params: The operator parameters to which the parameter values are assigned.
+            grad_params: The parameters with respect to which we are taking the gradient.
+                If grad_params = None, then grad_params = bind_params
+            backend: The quantum backend or QuantumInstance to use to evaluate the gradient.
+
+        Returns:
+            callable(param_values): Function to compute the gradient. The function takes an
+            iterable as argument which holds the parameter values.
+
+        Raises:
+            AquaError: If the operator is not a single circuit, or its expectation value with
+                an operator without parameters.
+        """
+        if grad_params is None:
+            grad_params = bind_params
+        if isinstance(grad_params, ParameterExpression):
+            grad_params = [grad_params]
+        if not self._supports_bound_shifts(operator, bind_params, grad_params):
+            raise AquaError('The shifted parameter bindings are only supported for the '
+                            'expectation value of a single circuit, or its state.')
+
+        circ = self.get_unique_circuits(operator)[0]
+        if self.analytic:
+            circ = ParamShift._unroll_to_supported_operations(circ)
+            shift, shift_constant = np.pi / 2, 0.5
+        else:
+            shift, shift_constant = self._epsilon, 1. / (2 * self._epsilon)
+
+        # Replace each occurrence of a gradient parameter by a new parameter
+        grad_param_set = set(grad_params)
+        occurrences = [(inst, index) for inst, _, _ in circ.data
+                       for index, inst_param in enumerate(inst.params)
+                       if isinstance(inst_param, ParameterExpression)
+                       and inst_param.parameters & grad_param_set]
+        shift_params = ParameterVector('_shift', len(occurrences))
+        shift_param_of = {(id(inst), index): shift_param
+                          for (inst, index), shift_param in zip(occurrences, shift_params)}
+        template = QuantumCircuit(*circ.qregs, *circ.cregs, name=circ.name,
+                                  global_phase=circ.global_phase)
+        for inst, qargs, cargs in circ.data:
+            indices = [index for index in range(len(inst.params))
+                       if (id(inst), index) in shift_param_of]
+            if indices:
+                shift_inst = inst.copy()
+                for index in indices:
+                    shift_inst.params[index] = shift_param_of[(id(inst), index)]
+                inst = shift_inst
+            template._append(inst, qargs, cargs)
+        expressions = [inst.params[index] for inst, index in occurrences]
+        # d(expression) / d(param) for each occurrence and parameter
+        expression_grads = [[DerivativeBase.parameter_expression_grad(expr, param)
+                             if expr != param else 1. for expr in expressions]
+                            for param in grad_params]
+        other_params = [param for param in template.parameters if param not in shift_params]
+
+        template_op = ParamShift._replace_operator_circuit(operator, template)
+        if isinstance(operator, ComposedOp):
+            template_op = PauliExpectation().convert(template_op)
+        sampler = CircuitSampler(backend=backend)
+        num_shifts = len(occurrences)
+
+        def value(expr, values):
+            if not isinstance(expr, ParameterExpression):
+                return float(expr)
+            return float(expr.bind({param: values[param] for param in expr.parameters}))
+
+        def gradient_fn(p_values):
+            if not num_shifts:
+                return np.zeros(len(grad_params))
+            values = dict(zip(bind_params, p_values))
+            points = np.tile([value(expr, values) for expr in expressions], (2 * num_shifts, 1))
+            points[np.arange(num_shifts), np.arange(num_shifts)] += shift
+            points[np.arange(num_shifts, 2 * num_shifts), np.arange(num_shifts)] -= shift
+            bindings = {shift_param: points[:, k].tolist()
+                        for k, shift_param in enumerate(shift_params)}
+            bindings.update({param: [values[param]] * (2 * num_shifts) for param in other_params})
+            shifted_ops = sampler.convert(template_op, params=bindings).oplist
+
+            if isinstance(operator, ComposedOp):
+                results = np.array([op.eval() for op in shifted_ops])
+                shift_grads = shift_constant * (results[:num_shifts] - results[num_shifts:])
+            else:
+                shift_grads = [ListOp([shifted_ops[k], shifted_ops[num_shifts + k]],
+                                      combo_fn=partial(self._prob_combo_fn,
+                                                       shift_constant=shift_constant)).eval()
+                               for k in range(num_shifts)]
+            grads = [sum(value(expr_grad, values) * shift_grad
+                         for expr_grad, shift_grad in zip(param_expr_grads, shift_grads))
+                     for param_expr_grads in expression_grads]
+            return np.real(grads)
+
+        return gradient_fn
+
+    def _supports_bound_shifts(self,
+                               operator: OperatorBase,
+                               bind_params: Union[ParameterExpression, ParameterVector,
+                                                  List[ParameterExpression]],
+                               grad_params: Union[ParameterExpression, ParameterVector,
+                                                  List[ParameterExpression]]) -> bool:
+        """Whether :meth:`gradient_wrapper` supports the operator and parameters.
+
+        Args:
+            operator: The operator for which we want to get the gradient.
+            bind_params: The operator parameters to which the parameter values are assigned.
+            grad_params: The parameters with respect to which we are taking the gradient.
+
+        Returns:
+            True if the operator is the expectation value with an operator without parameters
+            or the state of a single circuit, of which all parameters are bound, and the
+            gradient is a first order one.
+        """
+        if isinstance(grad_params, ParameterExpression):
+            grad_params = [grad_params]
+        if not all(isinstance(param, Parameter) for param in grad_params):
+            return False
+        if isinstance(operator, ComposedOp):
+            if len(operator.oplist) != 2 or not isinstance(operator.oplist[1], CircuitStateFn) \
+                    or not operator.oplist[0].is_measurement \
+                    or isinstance(operator.oplist[0], CircuitStateFn) \
+                    or operator.oplist[0].parameters:
+                return False
+        elif not isinstance(operator, CircuitStateFn):
+            return False
+        coeffs = [operator.coeff] + [op.coeff for op in getattr(operator, 'oplist', [])]
+        if any(isinstance(coeff, ParameterExpression) for coeff in coeffs):
+            return False
+        return operator.parameters.issubset(bind_params)
+
     # pylint: disable=too-many-return-statements
     def _parameter_shift(self,
                          operator: OperatorBase,
@@ -12,11 +12,12 @@
 
 """The base interface for Aqua's gradient."""
 
-from typing import Union, List, Optional
+from typing import Callable, Iterable, Union, List, Optional, Tuple
 
 import numpy as np
-from qiskit.aqua import AquaError
+from qiskit.aqua import AquaError, QuantumInstance
 from qiskit.aqua.operators import PauliExpectation
+from qiskit.aqua.operators.gradients.circuit_gradients import ParamShift, AdjointGradient
 from qiskit.aqua.operators.gradients.gradient_base import GradientBase
 from qiskit.aqua.operators.list_ops.composed_op import ComposedOp
 from qiskit.aqua.operators.list_ops.list_op import ListOp
@@ -26,6 +27,7 @@ from qiskit.aqua.operators.operator_base import OperatorBase
 from qiskit.aqua.operators.operator_globals import Zero, One
 from qiskit.aqua.operators.state_fns.circuit_state_fn import CircuitStateFn
 from qiskit.circuit import ParameterExpression, ParameterVector
+from qiskit.providers import BaseBackend
 
 try:
     from jax import grad, jit
@@ -57,6 +59,10 @@ class Gradient(GradientBase):
         if params is None:
             raise ValueError("No parameters were provided to differentiate")
 
+        if isinstance(self.grad_method, AdjointGradient):
+            # the adjoint method computes the gradient w.r.t. all the parameters at once
+            return self.grad_method.convert(operator, params)
+
         if isinstance(params, (ParameterVector, list)):
             param_grads = [self.convert(operator, param) for param in params]
             absent_params = [params[i]
@@ -74,6 +80,46 @@ class Gradient(GradientBase):
         cleaned_op = self._factor_coeffs_out_of_composed_op(expec_op)
         return self.get_gradient(cleaned_op, param)
 
+    def gradient_wrapper(self,
+                         operator: OperatorBase,
+                         bind_params: Union[ParameterExpression, ParameterVector,
+                                            List[ParameterExpression]],
+                         grad_params: Optional[Union[ParameterExpression, ParameterVector,
+                                                     List[ParameterExpression],
+                                                     Tuple[ParameterExpression,
+                                                           ParameterExpression],
+                                                     List[Tuple[ParameterExpression,
+                                                                ParameterExpression]]]] = None,
+                         backend: Optional[Union[BaseBackend, QuantumInstance]] = None) \
+            -> Callable[[Iterable], np.ndarray]:
+        """Get a callable function which provides the gradient for given parameter values.
+        This callable can be used as gradient function for optimizers.
+
+        With the parameter shift method and a backend, the gradient of the expectation value of
+        a single circuit, or of its sampling probabilities, is evaluated by
+        :meth:`~qiskit.aqua.operators.gradients.circuit_gradients.ParamShift.gradient_wrapper`,
+        which binds all the shifted parameters to a single circuit. With the adjoint method, the
+        gradient is evaluated in the process and the backend is not used.
+
+        Args:
+            operator: The operator for which we want to get the gradient.
+            bind_params: The operator parameters to which the parameter values are assigned.
+            grad_params: The parameters with respect to which we are taking the gradient.
+                If grad_params = None, then grad_params = bind_params
+            backend: The quantum backend or QuantumInstance to use to evaluate the gradient.
+
+        Returns:
+            callable(param_values): Function to compute the gradient. The function takes an
+            iterable as argument which holds the parameter values.
+        """
+        if isinstance(self.grad_method, ParamShift) and backend is not None \
+                and self.grad_method._supports_bound_shifts(operator, bind_params,
+                                                            grad_params or bind_params):
+            return self.grad_method.gradient_wrapper(operator, bind_params, grad_params, backend)
+        if isinstance(self.grad_method, AdjointGradient):
+            backend = None
+        return super().gradient_wrapper(operator, bind_params, grad_params, backend)
+
     # pylint: disable=too-many-return-statements
     def get_gradient(self,
                      operator: OperatorBase,
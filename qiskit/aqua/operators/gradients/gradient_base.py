@@ -30,7 +30,8 @@ class GradientBase(DerivativeBase):  # pylint: disable=abstract-method
         r"""
         Args:
             grad_method: The method used to compute the state/probability gradient. Can be either
-                         ``'param_shift'`` or ``'lin_comb'`` or ``'fin_diff'``.
+                         ``'param_shift'`` or ``'lin_comb'`` or ``'fin_diff'`` or ``'adjoint'``,
+                         for the gradients of expectation values only.
                          Ignored for gradients w.r.t observable parameters.
             kwargs (dict): Optional parameters for a CircuitGradient
 
@@ -52,10 +53,14 @@ class GradientBase(DerivativeBase):  # pylint: disable=abstract-method
         elif grad_method == 'lin_comb':
             from .circuit_gradients.lin_comb import LinComb
             self._grad_method = LinComb()
+
+        elif grad_method == 'adjoint':
+            from .circuit_gradients.adjoint_gradient import AdjointGradient
+            self._grad_method = AdjointGradient()
         else:
             raise ValueError("Unrecognized input provided for `grad_method`. Please provide"
                              " a CircuitGradient object or one of the pre-defined string"
-                             " arguments: {'param_shift', 'fin_diff', 'lin_comb'}. ")
+                             " arguments: {'param_shift', 'fin_diff', 'lin_comb', 'adjoint'}. ")
 
     @property
     def grad_method(self) -> CircuitGradient:
@@ -48,7 +48,7 @@ class NaturalGradient(GradientBase):
         r"""
         Args:
             grad_method: The method used to compute the state gradient. Can be either
-                ``'param_shift'`` or ``'lin_comb'`` or ``'fin_diff'``.
+                ``'param_shift'`` or ``'lin_comb'`` or ``'fin_diff'`` or ``'adjoint'``.
             qfi_method: The method used to compute the QFI. Can be either
                 ``'lin_comb_full'`` or ``'overlap_block_diag'`` or ``'overlap_diag'``.
             regularization: Use the following regularization with a least square method to solve the
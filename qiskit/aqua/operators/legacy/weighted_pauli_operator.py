@@ -379,10 +379,17 @@ class WeightedPauliOperator(LegacyBaseOperator):
         # pauli and tpb grouped pauli
         # should have a better way to rebuild the basis here.
         new_basis = []
+        # Pauli bases are looked up by label, other bases by comparing them in turn
+        new_basis_table = {}
         for basis, indices in op.basis:
             new_indices = []
             found = False
-            if new_basis:
+            if isinstance(basis, Pauli):
+                basis_idx = new_basis_table.get(basis.to_label(), None)
+                if basis_idx is not None:
+                    new_indices = new_basis[basis_idx][1]
+                    found = True
+            elif new_basis:
                 for b, ind in new_basis:
                     if b == basis:
                         new_indices = ind
@@ -393,6 +400,8 @@ class WeightedPauliOperator(LegacyBaseOperator):
                 if new_idx is not None and new_idx not in new_indices:
                     new_indices.append(new_idx)
             if new_indices and not found:
+                if isinstance(basis, Pauli):
+                    new_basis_table[basis.to_label()] = len(new_basis)
                 new_basis.append((basis, new_indices))
         op._basis = new_basis
         op.chop(0.0)
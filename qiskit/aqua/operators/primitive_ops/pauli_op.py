@@ -29,6 +29,7 @@ from ..list_ops.summed_op import SummedOp
 from ..list_ops.tensored_op import TensoredOp
 from ..legacy.weighted_pauli_operator import WeightedPauliOperator
 from ... import AquaError
+from ...utils.bit_packing import pack_bits, parity
 
 logger = logging.getLogger(__name__)
 PAULI_GATE_MAPPING = {'X': XGate(), 'Y': YGate(), 'Z': ZGate(), 'I': IGate()}
@@ -214,7 +215,11 @@ class PauliOp(PrimitiveOp):
                     '{} and {}, respectively.'.format(
                         self.num_qubits, front.num_qubits))
 
-            if isinstance(front, DictStateFn):
+            # pylint: disable=protected-access
+            if isinstance(front, DictStateFn) and front._sparse_arrays() is not None:
+                new_front = self._eval_sparse_arrays(front)
+
+            elif isinstance(front, DictStateFn):
 
                 new_dict = {}  # type: Dict
                 corrected_x_bits = self.primitive.x[::-1]  # type: ignore
@@ -243,6 +248,27 @@ class PauliOp(PrimitiveOp):
 
         return new_front
 
+    def _eval_sparse_arrays(self, front: OperatorBase) -> OperatorBase:
+        """ Apply the Pauli to the sparse array representation of a DictStateFn. """
+        # pylint: disable=import-outside-toplevel,protected-access
+        from ..state_fns.dict_state_fn import DictStateFn
+        indices, values, num_qubits = front._sparse_arrays()  # type: ignore
+        x_bits = self.primitive.x  # type: ignore
+        z_bits = self.primitive.z  # type: ignore
+        # qubit i is the bit i of the basis state index
+        x_mask = pack_bits(x_bits)[0]
+        z_mask = pack_bits(z_bits)[0]
+
+        # Z flips the sign of the states with an odd number of ones on the Z support
+        z_factor = 1. - 2. * parity(indices & z_mask)
+        # each Y contributes a factor i on top of its X and Z parts
+        y_factor = (1, 1j, -1, -1j)[int(np.sum(np.logical_and(x_bits, z_bits))) % 4]
+
+        return DictStateFn.from_sparse_arrays(indices ^ x_mask,
+                                              values * z_factor * (y_factor + 0j),
+                                              num_qubits,
+                                              coeff=self.coeff * front.coeff)
+
     def exp_i(self) -> OperatorBase:
         """ Return a ``CircuitOp`` equivalent to e^-iH for this operator H. """
         # if only one qubit is significant, we can perform the evolution
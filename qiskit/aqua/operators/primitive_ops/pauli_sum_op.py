@@ -22,6 +22,7 @@ from qiskit.circuit import Instruction, ParameterExpression
 from qiskit.quantum_info import Pauli, SparsePauliOp
 
 from ... import AquaError
+from ...utils.bit_packing import pack_bits, parity, popcount
 from ..list_ops.summed_op import SummedOp
 from ..list_ops.tensored_op import TensoredOp
 from ..operator_base import OperatorBase
@@ -29,6 +30,9 @@ from .primitive_op import PrimitiveOp
 
 logger = logging.getLogger(__name__)
 
+# number of (term, basis state) pairs processed at once by the DictStateFn evaluation
+_EVAL_BLOCK_SIZE = 2 ** 20
+
 
 class PauliSumOp(PrimitiveOp):
     """Class for Operators backend by Terra's ``SparsePauliOp`` class."""
@@ -246,27 +250,31 @@ class PauliSumOp(PrimitiveOp):
                     "{} and {}, respectively.".format(self.num_qubits, front.num_qubits)
                 )
 
-            if isinstance(front, DictStateFn):
+            # pylint: disable=protected-access
+            if isinstance(front, DictStateFn) and front._sparse_arrays() is not None:
+                return self._eval_sparse_arrays(front)
+
+            elif isinstance(front, DictStateFn):
 
                 new_dict = {}  # type: Dict
-                corrected_x_bits = self.primitive.table.X[::-1]  # type: ignore
-                corrected_z_bits = self.primitive.table.Z[::-1]  # type: ignore
+                corrected_x_bits = self.primitive.table.X[:, ::-1]  # type: ignore
+                corrected_z_bits = self.primitive.table.Z[:, ::-1]  # type: ignore
                 coeffs = self.primitive.coeffs  # type:ignore
+                y_factor = np.product(
+                    np.sqrt(1 - 2 * np.logical_and(corrected_x_bits, corrected_z_bits) + 0j),
+                    axis=1,
+                )
 
                 for bstr, v in front.primitive.items():
-                    bitstr = np.asarray(list(bstr)).astype(np.int).astype(np.bool)
+                    bitstr = np.asarray(list(bstr)).astype(int).astype(bool)
                     new_b_str = np.logical_xor(bitstr, corrected_x_bits)
                     new_str = ["".join(map(str, 1 * bs)) for bs in new_b_str]
                     z_factor = np.product(1 - 2 * np.logical_and(bitstr, corrected_z_bits), axis=1)
-                    y_factor = np.product(
-                        np.sqrt(1 - 2 * np.logical_and(corrected_x_bits, corrected_z_bits) + 0j),
-                        axis=1,
-                    )
                     for i, n_str in enumerate(new_str):
                         new_dict[n_str] = (
                             v * z_factor[i] * y_factor[i] * coeffs[i]
                         ) + new_dict.get(n_str, 0)
-                    return DictStateFn(new_dict, coeff=self.coeff * front.coeff)
+                return DictStateFn(new_dict, coeff=self.coeff * front.coeff)
 
             elif isinstance(front, StateFn) and front.is_measurement:
                 raise ValueError("Operator composed with a measurement is undefined.")
@@ -278,6 +286,81 @@ class PauliSumOp(PrimitiveOp):
         # Covers VectorStateFn and OperatorStateFn
         return self.to_matrix_op().eval(front.to_matrix_op())  # type: ignore
 
+    def _packed_terms(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ The X and Z qubit masks of the terms, packed into uint64 words, and the coefficients
+        of the terms including the factor i of each Y. Requires at most 64 qubits. """
+        table = self.primitive.table  # type: ignore
+        x_masks = pack_bits(table.X)[:, 0]
+        z_masks = pack_bits(table.Z)[:, 0]
+        y_phases = np.array([1, 1j, -1, -1j])[popcount(x_masks & z_masks) % 4]
+        return x_masks, z_masks, self.primitive.coeffs * y_phases  # type: ignore
+
+    def _eval_sparse_arrays(self, front: OperatorBase) -> OperatorBase:
+        """ Apply all the terms to the sparse array representation of a DictStateFn at once,
+        reducing the flipped basis states of a block of terms at a time. """
+        # pylint: disable=import-outside-toplevel,protected-access
+        from ..state_fns.dict_state_fn import DictStateFn
+        indices, values, num_qubits = front._sparse_arrays()  # type: ignore
+        x_masks, z_masks, phases = self._packed_terms()
+
+        result = DictStateFn.from_sparse_arrays([], np.zeros(0, dtype=complex), num_qubits)
+        block_size = max(1, _EVAL_BLOCK_SIZE // max(1, len(indices)))
+        for start in range(0, len(x_masks), block_size):
+            block = slice(start, start + block_size)
+            new_indices = indices[None, :] ^ x_masks[block, None]
+            signs = 1. - 2. * parity(indices[None, :] & z_masks[block, None])
+            new_values = values[None, :] * signs * phases[block, None]
+            result_indices, result_values, _ = result._sparse_arrays()
+            result = DictStateFn.from_sparse_arrays(
+                np.concatenate((result_indices, new_indices.ravel())),
+                np.concatenate((result_values, new_values.ravel())),
+                num_qubits)
+
+        result_indices, result_values, _ = result._sparse_arrays()
+        return DictStateFn.from_sparse_arrays(result_indices, result_values, num_qubits,
+                                              coeff=self.coeff * front.coeff)
+
+    def _expectation_sparse_arrays(self, front: OperatorBase) -> Optional[Union[float, complex]]:
+        """ The expectation value of the operator with respect to the sparse array representation
+        of a DictStateFn, i.e. ``(~front).eval(self.eval(front))``, without building the state
+        ``self.eval(front)``, or None if the DictStateFn has no such representation. The diagonal
+        terms only need the signs of the measured outcomes, the others look up the flipped
+        outcomes in the sorted indices. """
+        # pylint: disable=protected-access
+        sparse_arrays = front._sparse_arrays()  # type: ignore
+        if sparse_arrays is None or sparse_arrays[2] != self.num_qubits or \
+                isinstance(self.coeff, ParameterExpression) or \
+                isinstance(front.coeff, ParameterExpression):
+            return None
+        indices, values, _ = sparse_arrays
+        x_masks, z_masks, phases = self._packed_terms()
+        bra_values = np.conj(values)
+        block_size = max(1, _EVAL_BLOCK_SIZE // max(1, len(indices)))
+        total = 0j
+
+        diagonal = x_masks == 0
+        probabilities = bra_values * values
+        diagonal_z_masks = z_masks[diagonal]
+        diagonal_phases = phases[diagonal]
+        for start in range(0, len(diagonal_z_masks), block_size):
+            block = slice(start, start + block_size)
+            signs = 1. - 2. * parity(indices[None, :] & diagonal_z_masks[block, None])
+            total += np.dot(diagonal_phases[block], signs @ probabilities)
+
+        x_masks = x_masks[~diagonal]
+        z_masks = z_masks[~diagonal]
+        phases = phases[~diagonal]
+        for start in range(0, len(x_masks), block_size):
+            block = slice(start, start + block_size)
+            flipped = indices[None, :] ^ x_masks[block, None]
+            positions = np.searchsorted(indices, flipped)
+            positions[positions == len(indices)] = 0
+            amplitudes = np.where(indices[positions] == flipped, bra_values[positions], 0)
+            signs = 1. - 2. * parity(indices[None, :] & z_masks[block, None])
+            total += np.dot(phases[block], (amplitudes * signs) @ values)
+
+        return total * self.coeff * np.conj(front.coeff) * front.coeff
+
     def exp_i(self) -> OperatorBase:
         """ Return a ``CircuitOp`` equivalent to e^-iH for this operator H. """
         # TODO: optimize for some special cases
@@ -24,7 +24,6 @@ from qiskit.quantum_info import Pauli, SparsePauliOp
 from qiskit.quantum_info import Operator as MatrixOperator
 
 from ..legacy.base_operator import LegacyBaseOperator
-from ..list_ops.summed_op import SummedOp
 from ..operator_base import OperatorBase
 
 logger = logging.getLogger(__name__)
@@ -286,6 +285,7 @@ class PrimitiveOp(OperatorBase):
             coeff = coeff.real if np.isreal(coeff) else coeff
             return PrimitiveOp(Pauli.from_label(label), coeff * self.coeff)
 
+        from ..list_ops.summed_op import SummedOp  # pylint: disable=import-outside-toplevel
         return SummedOp(
             [
                 PrimitiveOp(
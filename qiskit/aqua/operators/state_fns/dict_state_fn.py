@@ -12,7 +12,7 @@
 
 """ DictStateFn Class """
 
-from typing import Optional, Union, Set, Dict, cast, List
+from typing import Optional, Union, Set, Dict, cast, List, Tuple, Iterable
 import itertools
 import numpy as np
 from scipy import sparse
@@ -30,6 +30,14 @@ from .vector_state_fn import VectorStateFn
 class DictStateFn(StateFn):
     """ A class for state functions and measurements which are defined by a lookup table,
     stored in a dict.
+
+    Alongside the dict, a DictStateFn over at most 64 qubits can hold a compact representation
+    of the lookup table as a sorted array of ``uint64`` basis state indices and an array of the
+    corresponding values (see :meth:`from_sparse_arrays` and :meth:`to_sparse_arrays`). Inner
+    products, sums, permutations, sampling and Pauli evaluations then operate on the arrays
+    instead of looping over the bitstrings, and a DictStateFn built from arrays only creates its
+    dict when the ``primitive`` is accessed. The dict primitive should therefore not be modified
+    in place.
     """
 
     # TODO allow normalization somehow?
@@ -72,14 +80,160 @@ class DictStateFn(StateFn):
                 'string, or Qiskit Result, not {}'.format(type(primitive)))
 
         super().__init__(primitive, coeff=coeff, is_measurement=is_measurement)
+        # (indices, values, num_qubits) of the compact representation, built on demand
+        self._sparse = None  # type: Optional[Tuple[np.ndarray, np.ndarray, int]]
+
+    @classmethod
+    def from_sparse_arrays(cls,
+                           indices: Union[np.ndarray, List[int]],
+                           values: Union[np.ndarray, List[complex]],
+                           num_qubits: int,
+                           coeff: Union[int, float, complex, ParameterExpression] = 1.0,
+                           is_measurement: bool = False) -> 'DictStateFn':
+        """ Construct a DictStateFn from arrays of basis state indices and values.
+
+        Args:
+            indices: The basis state indices, i.e. the integers of the bitstrings
+                (``int(bitstring, 2)``). Values of repeated indices are summed.
+            values: The values of the state function on the given basis states.
+            num_qubits: The number of qubits, at most 64.
+            coeff: A coefficient by which to multiply the state function.
+            is_measurement: Whether the StateFn is a measurement operator.
+
+        Returns:
+            The DictStateFn.
+
+        Raises:
+            ValueError: invalid parameters.
+        """
+        if not 0 < num_qubits <= 64:
+            raise ValueError('The sparse array representation requires between 1 and 64 qubits, '
+                             'not {}.'.format(num_qubits))
+        indices = np.asarray(indices, dtype=np.uint64).ravel()
+        values = np.asarray(values).ravel()
+        if indices.shape != values.shape:
+            raise ValueError('Got {} indices but {} values.'.format(len(indices), len(values)))
+        if values.dtype.kind not in 'biufc':
+            raise ValueError('The values must be numeric, not {}.'.format(values.dtype))
+        if values.dtype.kind in 'biu':
+            values = values.astype(float)
+        if num_qubits < 64 and len(indices) and indices.max() >> np.uint64(num_qubits):
+            raise ValueError('Basis state index out of range for {} qubits.'.format(num_qubits))
+
+        if len(indices) > 1 and not np.all(indices[1:] > indices[:-1]):
+            order = np.argsort(indices, kind='stable')
+            indices = indices[order]
+            values = values[order]
+            if not np.all(indices[1:] > indices[:-1]):
+                indices, starts = np.unique(indices, return_index=True)
+                values = np.add.reduceat(values, starts)
+
+        state_fn = cls({}, coeff=coeff, is_measurement=is_measurement)
+        state_fn._primitive = None
+        state_fn._sparse = (indices, values, num_qubits)
+        return state_fn
+
+    @classmethod
+    def from_bitstrings(cls,
+                        bitstrings: Iterable[str],
+                        values: Union[np.ndarray, List[complex]],
+                        coeff: Union[int, float, complex, ParameterExpression] = 1.0,
+                        is_measurement: bool = False) -> 'DictStateFn':
+        """ Construct a DictStateFn from bitstrings and their values, using the sparse array
+        representation whenever the bitstrings and values allow it.
+
+        Args:
+            bitstrings: The bitstrings.
+            values: The values of the state function on the given bitstrings.
+            coeff: A coefficient by which to multiply the state function.
+            is_measurement: Whether the StateFn is a measurement operator.
+
+        Returns:
+            The DictStateFn.
+        """
+        bitstrings = list(bitstrings)
+        values = np.asarray(values)
+        if bitstrings and values.dtype.kind in 'biufc':
+            num_qubits = len(bitstrings[0])
+            indices = _bitstrings_to_indices(bitstrings, num_qubits)
+            if indices is not None:
+                return cls.from_sparse_arrays(indices, values, num_qubits,
+                                              coeff=coeff, is_measurement=is_measurement)
+        primitive = {}  # type: Dict[str, complex]
+        for bitstring, value in zip(bitstrings, values.tolist()):
+            primitive[bitstring] = primitive.get(bitstring, 0) + value
+        return cls(primitive, coeff=coeff, is_measurement=is_measurement)
+
+    @property
+    def primitive(self) -> Dict[str, complex]:
+        if self._primitive is None:
+            indices, values, num_qubits = self._sparse
+            self._primitive = dict(zip(_indices_to_bitstrings(indices, num_qubits),
+                                       values.tolist()))
+        return self._primitive
+
+    def to_sparse_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """ Return the compact representation of the lookup table, i.e. the sorted ``uint64``
+        basis state indices and the corresponding values. The coefficient is not applied.
+
+        Returns:
+            The tuple of indices and values.
+
+        Raises:
+            AquaError: the lookup table cannot be represented by arrays, e.g. if it is over more
+                than 64 qubits or if its values are not numeric.
+        """
+        sparse_arrays = self._sparse_arrays()
+        if sparse_arrays is None:
+            raise AquaError('The DictStateFn cannot be represented by sparse arrays, it must '
+                            'be over at most 64 qubits, with numeric values.')
+        return sparse_arrays[0], sparse_arrays[1]
+
+    def _sparse_arrays(self) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """ The (indices, values, num_qubits) representation, or None if not representable. """
+        if self._sparse is None and self._primitive:
+            num_qubits = len(next(iter(self._primitive)))
+            indices = _bitstrings_to_indices(list(self._primitive.keys()), num_qubits)
+            if indices is None:
+                return None
+            values = np.array(list(self._primitive.values()))
+            if values.dtype.kind not in 'biufc':
+                return None
+            if values.dtype.kind in 'biu':
+                values = values.astype(float)
+            if len(indices) > 1 and not np.all(indices[1:] > indices[:-1]):
+                order = np.argsort(indices)
+                indices = indices[order]
+                values = values[order]
+            self._sparse = (indices, values, num_qubits)
+        return self._sparse
+
+    def _share_primitive(self,
+                         coeff: Union[int, float, complex, ParameterExpression],
+                         is_measurement: bool) -> 'DictStateFn':
+        """ A new DictStateFn with the same lookup table, without building the dict. """
+        state_fn = DictStateFn(self._primitive if self._primitive is not None else {},
+                               coeff=coeff, is_measurement=is_measurement)
+        state_fn._primitive = self._primitive
+        state_fn._sparse = self._sparse
+        return state_fn
 
     def primitive_strings(self) -> Set[str]:
         return {'Dict'}
 
     @property
     def num_qubits(self) -> int:
+        if self._primitive is None:
+            return self._sparse[2]
         return len(list(self.primitive.keys())[0])
 
+    def mul(self, scalar: Union[int, float, complex, ParameterExpression]) -> OperatorBase:
+        if not isinstance(scalar, (int, float, complex, ParameterExpression)):
+            raise ValueError('Operators can only be scalar multiplied by float or complex, not '
+                             '{} of type {}.'.format(scalar, type(scalar)))
+
+        return self._share_primitive(self.coeff * scalar, self.is_measurement)
+
     def add(self, other: OperatorBase) -> OperatorBase:
         if not self.num_qubits == other.num_qubits:
             raise ValueError(
@@ -89,6 +243,16 @@ class DictStateFn(StateFn):
         # Right now doesn't make sense to add a StateFn to a Measurement
         if isinstance(other, DictStateFn) and self.is_measurement == other.is_measurement:
             # TODO add compatibility with vector and Operator?
+            sparse_arrays = self._sparse_arrays()
+            other_sparse_arrays = other._sparse_arrays()
+            if sparse_arrays is not None and other_sparse_arrays is not None and \
+                    not isinstance(self.coeff, ParameterExpression) and \
+                    not isinstance(other.coeff, ParameterExpression):
+                indices = np.concatenate((sparse_arrays[0], other_sparse_arrays[0]))
+                values = np.concatenate((sparse_arrays[1] * self.coeff,
+                                         other_sparse_arrays[1] * other.coeff))
+                return DictStateFn.from_sparse_arrays(indices, values, self.num_qubits,
+                                                      is_measurement=self.is_measurement)
             if self.primitive == other.primitive:
                 return DictStateFn(self.primitive,
                                    coeff=self.coeff + other.coeff,
@@ -104,6 +268,12 @@ class DictStateFn(StateFn):
         return SummedOp([self, other])
 
     def adjoint(self) -> OperatorBase:
+        sparse_arrays = self._sparse_arrays()
+        if sparse_arrays is not None:
+            indices, values, num_qubits = sparse_arrays
+            return DictStateFn.from_sparse_arrays(indices, np.conj(values), num_qubits,
+                                                  coeff=self.coeff.conjugate(),
+                                                  is_measurement=(not self.is_measurement))
         return DictStateFn({b: np.conj(v) for (b, v) in self.primitive.items()},
                            coeff=self.coeff.conjugate(),
                            is_measurement=(not self.is_measurement))
@@ -113,6 +283,19 @@ class DictStateFn(StateFn):
         if self.num_qubits != len(permutation):
             raise AquaError("New index must be defined for each qubit of the operator.")
 
+        sparse_arrays = self._sparse_arrays()
+        if sparse_arrays is not None and new_num_qubits <= 64:
+            indices, values, num_qubits = sparse_arrays
+            new_indices = np.zeros_like(indices)
+            one = np.uint64(1)
+            # the i-th character of a bitstring is the bit (num_qubits - 1 - i) of its index
+            for i, k in enumerate(permutation):
+                bit = (indices >> np.uint64(num_qubits - 1 - i)) & one
+                new_indices |= bit << np.uint64(new_num_qubits - 1 - k)
+            return DictStateFn.from_sparse_arrays(new_indices, values, new_num_qubits,
+                                                  coeff=self.coeff,
+                                                  is_measurement=self.is_measurement)
+
         # helper function to permute the key
         def perm(key):
             list_key = ['0'] * new_num_qubits
@@ -124,6 +307,13 @@ class DictStateFn(StateFn):
         return DictStateFn(new_dict, coeff=self.coeff, is_measurement=self.is_measurement)
 
     def _expand_dim(self, num_qubits: int) -> 'DictStateFn':
+        sparse_arrays = self._sparse_arrays()
+        if sparse_arrays is not None and sparse_arrays[2] + num_qubits <= 64:
+            indices, values, old_num_qubits = sparse_arrays
+            return DictStateFn.from_sparse_arrays(indices << np.uint64(num_qubits), values,
+                                                  old_num_qubits + num_qubits,
+                                                  coeff=self.coeff,
+                                                  is_measurement=self.is_measurement)
         pad = '0'*num_qubits
         new_dict = {key + pad: value for key, value in self.primitive.items()}
         return DictStateFn(new_dict, coeff=self.coeff, is_measurement=self.is_measurement)
@@ -131,6 +321,19 @@ class DictStateFn(StateFn):
     def tensor(self, other: OperatorBase) -> OperatorBase:
         # Both dicts
         if isinstance(other, DictStateFn):
+            sparse_arrays = self._sparse_arrays()
+            other_sparse_arrays = other._sparse_arrays()
+            if sparse_arrays is not None and other_sparse_arrays is not None and \
+                    sparse_arrays[2] + other_sparse_arrays[2] <= 64:
+                indices, values, num_qubits = sparse_arrays
+                other_indices, other_values, other_num_qubits = other_sparse_arrays
+                new_indices = (indices[:, None] << np.uint64(other_num_qubits)) | \
+                    other_indices[None, :]
+                return DictStateFn.from_sparse_arrays(new_indices,
+                                                      np.outer(values, other_values),
+                                                      num_qubits + other_num_qubits,
+                                                      coeff=self.coeff * other.coeff,
+                                                      is_measurement=self.is_measurement)
             new_dict = {k1 + k2: v1 * v2 for ((k1, v1,), (k2, v2)) in
                         itertools.product(self.primitive.items(), other.primitive.items())}
             return StateFn(new_dict,
@@ -149,8 +352,12 @@ class DictStateFn(StateFn):
         OperatorBase._check_massive('to_matrix', False, self.num_qubits, massive)
         states = int(2 ** self.num_qubits)
         probs = np.zeros(states) + 0.j
-        for k, v in self.primitive.items():
-            probs[int(k, 2)] = v
+        sparse_arrays = self._sparse_arrays()
+        if sparse_arrays is not None:
+            probs[sparse_arrays[0]] = sparse_arrays[1]
+        else:
+            for k, v in self.primitive.items():
+                probs[int(k, 2)] = v
         vec = probs * self.coeff
 
         # Reshape for measurements so np.dot still works for composition.
@@ -167,8 +374,13 @@ class DictStateFn(StateFn):
             ValueError: invalid parameters.
         """
 
-        indices = [int(v, 2) for v in self.primitive.keys()]
-        vals = np.array(list(self.primitive.values())) * self.coeff
+        sparse_arrays = self._sparse_arrays()
+        if sparse_arrays is not None:
+            indices = sparse_arrays[0].astype(np.int64)
+            vals = sparse_arrays[1] * self.coeff
+        else:
+            indices = [int(v, 2) for v in self.primitive.keys()]
+            vals = np.array(list(self.primitive.values())) * self.coeff
         spvec = sparse.csr_matrix((vals, (np.zeros(len(indices), dtype=int), indices)),
                                   shape=(1, 2**self.num_qubits))
         return spvec if not self.is_measurement else spvec.transpose()
@@ -219,10 +431,16 @@ class DictStateFn(StateFn):
         # we define all missing strings to have a function value of
         # zero.
         if isinstance(front, DictStateFn):
-            return np.round(
-                cast(float, sum([v * front.primitive.get(b, 0) for (b, v) in
-                                 self.primitive.items()]) * self.coeff * front.coeff),
-                decimals=EVAL_SIG_DIGITS)
+            sparse_arrays = self._sparse_arrays()
+            front_sparse_arrays = front._sparse_arrays()
+            if sparse_arrays is not None and front_sparse_arrays is not None and \
+                    sparse_arrays[2] == front_sparse_arrays[2]:
+                overlap = _sparse_overlap(sparse_arrays, front_sparse_arrays)
+            else:
+                overlap = sum([v * front.primitive.get(b, 0) for (b, v) in
+                               self.primitive.items()])
+            return np.round(cast(float, overlap * self.coeff * front.coeff),
+                            decimals=EVAL_SIG_DIGITS)
 
         # All remaining possibilities only apply when self.is_measurement is True
 
@@ -230,10 +448,13 @@ class DictStateFn(StateFn):
             # TODO does it need to be this way for measurement?
             # return sum([v * front.primitive.data[int(b, 2)] *
             # np.conj(front.primitive.data[int(b, 2)])
-            return np.round(
-                cast(float, sum([v * front.primitive.data[int(b, 2)] for (b, v) in
-                                 self.primitive.items()]) * self.coeff),
-                decimals=EVAL_SIG_DIGITS)
+            sparse_arrays = self._sparse_arrays()
+            if sparse_arrays is not None:
+                overlap = np.dot(sparse_arrays[1], front.primitive.data[sparse_arrays[0]])
+            else:
+                overlap = sum([v * front.primitive.data[int(b, 2)] for (b, v) in
+                               self.primitive.items()])
+            return np.round(cast(float, overlap * self.coeff), decimals=EVAL_SIG_DIGITS)
 
         from .circuit_state_fn import CircuitStateFn
         if isinstance(front, CircuitStateFn):
@@ -252,14 +473,68 @@ class DictStateFn(StateFn):
                shots: int = 1024,
                massive: bool = False,
                reverse_endianness: bool = False) -> dict:
-        probs = np.square(np.abs(np.array(list(self.primitive.values()))))
-        unique, counts = np.unique(aqua_globals.random.choice(list(self.primitive.keys()),
-                                                              size=shots,
-                                                              p=(probs / sum(probs))),
-                                   return_counts=True)
-        counts = dict(zip(unique, counts))
+        if self._primitive is None:
+            # sample the positions in the index array, only the sampled bitstrings are built
+            indices, values, num_qubits = self._sparse
+            probs = np.square(np.abs(values))
+            unique, counts = np.unique(aqua_globals.random.choice(len(indices),
+                                                                  size=shots,
+                                                                  p=(probs / sum(probs))),
+                                       return_counts=True)
+            counts = dict(zip(_indices_to_bitstrings(indices[unique], num_qubits),
+                              counts.tolist()))
+        else:
+            probs = np.square(np.abs(np.array(list(self.primitive.values()))))
+            unique, counts = np.unique(aqua_globals.random.choice(list(self.primitive.keys()),
+                                                                  size=shots,
+                                                                  p=(probs / sum(probs))),
+                                       return_counts=True)
+            counts = dict(zip(unique, counts))
         if reverse_endianness:
             scaled_dict = {bstr[::-1]: (prob / shots) for (bstr, prob) in counts.items()}
         else:
             scaled_dict = {bstr: (prob / shots) for (bstr, prob) in counts.items()}
         return dict(sorted(scaled_dict.items(), key=lambda x: x[1], reverse=True))
+
+
+def _bitstrings_to_indices(bitstrings: List[str], num_qubits: int) -> Optional[np.ndarray]:
+    """ Convert equally long bitstrings to ``uint64`` indices, or return None if not possible. """
+    if not 0 < num_qubits <= 64:
+        return None
+    joined = ''.join(bitstrings)
+    if len(joined) != len(bitstrings) * num_qubits:
+        return None
+    try:
+        chars = np.frombuffer(joined.encode('ascii'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        return None
+    # characters other than '0' and '1' wrap around or exceed 1
+    bits = (chars - np.uint8(ord('0'))).reshape(len(bitstrings), num_qubits)
+    if bits.size and bits.max() > 1:
+        return None
+    padded = np.zeros((len(bitstrings), 64), dtype=np.uint8)
+    padded[:, 64 - num_qubits:] = bits
+    return np.packbits(padded, axis=1).view('>u8').ravel().astype(np.uint64)
+
+
+def _indices_to_bitstrings(indices: np.ndarray, num_qubits: int) -> List[str]:
+    """ Convert ``uint64`` indices to bitstrings of length ``num_qubits``. """
+    bits = np.unpackbits(indices.astype('>u8').view(np.uint8).reshape(-1, 8), axis=1)
+    chars = (bits[:, 64 - num_qubits:] + np.uint8(ord('0'))).tobytes().decode('ascii')
+    return [chars[i:i + num_qubits] for i in range(0, len(chars), num_qubits)]
+
+
+def _sparse_overlap(sparse_arrays: Tuple[np.ndarray, np.ndarray, int],
+                    other_sparse_arrays: Tuple[np.ndarray, np.ndarray, int]) -> complex:
+    """ The sum of the products of the values on the indices present in both (sorted) arrays. """
+    indices, values, _ = sparse_arrays
+    other_indices, other_values, _ = other_sparse_arrays
+    if len(indices) > len(other_indices):
+        indices, values, other_indices, other_values = \
+            other_indices, other_values, indices, values
+    if not len(indices):  # pylint: disable=len-as-condition
+        return 0
+    positions = np.searchsorted(other_indices, indices)
+    positions[positions == len(other_indices)] = 0
+    found = other_indices[positions] == indices
+    return np.dot(values[found], other_values[positions[found]])
@@ -205,6 +205,16 @@ class OperatorStateFn(StateFn):
             return front.combo_fn([self.eval(front.coeff * front_elem)  # type: ignore
                                    for front_elem in front.oplist])  # type: ignore
 
+        # pylint: disable=import-outside-toplevel,cyclic-import,protected-access
+        from ..primitive_ops.pauli_sum_op import PauliSumOp
+        from .dict_state_fn import DictStateFn
+        if isinstance(self.primitive, PauliSumOp) and isinstance(front, DictStateFn) and \
+                not front.is_measurement:
+            expectation = self.primitive._expectation_sparse_arrays(front)
+            if expectation is not None:
+                from ..operator_globals import EVAL_SIG_DIGITS
+                return np.round(expectation, decimals=EVAL_SIG_DIGITS) * self.coeff
+
         return front.adjoint().eval(self.primitive.eval(front)) * self.coeff  # type: ignore
 
     def sample(self,
@@ -186,6 +186,11 @@ class VectorStateFn(StateFn):
         from .circuit_state_fn import CircuitStateFn
         from .dict_state_fn import DictStateFn
         if isinstance(front, DictStateFn):
+            sparse_arrays = front._sparse_arrays()
+            if sparse_arrays is not None:
+                return np.round(np.dot(sparse_arrays[1], self.primitive.data[sparse_arrays[0]])
+                                * front.coeff * self.coeff,
+                                decimals=EVAL_SIG_DIGITS)
             return np.round(sum([v * self.primitive.data[int(b, 2)] * front.coeff  # type: ignore
                                  for (b, v) in front.primitive.items()]) * self.coeff,
                             decimals=EVAL_SIG_DIGITS)
@@ -15,16 +15,18 @@
 from typing import Optional, List, Union, Dict, Callable, Tuple
 import copy
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import numpy as np
 
 from qiskit.providers import Backend, BaseBackend
 from qiskit.transpiler import CouplingMap, PassManager
 from qiskit.transpiler.layout import Layout
 from qiskit.assembler.run_config import RunConfig
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import QuantumCircuit, Parameter
 from qiskit.result import Result
-from qiskit.qobj import Qobj
+from qiskit.qobj import Qobj, QasmQobj
 from qiskit import compiler
 
 try:
@@ -41,9 +43,25 @@ from .utils.backend_utils import (is_ibmq_provider,
                                   is_basicaer_provider,
                                   support_backend_options)
 from .utils.circuit_utils import summarize_circuits
+from .utils.transpilation_cache import TranspilationCache
+from .utils.numpy_statevector import NumPyStatevectorSimulator
+from .utils.execution_metrics import ExecutionMetrics
 
 logger = logging.getLogger(__name__)
 
+_ASYNC_EXECUTOR = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+
+def _async_executor() -> ThreadPoolExecutor:
+    """ Returns the executor of the asynchronous executions, created on first use. """
+    global _ASYNC_EXECUTOR  # pylint: disable=global-statement
+    with _ASYNC_EXECUTOR_LOCK:
+        if _ASYNC_EXECUTOR is None:
+            _ASYNC_EXECUTOR = ThreadPoolExecutor(max_workers=1,
+                                                 thread_name_prefix='aqua_execute_async')
+    return _ASYNC_EXECUTOR
+
 
 class QuantumInstance:
     """Quantum Backend including execution setting."""
@@ -85,7 +103,11 @@ class QuantumInstance:
                  measurement_error_mitigation_cls: Optional[Callable] = None,
                  cals_matrix_refresh_period: int = 30,
                  measurement_error_mitigation_shots: Optional[int] = None,
-                 job_callback: Optional[Callable] = None) -> None:
+                 job_callback: Optional[Callable] = None,
+                 transpilation_cache: Optional[TranspilationCache] = None,
+                 numpy_statevector: Union[bool, NumPyStatevectorSimulator] = False,
+                 metrics: Optional[ExecutionMetrics] = None,
+                 cals_matrix_file: Optional[str] = None) -> None:
         """
         Quantum Instance holds a Qiskit Terra backend as well as configuration for circuit
         transpilation and execution. When provided to an Aqua algorithm the algorithm will
@@ -125,11 +147,29 @@ class QuantumInstance:
                 to monitor job progress as jobs are submitted for processing by an Aqua algorithm.
                 The callback is provided the following arguments: `job_id, job_status,
                 queue_position, job`
+            transpilation_cache: Optional cache of transpiled circuits. Circuits which are
+                structurally identical to previously transpiled ones, for the same backend and
+                transpile settings, are taken from the cache instead of being transpiled again.
+                The cache is not used when a ``pass_manager`` is given.
+            numpy_statevector: Whether the statevectors sampled by the
+                :class:`~qiskit.aqua.operators.CircuitSampler` are simulated in the process with
+                NumPy, by :meth:`simulate_statevectors`, instead of being run on the backend,
+                which avoids assembling a Qobj and parsing the Result. A
+                :class:`~qiskit.aqua.utils.NumPyStatevectorSimulator` may be given to configure
+                the simulation. Only supported with a statevector backend.
+            metrics: Optional metrics to record the timings and counters of the stages of the
+                executions in, e.g. with a callback to export them. If None, new metrics are
+                created, see :attr:`metrics`.
+            cals_matrix_file: Optional file the calibration matrices of the measurement error
+                mitigation are saved to, with their timestamps, whenever they are built. The
+                matrices of the backend saved in the file by previous runs are reused until they
+                are out-of-date.
 
         Raises:
             AquaError: the shots exceeds the maximum number of shots
             AquaError: set noise model but the backend does not support that
             AquaError: set backend_options but the backend does not support that
+            AquaError: set numpy_statevector but the backend is not a statevector backend
         """
         self._backend = backend
         self._pass_manager = pass_manager
@@ -197,7 +237,8 @@ class QuantumInstance:
                                 "with the statevector simulation.")
         else:
             self._meas_error_mitigation_cls = measurement_error_mitigation_cls
-        self._meas_error_mitigation_fitters: Dict[str, Tuple[np.ndarray, float]] = {}
+        self._cals_matrix_file = cals_matrix_file
+        self._meas_error_mitigator = None
         # TODO: support different fitting method in error mitigation?
         self._meas_error_mitigation_method = 'least_squares'
         self._cals_matrix_refresh_period = cals_matrix_refresh_period
@@ -222,6 +263,10 @@ class QuantumInstance:
         self._skip_qobj_validation = skip_qobj_validation
         self._circuit_summary = False
         self._job_callback = job_callback
+        self._transpilation_cache = transpilation_cache
+        self._numpy_statevector = None  # type: Optional[NumPyStatevectorSimulator]
+        self.numpy_statevector = numpy_statevector
+        self._metrics = metrics if metrics is not None else ExecutionMetrics()
         self._time_taken = 0.
         logger.info(self)
 
@@ -251,13 +296,17 @@ class QuantumInstance:
         Returns:
             The transpiled circuits, it is always a list even though the length is one.
         """
-        if self._pass_manager is not None:
-            transpiled_circuits = self._pass_manager.run(circuits)
-        else:
-            transpiled_circuits = compiler.transpile(circuits,
-                                                     self._backend,
-                                                     **self._backend_config,
-                                                     **self._compile_config)
+        num_circuits = 1 if isinstance(circuits, QuantumCircuit) else len(circuits)
+        with self._metrics.measure('transpile', circuits=num_circuits) as counters:
+            if self._pass_manager is not None:
+                transpiled_circuits = self._pass_manager.run(circuits)
+            elif self._transpilation_cache is not None:
+                transpiled_circuits = self._transpile_with_cache(circuits, counters)
+            else:
+                transpiled_circuits = compiler.transpile(circuits,
+                                                         self._backend,
+                                                         **self._backend_config,
+                                                         **self._compile_config)
         if not isinstance(transpiled_circuits, list):
             transpiled_circuits = [transpiled_circuits]
 
@@ -270,20 +319,89 @@ class QuantumInstance:
 
         return transpiled_circuits
 
+    def _transpile_with_cache(self,
+                              circuits: Union[QuantumCircuit, List[QuantumCircuit]],
+                              counters: Optional[Dict[str, float]] = None
+                              ) -> List[QuantumCircuit]:
+        """ Transpile the circuits which are not found in the transpilation cache, counting
+        the cache hits and misses in ``counters``. """
+        if not isinstance(circuits, list):
+            circuits = [circuits]
+        cache = self._transpilation_cache
+        keys = [cache.key(circuit, self.backend_name, self._backend_config, self._compile_config)
+                for circuit in circuits]
+        transpiled_circuits = [cache.get(key, circuit) for key, circuit in zip(keys, circuits)]
+        missing = [i for i, circuit in enumerate(transpiled_circuits) if circuit is None]
+        if missing:
+            new_circuits = compiler.transpile([circuits[i] for i in missing],
+                                              self._backend,
+                                              **self._backend_config,
+                                              **self._compile_config)
+            if not isinstance(new_circuits, list):
+                new_circuits = [new_circuits]
+            for i, circuit in zip(missing, new_circuits):
+                cache.put(keys[i], circuits[i], circuit)
+                transpiled_circuits[i] = circuit
+        logger.debug('Transpilation cache: %s hits, %s misses.',
+                     len(circuits) - len(missing), len(missing))
+        if counters is not None:
+            counters['cache_hits'] = len(circuits) - len(missing)
+            counters['cache_misses'] = len(missing)
+        return transpiled_circuits
+
+    def simulate_statevectors(self,
+                              circuits: Union[QuantumCircuit, List[QuantumCircuit]],
+                              param_bindings: Optional[List[Dict[Parameter, float]]] = None
+                              ) -> List[np.ndarray]:
+        """
+        Simulates the statevectors of the circuits in the process with NumPy, for each binding
+        of their parameters. The circuits are simulated as given, they are not transpiled.
+
+        Args:
+            circuits: circuits to simulate, without measurements
+            param_bindings: the bindings of the parameters to simulate each circuit with
+
+        Returns:
+            For each circuit, the array of its statevectors for each binding.
+
+        Raises:
+            AquaError: the NumPy statevector simulation is not enabled
+        """
+        if self._numpy_statevector is None:
+            raise AquaError('The NumPy statevector simulation is not enabled.')
+        initial_statevector = self._backend_options.get('backend_options',
+                                                        {}).get('initial_statevector')
+        num_circuits = 1 if isinstance(circuits, QuantumCircuit) else len(circuits)
+        num_circuits *= len(param_bindings) if param_bindings is not None else 1
+        start_time = time.time()
+        with self._metrics.measure('execution', circuits=num_circuits):
+            statevectors = self._numpy_statevector.run(circuits, param_bindings,
+                                                       initial_statevector)
+        self._time_taken += time.time() - start_time
+        return statevectors
+
     def assemble(self,
                  circuits: Union[QuantumCircuit, List[QuantumCircuit]]) -> Qobj:
         """ assemble circuits """
-        return compiler.assemble(circuits, **self._run_config.to_dict())
+        num_circuits = 1 if isinstance(circuits, QuantumCircuit) else len(circuits)
+        with self._metrics.measure('assemble', circuits=num_circuits):
+            return compiler.assemble(circuits, **self._run_config.to_dict())
 
     def execute(self,
                 circuits: Union[QuantumCircuit, List[QuantumCircuit]],
-                had_transpiled: bool = False) -> Result:
+                had_transpiled: bool = False,
+                result_callback: Optional[Callable[[int, Result], None]] = None) -> Result:
         """
         A wrapper to interface with quantum backend.
 
         Args:
             circuits: circuits to execute
             had_transpiled: whether or not circuits had been transpiled
+            result_callback: Optional callback invoked with the partial result of each job, as
+                soon as it is finished, when the circuits are split into several jobs.
+                It is provided the index of the first circuit of the partial result and the
+                partial result. The callback is not used with measurement error mitigation,
+                since the counts can only be mitigated once the calibration is available.
 
         Returns:
             Result object
@@ -291,11 +409,6 @@ class QuantumInstance:
         TODO: Maybe we can combine the circuits for the main ones and calibration circuits before
               assembling to the qobj.
         """
-        # pylint: disable=import-outside-toplevel
-        from .utils.run_circuits import run_qobj
-
-        from .utils.measurement_error_mitigation import (get_measured_qubits_from_qobj,
-                                                         build_measurement_error_mitigation_qobj)
         # maybe compile
         if not had_transpiled:
             circuits = self.transpile(circuits)
@@ -303,31 +416,37 @@ class QuantumInstance:
         # assemble
         qobj = self.assemble(circuits)
 
+        return self.execute_qobj(qobj, result_callback)
+
+    def execute_qobj(self,
+                     qobj: QasmQobj,
+                     result_callback: Optional[Callable[[int, Result], None]] = None) -> Result:
+        """
+        Execute a Qobj assembled from circuits transpiled for the backend, e.g. bound from a
+        :class:`~qiskit.aqua.utils.QobjTemplate`, with the error mitigation of :meth:`execute`.
+
+        Args:
+            qobj: the qobj to execute
+            result_callback: Optional callback invoked with the partial result of each job,
+                see :meth:`execute`.
+
+        Returns:
+            Result object
+        """
+        # pylint: disable=import-outside-toplevel
+        from .utils.run_circuits import run_qobj
+
+        from .utils.measurement_error_mitigation import (get_measured_qubits_from_qobj,
+                                                         build_measurement_error_mitigation_qobj)
+        num_circuits = len(qobj.experiments)
+
         if self._meas_error_mitigation_cls is not None:
             qubit_index, qubit_mappings = get_measured_qubits_from_qobj(qobj)
-            qubit_index_str = '_'.join([str(x) for x in qubit_index]) + \
-                "_{}".format(self._meas_error_mitigation_shots or self._run_config.shots)
-            meas_error_mitigation_fitter, timestamp = \
-                self._meas_error_mitigation_fitters.get(qubit_index_str, (None, 0.))
-
-            if meas_error_mitigation_fitter is None:
-                # check the asked qubit_index are the subset of build matrices
-                for key, _ in self._meas_error_mitigation_fitters.items():
-                    stored_qubit_index = [int(x) for x in key.split("_")[:-1]]
-                    stored_shots = int(key.split("_")[-1])
-                    if len(qubit_index) < len(stored_qubit_index):
-                        tmp = list(set(qubit_index + stored_qubit_index))
-                        if sorted(tmp) == sorted(stored_qubit_index) and \
-                                self._run_config.shots == stored_shots:
-                            # the qubit used in current job is the subset and shots are the same
-                            meas_error_mitigation_fitter, timestamp = \
-                                self._meas_error_mitigation_fitters.get(key, (None, 0.))
-                            meas_error_mitigation_fitter = \
-                                meas_error_mitigation_fitter.subset_fitter(
-                                    qubit_sublist=qubit_index)
-                            logger.info("The qubits used in the current job is the subset of "
-                                        "previous jobs, "
-                                        "reusing the calibration matrix if it is not out-of-date.")
+            cals_shots = self._meas_error_mitigation_shots or self._run_config.shots
+            mitigator = self._get_meas_error_mitigator()
+            # the fitter of the qubits, or of a superset of the qubits
+            meas_error_mitigation_fitter, timestamp = mitigator.get_fitter(qubit_index,
+                                                                           cals_shots)
 
             build_cals_matrix = self.maybe_refresh_cals_matrix(timestamp) or \
                 meas_error_mitigation_fitter is None
@@ -352,59 +471,53 @@ class QuantumInstance:
                     cals_result = run_qobj(cals_qobj, self._backend, self._qjob_config,
                                            self._backend_options,
                                            self._noise_config,
-                                           self._skip_qobj_validation, self._job_callback)
+                                           self._skip_qobj_validation, self._job_callback,
+                                           metrics=self._metrics)
                     self._time_taken += cals_result.time_taken
                     result = run_qobj(qobj, self._backend, self._qjob_config,
                                       self._backend_options, self._noise_config,
-                                      self._skip_qobj_validation, self._job_callback)
+                                      self._skip_qobj_validation, self._job_callback,
+                                      metrics=self._metrics)
                     self._time_taken += result.time_taken
                 else:
                     # insert the calibration circuit into main qobj if the shots are the same
                     qobj.experiments[0:0] = cals_qobj.experiments
                     result = run_qobj(qobj, self._backend, self._qjob_config,
                                       self._backend_options, self._noise_config,
-                                      self._skip_qobj_validation, self._job_callback)
+                                      self._skip_qobj_validation, self._job_callback,
+                                      metrics=self._metrics)
                     self._time_taken += result.time_taken
                     cals_result = result
 
                 logger.info("Building calibration matrix for measurement error mitigation.")
-                meas_error_mitigation_fitter = \
-                    self._meas_error_mitigation_cls(cals_result,
-                                                    state_labels,
-                                                    qubit_list=qubit_index,
-                                                    circlabel=circuit_labels)
-                self._meas_error_mitigation_fitters[qubit_index_str] = \
-                    (meas_error_mitigation_fitter, time.time())
+                with self._metrics.measure('mitigation', circuits=len(cals_qobj.experiments)):
+                    meas_error_mitigation_fitter = \
+                        self._meas_error_mitigation_cls(cals_result,
+                                                        state_labels,
+                                                        qubit_list=qubit_index,
+                                                        circlabel=circuit_labels)
+                mitigator.add_fitter(qubit_index, cals_shots, meas_error_mitigation_fitter)
             else:
                 result = run_qobj(qobj, self._backend, self._qjob_config,
                                   self._backend_options, self._noise_config,
-                                  self._skip_qobj_validation, self._job_callback)
+                                  self._skip_qobj_validation, self._job_callback,
+                                  metrics=self._metrics)
                 self._time_taken += result.time_taken
 
             if meas_error_mitigation_fitter is not None:
                 logger.info("Performing measurement error mitigation.")
-                skip_num_circuits = len(result.results) - len(circuits)
-                #  remove the calibration counts from result object to assure the length of
-                #  ExperimentalResult is equal length to input circuits
-                result.results = result.results[skip_num_circuits:]
-                tmp_result = copy.deepcopy(result)
-                for qubit_index_str, c_idx in qubit_mappings.items():
-                    curr_qubit_index = [int(x) for x in qubit_index_str.split("_")]
-                    tmp_result.results = [result.results[i] for i in c_idx]
-                    if curr_qubit_index == qubit_index:
-                        tmp_fitter = meas_error_mitigation_fitter
-                    else:
-                        tmp_fitter = meas_error_mitigation_fitter.subset_fitter(curr_qubit_index)
-                    tmp_result = tmp_fitter.filter.apply(
-                        tmp_result, self._meas_error_mitigation_method
-                    )
-                    for i, n in enumerate(c_idx):
-                        result.results[n] = tmp_result.results[i]
+                with self._metrics.measure('mitigation', circuits=num_circuits):
+                    skip_num_circuits = len(result.results) - num_circuits
+                    #  remove the calibration counts from result object to assure the length of
+                    #  ExperimentalResult is equal length to input circuits
+                    result.results = result.results[skip_num_circuits:]
+                    mitigator.apply(result, qubit_index, qubit_mappings, cals_shots)
 
         else:
             result = run_qobj(qobj, self._backend, self._qjob_config,
                               self._backend_options, self._noise_config,
-                              self._skip_qobj_validation, self._job_callback)
+                              self._skip_qobj_validation, self._job_callback,
+                              result_callback, metrics=self._metrics)
             self._time_taken += result.time_taken
 
         if self._circuit_summary:
@@ -412,6 +525,30 @@ class QuantumInstance:
 
         return result
 
+    def execute_async(self,
+                      circuits: Union[QuantumCircuit, List[QuantumCircuit]],
+                      had_transpiled: bool = False,
+                      result_callback: Optional[Callable[[int, Result], None]] = None
+                      ) -> Future:
+        """
+        Execute the circuits in a background thread, see :meth:`execute`.
+
+        The call returns immediately, so the caller can post-process the results of previous
+        executions while the backend runs the circuits. The executions requested with this method
+        are run one after the other, in the order they were requested. The returned future can be
+        awaited in ``asyncio`` code with ``asyncio.wrap_future``.
+
+        Args:
+            circuits: circuits to execute
+            had_transpiled: whether or not circuits had been transpiled
+            result_callback: Optional callback invoked with the partial result of each job,
+                see :meth:`execute`. It is called from the background thread.
+
+        Returns:
+            A future of the Result object.
+        """
+        return _async_executor().submit(self.execute, circuits, had_transpiled, result_callback)
+
     def set_config(self, **kwargs):
         """Set configurations for the quantum instance."""
         for k, v in kwargs.items():
@@ -453,8 +590,44 @@ class QuantumInstance:
         return self._time_taken
 
     def reset_execution_results(self) -> None:
-        """ Reset execution results """
+        """ Reset execution results, and the metrics """
         self._time_taken = 0.
+        self._metrics.reset()
+
+    @property
+    def metrics(self) -> ExecutionMetrics:
+        """The timings and counters of the stages of the executions, see
+        :class:`~qiskit.aqua.utils.ExecutionMetrics`."""
+        return self._metrics
+
+    @property
+    def transpilation_cache(self) -> Optional[TranspilationCache]:
+        """Getter of the transpilation cache."""
+        return self._transpilation_cache
+
+    @transpilation_cache.setter
+    def transpilation_cache(self, new_value: Optional[TranspilationCache]) -> None:
+        """Sets the transpilation cache, None disables caching."""
+        self._transpilation_cache = new_value
+
+    @property
+    def numpy_statevector(self) -> Optional[NumPyStatevectorSimulator]:
+        """Getter of the NumPy statevector simulator, None if it is not enabled."""
+        return self._numpy_statevector
+
+    @numpy_statevector.setter
+    def numpy_statevector(self, new_value: Union[bool, NumPyStatevectorSimulator]) -> None:
+        """Enables or disables the NumPy statevector simulation.
+
+        Raises:
+            AquaError: the backend is not a statevector backend
+        """
+        if new_value is True:
+            new_value = NumPyStatevectorSimulator()
+        if new_value and not self.is_statevector:
+            raise AquaError('The NumPy statevector simulation requires a statevector backend, '
+                            'not {}.'.format(self.backend_name))
+        self._numpy_statevector = new_value or None
 
     @property
     def qjob_config(self):
@@ -597,12 +770,21 @@ class QuantumInstance:
             in a dictionary.
         """
         shots = self._meas_error_mitigation_shots or self._run_config.shots
+        cal_matrices = self._get_meas_error_mitigator().cal_matrices()
         if qubit_index:
             qubit_index_str = '_'.join([str(x) for x in qubit_index]) + "_{}".format(shots)
-            fitter, timestamp = self._meas_error_mitigation_fitters.get(qubit_index_str, None)
-            if fitter is not None:
-                return fitter.cal_matrix, timestamp
-        else:
-            return {k: (v.cal_matrix, t) for k, (v, t)
-                    in self._meas_error_mitigation_fitters.items()}
-        return None
+            return cal_matrices.get(qubit_index_str)
+        return cal_matrices
+
+    def _get_meas_error_mitigator(self):
+        """ Returns the calibrations of the measurement error mitigation, loaded from the
+        calibration matrix file if there is one. """
+        # pylint: disable=import-outside-toplevel
+        from .utils.measurement_error_mitigation import MeasurementErrorMitigator
+
+        if self._meas_error_mitigator is None:
+            self._meas_error_mitigator = \
+                MeasurementErrorMitigator(self.backend_name,
+                                          method=self._meas_error_mitigation_method,
+                                          file_name=self._cals_matrix_file)
+        return self._meas_error_mitigator
@@ -43,6 +43,14 @@ Utilities
    reduce_dim_to_via_pca
    optimize_svm
    CircuitFactory
+   TranspilationCache
+   NumPyStatevectorSimulator
+   ExecutionMetrics
+   QobjTemplate
+   pack_bits
+   popcount
+   parity
+   unpack_bits
    has_ibmq
    has_aer
    name_args
@@ -62,6 +70,11 @@ from .dataset_helper import (get_feature_dimension, get_num_classes,
                              map_label_to_class_name, reduce_dim_to_via_pca)
 from .qp_solver import optimize_svm
 from .circuit_factory import CircuitFactory
+from .transpilation_cache import TranspilationCache
+from .numpy_statevector import NumPyStatevectorSimulator
+from .execution_metrics import ExecutionMetrics
+from .qobj_template import QobjTemplate
+from .bit_packing import pack_bits, popcount, parity, unpack_bits
 from .backend_utils import has_ibmq, has_aer
 from .name_unnamed_args import name_args
 
@@ -85,6 +98,14 @@ __all__ = [
     'reduce_dim_to_via_pca',
     'optimize_svm',
     'CircuitFactory',
+    'TranspilationCache',
+    'NumPyStatevectorSimulator',
+    'ExecutionMetrics',
+    'QobjTemplate',
+    'pack_bits',
+    'popcount',
+    'parity',
+    'unpack_bits',
     'has_ibmq',
     'has_aer',
     'name_args'
@@ -0,0 +1,91 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Bit packing of boolean arrays into uint64 words """
+
+import numpy as np
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0f0f0f0f0f0f0f0f)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """
+    Pack the last axis of a boolean array into uint64 words, e.g. the X or Z part of a
+    ``PauliTable``. Bit ``j`` of word ``w`` holds the entry ``64 * w + j`` of the last axis,
+    so for up to 64 qubits the single word of a Pauli is its qubit mask.
+
+    Args:
+        bits: boolean array of shape ``(..., n)``
+
+    Returns:
+        uint64 array of shape ``(..., ceil(n / 64))``, with at least one word.
+    """
+    bits = np.asarray(bits, dtype=bool)
+    num_bits = bits.shape[-1]
+    num_words = max(1, -(-num_bits // 64))
+    padded = np.zeros(bits.shape[:-1] + (num_words * 64,), dtype=bool)
+    padded[..., :num_bits] = bits
+    packed = np.packbits(padded.reshape(bits.shape[:-1] + (num_words, 64)),
+                         axis=-1, bitorder='little')
+    return np.ascontiguousarray(packed).view('<u8')[..., 0].astype(np.uint64)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Count the set bits of each uint64 word.
+
+    Args:
+        words: uint64 array
+
+    Returns:
+        integer array of the same shape with the number of set bits of each word.
+    """
+    words = np.asarray(words, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    # SWAR bit counting, see e.g. "Hacker's Delight", section 5-1
+    words = words - ((words >> np.uint64(1)) & _M1)
+    words = (words & _M2) + ((words >> np.uint64(2)) & _M2)
+    words = (words + (words >> np.uint64(4))) & _M4
+    return (words * _H01) >> np.uint64(56)
+
+
+def parity(words: np.ndarray) -> np.ndarray:
+    """
+    The parity of the number of set bits of each uint64 word.
+
+    Args:
+        words: uint64 array
+
+    Returns:
+        integer array of the same shape, 1 where the number of set bits is odd and 0 elsewhere.
+    """
+    return popcount(words) & 1
+
+
+def unpack_bits(words: np.ndarray, num_bits: int) -> np.ndarray:
+    """
+    Unpack uint64 words into a boolean array, the inverse of :func:`pack_bits`.
+
+    Args:
+        words: uint64 array of shape ``(..., num_words)``
+        num_bits: the length of the last axis of the unpacked array
+
+    Returns:
+        boolean array of shape ``(..., num_bits)``
+    """
+    words = np.ascontiguousarray(words, dtype='<u8')
+    bits = np.unpackbits(words.view(np.uint8), axis=-1, bitorder='little')
+    return bits[..., :num_bits].astype(bool)
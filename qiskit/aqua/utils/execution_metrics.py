@@ -0,0 +1,172 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Timings and counters of the stages of circuit executions """
+
+from typing import Optional, List, Dict, Callable, Iterator, Any
+from collections import deque
+from contextlib import contextmanager
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionMetrics:
+    """
+    Timings and counters of the stages of the circuit executions of a
+    :class:`~qiskit.aqua.QuantumInstance`, and of their post-processing by the
+    :class:`~qiskit.aqua.operators.CircuitSampler`.
+
+    Each timed call of a stage is recorded as a dictionary with the keys ``'stage'``,
+    ``'start'`` (the time the call started, in seconds since the epoch), ``'duration'`` (in
+    seconds) and the counters of the call, e.g. ``'circuits'``, ``'shots'`` or ``'cache_hits'``.
+    The stages recorded are:
+
+    * ``'transpile'``: transpilation of circuits, with the hits and misses of the
+      transpilation cache if there is one,
+    * ``'bind'``: binding of the parameters of the transpiled circuits,
+    * ``'assemble'``: assembly of the circuits into a Qobj,
+    * ``'submit'``: submission of the jobs to the backend,
+    * ``'queue'``: time spent by the jobs of a remote backend in the queue, as observed
+      when polling their status,
+    * ``'execution'``: execution of the jobs, or in-process simulation of the statevectors,
+      until their results are available,
+    * ``'mitigation'``: calibration and application of the measurement error mitigation,
+      excluding the execution of the calibration circuits,
+    * ``'post_processing'``: conversion of the results into state functions.
+
+    The stages of an execution may overlap, e.g. the results of the jobs are post-processed as
+    soon as each job is done, while the others are executed. The most recent records are kept,
+    the aggregates of :meth:`summary` cover all of them. Records may be exported as they are
+    made with a ``callback``. The metrics can be shared by several threads.
+    """
+
+    def __init__(self,
+                 callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 max_records: Optional[int] = 1000) -> None:
+        """
+        Args:
+            callback: Optional callback invoked with each record, as it is made, e.g. to log or
+                export the records.
+            max_records: Maximum number of records kept, the oldest being discarded first.
+                If None, all the records are kept.
+
+        Raises:
+            ValueError: invalid number of records
+        """
+        if max_records is not None and max_records < 0:
+            raise ValueError('max_records must not be negative, not {}.'.format(max_records))
+        self._callback = callback
+        self._records = deque(maxlen=max_records)  # type: deque
+        self._aggregates = {}  # type: Dict[str, Dict[str, float]]
+        self._lock = threading.Lock()
+
+    @property
+    def callback(self) -> Optional[Callable[[Dict[str, Any]], None]]:
+        """ Returns the callback invoked with each record. """
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback: Optional[Callable[[Dict[str, Any]], None]]) -> None:
+        """ Sets the callback invoked with each record. """
+        self._callback = callback
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """ Returns the most recent records, oldest first. """
+        with self._lock:
+            return list(self._records)
+
+    def record(self, stage: str, duration: float, start: Optional[float] = None,
+               **counters: float) -> None:
+        """
+        Records a call of a stage.
+
+        Args:
+            stage: The name of the stage.
+            duration: The duration of the call, in seconds.
+            start: The time the call started, in seconds since the epoch. Defaults to the
+                current time minus the duration.
+            counters: The counters of the call, e.g. ``circuits=10``.
+        """
+        entry = {'stage': stage,
+                 'start': time.time() - duration if start is None else start,
+                 'duration': duration}
+        entry.update(counters)
+        with self._lock:
+            self._records.append(entry)
+            aggregate = self._aggregates.setdefault(stage, {'count': 0, 'total_time': 0.,
+                                                            'max_time': 0.})
+            aggregate['count'] += 1
+            aggregate['total_time'] += duration
+            aggregate['max_time'] = max(aggregate['max_time'], duration)
+            for name, value in counters.items():
+                aggregate[name] = aggregate.get(name, 0) + value
+        if self._callback is not None:
+            try:
+                self._callback(entry)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning('The execution metrics callback failed.', exc_info=True)
+
+    @contextmanager
+    def measure(self, stage: str, **counters: float) -> Iterator[Dict[str, float]]:
+        """
+        Times the block of a ``with`` statement and records it as a call of the stage.
+        The block is given the dictionary of the counters, to update the ones only known
+        at the end of the call. Nothing is recorded if the block raises an exception.
+
+        Args:
+            stage: The name of the stage.
+            counters: The counters of the call.
+
+        Yields:
+            The counters of the call.
+        """
+        start = time.time()
+        start_perf = time.perf_counter()
+        yield counters
+        self.record(stage, time.perf_counter() - start_perf, start=start, **counters)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the aggregates of all the calls of each stage: their number ``'count'``, their
+        total and maximum durations ``'total_time'`` and ``'max_time'`` in seconds, and the
+        totals of their counters.
+        """
+        with self._lock:
+            return {stage: dict(aggregate) for stage, aggregate in self._aggregates.items()}
+
+    def reset(self) -> None:
+        """ Removes all the records and aggregates. """
+        with self._lock:
+            self._records.clear()
+            self._aggregates = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the lock cannot be pickled, e.g. with a quantum instance sent to a process pool
+        with self._lock:
+            state = dict(self.__dict__)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        lines = ['{:<16}{:>8}{:>14}{:>14}'.format('stage', 'count', 'total (s)', 'max (s)')]
+        for stage, aggregate in self.summary().items():
+            lines.append('{:<16}{:>8}{:>14.6f}{:>14.6f}'.format(
+                stage, aggregate['count'], aggregate['total_time'], aggregate['max_time']))
+        return '\n'.join(lines)
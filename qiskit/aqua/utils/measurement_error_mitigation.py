@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2019, 2020.
+# (C) Copyright IBM 2019, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,10 +12,17 @@
 
 """ Measurement error mitigation """
 
+from typing import Optional, List, Dict, Tuple, FrozenSet, Any
 import copy
+import json
 import logging
+import os
+import time
 
+import numpy as np
+from scipy import linalg
 from qiskit import compiler
+from qiskit.result import Result
 from qiskit.ignis.mitigation.measurement import (complete_meas_cal,
                                                  CompleteMeasFitter, TensoredMeasFitter)
 
@@ -146,3 +153,293 @@ def build_measurement_error_mitigation_qobj(qubit_list, fitter_cls, backend,
     if hasattr(cals_qobj.config, 'parameterizations'):
         del cals_qobj.config.parameterizations
     return cals_qobj, state_labels, circlabel
+
+
+class MeasurementErrorMitigator:
+    """
+    The calibrations of the measurement error mitigation of a backend, and their application to
+    results.
+
+    The fitters are indexed by the set of calibrated qubits and the number of shots of the
+    calibration. The fitters of subsets and permutations of the calibrated qubits, and the
+    pseudo-inverses of their calibration matrices, are derived once and cached with the
+    calibration.
+
+    The counts of the experiments of a result sharing an order of the measured qubits are
+    mitigated at once, by multiplying their array with the pseudo-inverse of the calibration
+    matrix. With the ``least_squares`` method, this is the solution of the constrained least
+    squares problem of the fitter's filter whenever it has no negative counts and the
+    calibration matrix has full rank. The other experiments are mitigated by the fitter's filter.
+
+    The calibration matrices can be saved to a file with their timestamps, and loaded by
+    later runs on the same backend.
+    """
+
+    def __init__(self,
+                 backend_name: str,
+                 method: str = 'least_squares',
+                 file_name: Optional[str] = None) -> None:
+        """
+        Args:
+            backend_name: The name of the backend the calibrations are made on.
+            method: The fitting method of the mitigation, ``least_squares`` or
+                ``pseudo_inverse``.
+            file_name: Optional file the calibration matrices are saved to and loaded from.
+                The calibrations in the file are loaded if it exists.
+
+        Raises:
+            AquaError: invalid method
+        """
+        if method not in ('least_squares', 'pseudo_inverse'):
+            raise AquaError('Unknown mitigation method {}.'.format(method))
+        self._backend_name = backend_name
+        self._method = method
+        self._file_name = file_name
+        # the calibrations, keyed on the calibrated qubits and the shots
+        self._calibrations = {}  # type: Dict[Tuple[FrozenSet[int], int], Dict[str, Any]]
+        if file_name is not None and os.path.isfile(file_name):
+            self.load(file_name)
+
+    @property
+    def file_name(self) -> Optional[str]:
+        """ Returns the file the calibration matrices are saved to. """
+        return self._file_name
+
+    def add_fitter(self,
+                   qubits: List[int],
+                   shots: int,
+                   fitter: CompleteMeasFitter,
+                   timestamp: Optional[float] = None) -> None:
+        """
+        Adds the fitter of a calibration, replacing the previous calibration of the qubits, and
+        saves the calibration matrices if there is a file.
+
+        Args:
+            qubits: The calibrated qubits, in the order of the qubits of the fitter.
+            shots: The number of shots of the calibration.
+            fitter: The fitter of the calibration.
+            timestamp: The time of the calibration. Defaults to the current time.
+        """
+        self._calibrations[(frozenset(qubits), shots)] = {
+            'qubits': list(qubits), 'fitter': fitter,
+            'timestamp': time.time() if timestamp is None else timestamp,
+            'fitters': {tuple(qubits): fitter}, 'inverses': {}}
+        if self._file_name is not None:
+            self.save(self._file_name)
+
+    def get_fitter(self,
+                   qubits: List[int],
+                   shots: int) -> Tuple[Optional[CompleteMeasFitter], float]:
+        """
+        Returns the fitter of the qubits, in their order, from the calibration of the qubits or,
+        if there is none, from the most recent calibration of a superset of the qubits, with the
+        same number of shots.
+
+        Args:
+            qubits: The measured qubits.
+            shots: The number of shots of the calibration.
+
+        Returns:
+            The fitter and the timestamp of its calibration, or None and 0 if the qubits are not
+            calibrated.
+        """
+        calibration = self._calibration(qubits, shots)
+        if calibration is None:
+            return None, 0.
+        return self._fitter(calibration, tuple(qubits)), calibration['timestamp']
+
+    def _calibration(self, qubits: List[int], shots: int) -> Optional[Dict[str, Any]]:
+        qubit_set = frozenset(qubits)
+        calibration = self._calibrations.get((qubit_set, shots))
+        if calibration is None:
+            supersets = [calib for (calib_qubits, calib_shots), calib
+                         in self._calibrations.items()
+                         if calib_shots == shots and qubit_set < calib_qubits]
+            if supersets:
+                calibration = max(supersets, key=lambda calib: calib['timestamp'])
+                logger.info("The qubits used in the current job is the subset of "
+                            "previous jobs, "
+                            "reusing the calibration matrix if it is not out-of-date.")
+        return calibration
+
+    @staticmethod
+    def _fitter(calibration: Dict[str, Any], qubits: Tuple[int, ...]) -> CompleteMeasFitter:
+        """ Returns the fitter of the calibration for the qubits, in their order. """
+        fitter = calibration['fitters'].get(qubits)
+        if fitter is None:
+            fitter = _subset_fitter(calibration['fitter'], list(qubits))
+            calibration['fitters'][qubits] = fitter
+        return fitter
+
+    def apply(self,
+              result: Result,
+              qubits: List[int],
+              qubit_mappings: Dict[str, List[int]],
+              shots: int) -> None:
+        """
+        Mitigates the counts of the experiments of the result in place.
+
+        Args:
+            result: The result, whose experiments are the ones of ``qubit_mappings``.
+            qubits: The sorted measured qubits.
+            qubit_mappings: The indices of the experiments of each order of the measured qubits,
+                keyed on the qubits joined by ``'_'``, see ``get_measured_qubits_from_qobj``.
+            shots: The number of shots of the calibration.
+
+        Raises:
+            AquaError: the qubits are not calibrated.
+        """
+        calibration = self._calibration(qubits, shots)
+        if calibration is None:
+            raise AquaError('The qubits {} are not calibrated.'.format(qubits))
+        for qubits_str, experiment_indices in qubit_mappings.items():
+            order = tuple(int(qubit) for qubit in qubits_str.split('_'))
+            fitter = self._fitter(calibration, order)
+            inverse = calibration['inverses'].get(order)
+            if inverse is None:
+                inverse = _Inverse(fitter)
+                calibration['inverses'][order] = inverse
+            inverse.apply(result, experiment_indices, self._method, fitter)
+
+    def cal_matrices(self) -> Dict[str, Tuple[np.ndarray, float]]:
+        """ Returns the calibration matrices and their timestamps, keyed on the calibrated
+        qubits and the shots joined by ``'_'``. """
+        return {'_'.join(str(qubit) for qubit in calibration['qubits'] + [shots]):
+                (calibration['fitter'].cal_matrix, calibration['timestamp'])
+                for (_, shots), calibration in self._calibrations.items()}
+
+    def save(self, file_name: str) -> None:
+        """
+        Saves the calibration matrices and their timestamps, keeping the calibrations of other
+        backends, and the more recent ones of this backend, already in the file.
+
+        Args:
+            file_name: The file.
+        """
+        entries = {}
+        if os.path.isfile(file_name):
+            for entry in self._read(file_name):
+                entries[(entry['backend'], frozenset(entry['qubits']), entry['shots'])] = entry
+        for (qubit_set, shots), calibration in self._calibrations.items():
+            key = (self._backend_name, qubit_set, shots)
+            if key not in entries or entries[key]['timestamp'] <= calibration['timestamp']:
+                fitter = calibration['fitter']
+                entries[key] = {'backend': self._backend_name, 'qubits': calibration['qubits'],
+                                'shots': shots, 'timestamp': calibration['timestamp'],
+                                'state_labels': list(fitter.state_labels),
+                                'cal_matrix': np.asarray(fitter.cal_matrix).tolist()}
+
+        tmp_file_name = '{}.{}.tmp'.format(file_name, os.getpid())
+        try:
+            with open(tmp_file_name, 'w') as file:
+                json.dump(list(entries.values()), file)
+            # atomic, so that concurrent processes never read a partially written file
+            os.replace(tmp_file_name, file_name)
+        except OSError as ex:
+            logger.warning('Failed to save the calibration matrices in %s: %s', file_name, ex)
+
+    def load(self, file_name: str) -> None:
+        """
+        Loads the calibrations of the backend from a file, keeping the more recent ones already
+        loaded.
+
+        Args:
+            file_name: The file.
+        """
+        for entry in self._read(file_name):
+            if entry['backend'] != self._backend_name:
+                continue
+            key = (frozenset(entry['qubits']), entry['shots'])
+            if key in self._calibrations \
+                    and self._calibrations[key]['timestamp'] >= entry['timestamp']:
+                continue
+            fitter = CompleteMeasFitter(None, entry['state_labels'], qubit_list=entry['qubits'])
+            fitter.cal_matrix = np.array(entry['cal_matrix'], dtype=float)
+            self._calibrations[key] = {
+                'qubits': entry['qubits'], 'fitter': fitter, 'timestamp': entry['timestamp'],
+                'fitters': {tuple(entry['qubits']): fitter}, 'inverses': {}}
+
+    @staticmethod
+    def _read(file_name: str) -> List[Dict[str, Any]]:
+        try:
+            with open(file_name, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError) as ex:
+            logger.warning('Failed to load the calibration matrices from %s: %s', file_name, ex)
+            return []
+
+
+class _Inverse:
+    """ The pseudo-inverse of the calibration matrix of a fitter, and the indices of the
+    measured values in its state labels. """
+
+    def __init__(self, fitter: CompleteMeasFitter) -> None:
+        cal_matrix = np.asarray(fitter.cal_matrix, dtype=float)
+        self._labels = list(fitter.state_labels)
+        self._num_bits = len(self._labels[0])
+        label_indices = {label: i for i, label in enumerate(self._labels)}
+        # the index of the state label of each measured value, -1 if there is none
+        self._indices = np.array([label_indices.get(format(value, '0{}b'.format(self._num_bits)),
+                                                    -1)
+                                  for value in range(2 ** self._num_bits)])
+        self._pinv = linalg.pinv(cal_matrix)
+        self._full_rank = np.linalg.matrix_rank(cal_matrix) == len(self._labels)
+
+    def apply(self,
+              result: Result,
+              experiment_indices: List[int],
+              method: str,
+              fitter: CompleteMeasFitter) -> None:
+        """ Mitigates the counts of the experiments of the result in place. """
+        counts = np.zeros((len(self._labels), len(experiment_indices)))
+        valid = np.ones(len(experiment_indices), dtype=bool)
+        for column, index in enumerate(experiment_indices):
+            for key, count in result.results[index].data.counts.items():
+                value = int(key, 16) if key.startswith('0x') else int(key.replace(' ', ''), 2)
+                label_index = self._indices[value] if value < len(self._indices) else -1
+                if label_index < 0:
+                    valid[column] = False
+                    break
+                counts[label_index, column] += count
+
+        mitigated = self._pinv.dot(counts)
+        if method == 'least_squares':
+            # the unconstrained solution is the constrained one if it is physical
+            shots = counts.sum(axis=0)
+            tolerance = 1e-9 * np.maximum(shots, 1)
+            valid &= self._full_rank & np.all(mitigated >= -tolerance, axis=0) \
+                & (np.abs(mitigated.sum(axis=0) - shots) <= tolerance * len(self._labels))
+            np.clip(mitigated, 0, None, out=mitigated)
+
+        for column, index in enumerate(experiment_indices):
+            if valid[column]:
+                new_counts = {self._labels[i]: value
+                              for i, value in enumerate(mitigated[:, column].tolist())
+                              if value != 0}
+            else:
+                new_counts = fitter.filter.apply(result.get_counts(index), method)
+            result.results[index].data.counts = new_counts
+
+
+def _subset_fitter(fitter: CompleteMeasFitter, qubits: List[int]) -> CompleteMeasFitter:
+    """ The fitter of a subset of the qubits of the fitter, in the order of ``qubits``, as
+    ``CompleteMeasFitter.subset_fitter``, with the calibration matrix marginalized at once. """
+    qubit_list = list(fitter.qubit_list)
+    try:
+        positions = [qubit_list.index(qubit) for qubit in qubits]
+    except ValueError as ex:
+        raise AquaError('The qubits {} are not a subset of the calibrated qubits '
+                        '{}.'.format(qubits, qubit_list)) from ex
+    new_labels = [bin(j)[2:].zfill(len(qubits)) for j in range(2 ** len(qubits))]
+    new_indices = {label: i for i, label in enumerate(new_labels)}
+    # the reduced label of each state of the fitter
+    mapping = np.array([new_indices[''.join(label[position] for position in positions)]
+                        for label in fitter.state_labels])
+    projection = np.zeros((len(new_labels), len(mapping)))
+    projection[mapping, np.arange(len(mapping))] = 1
+    cal_matrix = projection.dot(np.asarray(fitter.cal_matrix)).dot(projection.T)
+    cal_matrix /= projection.sum(axis=1)[:, np.newaxis]
+
+    new_fitter = CompleteMeasFitter(None, new_labels, qubit_list=list(qubits))
+    new_fitter.cal_matrix = cal_matrix
+    return new_fitter
@@ -0,0 +1,316 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" In-process NumPy statevector simulator """
+
+from typing import Optional, List, Dict, Tuple, Union
+from collections import OrderedDict
+import logging
+import string
+
+import numpy as np
+from qiskit.circuit import QuantumCircuit, Parameter, ParameterExpression
+from qiskit.quantum_info import Operator
+
+from ..aqua_error import AquaError
+
+logger = logging.getLogger(__name__)
+
+# instructions which do not act on the state
+_SKIPPED = ('barrier', 'snapshot', 'delay', 'id')
+
+
+class NumPyStatevectorSimulator:
+    """
+    Simulates the statevectors of circuits in the process with NumPy, without assembling a
+    Qobj nor parsing a ``Result``, which for small circuits evaluated many times, e.g. in
+    variational algorithms, takes longer than the simulation itself.
+
+    The gates are applied one by one to the state, held as an array with one axis per qubit.
+    Consecutive single qubit gates on a qubit are fused into one, and the bindings of the
+    parameters of a circuit are simulated together, as a batch of states.
+
+    The circuits are compiled, i.e. the matrices of their fixed gates computed, on first use.
+    The compiled circuits are cached, they are identified by the ``id()`` of the circuit, so
+    circuits must not be modified after being simulated.
+    """
+
+    def __init__(self,
+                 max_amplitudes: int = 2 ** 22,
+                 cache_size: int = 32) -> None:
+        """
+        Args:
+            max_amplitudes: Maximum number of amplitudes of the batches of states. The bindings
+                of the parameters are simulated in batches of at most
+                ``max_amplitudes // 2 ** num_qubits`` states.
+            cache_size: Maximum number of compiled circuits held.
+
+        Raises:
+            ValueError: invalid sizes
+        """
+        if max_amplitudes < 1:
+            raise ValueError('max_amplitudes must be at least 1, not {}.'.format(max_amplitudes))
+        if cache_size < 1:
+            raise ValueError('cache_size must be at least 1, not {}.'.format(cache_size))
+        self._max_amplitudes = max_amplitudes
+        self._cache_size = cache_size
+        self._programs = OrderedDict()  # type: OrderedDict
+
+    def run(self,
+            circuits: Union[QuantumCircuit, List[QuantumCircuit]],
+            param_bindings: Optional[List[Dict[Parameter, float]]] = None,
+            initial_statevector: Optional[np.ndarray] = None) -> List[np.ndarray]:
+        """
+        Simulates the statevectors of the circuits.
+
+        Args:
+            circuits: The circuits to simulate, without measurements.
+            param_bindings: The bindings of the parameters to simulate each circuit with.
+                Parameters not in a circuit are ignored. If None, the circuits must not have
+                parameters.
+            initial_statevector: The state the circuits are applied to, instead of
+                :math:`|0\\rangle`.
+
+        Returns:
+            For each circuit, the array of its statevectors for each binding, of shape
+            ``(len(param_bindings), 2 ** num_qubits)``, or ``(1, 2 ** num_qubits)`` if
+            ``param_bindings`` is None.
+
+        Raises:
+            AquaError: a circuit can not be simulated, or its parameters are not all bound.
+        """
+        if isinstance(circuits, QuantumCircuit):
+            circuits = [circuits]
+        if param_bindings is None:
+            param_bindings = [{}]
+        results = []
+        for circuit in circuits:
+            program = self._program(circuit)
+            batch_size = max(1, self._max_amplitudes >> circuit.num_qubits)
+            states = [program.run(param_bindings[start:start + batch_size], initial_statevector)
+                      for start in range(0, len(param_bindings), batch_size)]
+            results.append(states[0] if len(states) == 1 else np.concatenate(states))
+        return results
+
+    def clear(self) -> None:
+        """ Removes all the compiled circuits from the cache. """
+        self._programs.clear()
+
+    def _program(self, circuit: QuantumCircuit) -> '_Program':
+        """ Returns the compiled circuit, from the cache if it is there. """
+        key = id(circuit)
+        entry = self._programs.get(key)
+        if entry is not None and entry[0] is circuit and entry[1] == len(circuit.data):
+            self._programs.move_to_end(key)
+            return entry[2]
+        program = _Program(circuit)
+        self._programs[key] = (circuit, len(circuit.data), program)
+        while len(self._programs) > self._cache_size:
+            self._programs.popitem(last=False)
+        return program
+
+
+class _Program:
+    """ A circuit compiled to the matrices of its gates. """
+
+    def __init__(self, circuit: QuantumCircuit) -> None:
+        self.num_qubits = circuit.num_qubits
+        self.parameters = set(circuit.parameters)
+        # the qubits, and either the matrix of a fixed gate or the instruction and the
+        # expressions of its parameters
+        self.ops = []  # type: List[Tuple[Tuple[int, ...], Optional[np.ndarray], Optional[tuple]]]
+        for inst, qargs, _ in circuit.data:
+            if inst.name in _SKIPPED:
+                continue
+            if inst.name in ('measure', 'reset') or getattr(inst, 'condition', None):
+                raise AquaError('The NumPy statevector simulator only supports unitary '
+                                'circuits, not the instruction {}.'.format(inst.name))
+            qubits = tuple(circuit.find_bit(qubit).index if hasattr(circuit, 'find_bit')
+                           else circuit.qubits.index(qubit) for qubit in qargs)
+            if any(isinstance(param, ParameterExpression) and param.parameters
+                   for param in inst.params):
+                exprs = [_Expression(param) for param in inst.params]
+                self.ops.append((qubits, None, (inst, exprs)))
+            elif any(isinstance(param, ParameterExpression) for param in inst.params):
+                self.ops.append((qubits, _matrix(inst, [_float(param) for param in inst.params]),
+                                 None))
+            else:
+                self.ops.append((qubits, _matrix(inst), None))
+        self.global_phase = _Expression(circuit.global_phase)
+
+    def run(self, param_bindings: List[Dict[Parameter, float]],
+            initial_statevector: Optional[np.ndarray]) -> np.ndarray:
+        """ Returns the statevectors for the bindings, as a (batch, 2 ** num_qubits) array. """
+        batch = len(param_bindings)
+        values = {}
+        for param in self.parameters:
+            try:
+                values[param] = np.array([binding[param] for binding in param_bindings],
+                                         dtype=float)
+            except KeyError as ex:
+                raise AquaError('The parameter {} of the circuit is not bound.'
+                                .format(param)) from ex
+
+        num_qubits = self.num_qubits
+        shape = (batch,) + (2,) * num_qubits
+        if initial_statevector is None:
+            state = np.zeros((batch, 2 ** num_qubits), dtype=complex)
+            state[:, 0] = 1
+        else:
+            state = np.tile(np.asarray(initial_statevector, dtype=complex), (batch, 1))
+        state = state.reshape(shape)
+
+        # the single qubit gates not applied yet, fused per qubit
+        pending = {}  # type: Dict[int, np.ndarray]
+        for qubits, matrix, gate in self.ops:
+            if matrix is None:
+                inst, exprs = gate
+                matrix = _batch_matrix(inst, [expr.evaluate(values, batch) for expr in exprs])
+            if len(qubits) == 1:
+                qubit = qubits[0]
+                pending[qubit] = matrix @ pending[qubit] if qubit in pending else matrix
+                continue
+            for qubit in qubits:
+                if qubit in pending:
+                    state = apply_gate(pending.pop(qubit), state, (qubit,))
+            state = apply_gate(matrix, state, qubits)
+        for qubit, matrix in pending.items():
+            state = apply_gate(matrix, state, (qubit,))
+
+        state = state.reshape(batch, 2 ** num_qubits)
+        phase = self.global_phase.evaluate(values, batch)
+        if np.any(phase != 0):
+            state = state * np.exp(1j * np.asarray(phase)).reshape(-1, 1)
+        return state
+
+
+class _Expression:
+    """ A parameter expression, evaluated for all the bindings at once. """
+
+    def __init__(self, expr: Union[float, ParameterExpression]) -> None:
+        self._value = None
+        self._param = None
+        self._function = None
+        self._expr = expr
+        if not isinstance(expr, ParameterExpression) or not expr.parameters:
+            self._value = _float(expr)
+        elif isinstance(expr, Parameter):
+            self._param = expr
+        else:
+            self._params = list(expr.parameters)
+            try:
+                # pylint: disable=import-outside-toplevel
+                import sympy
+                symbols = [expr._parameter_symbols[param] for param in self._params]
+                self._function = sympy.lambdify(symbols, sympy.sympify(expr._symbol_expr),
+                                                'numpy')
+            except Exception:  # pylint: disable=broad-except
+                logger.debug('Parameter expression %s evaluated binding by binding.', expr)
+
+    def evaluate(self, values: Dict[Parameter, np.ndarray], batch: int
+                 ) -> Union[float, np.ndarray]:
+        """ Returns the value of the expression, or the array of its values for the bindings."""
+        if self._value is not None:
+            return self._value
+        if self._param is not None:
+            return values[self._param]
+        if self._function is not None:
+            result = np.real(self._function(*[values[param] for param in self._params]))
+            return np.broadcast_to(result, (batch,)).astype(float)
+        return np.array([_float(self._expr.bind({param: values[param][i]
+                                                 for param in self._params}))
+                         for i in range(batch)])
+
+
+def _float(value) -> float:
+    """ Returns the value of a number or bound parameter expression. """
+    return float(np.real(complex(value)))
+
+
+def _matrix(inst, params: Optional[List[float]] = None) -> np.ndarray:
+    """ Returns the matrix of an instruction, with the given parameters if any. """
+    if params is not None:
+        inst = inst.copy()
+        inst.params = params
+    try:
+        return np.asarray(inst.to_matrix(), dtype=complex)
+    except Exception:  # pylint: disable=broad-except
+        try:
+            return Operator(inst).data
+        except Exception as ex:  # pylint: disable=broad-except
+            raise AquaError('The NumPy statevector simulator does not support the '
+                            'instruction {}.'.format(inst.name)) from ex
+
+
+def _batch_matrix(inst, values: List[Union[float, np.ndarray]]) -> np.ndarray:
+    """ Returns the matrices of a parameterized gate for the bindings, as a (batch, d, d)
+    array. """
+    name = inst.name
+    batch = max(np.size(value) for value in values)
+    values = [np.broadcast_to(value, (batch,)) for value in values]
+    if name in ('u1', 'p', 'rz', 'u2', 'u3', 'u', 'rx', 'ry'):
+        matrix = np.empty((batch, 2, 2), dtype=complex)
+        if name in ('u1', 'p', 'rz'):
+            lam = values[0]
+            matrix[:, 0, 1] = matrix[:, 1, 0] = 0
+            if name == 'rz':
+                matrix[:, 0, 0] = np.exp(-0.5j * lam)
+                matrix[:, 1, 1] = np.exp(0.5j * lam)
+            else:
+                matrix[:, 0, 0] = 1
+                matrix[:, 1, 1] = np.exp(1j * lam)
+            return matrix
+        if name in ('rx', 'ry'):
+            cos, sin = np.cos(values[0] / 2), np.sin(values[0] / 2)
+            matrix[:, 0, 0] = matrix[:, 1, 1] = cos
+            if name == 'rx':
+                matrix[:, 0, 1] = matrix[:, 1, 0] = -1j * sin
+            else:
+                matrix[:, 0, 1] = -sin
+                matrix[:, 1, 0] = sin
+            return matrix
+        theta, phi, lam = (np.full(batch, np.pi / 2), *values) if name == 'u2' else values
+        cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+        matrix[:, 0, 0] = cos
+        matrix[:, 0, 1] = -np.exp(1j * lam) * sin
+        matrix[:, 1, 0] = np.exp(1j * phi) * sin
+        matrix[:, 1, 1] = np.exp(1j * (phi + lam)) * cos
+        return matrix
+    return np.array([_matrix(inst, [float(value[i]) for value in values])
+                     for i in range(batch)])
+
+
+def apply_gate(matrix: np.ndarray, state: np.ndarray, qubits: Tuple[int, ...]) -> np.ndarray:
+    """ Applies the matrix of a gate on the qubits to a state, held as an array with one axis
+    per qubit, the last one being qubit 0, after any batch axes. A (batch, d, d) matrix is
+    applied state by state to a batch of states, of shape (batch,) + (2,) * num_qubits. """
+    num_gate_qubits = len(qubits)
+    # the axis of qubit q is ndim - 1 - q, and the gate's first qubit is its lowest bit
+    axes = [state.ndim - 1 - qubit for qubit in reversed(qubits)]
+    if matrix.ndim == 2:
+        state = np.tensordot(matrix.reshape((2,) * 2 * num_gate_qubits), state,
+                             axes=(list(range(num_gate_qubits, 2 * num_gate_qubits)), axes))
+        return np.moveaxis(state, list(range(num_gate_qubits)), axes)
+    num_qubits = state.ndim - 1
+    if num_qubits + num_gate_qubits + 1 > len(string.ascii_letters):
+        raise AquaError('Too many qubits for the NumPy statevector simulator.')
+    letters = string.ascii_letters
+    state_indices = letters[:num_qubits + 1]
+    input_indices = ''.join(state_indices[axis] for axis in axes)
+    output_indices = letters[num_qubits + 1:num_qubits + 1 + num_gate_qubits]
+    result_indices = list(state_indices)
+    for axis, index in zip(axes, output_indices):
+        result_indices[axis] = index
+    subscripts = '{}{}{},{}->{}'.format(state_indices[0], output_indices, input_indices,
+                                        state_indices, ''.join(result_indices))
+    return np.einsum(subscripts,
+                     matrix.reshape((matrix.shape[0],) + (2,) * 2 * num_gate_qubits), state)
@@ -0,0 +1,188 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Qobj templates bound by patching the parameter values of their instructions """
+
+from typing import List, Dict, Callable, Set
+import copy
+import uuid
+
+import numpy as np
+from qiskit.circuit import QuantumCircuit, Parameter, ParameterExpression
+from qiskit.qobj import QasmQobj, QasmQobjExperiment
+
+from ..aqua_error import AquaError
+from .numpy_statevector import _Expression
+
+
+class QobjTemplate:
+    """
+    A Qobj assembled once from parameterized circuits, which is bound to many values of the
+    parameters by patching the parameters of its instructions, rather than by binding the
+    circuits and assembling them again, which is slow for many bindings.
+
+    The instruction slots fed by each parameter, and their expressions, are recorded when the
+    template is built. For a list of bindings, the expressions are evaluated for all the
+    bindings at once, and the bound experiments share the instructions which do not depend on
+    the parameters with the template.
+
+    Any backend accepting a ``QasmQobj`` can run the bound Qobjs. The run configuration, e.g.
+    the number of shots, is the one the template was assembled with.
+    """
+
+    def __init__(self,
+                 circuits: List[QuantumCircuit],
+                 assemble: Callable[[List[QuantumCircuit]], QasmQobj],
+                 param_binding: Dict[Parameter, float]) -> None:
+        """
+        Args:
+            circuits: The parameterized circuits, transpiled for the backend.
+            assemble: The function assembling circuits into a Qobj, e.g.
+                :meth:`~qiskit.aqua.QuantumInstance.assemble`.
+            param_binding: Values of the parameters of the circuits, used to assemble them.
+
+        Raises:
+            AquaError: the circuits cannot be bound by patching their instructions, e.g. they
+                have parameterized calibrations, or parameters without a value.
+        """
+        self._parameters = set()  # type: Set[Parameter]
+        bound_circuits = []
+        for circuit in circuits:
+            if circuit.calibrations and circuit.parameters:
+                raise AquaError('Circuits with calibrations cannot be bound in a Qobj template.')
+            missing = [param for param in circuit.parameters if param not in param_binding]
+            if missing:
+                raise AquaError('The parameters {} are not bound.'.format(missing))
+            self._parameters.update(circuit.parameters)
+            bound_circuits.append(circuit.assign_parameters(
+                {param: param_binding[param] for param in circuit.parameters}))
+
+        self._qobj = assemble(bound_circuits)
+        if not isinstance(self._qobj, QasmQobj) \
+                or len(self._qobj.experiments) != len(circuits):
+            raise AquaError('The circuits are not assembled into a QasmQobj, one experiment '
+                            'per circuit.')
+
+        values = {param: np.array([value], dtype=float) for param, value in param_binding.items()
+                  if param in self._parameters}
+        # for each experiment, its parameterized instructions, with the indices and expressions
+        # of their parameterized parameters, and the expression of its global phase
+        self._slots = []  # type: List[List]
+        self._global_phases = []  # type: List
+        for circuit, experiment in zip(circuits, self._qobj.experiments):
+            slots = self._record_slots(circuit, experiment, values)
+            self._slots.append(slots)
+            global_phase = None
+            if isinstance(circuit.global_phase, ParameterExpression) \
+                    and circuit.global_phase.parameters:
+                global_phase = _Expression(circuit.global_phase)
+            self._global_phases.append(global_phase)
+
+    @staticmethod
+    def _record_slots(circuit: QuantumCircuit,
+                      experiment: QasmQobjExperiment,
+                      values: Dict[Parameter, np.ndarray]) -> List:
+        """ Records the parameterized instructions of the experiment assembled from the circuit,
+        and checks that their assembled parameters are the values of their expressions. """
+        slots = []
+        # the assembler inserts a bfunc instruction before each conditional instruction
+        index = 0
+        for inst, _, _ in circuit.data:
+            if inst.condition is not None:
+                index += 1
+            params = [(param_index, _Expression(param))
+                      for param_index, param in enumerate(inst.params)
+                      if isinstance(param, ParameterExpression) and param.parameters]
+            if params:
+                if index >= len(experiment.instructions) \
+                        or experiment.instructions[index].name != inst.name:
+                    raise AquaError('The instruction {} is not assembled into the '
+                                    'experiment.'.format(inst.name))
+                assembled_params = experiment.instructions[index].params
+                for param_index, expr in params:
+                    value = float(np.real(np.ravel(expr.evaluate(values, 1))[0]))
+                    try:
+                        assembled_value = float(assembled_params[param_index])
+                    except (TypeError, ValueError):
+                        assembled_value = None
+                    if assembled_value is None or not np.isclose(assembled_value, value):
+                        raise AquaError('The parameter {} of the instruction {} is not '
+                                        'assembled into its value.'.format(param_index,
+                                                                           inst.name))
+                slots.append((index, params))
+            index += 1
+        if index != len(experiment.instructions):
+            raise AquaError('The circuit {} is not assembled one instruction per '
+                            'instruction.'.format(circuit.name))
+        return slots
+
+    @property
+    def parameters(self) -> Set[Parameter]:
+        """ Returns the parameters of the circuits. """
+        return self._parameters
+
+    @property
+    def qobj(self) -> QasmQobj:
+        """ Returns the Qobj assembled from the circuits. """
+        return self._qobj
+
+    def bind(self, param_bindings: List[Dict[Parameter, float]]) -> QasmQobj:
+        """
+        Binds the template to the parameter bindings.
+
+        Args:
+            param_bindings: The bindings of the parameters. Bindings may contain other
+                parameters than the ones of the circuits.
+
+        Returns:
+            A Qobj with an experiment per circuit and binding, the experiments of a circuit
+            being consecutive, in the order of the bindings.
+
+        Raises:
+            AquaError: a parameter of the circuits is not bound.
+        """
+        batch = len(param_bindings)
+        try:
+            values = {param: np.array([binding[param] for binding in param_bindings],
+                                      dtype=float)
+                      for param in self._parameters}
+        except KeyError as ex:
+            raise AquaError('The parameter {} is not bound.'.format(ex.args[0])) from ex
+
+        experiments = []
+        for experiment, slots, global_phase in zip(self._qobj.experiments, self._slots,
+                                                   self._global_phases):
+            # the values of the slots of all the bindings, as lists of floats
+            slot_values = [[np.broadcast_to(expr.evaluate(values, batch), (batch,)).tolist()
+                            for _, expr in params] for _, params in slots]
+            phases = None
+            if global_phase is not None:
+                phases = np.broadcast_to(global_phase.evaluate(values, batch), (batch,)).tolist()
+
+            for i in range(batch):
+                instructions = list(experiment.instructions)
+                for (index, params), param_values in zip(slots, slot_values):
+                    instruction = copy.copy(instructions[index])
+                    instruction.params = list(instruction.params)
+                    for (param_index, _), values_of_param in zip(params, param_values):
+                        instruction.params[param_index] = values_of_param[i]
+                    instructions[index] = instruction
+                header = experiment.header
+                if phases is not None:
+                    header = copy.copy(header)
+                    header.global_phase = phases[i]
+                experiments.append(QasmQobjExperiment(instructions=instructions,
+                                                      header=header,
+                                                      config=experiment.config))
+
+        return QasmQobj(qobj_id=str(uuid.uuid4()), config=self._qobj.config,
+                        experiments=experiments, header=self._qobj.header)
@@ -19,6 +19,7 @@ import time
 import copy
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
@@ -35,9 +36,11 @@ from qiskit.aqua.utils.backend_utils import (is_aer_provider,
                                              is_simulator_backend,
                                              is_local_backend,
                                              is_ibmq_provider)
+from qiskit.aqua.utils.execution_metrics import ExecutionMetrics
 
 MAX_CIRCUITS_PER_JOB = os.environ.get('QISKIT_AQUA_MAX_CIRCUITS_PER_JOB', None)
 MAX_GATES_PER_JOB = os.environ.get('QISKIT_AQUA_MAX_GATES_PER_JOB', None)
+MAX_CONCURRENT_SUBMISSIONS = os.environ.get('QISKIT_AQUA_MAX_CONCURRENT_SUBMISSIONS', 5)
 
 logger = logging.getLogger(__name__)
 
@@ -186,6 +189,38 @@ def _safe_submit_qobj(qobj: QasmQobj,
     return job, job_id
 
 
+def _measured_submit_qobj(qobj: QasmQobj,
+                          backend: Union[Backend, BaseBackend],
+                          backend_options: Dict,
+                          noise_config: Dict,
+                          skip_qobj_validation: bool,
+                          metrics: Optional[ExecutionMetrics]) -> Tuple[BaseJob, str, float]:
+    """ Submits the qobj, recording the submission in the metrics, and returns the job, its id
+    and the time it was submitted at. """
+    if metrics is None:
+        job, job_id = _safe_submit_qobj(qobj, backend, backend_options, noise_config,
+                                        skip_qobj_validation)
+    else:
+        with metrics.measure('submit', jobs=1, circuits=len(qobj.experiments)):
+            job, job_id = _safe_submit_qobj(qobj, backend, backend_options, noise_config,
+                                            skip_qobj_validation)
+    return job, job_id, time.time()
+
+
+def _record_execution(metrics: Optional[ExecutionMetrics], qobj: QasmQobj,
+                      submitted: float, started: float) -> None:
+    """ Records the queue wait and the execution of a job, from the times it was submitted
+    at and it was last seen waiting in the queue at. """
+    if metrics is None:
+        return
+    done = time.time()
+    if started > submitted:
+        metrics.record('queue', started - submitted, start=submitted, jobs=1)
+    num_circuits = len(qobj.experiments)
+    metrics.record('execution', done - started, start=started, jobs=1, circuits=num_circuits,
+                   shots=num_circuits * getattr(qobj.config, 'shots', 1))
+
+
 def _safe_get_job_status(job: BaseJob, job_id: str) -> JobStatus:
 
     while True:
@@ -210,13 +245,19 @@ def run_qobj(qobj: QasmQobj,
              backend_options: Optional[Dict] = None,
              noise_config: Optional[Dict] = None,
              skip_qobj_validation: bool = False,
-             job_callback: Optional[Callable] = None) -> Result:
+             job_callback: Optional[Callable] = None,
+             result_callback: Optional[Callable[[int, Result], None]] = None,
+             metrics: Optional[ExecutionMetrics] = None) -> Result:
     """
     An execution wrapper with Qiskit-Terra, with job auto recover capability.
 
     The auto-recovery feature is only applied for non-simulator backend.
     This wrapper will try to get the result no matter how long it takes.
 
+    If the qobj is split into several jobs, the jobs of a remote backend are submitted
+    concurrently and polled together, so the results of the jobs are available as soon as
+    each one finishes, see ``result_callback``.
+
     Args:
         qobj: qobj to execute
         backend: backend instance
@@ -228,6 +269,12 @@ def run_qobj(qobj: QasmQobj,
         job_callback: callback used in querying info of the submitted job, and
                                            providing the following arguments:
                                             job_id, job_status, queue_position, job
+        result_callback: callback invoked with the partial result of each job as soon as it is
+            available, which allows to post-process the results of finished jobs while the
+            remaining ones are executed. It is provided the following arguments:
+            the index of the first experiment of the partial result in the qobj, and the
+            partial result.
+        metrics: metrics the submission, queue wait and execution of the jobs are recorded in
 
     Returns:
         Result object
@@ -256,80 +303,39 @@ def run_qobj(qobj: QasmQobj,
     # split qobj if it exceeds the payload of the backend
 
     qobjs = _split_qobj_to_qobjs(qobj, max_circuits_per_job)
-    jobs = []
-    job_ids = []
-    for qob in qobjs:
-        job, job_id = _safe_submit_qobj(qob, backend,
-                                        backend_options, noise_config, skip_qobj_validation)
-        job_ids.append(job_id)
-        jobs.append(job)
+    offsets = np.cumsum([0] + [len(qob.experiments) for qob in qobjs[:-1]]).tolist()
+
+    def submit(qob):
+        return _measured_submit_qobj(qob, backend, backend_options, noise_config,
+                                     skip_qobj_validation, metrics)
+
+    if len(qobjs) > 1 and not is_local_backend(backend):
+        # uploading a qobj to a remote backend takes time, submit the split qobjs concurrently
+        max_workers = min(len(qobjs), int(MAX_CONCURRENT_SUBMISSIONS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            submitted = list(executor.map(submit, qobjs))
+    else:
+        submitted = [submit(qob) for qob in qobjs]
+    jobs = [job for job, _, _ in submitted]
+    job_ids = [job_id for _, job_id, _ in submitted]
+    submit_times = [submit_time for _, _, submit_time in submitted]
 
     results = []
     if with_autorecover:
         logger.info("Backend status: %s", backend.status())
         logger.info("There are %s jobs are submitted.", len(jobs))
         logger.info("All job ids:\n%s", job_ids)
-        for idx, _ in enumerate(jobs):
-            job = jobs[idx]
-            job_id = job_ids[idx]
-            while True:
-                logger.info("Running %s-th qobj, job id: %s", idx, job_id)
-                # try to get result if possible
-                while True:
-                    job_status = _safe_get_job_status(job, job_id)
-                    queue_position = 0
-                    if job_status in JOB_FINAL_STATES:
-                        # do callback again after the job is in the final states
-                        if job_callback is not None:
-                            job_callback(job_id, job_status, queue_position, job)
-                        break
-                    if job_status == JobStatus.QUEUED:
-                        queue_position = job.queue_position()
-                        logger.info("Job id: %s is queued at position %s", job_id, queue_position)
-                    else:
-                        logger.info("Job id: %s, status: %s", job_id, job_status)
-                    if job_callback is not None:
-                        job_callback(job_id, job_status, queue_position, job)
-                    time.sleep(qjob_config['wait'])
-
-                # get result after the status is DONE
-                if job_status == JobStatus.DONE:
-                    while True:
-                        result = job.result(**qjob_config)
-                        if result.success:
-                            results.append(result)
-                            logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
-                            break
-
-                        logger.warning("FAILURE: Job id: %s", job_id)
-                        logger.warning("Job (%s) is completed anyway, retrieve result "
-                                       "from backend again.", job_id)
-                        job = backend.retrieve_job(job_id)
-                    break
-                # for other cases, resubmit the qobj until the result is available.
-                # since if there is no result returned, there is no way algorithm can do any process
-                # get back the qobj first to avoid for job is consumed
-                qobj = job.qobj()
-                if job_status == JobStatus.CANCELLED:
-                    logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
-                                   job_id)
-                elif job_status == JobStatus.ERROR:
-                    logger.warning("FAILURE: Job id: %s encounters the error. "
-                                   "Error is : %s. Re-submit the Qobj.",
-                                   job_id, job.error_message())
-                else:
-                    logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
-                                    "Re-submit the Qobj.", job_id, job_status)
-
-                job, job_id = _safe_submit_qobj(qobj, backend,
-                                                backend_options,
-                                                noise_config, skip_qobj_validation)
-                jobs[idx] = job
-                job_ids[idx] = job_id
+        results = _wait_for_jobs(jobs, job_ids, offsets, backend, qjob_config,
+                                 backend_options, noise_config, skip_qobj_validation,
+                                 job_callback, result_callback, metrics, qobjs, submit_times)
     else:
         results = []
-        for job in jobs:
-            results.append(job.result(**qjob_config))
+        for job, offset, qob, submit_time in zip(jobs, offsets, qobjs, submit_times):
+            result = job.result(**qjob_config)
+            _record_execution(metrics, qob, submit_time, submit_time)
+            if result_callback is not None:
+                result_callback(offset, result)
+            results.append(result)
 
     result = _combine_result_objects(results) if results else None
 
@@ -353,6 +359,110 @@ def run_qobj(qobj: QasmQobj,
     return result
 
 
+def _wait_for_jobs(jobs: List[BaseJob],
+                   job_ids: List[str],
+                   offsets: List[int],
+                   backend: Union[Backend, BaseBackend],
+                   qjob_config: Dict,
+                   backend_options: Dict,
+                   noise_config: Dict,
+                   skip_qobj_validation: bool,
+                   job_callback: Optional[Callable],
+                   result_callback: Optional[Callable[[int, Result], None]],
+                   metrics: Optional[ExecutionMetrics] = None,
+                   qobjs: Optional[List[QasmQobj]] = None,
+                   submit_times: Optional[List[float]] = None) -> List[Result]:
+    """Poll all the jobs together until each one is done, re-submitting the failed ones.
+
+    The jobs are queried in turn and the poller only sleeps once all the pending jobs
+    have been queried, so the waiting time does not grow with the number of jobs.
+    """
+    results = [None] * len(jobs)  # type: List[Optional[Result]]
+    submit_times = list(submit_times) if submit_times else [time.time()] * len(jobs)
+    # the last time each job was seen waiting to run
+    start_times = list(submit_times)
+    pending = list(range(len(jobs)))
+    for idx in pending:
+        logger.info("Running %s-th qobj, job id: %s", idx, job_ids[idx])
+
+    while pending:
+        still_pending = []
+        for idx in pending:
+            job = jobs[idx]
+            job_id = job_ids[idx]
+            job_status = _safe_get_job_status(job, job_id)
+            queue_position = 0
+            if job_status not in JOB_FINAL_STATES:
+                if job_status in (JobStatus.QUEUED, JobStatus.INITIALIZING,
+                                  JobStatus.VALIDATING):
+                    start_times[idx] = time.time()
+                if job_status == JobStatus.QUEUED:
+                    queue_position = job.queue_position()
+                    logger.info("Job id: %s is queued at position %s", job_id, queue_position)
+                else:
+                    logger.info("Job id: %s, status: %s", job_id, job_status)
+                if job_callback is not None:
+                    job_callback(job_id, job_status, queue_position, job)
+                still_pending.append(idx)
+                continue
+
+            # do callback again after the job is in the final states
+            if job_callback is not None:
+                job_callback(job_id, job_status, queue_position, job)
+
+            # get result after the status is DONE
+            if job_status == JobStatus.DONE:
+                while True:
+                    result = job.result(**qjob_config)
+                    if result.success:
+                        results[idx] = result
+                        logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
+                        break
+
+                    logger.warning("FAILURE: Job id: %s", job_id)
+                    logger.warning("Job (%s) is completed anyway, retrieve result "
+                                   "from backend again.", job_id)
+                    job = backend.retrieve_job(job_id)
+                    jobs[idx] = job
+                if qobjs is not None:
+                    _record_execution(metrics, qobjs[idx], submit_times[idx], start_times[idx])
+                if result_callback is not None:
+                    result_callback(offsets[idx], result)
+                continue
+
+            # for other cases, resubmit the qobj until the result is available.
+            # since if there is no result returned, there is no way algorithm can do any process
+            # get back the qobj first to avoid for job is consumed
+            qobj = job.qobj()
+            if job_status == JobStatus.CANCELLED:
+                logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
+                               job_id)
+            elif job_status == JobStatus.ERROR:
+                logger.warning("FAILURE: Job id: %s encounters the error. "
+                               "Error is : %s. Re-submit the Qobj.",
+                               job_id, job.error_message())
+            else:
+                logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
+                                "Re-submit the Qobj.", job_id, job_status)
+
+            job, job_id, submit_times[idx] = _measured_submit_qobj(qobj, backend,
+                                                                   backend_options,
+                                                                   noise_config,
+                                                                   skip_qobj_validation,
+                                                                   metrics)
+            start_times[idx] = submit_times[idx]
+            jobs[idx] = job
+            job_ids[idx] = job_id
+            logger.info("Running %s-th qobj, job id: %s", idx, job_id)
+            still_pending.append(idx)
+
+        pending = still_pending
+        if pending:
+            time.sleep(qjob_config['wait'])
+
+    return results
+
+
 # skip_qobj_validation = True does what backend.run
 # and aerjob.submit do, but without qobj validation.
 def run_on_backend(backend: Union[Backend, BaseBackend],
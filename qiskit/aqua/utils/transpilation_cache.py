@@ -0,0 +1,324 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Content-addressed cache of transpiled circuits """
+
+from typing import Optional, List, Dict, Tuple, Any
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import pickle
+
+from qiskit.circuit import QuantumCircuit, Parameter, ParameterExpression
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.layout import Layout
+
+logger = logging.getLogger(__name__)
+
+
+class TranspilationCache:
+    """
+    A cache of transpiled circuits, keyed on a canonical hash of the (unbound) input circuit
+    together with the backend and the transpiler settings used to transpile it.
+
+    Entries are kept in an in-memory tier with least-recently-used eviction and, if a
+    ``cache_dir`` is given, are also written to pickle files in that directory so that separate
+    processes (e.g. the points of a parameter sweep) can reuse the transpiled templates.
+    The on-disk tier is bounded as well, the least recently used files being removed first.
+
+    The parameters of a cached circuit are matched to the ones of the requested circuit by their
+    order of first appearance, so structurally identical circuits built with different
+    ``Parameter`` instances share the same entry.
+    """
+
+    def __init__(self,
+                 max_size: int = 128,
+                 cache_dir: Optional[str] = None,
+                 max_disk_size: Optional[int] = 1024) -> None:
+        """
+        Args:
+            max_size: Maximum number of transpiled circuits held in memory.
+            cache_dir: Directory for the on-disk tier. If None, only the in-memory tier is used.
+            max_disk_size: Maximum number of transpiled circuits stored in ``cache_dir``.
+                If None, the on-disk tier is unbounded.
+
+        Raises:
+            ValueError: invalid cache sizes
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1, not {}.'.format(max_size))
+        if max_disk_size is not None and max_disk_size < 1:
+            raise ValueError('max_disk_size must be at least 1, not {}.'.format(max_disk_size))
+
+        self._max_size = max_size
+        self._cache_dir = cache_dir
+        self._max_disk_size = max_disk_size
+        self._memory = OrderedDict()  # type: OrderedDict
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def max_size(self) -> int:
+        """ Returns the maximum number of entries held in memory. """
+        return self._max_size
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        """ Returns the directory of the on-disk tier. """
+        return self._cache_dir
+
+    @property
+    def hits(self) -> int:
+        """ Returns the number of lookups served from the cache, including the on-disk tier. """
+        return self._hits
+
+    @property
+    def disk_hits(self) -> int:
+        """ Returns the number of lookups served from the on-disk tier. """
+        return self._disk_hits
+
+    @property
+    def misses(self) -> int:
+        """ Returns the number of lookups which required transpilation. """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def reset_stats(self) -> None:
+        """ Reset the hit and miss counters. """
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def clear(self, disk: bool = False) -> None:
+        """ Remove all in-memory entries.
+
+        Args:
+            disk: Whether to also remove the cached files of the on-disk tier.
+        """
+        self._memory.clear()
+        if disk and self._cache_dir is not None:
+            for file_name in self._disk_files():
+                os.remove(file_name)
+
+    def key(self,
+            circuit: QuantumCircuit,
+            backend_name: str,
+            backend_config: Dict,
+            compile_config: Dict) -> str:
+        """ Compute the cache key of a circuit transpiled with the given settings.
+
+        Args:
+            circuit: the circuit to transpile
+            backend_name: name of the target backend
+            backend_config: backend configuration, as in ``QuantumInstance.backend_config``
+            compile_config: compile configuration, as in ``QuantumInstance.compile_config``
+
+        Returns:
+            The hex digest identifying the transpiled circuit.
+        """
+        settings = [backend_name]
+        for name, value in sorted(backend_config.items()):
+            settings.append((name, _canonical_setting(value)))
+        for name, value in sorted(compile_config.items()):
+            settings.append((name, _canonical_setting(value)))
+        content = repr((_circuit_fingerprint(circuit), settings))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, circuit: QuantumCircuit) -> Optional[QuantumCircuit]:
+        """ Look up the transpiled version of ``circuit`` stored under ``key``.
+
+        Args:
+            key: the cache key, as returned by :meth:`key`
+            circuit: the (untranspiled) circuit being looked up. Its name and parameters
+                are transferred to the returned circuit.
+
+        Returns:
+            A transpiled circuit, or None on a cache miss.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        else:
+            entry = self._load(key)
+            if entry is not None:
+                self._disk_hits += 1
+                self._store_in_memory(key, entry)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        transpiled, cached_params = entry
+        return _rebind(transpiled, cached_params, _ordered_parameters(circuit), circuit.name)
+
+    def put(self, key: str, circuit: QuantumCircuit, transpiled: QuantumCircuit) -> None:
+        """ Store the transpiled version of ``circuit`` under ``key``.
+
+        Args:
+            key: the cache key, as returned by :meth:`key`
+            circuit: the (untranspiled) circuit
+            transpiled: the transpiled circuit
+        """
+        entry = (transpiled.copy(), _ordered_parameters(circuit))
+        self._store_in_memory(key, entry)
+        self._dump(key, entry)
+
+    def _store_in_memory(self, key: str, entry: Tuple[QuantumCircuit, List[Parameter]]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_size:
+            self._memory.popitem(last=False)
+
+    def _file_name(self, key: str) -> str:
+        return os.path.join(self._cache_dir, '{}.pickle'.format(key))
+
+    def _disk_files(self) -> List[str]:
+        return [os.path.join(self._cache_dir, name) for name in os.listdir(self._cache_dir)
+                if name.endswith('.pickle')]
+
+    def _load(self, key: str) -> Optional[Tuple[QuantumCircuit, List[Parameter]]]:
+        if self._cache_dir is None:
+            return None
+        file_name = self._file_name(key)
+        if not os.path.isfile(file_name):
+            return None
+        try:
+            with open(file_name, 'rb') as file:
+                entry = pickle.load(file)
+            # refresh the access time used by the on-disk eviction
+            os.utime(file_name)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning('Failed to load cached transpiled circuit %s: %s', file_name, ex)
+            return None
+        return entry
+
+    def _dump(self, key: str, entry: Tuple[QuantumCircuit, List[Parameter]]) -> None:
+        if self._cache_dir is None:
+            return
+        file_name = self._file_name(key)
+        tmp_file_name = '{}.{}.tmp'.format(file_name, os.getpid())
+        try:
+            with open(tmp_file_name, 'wb') as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic, so that concurrent processes never read a partially written file
+            os.replace(tmp_file_name, file_name)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning('Failed to store transpiled circuit in %s: %s', file_name, ex)
+            return
+
+        if self._max_disk_size is not None:
+            file_names = self._disk_files()
+            if len(file_names) > self._max_disk_size:
+                file_names.sort(key=_modification_time)
+                for old_file_name in file_names[:len(file_names) - self._max_disk_size]:
+                    try:
+                        os.remove(old_file_name)
+                    except OSError:
+                        pass
+
+
+def _modification_time(file_name: str) -> float:
+    try:
+        return os.path.getmtime(file_name)
+    except OSError:
+        return 0.
+
+
+def _ordered_parameters(circuit: QuantumCircuit) -> List[Parameter]:
+    """ Returns the parameters of the circuit in order of first appearance. """
+    params = {}  # type: Dict[Parameter, None]
+    for inst, _, _ in circuit.data:
+        for inst_param in inst.params:
+            if isinstance(inst_param, ParameterExpression):
+                for param in sorted(inst_param.parameters, key=lambda p: p.name):
+                    params.setdefault(param, None)
+    global_phase = circuit.global_phase
+    if isinstance(global_phase, ParameterExpression):
+        for param in sorted(global_phase.parameters, key=lambda p: p.name):
+            params.setdefault(param, None)
+    return list(params)
+
+
+def _circuit_fingerprint(circuit: QuantumCircuit) -> Tuple:
+    """ A hashable description of the circuit, independent of the ``Parameter`` instances. """
+    param_index = {param: i for i, param in enumerate(_ordered_parameters(circuit))}
+    qubit_index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    clbit_index = {clbit: i for i, clbit in enumerate(circuit.clbits)}
+
+    def canonical_param(value: Any) -> Any:
+        if isinstance(value, ParameterExpression):
+            return (str(value),
+                    tuple(sorted((p.name, param_index[p]) for p in value.parameters)))
+        return repr(value)
+
+    data = []
+    for inst, qargs, cargs in circuit.data:
+        condition = None
+        if inst.condition is not None:
+            condition = (inst.condition[0].name, inst.condition[0].size, inst.condition[1])
+        definition = None
+        if inst.name not in _STANDARD_NAMES and inst.definition is not None:
+            # custom names (e.g. from ``to_instruction``) may hide different definitions
+            definition = _circuit_fingerprint(inst.definition)
+        data.append((inst.name,
+                     tuple(canonical_param(p) for p in inst.params),
+                     tuple(qubit_index[q] for q in qargs),
+                     tuple(clbit_index[c] for c in cargs),
+                     condition,
+                     definition))
+
+    return (tuple((reg.name, reg.size) for reg in circuit.qregs),
+            tuple((reg.name, reg.size) for reg in circuit.cregs),
+            canonical_param(circuit.global_phase),
+            tuple(data))
+
+
+def _canonical_setting(value: Any) -> Any:
+    if isinstance(value, CouplingMap):
+        return sorted(value.get_edges())
+    if isinstance(value, Layout):
+        return sorted((phys, repr(virt)) for phys, virt in value.get_physical_bits().items())
+    if isinstance(value, dict):
+        return sorted((repr(k), repr(v)) for k, v in value.items())
+    return repr(value)
+
+
+def _rebind(transpiled: QuantumCircuit,
+            cached_params: List[Parameter],
+            params: List[Parameter],
+            name: str) -> QuantumCircuit:
+    """ Returns a copy of ``transpiled`` with the parameters and the name of the requested circuit.
+    """
+    mapping = {old: new for old, new in zip(cached_params, params) if old is not new}
+    if mapping:
+        # the transpiler may have optimized some of the parameters away
+        present = transpiled.parameters
+        mapping = {old: new for old, new in mapping.items() if old in present}
+    if mapping:
+        ret = transpiled.assign_parameters(mapping, inplace=False)
+    else:
+        ret = transpiled.copy()
+    ret.name = name
+    return ret
+
+
+_STANDARD_NAMES = {'barrier', 'measure', 'reset', 'id', 'x', 'y', 'z', 'h', 's', 'sdg', 't', 'tdg',
+                   'sx', 'sxdg', 'cx', 'cy', 'cz', 'ch', 'swap', 'ccx', 'cswap', 'iswap', 'ecr',
+                   'u', 'u1', 'u2', 'u3', 'p', 'rx', 'ry', 'rz', 'rxx', 'ryy', 'rzz', 'rzx',
+                   'cu', 'cu1', 'cu3', 'cp', 'crx', 'cry', 'crz', 'mcx'}
@@ -141,6 +141,18 @@ Chemistry Classes
    WatsonHamiltonian
    MP2Info
 
+Two Body Integrals
+==================
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   TwoBodyIntegrals
+   PackedTwoBodyIntegrals
+   CholeskyTwoBodyIntegrals
+   SpinTwoBodyIntegrals
+
 Submodules
 ==========
 
@@ -158,6 +170,8 @@ Submodules
 """
 
 from .qiskit_chemistry_error import QiskitChemistryError
+from .two_body_integrals import (TwoBodyIntegrals, PackedTwoBodyIntegrals,
+                                 CholeskyTwoBodyIntegrals, SpinTwoBodyIntegrals)
 from .qmolecule import QMolecule
 from .watson_hamiltonian import WatsonHamiltonian
 from .bosonic_operator import BosonicOperator
@@ -168,6 +182,10 @@ from ._logging import (get_qiskit_chemistry_logging,
 
 __all__ = ['QiskitChemistryError',
            'QMolecule',
+           'TwoBodyIntegrals',
+           'PackedTwoBodyIntegrals',
+           'CholeskyTwoBodyIntegrals',
+           'SpinTwoBodyIntegrals',
            'WatsonHamiltonian',
            'BosonicOperator',
            'FermionicOperator',
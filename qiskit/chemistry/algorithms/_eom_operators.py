@@ -0,0 +1,322 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" The operators of the qEOM matrix elements on packed symplectic arrays """
+
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+import logging
+
+import numpy as np
+from scipy import sparse
+from qiskit.quantum_info import Pauli
+from qiskit.aqua import AquaError
+from qiskit.aqua.operators import (WeightedPauliOperator, Z2Symmetries,
+                                   TPBGroupedWeightedPauliOperator)
+from qiskit.aqua.operators.legacy import op_converter
+from qiskit.aqua.utils import pack_bits, unpack_bits, parity
+
+from ..fermionic_operator import _multiply, _reduce_terms, _TermAccumulator, _PHASES
+
+logger = logging.getLogger(__name__)
+
+# the number of Pauli products formed at once
+_BLOCK_SIZE = 2 ** 18
+# the number of Pauli strings of the cached products of the Hamiltonian
+_CACHE_SIZE = 2 ** 24
+
+
+class EomCommutators:
+    """
+    Builds the commutators of the qEOM matrix elements.
+
+    The Hamiltonian and the excitation operators are kept as packed symplectic arrays. With
+    ``s`` the sign of the commutation rule, the double commutator of the excitation operators
+    ``A``, ``C`` and the Hamiltonian ``H``,
+
+        ``A H C - s C H A + 0.5 * (- H A C + s C A H - A C H + s H C A)``,
+
+    is computed as ``A (H C - 0.5 C H) + s (0.5 H C - C H) A + 0.5 s C (A H) - 0.5 (H A) C``,
+    so that the products of the Hamiltonian with each excitation operator are formed once and
+    reused by all the matrix elements of the excitation, as long as they fit in the cache.
+    """
+
+    def __init__(self, hamiltonian: WeightedPauliOperator,
+                 hopping_operators: Dict[str, WeightedPauliOperator],
+                 sign: bool = False,
+                 z2_symmetries: Optional[Z2Symmetries] = None,
+                 threshold: float = 1e-12) -> None:
+        """
+        Args:
+            hamiltonian: the untapered Hamiltonian
+            hopping_operators: the untapered excitation operators, by key
+            sign: False anti-commutes, True commutes
+            z2_symmetries: the symmetries the commutators are tapered with, if not empty
+            threshold: the truncation threshold of the commutators
+        """
+        self._num_qubits = hamiltonian.num_qubits
+        self._num_words = pack_bits(np.zeros(self._num_qubits)).shape[-1]
+        self._hamiltonian = self._to_arrays(hamiltonian)
+        self._hopping_operators = hopping_operators
+        self._sign = 1 if sign else -1
+        self._z2_symmetries = z2_symmetries if z2_symmetries is not None \
+            and not z2_symmetries.is_empty() else None
+        self._threshold = threshold
+        self._arrays = {}  # type: Dict[str, Tuple]
+        self._cache = OrderedDict()  # type: OrderedDict
+        self._cache_size = 0
+        if self._z2_symmetries is not None:
+            self._cliffords = [self._to_arrays(clifford)
+                               for clifford in self._z2_symmetries.cliffords]
+
+    def commutators(self, left: str, right: str
+                    ) -> Tuple[Optional[WeightedPauliOperator], Optional[WeightedPauliOperator]]:
+        """
+        Computes the double commutator with the Hamiltonian and the commutator of two excitation
+        operators.
+
+        Args:
+            left: the key of the left excitation operator
+            right: the key of the right excitation operator
+
+        Returns:
+            The double commutator and the commutator, tapered if there are symmetries, or None
+            where they are empty.
+        """
+        left_ops, right_ops = self._operator(left), self._operator(right)
+        left_1, left_2 = self._products(left, left_ops, 'left')
+        right_1, right_2 = self._products(right, right_ops, 'right')
+
+        terms = _TermAccumulator(self._num_words)
+        _add_products(terms, left_ops, right_1, 1.)
+        _add_products(terms, right_2, left_ops, 1.)
+        _add_products(terms, right_ops, left_1, 1.)
+        _add_products(terms, left_2, right_ops, 1.)
+        terms.chop(self._threshold)
+        double_commutator = terms.reduce()
+
+        terms = _TermAccumulator(self._num_words)
+        _add_products(terms, left_ops, right_ops, 1.)
+        _add_products(terms, right_ops, left_ops, -1.)
+        terms.chop(self._threshold)
+        single_commutator = terms.reduce()
+
+        return self._to_operator(double_commutator), self._to_operator(single_commutator)
+
+    def _operator(self, key):
+        if key not in self._arrays:
+            self._arrays[key] = self._to_arrays(self._hopping_operators[key])
+        return self._arrays[key]
+
+    def _products(self, key, operator, side):
+        """ The combinations of the products with the Hamiltonian of an excitation operator. """
+        cached = self._cache.get((key, side))
+        if cached is not None:
+            self._cache.move_to_end((key, side))
+            return cached
+
+        products = _TermAccumulator(self._num_words)
+        _add_products(products, self._hamiltonian, operator, 1.)
+        h_e = products.reduce()
+        products = _TermAccumulator(self._num_words)
+        _add_products(products, operator, self._hamiltonian, 1.)
+        e_h = products.reduce()
+        if side == 'left':
+            # the factors of C (A H) and (H A) C
+            first = _nonzero((e_h[0], e_h[1], 0.5 * self._sign * e_h[2]))
+            second = _nonzero((h_e[0], h_e[1], -0.5 * h_e[2]))
+        else:
+            # the factors of A (H C - 0.5 C H) and s (0.5 H C - C H) A
+            x, z = np.concatenate([h_e[0], e_h[0]]), np.concatenate([h_e[1], e_h[1]])
+            first = _nonzero(_reduce_terms(x, z, np.concatenate([h_e[2], -0.5 * e_h[2]])))
+            second = _nonzero(_reduce_terms(
+                x, z, self._sign * np.concatenate([0.5 * h_e[2], -e_h[2]])))
+
+        size = len(first[2]) + len(second[2])
+        if size <= _CACHE_SIZE:
+            self._cache[(key, side)] = first, second
+            self._cache_size += size
+            while self._cache_size > _CACHE_SIZE:
+                _, (old_first, old_second) = self._cache.popitem(last=False)
+                self._cache_size -= len(old_first[2]) + len(old_second[2])
+        return first, second
+
+    def _to_arrays(self, operator):
+        """ Packs the Pauli strings of an operator. """
+        num_terms = len(operator.paulis)
+        if num_terms == 0:
+            empty = np.zeros((0, self._num_words), dtype=np.uint64)
+            return empty, empty.copy(), np.zeros(0, dtype=complex)
+        x = pack_bits(np.array([pauli.x for _, pauli in operator.paulis], dtype=bool))
+        z = pack_bits(np.array([pauli.z for _, pauli in operator.paulis], dtype=bool))
+        return x, z, np.array([weight for weight, _ in operator.paulis], dtype=complex)
+
+    def _to_operator(self, terms):
+        """ Unpacks the Pauli strings of an operator, tapering them if there are symmetries. """
+        if len(terms[2]) == 0:
+            return None
+        num_qubits = self._num_qubits
+        z2_symmetries = None
+        if self._z2_symmetries is not None:
+            terms, num_qubits = self._taper(terms), num_qubits - len(self._z2_symmetries.sq_list)
+            z2_symmetries = self._z2_symmetries.copy()
+            if len(terms[2]) == 0:
+                return None
+        x, z = unpack_bits(terms[0], num_qubits), unpack_bits(terms[1], num_qubits)
+        return WeightedPauliOperator(paulis=[[coeff, Pauli((z_k, x_k))]
+                                             for coeff, z_k, x_k in zip(terms[2], z, x)],
+                                     z2_symmetries=z2_symmetries)
+
+    def _taper(self, terms):
+        """ Tapers the Pauli strings as :meth:`Z2Symmetries.taper` in the set sector. """
+        for clifford in self._cliffords:
+            products = _TermAccumulator(self._num_words)
+            _add_products(products, clifford, terms, 1.)
+            terms = products.reduce()
+            products = _TermAccumulator(self._num_words)
+            _add_products(products, terms, clifford, 1.)
+            terms = products.reduce()
+
+        sq_list = np.asarray(self._z2_symmetries.sq_list)
+        tapering_values = np.asarray(self._z2_symmetries.tapering_values)
+        x, z = unpack_bits(terms[0], self._num_qubits), unpack_bits(terms[1], self._num_qubits)
+        acted_on = x[:, sq_list] | z[:, sq_list]
+        coeffs = terms[2] * np.prod(np.where(acted_on, tapering_values, 1), axis=1)
+        x, z = np.delete(x, sq_list, axis=1), np.delete(z, sq_list, axis=1)
+        return _nonzero(_reduce_terms(pack_bits(x), pack_bits(z), coeffs))
+
+
+def _add_products(terms, left, right, factor):
+    """ Adds the products of all the Pauli strings of two operators, in blocks. """
+    x_2, z_2, coeffs_2 = right
+    if len(coeffs_2) == 0:
+        return
+    rows = max(1, _BLOCK_SIZE // len(coeffs_2))
+    for start in range(0, len(left[2]), rows):
+        x_1, z_1 = left[0][start:start + rows], left[1][start:start + rows]
+        x, z, exponents = _multiply(x_1[:, None], z_1[:, None], x_2[None], z_2[None])
+        coeffs = factor * left[2][start:start + rows, None] * coeffs_2[None] \
+            * _PHASES[exponents % 4]
+        terms.add(x.reshape(-1, x.shape[-1]), z.reshape(-1, z.shape[-1]), coeffs.ravel())
+
+
+def _nonzero(terms):
+    keep = terms[2] != 0
+    return terms[0][keep], terms[1][keep], terms[2][keep]
+
+
+def evaluate_operators(operators: List[Optional[WeightedPauliOperator]], wave_fn,
+                       quantum_instance=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates operators on a state with a single set of measurements.
+
+    The distinct Pauli strings of all the operators are measured once, grouped in tensor product
+    bases together, and the mean of each operator is the combination of their expectation values.
+
+    Args:
+        operators: the operators, with None for operators which are zero
+        wave_fn (Union(QuantumCircuit, numpy.ndarray)): the circuit preparing the state, or the
+            statevector if there is no quantum instance
+        quantum_instance (QuantumInstance): a quantum instance with configured settings
+
+    Returns:
+        The means and the standard deviations of the operators.
+
+    Raises:
+        AquaError: if the operators do not act on the same number of qubits
+    """
+    num_ops = len(operators)
+    indices = [idx for idx, op in enumerate(operators) if op is not None and not op.is_empty()]
+    if not indices:
+        return np.zeros(num_ops, dtype=complex), np.zeros(num_ops, dtype=complex)
+    if len({operators[idx].num_qubits for idx in indices}) > 1:
+        raise AquaError("The operators do not act on the same number of qubits.")
+    num_qubits = operators[indices[0]].num_qubits
+
+    rows = np.concatenate([np.full(len(operators[idx].paulis), idx) for idx in indices])
+    coeffs = np.array([weight for idx in indices for weight, _ in operators[idx].paulis],
+                      dtype=complex)
+    x = np.array([pauli.x for idx in indices for _, pauli in operators[idx].paulis], dtype=bool)
+    z = np.array([pauli.z for idx in indices for _, pauli in operators[idx].paulis], dtype=bool)
+    keys, columns = np.unique(pack_bits(np.hstack([x, z])), axis=0, return_inverse=True)
+    x, z = unpack_bits(keys, 2 * num_qubits)[:, :num_qubits], \
+        unpack_bits(keys, 2 * num_qubits)[:, num_qubits:]
+    weights = sparse.csr_matrix((coeffs, (rows, columns.ravel())), shape=(num_ops, len(keys)))
+    logger.info('Evaluating %s operators with %s distinct Pauli strings.',
+                len(indices), len(keys))
+
+    variances = np.zeros(num_ops, dtype=complex)
+    num_shots = 1
+    if quantum_instance is None:
+        values = _statevector_expectations(np.asarray(wave_fn).ravel(), x, z)
+    else:
+        paulis = WeightedPauliOperator(paulis=[[1.0, Pauli((z_k, x_k))] for x_k, z_k in zip(x, z)])
+        if quantum_instance.is_statevector:
+            result = quantum_instance.execute(
+                paulis.construct_evaluation_circuit(wave_fn, statevector_mode=True))
+            state = np.asarray(result.get_statevector('psi'))
+            values = np.array([1.0 if not np.any(x_k | z_k) else
+                               np.vdot(state, result.get_statevector(pauli.to_label()))
+                               for (_, pauli), x_k, z_k in zip(paulis.paulis, x, z)])
+        else:
+            grouped = op_converter.to_tpb_grouped_weighted_pauli_operator(
+                paulis, TPBGroupedWeightedPauliOperator.sorted_grouping)
+            result = quantum_instance.execute(
+                grouped.construct_evaluation_circuit(wave_fn, statevector_mode=False))
+            num_shots = sum(result.get_counts(0).values())
+            positions = {pauli.to_label(): pos for pos, (_, pauli) in enumerate(paulis.paulis)}
+            values = np.zeros(len(keys))
+            for basis, group in grouped.basis:
+                group = [positions[grouped.paulis[idx][1].to_label()] for idx in group]
+                means, covariances = _measured_moments(result.get_counts(basis.to_label()),
+                                                       x[group] | z[group])
+                values[group] = means
+                # the variance of each operator is the sum of w_i w_j cov(P_i, P_j) in each basis
+                group_weights = weights[:, group]
+                touched = np.unique(group_weights.nonzero()[0])
+                group_weights = group_weights[touched]
+                variances[touched] += np.asarray(group_weights.multiply(
+                    group_weights.dot(covariances)).sum(axis=1)).ravel()
+    return weights.dot(values), np.sqrt(variances / num_shots)
+
+
+def _statevector_expectations(state, x, z):
+    """ The expectation values of Pauli strings on a statevector. """
+    num_qubits = x.shape[1]
+    powers = np.left_shift(1, np.arange(num_qubits, dtype=np.int64))
+    x_masks, z_masks = x.dot(powers), z.dot(powers)
+    basis_states = np.arange(len(state))
+    values = np.zeros(len(x), dtype=complex)
+    for x_mask in np.unique(x_masks):
+        flipped = basis_states ^ x_mask
+        products = np.conj(state) * state[flipped]
+        selected = np.flatnonzero(x_masks == x_mask)
+        rows = max(1, _BLOCK_SIZE // len(state))
+        for start in range(0, len(selected), rows):
+            block = selected[start:start + rows]
+            signs = 1. - 2. * parity((flipped[None, :] & z_masks[block, None]).astype(np.uint64))
+            values[block] = signs.dot(products)
+    # a Y is i X Z
+    return values * 1j ** np.count_nonzero(x & z, axis=1)
+
+
+def _measured_moments(counts, masks):
+    """ The means and the covariance matrix of Pauli strings measured in their diagonal basis. """
+    outcomes = np.array([np.array(list(key))[::-1] == '1' for key in counts], dtype=bool)
+    frequencies = np.array(list(counts.values()), dtype=float)
+    num_shots = frequencies.sum()
+    signs = 1. - 2. * (outcomes.astype(np.int64).dot(masks.T.astype(np.int64)) % 2)
+    means = frequencies.dot(signs) / num_shots
+    if num_shots == 1:
+        return means, np.zeros((len(masks), len(masks)))
+    deviations = signs - means
+    return means, (deviations.T * frequencies).dot(deviations) / (num_shots - 1)
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2019, 2020.
+# (C) Copyright IBM 2019, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -16,23 +16,18 @@ from typing import Optional, List, Union
 import logging
 import copy
 import itertools
-import sys
 
 import numpy as np
 from scipy import linalg
 from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.tools import parallel_map
-from qiskit.tools.events import TextProgressBar
 from qiskit.aqua import AquaError, aqua_globals
-from qiskit.aqua.operators import (LegacyBaseOperator,
-                                   WeightedPauliOperator,
-                                   Z2Symmetries,
-                                   TPBGroupedWeightedPauliOperator,
-                                   commutator)
+from qiskit.aqua.operators import LegacyBaseOperator, WeightedPauliOperator, Z2Symmetries
 from qiskit.aqua.operators.legacy import op_converter
 
 from qiskit.chemistry.components.variational_forms import UCCSD
 from qiskit.chemistry import FermionicOperator
+from .._eom_operators import EomCommutators, evaluate_operators
 
 logger = logging.getLogger(__name__)
 
@@ -216,6 +211,16 @@ class QEquationOfMotion:
     def build_all_commutators(self, excitations_list, hopping_operators, type_of_commutativities):
         """Building all commutators for Q, W, M, V matrices.
 
+        The commutators are computed on packed symplectic arrays, reusing the products of the
+        Hamiltonian with each hopping operator across the matrix elements.
+
+        The commutators are plain :class:`~qiskit.aqua.operators.WeightedPauliOperator`
+        objects, not grouped into
+        :class:`~qiskit.aqua.operators.TPBGroupedWeightedPauliOperator` ones, since
+        :meth:`build_eom_matrices` groups the distinct Pauli strings of all of them at once.
+        A commutator can still be grouped on its own with
+        :func:`~qiskit.aqua.operators.legacy.op_converter.to_tpb_grouped_weighted_pauli_operator`.
+
         Args:
             excitations_list (list): single excitations list + double excitation list
             hopping_operators (dict): all hopping operators based on excitations_list,
@@ -225,10 +230,10 @@ class QEquationOfMotion:
                                      hopping operators with the
                                      Z2 symmetries found in the original operator.
         Returns:
-            dict: key: a string of matrix indices; value: the commutators for Q matrix
-            dict: key: a string of matrix indices; value: the commutators for W matrix
-            dict: key: a string of matrix indices; value: the commutators for M matrix
-            dict: key: a string of matrix indices; value: the commutators for V matrix
+            numpy.ndarray: the WeightedPauliOperator commutators of the Q matrix, or None
+            numpy.ndarray: the WeightedPauliOperator commutators of the W matrix, or None
+            numpy.ndarray: the WeightedPauliOperator commutators of the M matrix, or None
+            numpy.ndarray: the WeightedPauliOperator commutators of the V matrix, or None
             int: number of entries in the matrix
         """
         size = len(excitations_list)
@@ -244,41 +249,28 @@ class QEquationOfMotion:
             mus = np.asarray(mus.flat)
             nus = np.asarray(nus.flat)
 
-        def _build_one_sector(available_hopping_ops):
+        commutators = EomCommutators(self._untapered_op, hopping_operators,
+                                     z2_symmetries=self._z2_symmetries)
 
-            to_be_computed_list = []
-            for idx, _ in enumerate(mus):
-                m_u = mus[idx]
-                n_u = nus[idx]
-                left_op = available_hopping_ops.get(
-                    '_'.join([str(x) for x in excitations_list[m_u]]), None)
-                right_op_1 = available_hopping_ops.get(
-                    '_'.join([str(x) for x in excitations_list[n_u]]), None)
-                right_op_2 = available_hopping_ops.get(
-                    '_'.join([str(x) for x in reversed(excitations_list[n_u])]), None)
-                to_be_computed_list.append((m_u, n_u, left_op, right_op_1, right_op_2))
-
-            if logger.isEnabledFor(logging.INFO):
-                logger.info("Building all commutators:")
-                TextProgressBar(sys.stderr)
-            results = parallel_map(QEquationOfMotion._build_commutator_rountine,
-                                   to_be_computed_list,
-                                   task_args=(self._untapered_op, self._z2_symmetries),
-                                   num_processes=aqua_globals.num_processes)
-            for result in results:
-                m_u, n_u, q_mat_op, w_mat_op, m_mat_op, v_mat_op = result
-                q_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    q_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if q_mat_op is not None else q_commutators[m_u][n_u]
-                w_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    w_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if w_mat_op is not None else w_commutators[m_u][n_u]
-                m_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    m_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if m_mat_op is not None else m_commutators[m_u][n_u]
-                v_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    v_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if v_mat_op is not None else v_commutators[m_u][n_u]
+        def _build_one_sector(available_hopping_ops):
+            for m_u, n_u in zip(mus, nus):
+                left = '_'.join([str(x) for x in excitations_list[m_u]])
+                right_1 = '_'.join([str(x) for x in excitations_list[n_u]])
+                right_2 = '_'.join([str(x) for x in reversed(excitations_list[n_u])])
+                if left not in available_hopping_ops:
+                    continue
+                if right_1 in available_hopping_ops:
+                    q_mat_op, w_mat_op = commutators.commutators(left, right_1)
+                    if q_mat_op is not None:
+                        q_commutators[m_u][n_u] = q_mat_op
+                    if w_mat_op is not None:
+                        w_commutators[m_u][n_u] = w_mat_op
+                if right_2 in available_hopping_ops:
+                    m_mat_op, v_mat_op = commutators.commutators(left, right_2)
+                    if m_mat_op is not None:
+                        m_commutators[m_u][n_u] = m_mat_op
+                    if v_mat_op is not None:
+                        v_commutators[m_u][n_u] = v_mat_op
 
         available_entry = 0
         if not self._z2_symmetries.is_empty():
@@ -348,71 +340,22 @@ class QEquationOfMotion:
         v_mat = np.zeros((size, size), dtype=complex)
         q_mat = np.zeros((size, size), dtype=complex)
         w_mat = np.zeros((size, size), dtype=complex)
-        m_mat_std, v_mat_std, q_mat_std, w_mat_std = 0, 0, 0, 0
-
-        if quantum_instance is not None:
-
-            circuit_names = []
-            circuits = []
-            for idx, _ in enumerate(mus):
-                m_u = mus[idx]
-                n_u = nus[idx]
-
-                for op in [q_commutators[m_u][n_u], w_commutators[m_u][n_u],
-                           m_commutators[m_u][n_u], v_commutators[m_u][n_u]]:
-                    if op is not None and not op.is_empty():
-                        curr_circuits = op.construct_evaluation_circuit(
-                            wave_function=wave_fn, statevector_mode=quantum_instance.is_statevector)
-                        for c in curr_circuits:
-                            if c.name not in circuit_names:
-                                circuits.append(c)
-                                circuit_names.append(c.name)
-
-            result = quantum_instance.execute(circuits)
-
-            # evaluate results
-            for idx, _ in enumerate(mus):
-                m_u = mus[idx]
-                n_u = nus[idx]
-
-                def _get_result(op):
-                    mean, std = 0.0, 0.0
-                    if op is not None and not op.is_empty():
-                        mean, std = \
-                            op.evaluate_with_result(
-                                result=result,
-                                statevector_mode=quantum_instance.is_statevector)
-                    return mean, std
-
-                q_mean, q_std = _get_result(q_commutators[m_u][n_u])
-                w_mean, w_std = _get_result(w_commutators[m_u][n_u])
-                m_mean, m_std = _get_result(m_commutators[m_u][n_u])
-                v_mean, v_std = _get_result(v_commutators[m_u][n_u])
-
-                q_mat[m_u][n_u] = q_mean if q_mean != 0.0 else q_mat[m_u][n_u]
-                w_mat[m_u][n_u] = w_mean if w_mean != 0.0 else w_mat[m_u][n_u]
-                m_mat[m_u][n_u] = m_mean if m_mean != 0.0 else m_mat[m_u][n_u]
-                v_mat[m_u][n_u] = v_mean if v_mean != 0.0 else v_mat[m_u][n_u]
-                q_mat_std += q_std
-                w_mat_std += w_std
-                m_mat_std += m_std
-                v_mat_std += v_std
-        else:
-            for idx, _ in enumerate(mus):
-                m_u = mus[idx]
-                n_u = nus[idx]
-                q_mean, q_std = q_commutators[m_u][n_u].evaluate_with_statevector(wave_fn) \
-                    if q_commutators[m_u][n_u] is not None else (0.0, 0.0)
-                w_mean, w_std = w_commutators[m_u][n_u].evaluate_with_statevector(wave_fn) \
-                    if w_commutators[m_u][n_u] is not None else (0.0, 0.0)
-                m_mean, m_std = m_commutators[m_u][n_u].evaluate_with_statevector(wave_fn) \
-                    if m_commutators[m_u][n_u] is not None else (0.0, 0.0)
-                v_mean, v_std = v_commutators[m_u][n_u].evaluate_with_statevector(wave_fn) \
-                    if v_commutators[m_u][n_u] is not None else (0.0, 0.0)
-                q_mat[m_u][n_u] = q_mean if q_mean != 0.0 else q_mat[m_u][n_u]
-                w_mat[m_u][n_u] = w_mean if w_mean != 0.0 else w_mat[m_u][n_u]
-                m_mat[m_u][n_u] = m_mean if m_mean != 0.0 else m_mat[m_u][n_u]
-                v_mat[m_u][n_u] = v_mean if v_mean != 0.0 else v_mat[m_u][n_u]
+
+        # the Pauli strings of all the matrix elements are measured together
+        operators = [commutators[m_u][n_u]
+                     for m_u, n_u in zip(mus, nus)
+                     for commutators in [q_commutators, w_commutators,
+                                         m_commutators, v_commutators]]
+        means, stds = evaluate_operators(operators, wave_fn, quantum_instance)
+        means, stds = means.reshape(-1, 4), stds.reshape(-1, 4)
+
+        for idx, (m_u, n_u) in enumerate(zip(mus, nus)):
+            q_mean, w_mean, m_mean, v_mean = means[idx]
+            q_mat[m_u][n_u] = q_mean if q_mean != 0.0 else q_mat[m_u][n_u]
+            w_mat[m_u][n_u] = w_mean if w_mean != 0.0 else w_mat[m_u][n_u]
+            m_mat[m_u][n_u] = m_mean if m_mean != 0.0 else m_mat[m_u][n_u]
+            v_mat[m_u][n_u] = v_mean if v_mean != 0.0 else v_mat[m_u][n_u]
+        q_mat_std, w_mat_std, m_mat_std, v_mat_std = stds.sum(axis=0)
 
         # pylint: disable=unsubscriptable-object
         if self._is_eom_matrix_symmetric:
@@ -508,48 +451,3 @@ class QEquationOfMotion:
                                     "to exciting operator.".format(symmetry.to_label()))
 
         return qubit_op, commutativities
-
-    @staticmethod
-    def _build_commutator_rountine(params, operator, z2_symmetries):
-        m_u, n_u, left_op, right_op_1, right_op_2 = params
-        if left_op is None:
-            q_mat_op = None
-            w_mat_op = None
-            m_mat_op = None
-            v_mat_op = None
-        else:
-            if right_op_1 is None and right_op_2 is None:
-                q_mat_op = None
-                w_mat_op = None
-                m_mat_op = None
-                v_mat_op = None
-            else:
-                if right_op_1 is not None:
-                    q_mat_op = commutator(left_op, operator, right_op_1)
-                    w_mat_op = commutator(left_op, right_op_1)
-                    q_mat_op = None if q_mat_op.is_empty() else q_mat_op
-                    w_mat_op = None if w_mat_op.is_empty() else w_mat_op
-                else:
-                    q_mat_op = None
-                    w_mat_op = None
-
-                if right_op_2 is not None:
-                    m_mat_op = commutator(left_op, operator, right_op_2)
-                    v_mat_op = commutator(left_op, right_op_2)
-                    m_mat_op = None if m_mat_op.is_empty() else m_mat_op
-                    v_mat_op = None if v_mat_op.is_empty() else v_mat_op
-                else:
-                    m_mat_op = None
-                    v_mat_op = None
-
-                if not z2_symmetries.is_empty():
-                    if q_mat_op is not None and not q_mat_op.is_empty():
-                        q_mat_op = z2_symmetries.taper(q_mat_op)
-                    if w_mat_op is not None and not w_mat_op.is_empty():
-                        w_mat_op = z2_symmetries.taper(w_mat_op)
-                    if m_mat_op is not None and not m_mat_op.is_empty():
-                        m_mat_op = z2_symmetries.taper(m_mat_op)
-                    if v_mat_op is not None and not v_mat_op.is_empty():
-                        v_mat_op = z2_symmetries.taper(v_mat_op)
-
-        return m_u, n_u, q_mat_op, w_mat_op, m_mat_op, v_mat_op
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2020.
+# (C) Copyright IBM 2020, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -15,21 +15,18 @@
 from typing import List, Union, Optional, Tuple, Dict, cast
 import itertools
 import logging
-import sys
 import numpy as np
 from scipy import linalg
 
-from qiskit.tools import parallel_map
-from qiskit.tools.events import TextProgressBar
-from qiskit.aqua import aqua_globals
 from qiskit.aqua.algorithms import AlgorithmResult
-from qiskit.aqua.operators import Z2Symmetries, commutator, WeightedPauliOperator
+from qiskit.aqua.operators import Z2Symmetries
 from qiskit.chemistry import FermionicOperator, BosonicOperator
 from qiskit.chemistry.drivers import BaseDriver
 from qiskit.chemistry.results import (ElectronicStructureResult, VibronicStructureResult,
                                       EigenstateResult)
 
 from .excited_states_solver import ExcitedStatesSolver
+from .._eom_operators import EomCommutators
 from ..ground_state_solvers import GroundStateSolver
 
 logger = logging.getLogger(__name__)
@@ -159,6 +156,9 @@ class QEOM(ExcitedStatesSolver):
                                size: int) -> dict:
         """Building all commutators for Q, W, M, V matrices.
 
+        The commutators are computed on packed symplectic arrays, reusing the products of the
+        Hamiltonian with each hopping operator across the matrix elements.
+
         Args:
             hopping_operators: all hopping operators based on excitations_list,
                 key is the string of single/double excitation;
@@ -176,35 +176,23 @@ class QEOM(ExcitedStatesSolver):
 
         mus, nus = np.triu_indices(size)
 
-        def _build_one_sector(available_hopping_ops, untapered_op, z2_symmetries, sign):
-
-            to_be_computed_list = []
-            for idx, _ in enumerate(mus):
-                m_u = mus[idx]
-                n_u = nus[idx]
-                left_op = available_hopping_ops.get('E_{}'.format(m_u))
-                right_op_1 = available_hopping_ops.get('E_{}'.format(n_u))
-                right_op_2 = available_hopping_ops.get('Edag_{}'.format(n_u))
-                to_be_computed_list.append((m_u, n_u, left_op, right_op_1, right_op_2))
-
-            if logger.isEnabledFor(logging.INFO):
-                logger.info("Building all commutators:")
-                TextProgressBar(sys.stderr)
-            results = parallel_map(self._build_commutator_routine,
-                                   to_be_computed_list,
-                                   task_args=(untapered_op, z2_symmetries, sign),
-                                   num_processes=aqua_globals.num_processes)
-            for result in results:
-                m_u, n_u, q_mat_op, w_mat_op, m_mat_op, v_mat_op = result
-
-                if q_mat_op is not None:
-                    all_matrix_operators['q_{}_{}'.format(m_u, n_u)] = q_mat_op
-                if w_mat_op is not None:
-                    all_matrix_operators['w_{}_{}'.format(m_u, n_u)] = w_mat_op
-                if m_mat_op is not None:
-                    all_matrix_operators['m_{}_{}'.format(m_u, n_u)] = m_mat_op
-                if v_mat_op is not None:
-                    all_matrix_operators['v_{}_{}'.format(m_u, n_u)] = v_mat_op
+        def _build_one_sector(available_hopping_ops, commutators):
+            for m_u, n_u in zip(mus, nus):
+                left = 'E_{}'.format(m_u)
+                if left not in available_hopping_ops:
+                    continue
+                if 'E_{}'.format(n_u) in available_hopping_ops:
+                    q_mat_op, w_mat_op = commutators.commutators(left, 'E_{}'.format(n_u))
+                    if q_mat_op is not None:
+                        all_matrix_operators['q_{}_{}'.format(m_u, n_u)] = q_mat_op
+                    if w_mat_op is not None:
+                        all_matrix_operators['w_{}_{}'.format(m_u, n_u)] = w_mat_op
+                if 'Edag_{}'.format(n_u) in available_hopping_ops:
+                    m_mat_op, v_mat_op = commutators.commutators(left, 'Edag_{}'.format(n_u))
+                    if m_mat_op is not None:
+                        all_matrix_operators['m_{}_{}'.format(m_u, n_u)] = m_mat_op
+                    if v_mat_op is not None:
+                        all_matrix_operators['v_{}_{}'.format(m_u, n_u)] = v_mat_op
 
         try:
             # The next step only works in the case of the FermionicTransformation. Thus, it is done
@@ -213,6 +201,12 @@ class QEOM(ExcitedStatesSolver):
         except AttributeError:
             z2_symmetries = Z2Symmetries([], [], [])
 
+        # untapered_qubit_op is a WeightedPauliOperator and should not be exposed.
+        commutators = EomCommutators(self._gsc.transformation.untapered_qubit_op,  # type: ignore
+                                     hopping_operators,
+                                     self._gsc.transformation.commutation_rule,
+                                     z2_symmetries)
+
         if not z2_symmetries.is_empty():
             combinations = itertools.product([1, -1], repeat=len(z2_symmetries.symmetries))
             for targeted_tapering_values in combinations:
@@ -225,82 +219,13 @@ class QEOM(ExcitedStatesSolver):
                     value = np.asarray(value)
                     if np.all(value == targeted_sector):
                         available_hopping_ops[key] = hopping_operators[key]
-                # untapered_qubit_op is a WeightedPauliOperator and should not be exposed.
-                _build_one_sector(available_hopping_ops,
-                                  self._gsc.transformation.untapered_qubit_op,  # type: ignore
-                                  z2_symmetries,
-                                  self._gsc.transformation.commutation_rule)
+                _build_one_sector(available_hopping_ops, commutators)
 
         else:
-            # untapered_qubit_op is a WeightedPauliOperator and should not be exposed.
-            _build_one_sector(hopping_operators,
-                              self._gsc.transformation.untapered_qubit_op,  # type: ignore
-                              z2_symmetries,
-                              self._gsc.transformation.commutation_rule)
+            _build_one_sector(hopping_operators, commutators)
 
         return all_matrix_operators
 
-    @staticmethod
-    def _build_commutator_routine(params: List, operator: WeightedPauliOperator,
-                                  z2_symmetries: Z2Symmetries, sign: int
-                                  ) -> Tuple[int, int, WeightedPauliOperator, WeightedPauliOperator,
-                                             WeightedPauliOperator, WeightedPauliOperator]:
-        """Numerically computes the commutator / double commutator between operators.
-
-        Args:
-            params: list containing the indices of matrix element and the corresponding
-                excitation operators
-            operator: the hamiltonian
-            z2_symmetries: z2_symmetries in case of tapering
-            sign: commute or anticommute
-
-        Returns:
-            The indices of the matrix element and the corresponding qubit
-            operator for each of the EOM matrices
-        """
-        m_u, n_u, left_op, right_op_1, right_op_2 = params
-        if left_op is None:
-            q_mat_op = None
-            w_mat_op = None
-            m_mat_op = None
-            v_mat_op = None
-        else:
-            if right_op_1 is None and right_op_2 is None:
-                q_mat_op = None
-                w_mat_op = None
-                m_mat_op = None
-                v_mat_op = None
-            else:
-                if right_op_1 is not None:
-                    q_mat_op = commutator(left_op, operator, right_op_1, sign=sign)
-                    w_mat_op = commutator(left_op, right_op_1, sign=sign)
-                    q_mat_op = None if q_mat_op.is_empty() else q_mat_op
-                    w_mat_op = None if w_mat_op.is_empty() else w_mat_op
-                else:
-                    q_mat_op = None
-                    w_mat_op = None
-
-                if right_op_2 is not None:
-                    m_mat_op = commutator(left_op, operator, right_op_2, sign=sign)
-                    v_mat_op = commutator(left_op, right_op_2, sign=sign)
-                    m_mat_op = None if m_mat_op.is_empty() else m_mat_op
-                    v_mat_op = None if v_mat_op.is_empty() else v_mat_op
-                else:
-                    m_mat_op = None
-                    v_mat_op = None
-
-                if not z2_symmetries.is_empty():
-                    if q_mat_op is not None and not q_mat_op.is_empty():
-                        q_mat_op = z2_symmetries.taper(q_mat_op)
-                    if w_mat_op is not None and not w_mat_op.is_empty():
-                        w_mat_op = z2_symmetries.taper(w_mat_op)
-                    if m_mat_op is not None and not m_mat_op.is_empty():
-                        m_mat_op = z2_symmetries.taper(m_mat_op)
-                    if v_mat_op is not None and not v_mat_op.is_empty():
-                        v_mat_op = z2_symmetries.taper(v_mat_op)
-
-        return m_u, n_u, q_mat_op, w_mat_op, m_mat_op, v_mat_op
-
     def _build_eom_matrices(self, gs_results: Dict[str, List[float]], size: int
                             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
                                        float, float, float, float]:
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2020.
+# (C) Copyright IBM 2020, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,30 +12,51 @@
 
 """The calculation of points on the Born-Oppenheimer Potential Energy Surface (BOPES)."""
 
+import copy
+import functools
 import logging
-from typing import Optional, List, Dict
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, List, Dict, Tuple, Any
 
 import numpy as np
 from qiskit.aqua import AquaError
 from qiskit.aqua.algorithms import VQAlgorithm
+from qiskit.aqua.utils.validation import validate_min
 from qiskit.chemistry.drivers import BaseDriver
 from qiskit.chemistry.algorithms.ground_state_solvers import GroundStateSolver
 from qiskit.chemistry.results.bopes_sampler_result import BOPESSamplerResult
 from qiskit.chemistry.algorithms.pes_samplers.extrapolator import Extrapolator, WindowExtrapolator
 from qiskit.chemistry.results import EigenstateResult
+from qiskit.chemistry.transformations import Transformation
 
 logger = logging.getLogger(__name__)
 
 
 class BOPESSampler:
-    """Class to evaluate the Born-Oppenheimer Potential Energy Surface (BOPES)."""
+    """Class to evaluate the Born-Oppenheimer Potential Energy Surface (BOPES).
+
+    The points can be evaluated at the same time, on the workers of a pool executor, with
+    ``max_workers`` greater than 1. When warm-starting a variational solver, the points are then
+    evaluated in waves of consecutive points, each of which is no larger than the number of points
+    already evaluated, so that all of the points of a wave are bootstrapped from finished points,
+    as they are when the points are evaluated one after the other.
+
+    With ``cache_transformations``, the qubit operators of the points, as given by the driver and
+    the transformation of the ground state solver, are cached by the sampler, so that sampling
+    the points again, e.g. after setting another solver, does not run the driver and the
+    transformation again.
+    """
 
     def __init__(self,
                  gss: GroundStateSolver,
                  tolerance: float = 1e-3,
                  bootstrap: bool = True,
                  num_bootstrap: Optional[int] = None,
-                 extrapolator: Optional[Extrapolator] = None) -> None:
+                 extrapolator: Optional[Extrapolator] = None,
+                 max_workers: int = 1,
+                 executor: Optional[Executor] = None,
+                 cache_transformations: bool = False) -> None:
         """
         Args:
             gss: GroundStateSolver
@@ -48,12 +69,25 @@ class BOPESSampler:
                 all previous points will be used for bootstrapping.
             extrapolator: Extrapolator objects that define space/window
                            and method to extrapolate variational parameters.
+            max_workers: The maximum number of points evaluated at the same time. If greater
+                than 1, and no ``executor`` is given, the points are evaluated on a process pool
+                of as many workers. It has a min. value of 1.
+            executor: Optional executor the points are submitted to, e.g. a process pool, to
+                which the ground state solver and the driver must then be picklable. Since the
+                solvers share the state of the process they run in, e.g. ``aqua_globals``, the
+                points submitted to other executors, e.g. a thread pool, are evaluated one after
+                the other, in order. It is not shut down by the sampler.
+            cache_transformations: Whether to cache the qubit operators of the points, until the
+                driver or the transformation of the ground state solver is replaced, or
+                :meth:`clear_cache` is called. The cache must be cleared when the settings of the
+                driver or the transformation are changed in place.
 
         Raises:
             AquaError: If ``num_boostrap`` is an integer smaller than 2, or
                 if ``num_boostrap`` is larger than 2 and the extrapolator is not an instance of
                 ``WindowExtrapolator``.
         """
+        validate_min('max_workers', max_workers, 1)
 
         self._gss = gss
         self._tolerance = tolerance
@@ -65,6 +99,12 @@ class BOPESSampler:
         self._points_optparams = None   # type: Optional[Dict[float, List[float]]]
         self._num_bootstrap = num_bootstrap
         self._extrapolator = extrapolator
+        self._max_workers = max_workers
+        self._executor = executor
+        self._cache_transformations = cache_transformations
+        # the driver and transformation of the cached points, and the points
+        self._cache_owner = None    # type: Optional[Tuple[BaseDriver, Transformation]]
+        self._transformed = dict()  # type: Dict[float, Tuple[Transformation, Any, Any]]
 
         if self._extrapolator:
             if num_bootstrap is None:
@@ -86,6 +126,23 @@ class BOPESSampler:
             # this will be used when NOT bootstrapping
             self._initial_point = self._gss.solver.initial_point
 
+    @property
+    def gss(self) -> GroundStateSolver:
+        """Returns the ground state solver."""
+        return self._gss
+
+    @gss.setter
+    def gss(self, gss: GroundStateSolver) -> None:
+        """Sets the ground state solver, e.g. to sample the cached points with another solver."""
+        self._gss = gss
+        if isinstance(self._gss.solver, VQAlgorithm):
+            self._initial_point = self._gss.solver.initial_point
+
+    def clear_cache(self) -> None:
+        """Clears the cached qubit operators of the points."""
+        self._cache_owner = None
+        self._transformed = dict()
+
     def sample(self, driver: BaseDriver, points: List[float]) -> BOPESSamplerResult:
         """Run the sampler at the given points, potentially with repetitions.
 
@@ -130,33 +187,87 @@ class BOPESSampler:
             The results for all points.
         """
         raw_results = dict()   # type: Dict[float, EigenstateResult]
-        if isinstance(self._gss.solver, VQAlgorithm):
+        variational = isinstance(self._gss.solver, VQAlgorithm)
+        if variational:
             self._points_optparams = dict()
             self._gss.solver.initial_point = self._initial_point
 
-        # Iterate over the points
-        for i, point in enumerate(points):
-            logger.info('Point %s of %s', i + 1, len(points))
-            raw_result = self._run_single_point(point)  # dict of results
-            raw_results[point] = raw_result
+        if self._cache_owner is None or self._cache_owner[0] is not self._driver \
+                or self._cache_owner[1] is not self._gss.transformation:
+            self.clear_cache()
+            self._cache_owner = (self._driver, self._gss.transformation)
+
+        executor = self._executor
+        if executor is None and self._max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self._max_workers)
+
+        try:
+            # Iterate over waves of points
+            start = 0
+            while start < len(points):
+                size = self._max_workers
+                if variational and self._bootstrap:
+                    # bootstrap all the points of the wave from finished points
+                    size = max(1, min(size, start))
+                wave = points[start:start + size]
+                logger.info('Points %s to %s of %s', start + 1, start + len(wave), len(points))
+                for point, (raw_result, transformed, optimal_params) in \
+                        zip(wave, self._run_wave(wave, executor)):
+                    raw_results[point] = raw_result
+                    if transformed is not None:
+                        self._transformed[point] = transformed
+                    # Save optimal point to bootstrap
+                    if variational:
+                        self._points_optparams[point] = optimal_params
+                start += len(wave)
+        finally:
+            if executor is not self._executor:
+                executor.shutdown()
 
         return raw_results
 
-    def _run_single_point(self, point: float) -> EigenstateResult:
-        """Run the sampler at the given single point
+    def _run_wave(self, points: List[float], executor: Optional[Executor]) -> List[Tuple]:
+        """Run the sampler at the given points at the same time.
 
         Args:
-            point: The value of the degree of freedom to evaluate.
+            points: The values of the degree of freedom to evaluate.
+            executor: The executor the points are submitted to, if any.
 
         Returns:
-            Results for a single point.
+            The results, transformations and optimal parameters of the points.
         """
+        tasks = [(point, self._bootstrap_point(point), self._transformed.get(point),
+                  self._cache_transformations) for point in points]
+        if executor is None:
+            return [_run_single_point(self._gss, self._driver, *task) for task in tasks]
+        if not isinstance(executor, ProcessPoolExecutor):
+            # the points would race on the state of the process, e.g. the random generator of
+            # aqua_globals, so they are evaluated in order, as without an executor
+            return executor.submit(
+                lambda: [_run_single_point(self._gss, self._driver, *task)
+                         for task in tasks]).result()
+        # the workers of a process pool set the geometry, initial point and transformation of
+        # their own copies of the solver and the driver, from pickling
+        futures = [executor.submit(_run_single_point, self._gss, self._driver, *task,
+                                   os.getpid())
+                   for task in tasks]
+        return [future.result() for future in futures]
+
+    def _bootstrap_point(self, point: float) -> Optional[np.ndarray]:
+        """Find the initial point of a variational solver at the given point.
 
-        # update molecule geometry and thus resulting Hamiltonian based on specified point
-        self._driver.molecule.perturbations = [point]
+        Args:
+            point: The value of the degree of freedom to evaluate.
+
+        Returns:
+            The initial point, bootstrapped from the previously run points, if any.
+        """
+        if not isinstance(self._gss.solver, VQAlgorithm):
+            return None
+        initial_point = self._initial_point
 
         # find closest previously run point and take optimal parameters
-        if isinstance(self._gss.solver, VQAlgorithm) and self._bootstrap:
+        if self._bootstrap:
             prev_points = list(self._points_optparams.keys())
             prev_params = list(self._points_optparams.values())
             n_pp = len(prev_points)
@@ -175,21 +286,99 @@ class BOPESSampler:
                     # find min 'distance' from point to previous points
                     min_index = np.argmin(np.linalg.norm(distances, axis=1))
                     # update initial point
-                    self._gss.solver.initial_point = prev_params[min_index]
+                    initial_point = prev_params[min_index]
                 else:  # extrapolate using saved parameters
                     opt_params = self._points_optparams
                     param_sets = self._extrapolator.extrapolate(points=[point],
                                                                 param_dict=opt_params)
                     # update initial point, note param_set is a dictionary
-                    self._gss.solver.initial_point = param_sets.get(point)
+                    initial_point = param_sets.get(point)
+
+        return initial_point
+
+
+def _run_single_point(gss: GroundStateSolver,
+                      driver: BaseDriver,
+                      point: float,
+                      initial_point: Optional[np.ndarray],
+                      transformed: Optional[Tuple[Transformation, Any, Any]],
+                      cache_transformations: bool,
+                      parent_pid: Optional[int] = None) -> Tuple:
+    """Run the sampler at the given single point
+
+    Args:
+        gss: The ground state solver.
+        driver: The driver of the molecule.
+        point: The value of the degree of freedom to evaluate.
+        initial_point: The initial point of a variational solver.
+        transformed: The cached transformation and qubit operators of the point, if any.
+        cache_transformations: Whether to return the transformation and qubit operators of the
+            point, to be cached.
+        parent_pid: The id of the process of the sampler, if the point is submitted to an
+            executor.
+
+    Returns:
+        Results for a single point, its transformation and qubit operators, if cached, and the
+        optimal parameters of a variational solver.
+    """
+    in_parallel = parent_pid is not None and os.getpid() != parent_pid
+    in_parallel_env = os.environ.get('QISKIT_IN_PARALLEL')
+    if in_parallel:
+        # the worker process does not spawn processes of its own, see qiskit.tools.parallel_map
+        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    try:
+        return _solve_point(gss, driver, point, initial_point, transformed,
+                            cache_transformations)
+    finally:
+        if in_parallel:
+            if in_parallel_env is None:
+                del os.environ['QISKIT_IN_PARALLEL']
+            else:
+                os.environ['QISKIT_IN_PARALLEL'] = in_parallel_env
 
-        # the output is an instance of EigenstateResult
-        result = self._gss.solve(self._driver)
 
-        # Save optimal point to bootstrap
-        if isinstance(self._gss.solver, VQAlgorithm):
-            # at every point evaluation, the optimal params are updated
-            optimal_params = self._gss.solver.optimal_params
-            self._points_optparams[point] = optimal_params
+def _solve_point(gss: GroundStateSolver,
+                 driver: BaseDriver,
+                 point: float,
+                 initial_point: Optional[np.ndarray],
+                 transformed: Optional[Tuple[Transformation, Any, Any]],
+                 cache_transformations: bool) -> Tuple:
+    """Solve the problem at the given single point, see :func:`_run_single_point`."""
+    # update molecule geometry and thus resulting Hamiltonian based on specified point
+    driver.molecule.perturbations = [point]
 
-        return result
+    variational = isinstance(gss.solver, VQAlgorithm)
+    if variational:
+        gss.solver.initial_point = initial_point
+
+    if not cache_transformations:
+        # the output is an instance of EigenstateResult
+        result = gss.solve(driver)
+    else:
+        transformation = gss.transformation
+        if transformed is None:
+            operator, aux_operators = transformation.transform(driver)
+            transformed = (copy.deepcopy(transformation), operator, aux_operators)
+
+        # a copy of the transformation of the point, which gives its cached operators,
+        # so that the solver does not run the driver and the transformation again
+        point_transformation = copy.copy(transformed[0])
+        point_transformation.transform = functools.partial(_cached_operators, *transformed[1:])
+        gss.transformation = point_transformation
+        try:
+            result = gss.solve(driver)
+        finally:
+            gss.transformation = transformation
+
+    optimal_params = gss.solver.optimal_params if variational else None
+    return result, transformed if cache_transformations else None, optimal_params
+
+
+def _cached_operators(operator: Any, aux_operators: Any, driver: BaseDriver,
+                      aux_ops: Optional[List] = None) -> Tuple[Any, Any]:
+    """The ``transform`` method of the cached transformation of a point."""
+    # pylint: disable=unused-argument
+    if aux_ops:
+        raise AquaError('The cached qubit operators do not include additional auxiliary '
+                        'operators.')
+    return operator, aux_operators
@@ -186,7 +186,11 @@ class Hamiltonian(ChemistryOperator):
 
         new_nel = [new_num_alpha, new_num_beta]
 
-        fer_op = FermionicOperator(h1=qmolecule.one_body_integrals, h2=qmolecule.two_body_integrals)
+        # compact integrals are reduced and mapped without the dense two body integrals
+        h_2 = qmolecule.compact_two_body_integrals
+        if h_2 is None:
+            h_2 = qmolecule.two_body_integrals
+        fer_op = FermionicOperator(h1=qmolecule.one_body_integrals, h2=h_2)
         fer_op, self._energy_shift, did_shift = \
             Hamiltonian._try_reduce_fermionic_operator(fer_op, freeze_list, remove_list)
         if did_shift:
@@ -13,7 +13,6 @@
 """FCIDump dumper."""
 
 from typing import List, Optional, Union, TextIO, Tuple
-import itertools
 import numpy as np
 
 
@@ -66,20 +65,29 @@ def dump(outpath: str, norb: int, nelec: int, hijs: np.ndarray, hijkls: np.ndarr
         _write_to_outfile(outfile, einact, (0, 0, 0, 0))
 
 
+# the number of integral lines formatted and written at once
+_CHUNK_SIZE = 2 ** 16
+
+_LINE_FORMAT = '%23.16E%4d%4d%4d%4d\n'
+
+
 def _dump_1e_ints(hij: List[List[float]],
                   mos: Union[range, List[int]],
                   outfile: TextIO,
                   beta: bool = False) -> None:
     idx_offset = 1 if not beta else 1+len(mos)
-    hij_elements = set()
-    for i, j in itertools.product(mos, repeat=2):
-        if i == j:
-            _write_to_outfile(outfile, hij[i][j], (i+idx_offset, j+idx_offset, 0, 0))
-            continue
-        if (j, i) in hij_elements and np.isclose(hij[i][j], hij[j][i]):
-            continue
-        _write_to_outfile(outfile, hij[i][j], (i+idx_offset, j+idx_offset, 0, 0))
-        hij_elements.add((i, j))
+    hij = np.asarray(hij)
+    # the diagonal and upper elements, and the lower ones differing from their transposed ones
+    written = np.triu(np.ones(hij.shape, dtype=bool)) | ~np.isclose(hij, hij.T)
+    i, j = np.nonzero(written)
+    zeros = np.zeros_like(i)
+    _write_lines(outfile, hij[i, j], (i + idx_offset, j + idx_offset, zeros, zeros))
+
+
+# the permutations of the indices of (ij|kl) which leave the integral unchanged, with the one
+# reversing all indices first; the first three only permute the indices within the bra and the ket
+_2E_PERMUTATIONS = [(1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2),
+                    (3, 2, 1, 0), (2, 3, 0, 1), (3, 2, 0, 1), (2, 3, 1, 0)]
 
 
 def _dump_2e_ints(hijkl: np.ndarray,
@@ -89,34 +97,33 @@ def _dump_2e_ints(hijkl: np.ndarray,
     idx_offsets = [1, 1]
     for b in range(beta):
         idx_offsets[1-b] += len(mos)
-    hijkl_elements = set()
-    # pylint: disable=invalid-name
-    for elem in itertools.product(mos, repeat=4):
-        if np.isclose(hijkl[elem], 0.0, atol=1e-14):
-            continue
-        if len(set(elem)) == 1:
-            _write_to_outfile(outfile, hijkl[elem], (*[e+idx_offsets[0] for e in elem[:2]],
-                                                     *[e+idx_offsets[1] for e in elem[2:]]))
-            continue
-        if beta != 1 and elem[::-1] in hijkl_elements and \
-                np.isclose(hijkl[elem], hijkl[elem[::-1]]):
-            continue
-        bra_perms = set(itertools.permutations(elem[:2]))
-        ket_perms = set(itertools.permutations(elem[2:]))
-        if beta == 1:
-            permutations = itertools.product(bra_perms, ket_perms)
-        else:
-            permutations = itertools.chain(
-                itertools.product(bra_perms, ket_perms),
-                itertools.product(ket_perms, bra_perms)
-            )
-        for perm in {e1 + e2 for e1, e2 in permutations}:
-            if perm in hijkl_elements and np.isclose(hijkl[elem], hijkl[perm]):
-                break
-        else:
-            _write_to_outfile(outfile, hijkl[elem], (*[e+idx_offsets[0] for e in elem[:2]],
-                                                     *[e+idx_offsets[1] for e in elem[2:]]))
-            hijkl_elements.add(elem)
+    norb = len(mos)
+    hijkl = np.asarray(hijkl)
+    nonzero = ~np.isclose(hijkl, 0.0, atol=1e-14)
+    # generally (ij|ab) != (ab|ij) when the spins differ
+    permutations = _2E_PERMUTATIONS[:3] if beta == 1 else _2E_PERMUTATIONS
+    grid = np.indices((norb,) * 3)
+    # an element is written unless it is zero, or a permutation of its indices preceding it is
+    # written with the same value; the elements are processed per first index to bound memory
+    for first in range(norb):
+        elem = (np.full((norb,) * 3, first), *grid)
+        flat = np.ravel_multi_index(elem, hijkl.shape)
+        values = hijkl[elem]
+        written = nonzero[elem]
+        for perm in permutations:
+            perm_elem = tuple(elem[p] for p in perm)
+            written &= ~((np.ravel_multi_index(perm_elem, hijkl.shape) < flat)
+                         & nonzero[perm_elem] & np.isclose(values, hijkl[perm_elem]))
+        i, a, j, b = (e[written] for e in elem)
+        _write_lines(outfile, values[written], (i + idx_offsets[0], a + idx_offsets[0],
+                                                j + idx_offsets[1], b + idx_offsets[1]))
+
+
+def _write_lines(outfile: TextIO, values: np.ndarray, indices: Tuple) -> None:
+    # the lines are formatted in chunks, and each chunk written at once
+    rows = list(zip(values.tolist(), *(idx.tolist() for idx in indices)))
+    for start in range(0, len(rows), _CHUNK_SIZE):
+        outfile.write(''.join([_LINE_FORMAT % row for row in rows[start:start + _CHUNK_SIZE]]))
 
 
 def _write_to_outfile(outfile: TextIO, value: float, indices: Tuple):
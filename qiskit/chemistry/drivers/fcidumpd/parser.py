@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2020.
+# (C) Copyright IBM 2020, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,18 +12,24 @@
 
 """FCIDump parser."""
 
-from typing import Any, Dict, Set, Tuple
-import itertools
+from typing import Any, Dict, Optional
 import re
 import numpy as np
 
 from qiskit.chemistry import QiskitChemistryError
 
 
+# the size hint in characters of the chunks of integral lines read at once
+_CHUNK_SIZE = 2 ** 24
+
+
 def parse(fcidump: str) -> Dict[str, Any]:
     # pylint: disable=wrong-spelling-in-comment
     """Parses a FCIDump output.
 
+    The integral lines are read in chunks, parsed in bulk with NumPy, and scattered into
+    preallocated arrays, whose missing elements are then filled from their symmetric ones.
+
     Args:
         fcidump: Path to the FCIDump file.
     Raises:
@@ -34,16 +40,86 @@ def parse(fcidump: str) -> Dict[str, Any]:
         A dictionary storing the parsed data.
     """
     try:
-        with open(fcidump, 'r') as file:
-            fcidump_str = file.read()
+        file = open(fcidump, 'r')
     except OSError as ex:
         raise QiskitChemistryError("Input file '{}' cannot be read!".format(fcidump)) from ex
 
-    output = {}  # type: Dict[str, Any]
+    with file:
+        # FCIDump starts with a Fortran namelist of meta data
+        namelist = ''
+        namelist_end = None
+        for line in file:
+            namelist += line
+            namelist_end = re.search('(/|&END)', namelist)
+            if namelist_end is not None:
+                break
+        if namelist_end is None:
+            raise QiskitChemistryError("The namelist of the FCIDump file '{}' is not "
+                                       "terminated!".format(fcidump))
+        output = _parse_metadata(namelist[:namelist_end.start(0)])
+        norb = output['NORB']
+
+        integrals = _Integrals(norb)
+        integrals.add(namelist[namelist_end.end(0):])
+        while True:
+            lines = file.readlines(_CHUNK_SIZE)
+            if not lines:
+                break
+            integrals.add(''.join(lines))
+
+    # If the FCIDump file resulted from an unrestricted spin calculation the indices will label spin
+    # rather than molecular orbitals. This means, that a line must exist which encodes the
+    # coefficient for the spin orbital with index (norb*2, norb*2). By checking for such a line we
+    # can distinguish between unrestricted and restricted FCIDump files.
+    _uhf = integrals.uhf
+    if _uhf:
+        integrals.allocate_beta()
+    elif integrals.invalid_1e is not None:
+        raise QiskitChemistryError("Unkown 1-electron integral indices encountered in '{}'".format(
+            integrals.invalid_1e))
+    elif integrals.invalid_2e is not None:
+        raise QiskitChemistryError("Unkown 2-electron integral indices encountered in '{}'".format(
+            integrals.invalid_2e))
+
+    if integrals.ecore is not None:
+        output['ecore'] = integrals.ecore
+
+    # populate the elements missing in the 1-electron matrix with their symmetric ones
+    # if any elements are not populated these will be zero
+    hij = _permute_1e_ints(integrals.hij, integrals.hij_given)
+    hij_b = hijkl_ba = hijkl_bb = None
+    if _uhf:
+        # do the same for beta spin
+        hij_b = _permute_1e_ints(integrals.hij_b, integrals.hij_b_given)
+
+    # do the same of the 2-electron 4D matrix, in place
+    hijkl = _permute_2e_ints(integrals.hijkl, integrals.hijkl_given)
+
+    if _uhf:
+        # do the same for beta spin
+        hijkl_bb = _permute_2e_ints(integrals.hijkl_bb, integrals.hijkl_bb_given)
+        hijkl_ab = _permute_2e_ints(integrals.hijkl_ab, integrals.hijkl_ab_given, mixed=True)
+        hijkl_ba = _permute_2e_ints(integrals.hijkl_ba, integrals.hijkl_ba_given, mixed=True)
+
+        # assert that EITHER hijkl_ab OR hijkl_ba were given
+        if np.allclose(hijkl_ab, 0.0) == np.allclose(hijkl_ba, 0.0):
+            raise QiskitChemistryError("Encountered mixed sets of indices for the 2-electron \
+                    integrals. Either alpha/beta or beta/alpha matrix should be specified.")
+
+        if np.allclose(hijkl_ba, 0.0):
+            hijkl_ba = hijkl_ab.transpose()
+
+    output['hij'] = hij
+    output['hij_b'] = hij_b
+    output['hijkl'] = hijkl
+    output['hijkl_ba'] = hijkl_ba
+    output['hijkl_bb'] = hijkl_bb
+
+    return output
 
-    # FCIDump starts with a Fortran namelist of meta data
-    namelist_end = re.search('(/|&END)', fcidump_str)
-    metadata = fcidump_str[:namelist_end.start(0)]
+
+def _parse_metadata(metadata: str) -> Dict[str, Any]:
+    output = {}  # type: Dict[str, Any]
     metadata = ' '.join(metadata.split())  # replace duplicate whitespace and newlines
     # we know what elements to look for so we don't get too fancy with the parsing
     # pattern explanation:
@@ -86,158 +162,129 @@ def parse(fcidump: str) -> Dict[str, Any]:
     output['THRRES'] = float(_thrres.groups()[0]) if _thrres else 0.1
     _nroot = re.search('NROOT'+pattern, metadata)
     output['NROOT'] = int(_nroot.groups()[0]) if _nroot else 1
+    return output
 
-    # If the FCIDump file resulted from an unrestricted spin calculation the indices will label spin
-    # rather than molecular orbitals. This means, that a line must exist which encodes the
-    # coefficient for the spin orbital with index (norb*2, norb*2). By checking for such a line we
-    # can distinguish between unrestricted and restricted FCIDump files.
-    _uhf = bool(re.search(r'.*(\s+{}\s+{}\s+0\s+0)'.format(norb*2, norb*2),
-                          fcidump_str[namelist_end.start(0):]))
-
-    # the rest of the FCIDump will hold lines of the form x i a j b
-    # a few cases have to be treated differently:
-    # i, a, j and b are all zero: x is the core energy
-    # TODO: a, j and b are all zero: x is the energy of the i-th MO  (often not supported)
-    # j and b are both zero: x is the 1e-integral between i and a (x = <i|h|a>)
-    # otherwise: x is the Coulomb integral ( x = (ia|jb) )
-    hij = np.zeros((norb, norb))
-    hij_elements = set(itertools.product(range(norb), repeat=2))
-    hijkl = np.zeros((norb, norb, norb, norb))
-    hijkl_elements = set(itertools.product(range(norb), repeat=4))
-    hij_b = hijkl_ab = hijkl_ba = hijkl_bb = None
-    hij_b_elements = hijkl_ab_elements = hijkl_ba_elements = hijkl_bb_elements = set()
-    if _uhf:
-        beta_range = [n+norb for n in range(norb)]
-        hij_b = np.zeros((norb, norb))
-        hij_b_elements = set(itertools.product(beta_range, repeat=2))
-        hijkl_ab = np.zeros((norb, norb, norb, norb))
-        hijkl_ba = np.zeros((norb, norb, norb, norb))
-        hijkl_bb = np.zeros((norb, norb, norb, norb))
-        hijkl_ab_elements = set(itertools.product(
-            range(norb), range(norb), beta_range, beta_range
-        ))
-        hijkl_ba_elements = set(itertools.product(
-            beta_range, beta_range, range(norb), range(norb)
-        ))
-        hijkl_bb_elements = set(itertools.product(beta_range, repeat=4))
-    orbital_data = fcidump_str[namelist_end.end(0):].split('\n')
-    for orbital in orbital_data:
-        if not orbital:
-            continue
-        x = float(orbital.split()[0])
+
+class _Integrals:
+    """The integrals of a FCIDump file, scattered chunk by chunk into preallocated arrays, with
+    masks of their given elements. The beta spin arrays are allocated when the first beta spin
+    integral is encountered."""
+
+    def __init__(self, norb: int) -> None:
+        self._norb = norb
+        self.ecore = None  # type: Optional[float]
+        self.uhf = False
+        self.hij = np.zeros((norb, norb))
+        self.hij_given = np.zeros((norb, norb), dtype=bool)
+        self.hijkl = np.zeros((norb, norb, norb, norb))
+        self.hijkl_given = np.zeros((norb, norb, norb, norb), dtype=bool)
+        self.hij_b = self.hij_b_given = None  # type: Optional[np.ndarray]
+        self.hijkl_ab = self.hijkl_ab_given = None  # type: Optional[np.ndarray]
+        self.hijkl_ba = self.hijkl_ba_given = None  # type: Optional[np.ndarray]
+        self.hijkl_bb = self.hijkl_bb_given = None  # type: Optional[np.ndarray]
+        # the first indices of beta spin integrals, reported if the file is not unrestricted
+        self.invalid_1e = None  # type: Optional[tuple]
+        self.invalid_2e = None  # type: Optional[tuple]
+
+    def add(self, text: str) -> None:
+        """Adds the integral lines of the text, of the form x i a j b."""
+        try:
+            rows = np.array(text.split(), dtype=float).reshape(-1, 5)
+        except ValueError as ex:
+            raise QiskitChemistryError("Invalid integral lines encountered in "
+                                       "'{}'".format(text[:100])) from ex
+        if not rows.size:
+            return
+        values = rows[:, 0]
         # Note: differing naming than ijkl due to E741 and this iajb is inline with this:
         # https://hande.readthedocs.io/en/latest/manual/integrals.html#fcidump-format
-        i, a, j, b = [int(i) for i in orbital.split()[1:]]  # pylint: disable=invalid-name
-        if i == a == j == b == 0:
-            output['ecore'] = x
-        elif a == j == b == 0:
-            # TODO: x is the energy of the i-th MO
-            continue
-        elif j == b == 0:
-            try:
-                hij_elements.remove((i-1, a-1))
-                hij[i-1][a-1] = x
-            except KeyError as ex:
-                if _uhf:
-                    hij_b_elements.remove((i-1, a-1))
-                    hij_b[i-1-norb][a-1-norb] = x
-                else:
-                    raise QiskitChemistryError("Unkown 1-electron integral indices encountered in \
-                            '{}'".format((i, a))) from ex
-        else:
-            try:
-                hijkl_elements.remove((i-1, a-1, j-1, b-1))
-                hijkl[i-1][a-1][j-1][b-1] = x
-            except KeyError as ex:
-                if _uhf:
-                    try:
-                        hijkl_ab_elements.remove((i-1, a-1, j-1, b-1))
-                        hijkl_ab[i-1][a-1][j-1-norb][b-1-norb] = x
-                    except KeyError:
-                        try:
-                            hijkl_ba_elements.remove((i-1, a-1, j-1, b-1))
-                            hijkl_ba[i-1-norb][a-1-norb][j-1][b-1] = x
-                        except KeyError:
-                            hijkl_bb_elements.remove((i-1, a-1, j-1, b-1))
-                            hijkl_bb[i-1-norb][a-1-norb][j-1-norb][b-1-norb] = x
-                else:
-                    raise QiskitChemistryError("Unkown 2-electron integral indices encountered in \
-                            '{}'".format((i, a, j, b))) from ex
-
-    # iterate over still empty elements in 1-electron matrix and populate with symmetric ones
-    # if any elements are not populated these will be zero
-    _permute_1e_ints(hij, hij_elements, norb)
+        indices = rows[:, 1:].astype(int)
+        norb = self._norb
+        self.uhf |= bool(np.any(np.all(indices == [2 * norb, 2 * norb, 0, 0], axis=1)))
 
-    if _uhf:
-        # do the same for beta spin
-        _permute_1e_ints(hij_b, hij_b_elements, norb, beta=True)
+        # a few cases have to be treated differently:
+        # i, a, j and b are all zero: x is the core energy
+        # TODO: a, j and b are all zero: x is the energy of the i-th MO  (often not supported)
+        # j and b are both zero: x is the 1e-integral between i and a (x = <i|h|a>)
+        # otherwise: x is the Coulomb integral ( x = (ia|jb) )
+        core = np.all(indices == 0, axis=1)
+        if core.any():
+            self.ecore = float(values[core][-1])
+        one_e = np.all(indices[:, 2:] == 0, axis=1) & (indices[:, 1] != 0)
+        two_e = ~np.all(indices[:, 1:] == 0, axis=1) & ~one_e
 
-    # do the same of the 2-electron 4D matrix
-    _permute_2e_ints(hijkl, hijkl_elements, norb)
+        # the spin of each index, 0 for alpha and 1 for beta, or -1 for an invalid index
+        spins = np.where((indices >= 1) & (indices <= norb), 0,
+                         np.where((indices > norb) & (indices <= 2 * norb), 1, -1))
+        orbitals = indices - 1 - spins * norb
 
-    if _uhf:
-        # do the same for beta spin
-        _permute_2e_ints(hijkl_bb, hijkl_bb_elements, norb, beta=2)
-        _permute_2e_ints(hijkl_ab, hijkl_ab_elements, norb, beta=1)  # type: ignore
-        _permute_2e_ints(hijkl_ba, hijkl_ba_elements, norb, beta=1)  # type: ignore
+        for spin in (0, 1):
+            rows_1e = one_e & np.all(spins[:, :2] == spin, axis=1)
+            if rows_1e.any():
+                if spin and self.invalid_1e is None:
+                    self.invalid_1e = tuple(indices[rows_1e][0, :2].tolist())
+                    self.allocate_beta()
+                hij, given = (self.hij_b, self.hij_b_given) if spin else (self.hij, self.hij_given)
+                idx = tuple(orbitals[rows_1e, :2].T)
+                hij[idx] = values[rows_1e]
+                given[idx] = True
+        invalid = one_e & ~((spins[:, 0] == spins[:, 1]) & (spins[:, 0] >= 0))
+        if invalid.any():
+            raise QiskitChemistryError("Unkown 1-electron integral indices encountered in "
+                                       "'{}'".format(tuple(indices[invalid][0, :2].tolist())))
 
-        # assert that EITHER hijkl_ab OR hijkl_ba were given
-        if np.allclose(hijkl_ab, 0.0) == np.allclose(hijkl_ba, 0.0):
-            raise QiskitChemistryError("Encountered mixed sets of indices for the 2-electron \
-                    integrals. Either alpha/beta or beta/alpha matrix should be specified.")
+        valid_2e = np.zeros(len(indices), dtype=bool)
+        for bra, ket, name in ((0, 0, 'hijkl'), (0, 1, 'hijkl_ab'), (1, 0, 'hijkl_ba'),
+                               (1, 1, 'hijkl_bb')):
+            rows_2e = two_e & np.all(spins[:, :2] == bra, axis=1) \
+                & np.all(spins[:, 2:] == ket, axis=1)
+            if not rows_2e.any():
+                continue
+            valid_2e |= rows_2e
+            if (bra or ket) and self.invalid_2e is None:
+                self.invalid_2e = tuple(indices[rows_2e][0].tolist())
+                self.allocate_beta()
+            idx = tuple(orbitals[rows_2e].T)
+            getattr(self, name)[idx] = values[rows_2e]
+            getattr(self, name + '_given')[idx] = True
+        invalid = two_e & ~valid_2e
+        if invalid.any():
+            raise QiskitChemistryError("Unkown 2-electron integral indices encountered in "
+                                       "'{}'".format(tuple(indices[invalid][0].tolist())))
 
-        if np.allclose(hijkl_ba, 0.0):
-            hijkl_ba = hijkl_ab.transpose()
+    def allocate_beta(self) -> None:
+        """Allocates the beta spin arrays, if not allocated yet."""
+        norb = self._norb
+        for name, shape in (('hij_b', (norb, norb)), ('hijkl_ab', (norb,) * 4),
+                            ('hijkl_ba', (norb,) * 4), ('hijkl_bb', (norb,) * 4)):
+            if getattr(self, name) is None:
+                setattr(self, name, np.zeros(shape))
+                setattr(self, name + '_given', np.zeros(shape, dtype=bool))
 
-    output['hij'] = hij
-    output['hij_b'] = hij_b
-    output['hijkl'] = hijkl
-    output['hijkl_ba'] = hijkl_ba
-    output['hijkl_bb'] = hijkl_bb
 
-    return output
+def _permute_1e_ints(hij: np.ndarray, given: np.ndarray) -> np.ndarray:
+    # the missing elements are the transposed ones, or zero
+    return np.where(given, hij, hij.T)
 
 
-def _permute_1e_ints(hij: np.ndarray,
-                     elements: Set[Tuple[int, ...]],
-                     norb: int,
-                     beta: bool = False) -> None:
-    for elem in elements.copy():
-        shifted = tuple(e-(beta * norb) for e in elem)
-        hij[shifted] = hij[shifted[::-1]]
-        elements.remove(elem)
+# the permutations of the indices of (ij|kl) which leave the integral unchanged: the one swapping
+# bra and ket, and reversing all indices, first, then the ones within the bra and the ket
+_2E_PERMUTATIONS = [(3, 2, 1, 0), (1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2),
+                    (2, 3, 0, 1), (3, 2, 0, 1), (2, 3, 1, 0)]
 
 
-def _permute_2e_ints(hijkl: np.ndarray,
-                     elements: Set[Tuple[int, ...]],
-                     norb: int,
-                     beta: int = 0) -> None:
+def _permute_2e_ints(hijkl: np.ndarray, given: np.ndarray, mixed: bool = False) -> np.ndarray:
     # pylint: disable=wrong-spelling-in-comment
-    for elem in elements.copy():
-        shifted = tuple(e-((e >= norb) * norb) for e in elem)
-        # initially look for "transposed" element if spins are equal
-        if beta != 1 and elem[::-1] not in elements:
-            hijkl[shifted] = hijkl[shifted[::-1]]
-            elements.remove(elem)
-            continue
-        # then look at permutations of indices within the bra and ket respectively
-        bra_perms = set(itertools.permutations(elem[:2]))
-        ket_perms = set(itertools.permutations(elem[2:]))
-        if beta == 1:
-            # generally (ij|ab) != (ab|ij)
-            # thus, the possible permutations are much less when the spins differ
-            permutations = itertools.product(bra_perms, ket_perms)
-        else:
-            # ( ij | kl ) gives { ( ij | kl ), ( ij | lk ), ( ji | kl ), ( ji | lk ) }
-            # AND { ( kl | ij ), ( kl | ji ), ( lk | ij ), ( lk | ji ) }
-            # BUT NOT ( ik | jl ) etc.
-            permutations = itertools.chain(
-                itertools.product(bra_perms, ket_perms),
-                itertools.product(ket_perms, bra_perms)
-            )
-        for perm in {e1 + e2 for e1, e2 in permutations}:
-            if perm in elements:
-                continue
-            hijkl[shifted] = hijkl[tuple([e-((e >= norb) * norb) for e in perm])]
-            elements.remove(elem)
-            break
+    # ( ij | kl ) gives { ( ij | kl ), ( ij | lk ), ( ji | kl ), ( ji | lk ) }
+    # AND { ( kl | ij ), ( kl | ji ), ( lk | ij ), ( lk | ji ) }
+    # BUT NOT ( ik | jl ) etc.
+    # generally (ij|ab) != (ab|ij) when the spins differ, thus the possible permutations are
+    # much less
+    # hijkl and given are modified in place, not to double the memory of large integrals: the
+    # permutations form a group, so the elements filled in are valid sources of the next ones
+    permutations = _2E_PERMUTATIONS[1:4] if mixed else _2E_PERMUTATIONS
+    for perm in permutations:
+        missing = ~given & given.transpose(perm)
+        hijkl[missing] = hijkl.transpose(perm)[missing]
+        given |= missing
+    return hijkl
@@ -14,21 +14,22 @@
 
 import itertools
 import logging
-import sys
 
 import numpy as np
-from qiskit.quantum_info import Pauli
-from qiskit.tools import parallel_map
-from qiskit.tools.events import TextProgressBar
+from qiskit.quantum_info import Pauli, PauliTable, SparsePauliOp
 
-from qiskit.aqua import aqua_globals
-from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators import WeightedPauliOperator, PauliSumOp
+from qiskit.aqua.utils import pack_bits, popcount, unpack_bits
 from .qiskit_chemistry_error import QiskitChemistryError
+from .qmolecule import QMolecule
 from .bksf import bksf_mapping
 from .particle_hole import particle_hole_transformation
 
 logger = logging.getLogger(__name__)
 
+# number of integral index tuples mapped at a time
+_MAPPING_BLOCK_SIZE = 2 ** 16
+
 
 class FermionicOperator:
     """
@@ -74,8 +75,11 @@ class FermionicOperator:
 
         Args:
             h1 (numpy.ndarray): second-quantized fermionic one-body operator, a 2-D (NxN) tensor
-            h2 (numpy.ndarray): second-quantized fermionic two-body operator,
-                                a 4-D (NxNxNxN) tensor
+            h2 (Union(numpy.ndarray, SpinTwoBodyIntegrals)): second-quantized fermionic
+                two-body operator, a 4-D (NxNxNxN) tensor, or the integrals in spin orbitals
+                computed on demand from compact molecular integrals, as returned by
+                :attr:`~qiskit.chemistry.QMolecule.compact_two_body_integrals`. These are
+                reduced and mapped without building the dense tensor.
             ph_trans_shift (float): energy shift caused by particle hole transformation
         """
         self._h1 = h1
@@ -116,7 +120,7 @@ class FermionicOperator:
         ret = np.all(self._h1 == other._h1)
         if not ret:
             return ret
-        ret = np.all(self._h2 == other._h2)
+        ret = np.all(np.asarray(self._h2) == np.asarray(other._h2))
         return ret
 
     def __ne__(self, other):
@@ -144,21 +148,10 @@ class FermionicOperator:
         Args:
             unitary_matrix (numpy.ndarray): A 2-D unitary matrix for h1 transformation.
         """
-        num_modes = unitary_matrix.shape[0]
-        temp_ret = np.zeros((num_modes, num_modes, num_modes, num_modes),
-                            dtype=unitary_matrix.dtype)
         unitary_matrix_dagger = np.conjugate(unitary_matrix)
-
-        # option 3: temp1 is a 3-D tensor, temp2 and temp3 are 2-D tensors
-        # pylint: disable=unsubscriptable-object
-        for a_i in range(num_modes):
-            temp1 = np.einsum('i,i...->...', unitary_matrix_dagger[:, a_i], self._h2)
-            for b_i in range(num_modes):
-                temp2 = np.einsum('j,j...->...', unitary_matrix[:, b_i], temp1)
-                temp3 = np.einsum('kc,k...->...c', unitary_matrix_dagger, temp2)
-                temp_ret[a_i, b_i, :, :] = np.einsum('ld,l...c->...cd', unitary_matrix, temp3)
-
-        self._h2 = temp_ret
+        self._h2 = QMolecule.twoeints2mo_general(np.asarray(self._h2),
+                                                 unitary_matrix_dagger, unitary_matrix,
+                                                 unitary_matrix_dagger, unitary_matrix)
 
     def _jordan_wigner_mode(self, n):
         r"""
@@ -172,7 +165,7 @@ class FermionicOperator:
 
         This is implemented by creating an array of tuples, each including two operators.
         The phase between two elements in a tuple is implicitly assumed, and added calculated at the
-        appropriate time (see for example _one_body_mapping).
+        appropriate time (see for example _map_to_symplectic).
 
         Args:
             n (int): number of modes
@@ -343,8 +336,8 @@ class FermionicOperator:
         """
         Map fermionic operator to qubit operator.
 
-        Using multiprocess to speedup the mapping, the improvement can be
-        observed when h2 is a non-sparse matrix.
+        The mapping is vectorized, see :meth:`to_pauli_sum_op`, and the resulting Pauli
+        strings are ordered by their symplectic representation.
 
         Args:
             map_type (str): case-insensitive mapping type.
@@ -357,12 +350,68 @@ class FermionicOperator:
         Raises:
             QiskitChemistryError: if the `map_type` can not be recognized.
         """
+        self._map_type = map_type
+        if map_type.lower() == 'bksf':
+            return bksf_mapping(self._dense())
+
+        x, z, coeffs = self._map_to_symplectic(map_type, threshold)
+        x = unpack_bits(x, self._modes)
+        z = unpack_bits(z, self._modes)
+        return WeightedPauliOperator(paulis=[[coeff, Pauli((z_k, x_k))]
+                                             for coeff, z_k, x_k in zip(coeffs, z, x)])
+
+    def to_pauli_sum_op(self, map_type, threshold=0.00000001):
+        """
+        Map fermionic operator to qubit operator, as a
+        :class:`~qiskit.aqua.operators.PauliSumOp`.
 
-        # ###################################################################
-        # ###########   DEFINING MAPPED FERMIONIC OPERATORS    ##############
-        # ###################################################################
+        The images of the creation and annihilation operators of each mode are kept as packed
+        symplectic arrays, so that the Pauli products of whole blocks of one- and two-body terms
+        are computed at once. Terms which are the same fermionic operator, or its adjoint,
+        e.g. ``h2(i,j,k,l)`` and ``h2(k,l,i,j)``, are only mapped once, and equal Pauli strings
+        are summed by sorting their symplectic representation.
 
+        Args:
+            map_type (str): case-insensitive mapping type.
+                            "jordan_wigner", "parity", "bravyi_kitaev", "bksf"
+            threshold (float): threshold for Pauli simplification
+
+        Returns:
+            PauliSumOp: the qubit operator, with Pauli strings ordered by their symplectic
+            representation
+
+        Raises:
+            QiskitChemistryError: if the `map_type` can not be recognized.
+        """
         self._map_type = map_type
+        if map_type.lower() == 'bksf':
+            qubit_op = bksf_mapping(self._dense())
+            return PauliSumOp.from_list([(pauli.to_label(), weight)
+                                         for weight, pauli in qubit_op.paulis])
+
+        x, z, coeffs = self._map_to_symplectic(map_type, threshold)
+        if len(coeffs) == 0:
+            return PauliSumOp.from_list([('I' * self._modes, 0.0)])
+        table = PauliTable(np.hstack([unpack_bits(x, self._modes),
+                                      unpack_bits(z, self._modes)]))
+        return PauliSumOp(SparsePauliOp(table, coeffs))
+
+    def _map_to_symplectic(self, map_type, threshold):
+        """
+        Map fermionic operator to packed symplectic arrays.
+
+        Args:
+            map_type (str): case-insensitive mapping type.
+                            "jordan_wigner", "parity", "bravyi_kitaev"
+            threshold (float): threshold for Pauli simplification
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the packed X and Z parts of the
+            Pauli strings, of shape (num_terms, num_words), and their complex coefficients.
+
+        Raises:
+            QiskitChemistryError: if the `map_type` can not be recognized.
+        """
         n = self._modes  # number of fermionic modes / qubits
         map_type = map_type.lower()
         if map_type == 'jordan_wigner':
@@ -371,101 +420,43 @@ class FermionicOperator:
             a_list = self._parity_mode(n)
         elif map_type == 'bravyi_kitaev':
             a_list = self._bravyi_kitaev_mode(n)
-        elif map_type == 'bksf':
-            return bksf_mapping(self)
         else:
             raise QiskitChemistryError('Please specify the supported modes: '
                                        'jordan_wigner, parity, bravyi_kitaev, bksf')
 
-        # ###################################################################
-        # ###########    BUILDING THE MAPPED HAMILTONIAN     ################
-        # ###################################################################
-
-        pauli_list = WeightedPauliOperator(paulis=[])
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Mapping one-body terms to Qubit Hamiltonian:")
-            TextProgressBar(output_handler=sys.stderr)
-        results = parallel_map(FermionicOperator._one_body_mapping,
-                               [(self._h1[i, j], a_list[i], a_list[j])
-                                for i, j in itertools.product(range(n), repeat=2)
-                                if self._h1[i, j] != 0],
-                               task_args=(threshold,), num_processes=aqua_globals.num_processes)
-        for result in results:
-            pauli_list += result
-        pauli_list.chop(threshold=threshold)
-
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Mapping two-body terms to Qubit Hamiltonian:")
-            TextProgressBar(output_handler=sys.stderr)
-        results = parallel_map(FermionicOperator._two_body_mapping,
-                               [(self._h2[i, j, k, m], a_list[i], a_list[j], a_list[k], a_list[m])
-                                for i, j, k, m in itertools.product(range(n), repeat=4)
-                                if self._h2[i, j, k, m] != 0],
-                               task_args=(threshold,), num_processes=aqua_globals.num_processes)
-        for result in results:
-            pauli_list += result
-        pauli_list.chop(threshold=threshold)
+        images = _mode_images(a_list)
+        # the images of the annihilation operators are the adjoints of the images of the
+        # creation operators only if the Paulis of the mode images have real phases
+        symmetric = bool(np.all(images[2] % 2 == 0))
+        num_words = images[0].shape[-1]
+        terms = _TermAccumulator(num_words)
+
+        # a_i^dag a_j
+        for entries in _nonzero_entries(self._h1):
+            indices, coeffs, adjoint_coeffs = _representative_terms(
+                self._h1, entries, [(0, 1)], [(1, 0)] if symmetric else [])
+            terms.add(*_mapped_products(images, [(indices[0], -1), (indices[1], 1)],
+                                        coeffs, adjoint_coeffs, 4))
+        terms.chop(threshold)
+
+        # a_i^dag a_k^dag a_m a_j, which vanishes for i == k or m == j
+        for entries in _nonzero_entries(self._h2):
+            nonzero = (entries[0] != entries[2]) & (entries[1] != entries[3])
+            indices, coeffs, adjoint_coeffs = _representative_terms(
+                self._h2, [index[nonzero] for index in entries], [(0, 1, 2, 3), (2, 3, 0, 1)],
+                [(1, 0, 3, 2), (3, 2, 1, 0)] if symmetric else [])
+            terms.add(*_mapped_products(images,
+                                        [(indices[0], -1), (indices[2], -1),
+                                         (indices[3], 1), (indices[1], 1)],
+                                        coeffs, adjoint_coeffs, 16))
+        terms.chop(threshold)
 
         if self._ph_trans_shift is not None:
-            pauli_term = [self._ph_trans_shift, Pauli.from_label('I' * self._modes)]
-            pauli_list += WeightedPauliOperator(paulis=[pauli_term])
-
-        return pauli_list
-
-    @staticmethod
-    def _one_body_mapping(h1_ij_aij, threshold):
-        """
-        Subroutine for one body mapping.
-
-        Args:
-            h1_ij_aij (tuple): value of h1 at index (i,j), pauli at index i, pauli at index j
-            threshold (float): threshold to remove a pauli
-
-        Returns:
-            WeightedPauliOperator: Operator for those paulis
-        """
-        h1_ij, a_i, a_j = h1_ij_aij
-        pauli_list = []
-        for alpha in range(2):
-            for beta in range(2):
-                pauli_prod = Pauli.sgn_prod(a_i[alpha], a_j[beta])
-                coeff = h1_ij / 4 * pauli_prod[1] * np.power(-1j, alpha) * np.power(1j, beta)
-                pauli_term = [coeff, pauli_prod[0]]
-                if np.absolute(pauli_term[0]) > threshold:
-                    pauli_list.append(pauli_term)
-        return WeightedPauliOperator(paulis=pauli_list)
-
-    @staticmethod
-    def _two_body_mapping(h2_ijkm_a_ijkm, threshold):
-        """
-        Subroutine for two body mapping. We use the chemists notation
-        for the two-body term, h2(i,j,k,m) adag_i adag_k a_m a_j.
-
-        Args:
-            h2_ijkm_a_ijkm (tuple): value of h2 at index (i,j,k,m),
-                                    pauli at index i, pauli at index j,
-                                    pauli at index k, pauli at index m
-            threshold (float): threshold to remove a pauli
+            terms.add(np.zeros((1, num_words), dtype=np.uint64),
+                      np.zeros((1, num_words), dtype=np.uint64),
+                      np.array([self._ph_trans_shift], dtype=complex))
 
-        Returns:
-            WeightedPauliOperator: Operator for those paulis
-        """
-        h2_ijkm, a_i, a_j, a_k, a_m = h2_ijkm_a_ijkm
-        pauli_list = []
-        for alpha in range(2):
-            for beta in range(2):
-                for gamma in range(2):
-                    for delta in range(2):
-                        pauli_prod_1 = Pauli.sgn_prod(a_i[alpha], a_k[beta])
-                        pauli_prod_2 = Pauli.sgn_prod(pauli_prod_1[0], a_m[gamma])
-                        pauli_prod_3 = Pauli.sgn_prod(pauli_prod_2[0], a_j[delta])
-
-                        phase1 = pauli_prod_1[1] * pauli_prod_2[1] * pauli_prod_3[1]
-                        phase2 = np.power(-1j, alpha + beta) * np.power(1j, gamma + delta)
-                        pauli_term = [h2_ijkm / 16 * phase1 * phase2, pauli_prod_3[0]]
-                        if np.absolute(pauli_term[0]) > threshold:
-                            pauli_list.append(pauli_term)
-        return WeightedPauliOperator(paulis=pauli_list)
+        return terms.reduce()
 
     def _convert_to_interleaved_spins(self):
         """
@@ -498,6 +489,12 @@ class FermionicOperator:
         self.transform(matrix)
 
     # Modified for Open-Shell : 17.07.2019 by iso and bpa
+    def _dense(self):
+        """ Returns the operator with dense integrals. """
+        if isinstance(self._h2, np.ndarray):
+            return self
+        return FermionicOperator(self._h1, np.asarray(self._h2), self._ph_trans_shift)
+
     def particle_hole_transformation(self, num_particles):
         """
         The 'standard' second quantized Hamiltonian can be transformed in the
@@ -519,7 +516,7 @@ class FermionicOperator:
 
         self._convert_to_interleaved_spins()
         h_1, h_2, energy_shift = particle_hole_transformation(self._modes, num_particles,
-                                                              self._h1, self._h2)
+                                                              self._h1, np.asarray(self._h2))
         new_fer_op = FermionicOperator(h1=h_1, h2=h_2, ph_trans_shift=energy_shift)
         new_fer_op._convert_to_block_spins()
         return new_fer_op, energy_shift
@@ -541,7 +538,9 @@ class FermionicOperator:
         mode_set_diff = np.setdiff1d(np.arange(n_modes_old), fermion_mode_array)
         h1_id_i, h1_id_j = np.meshgrid(mode_set_diff, mode_set_diff, indexing='ij')
         h1_new = self._h1[h1_id_i, h1_id_j].copy()
-        if np.count_nonzero(self._h2) > 0:
+        if not isinstance(self._h2, np.ndarray):
+            h2_new = self._h2.select(mode_set_diff)
+        elif np.count_nonzero(self._h2) > 0:
             h2_id_i, h2_id_j, h2_id_k, h2_id_l = np.meshgrid(
                 mode_set_diff, mode_set_diff, mode_set_diff, mode_set_diff, indexing='ij')
             h2_new = self._h2[h2_id_i, h2_id_j, h2_id_k, h2_id_l].copy()
@@ -563,45 +562,32 @@ class FermionicOperator:
             tuple(FermionicOperator, float):
                 Fermionic Hamiltonian and energy of frozen modes
         """
-        fermion_mode_array = np.sort(fermion_mode_array)
-        n_modes_old = self._modes
-        n_modes_new = n_modes_old - fermion_mode_array.size
-        mode_set_diff = np.setdiff1d(np.arange(n_modes_old), fermion_mode_array)
+        fermion_mode_array = np.sort(fermion_mode_array).astype(int)
+        mode_set_diff = np.setdiff1d(np.arange(self._modes), fermion_mode_array)
 
         h_1 = self._h1.copy()
-        h2_new = np.zeros((n_modes_new, n_modes_new, n_modes_new, n_modes_new))
-
-        energy_shift = 0.0
-        if np.count_nonzero(self._h2) > 0:
-            # First simplify h2 and renormalize original h1
-            for __i, __j, __l, __k in itertools.product(range(n_modes_old), repeat=4):
-                # Untouched terms
-                h2_ijlk = self._h2[__i, __j, __l, __k]
-                if h2_ijlk == 0.0:
-                    continue
-                if __i in mode_set_diff and __j in mode_set_diff \
-                        and __l in mode_set_diff and __k in mode_set_diff:
-                    h2_new[__i - np.where(fermion_mode_array < __i)[0].size,
-                           __j - np.where(fermion_mode_array < __j)[0].size,
-                           __l - np.where(fermion_mode_array < __l)[0].size,
-                           __k - np.where(fermion_mode_array < __k)[0].size] = h2_ijlk
-                else:
-                    if __i in fermion_mode_array:
-                        if __l not in fermion_mode_array:
-                            if __i == __k and __j not in fermion_mode_array:
-                                h_1[__l, __j] -= h2_ijlk
-                            elif __i == __j and __k not in fermion_mode_array:
-                                h_1[__l, __k] += h2_ijlk
-                        elif __i != __l:
-                            if __j in fermion_mode_array and __i == __k and __l == __j:
-                                energy_shift -= h2_ijlk
-                            elif __l in fermion_mode_array and __i == __j and __l == __k:
-                                energy_shift += h2_ijlk
-                    elif __i not in fermion_mode_array and __l in fermion_mode_array:
-                        if __l == __k and __j not in fermion_mode_array:
-                            h_1[__i, __j] += h2_ijlk
-                        elif __l == __j and __k not in fermion_mode_array:
-                            h_1[__i, __k] -= h2_ijlk
+        frozen, active = fermion_mode_array, mode_set_diff
+        # the frozen modes are occupied: a_i^dag a_k^dag a_m a_j with two frozen modes i == j,
+        # k == m or i == m, k == j is a one-body term of the others and with four an energy
+        h_1[np.ix_(active, active)] += \
+            _gather(self._h2, frozen[:, None, None], frozen[:, None, None],
+                    active[None, :, None], active[None, None, :]).sum(axis=0) \
+            + _gather(self._h2, active[:, None, None], active[None, :, None],
+                      frozen[None, None, :], frozen[None, None, :]).sum(axis=2) \
+            - _gather(self._h2, frozen[:, None, None], active[None, None, :],
+                      active[None, :, None], frozen[:, None, None]).sum(axis=0) \
+            - _gather(self._h2, active[:, None, None], frozen[None, :, None],
+                      frozen[None, :, None], active[None, None, :]).sum(axis=1)
+        distinct = frozen[:, None] != frozen[None, :]
+        energy_shift = \
+            np.sum(_gather(self._h2, frozen[:, None], frozen[:, None], frozen[None, :],
+                           frozen[None, :])[distinct]) \
+            - np.sum(_gather(self._h2, frozen[:, None], frozen[None, :], frozen[None, :],
+                             frozen[:, None])[distinct])
+        if isinstance(self._h2, np.ndarray):
+            h2_new = self._h2[np.ix_(active, active, active, active)]
+        else:
+            h2_new = self._h2.select(active)
 
         # now simplify h1
         energy_shift += np.sum(np.diagonal(h_1)[fermion_mode_array])
@@ -743,3 +729,213 @@ class FermionicOperator:
         h_2 = x_h2 + y_h2 + z_h2
 
         return FermionicOperator(h1=h_1, h2=h_2)
+
+
+def _mode_images(a_list):
+    """
+    Packs the Pauli images of the modes.
+
+    Args:
+        a_list (list[Tuple]): the pair of Paulis of each mode, as built by the mode methods
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the packed X and Z parts, of shape
+        (modes, 2, num_words), and the exponent ``e`` of the phase ``1j ** e`` of each Pauli.
+    """
+    x = pack_bits([[pauli.x for pauli in pair] for pair in a_list])
+    z = pack_bits([[pauli.z for pauli in pair] for pair in a_list])
+    # a Pauli with phase p is (-1j) ** p times its label
+    exponents = np.array([[-pauli.phase % 4 for pauli in pair] for pair in a_list], dtype=np.int64)
+    return x, z, exponents
+
+
+def _multiply(x_1, z_1, x_2, z_2):
+    """
+    Multiplies packed Pauli strings.
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the packed X and Z parts of the
+        products and the exponent ``e`` of their phase ``1j ** e``.
+    """
+    only_x_1, only_z_1, y_1 = x_1 & ~z_1, z_1 & ~x_1, x_1 & z_1
+    only_x_2, only_z_2, y_2 = x_2 & ~z_2, z_2 & ~x_2, x_2 & z_2
+    # XY = iZ, YZ = iX, ZX = iY and the reverse products get a phase of -i
+    plus = (only_x_1 & y_2) | (y_1 & only_z_2) | (only_z_1 & only_x_2)
+    minus = (y_1 & only_x_2) | (only_z_1 & y_2) | (only_x_1 & only_z_2)
+    exponents = popcount(plus).astype(np.int64).sum(axis=-1) \
+        - popcount(minus).astype(np.int64).sum(axis=-1)
+    return x_1 ^ x_2, z_1 ^ z_2, exponents
+
+
+def _gather(tensor, *indices):
+    """ Gathers the entries of dense or compact integrals at broadcast indices. """
+    if isinstance(tensor, np.ndarray):
+        return tensor[tuple(indices)]
+    return tensor.gather(*indices)
+
+
+def _nonzero_entries(tensor):
+    """
+    Finds the nonzero entries of dense or compact integrals, in blocks.
+
+    Compact integrals are only formed one slice of the first index at a time.
+
+    Args:
+        tensor (Union(numpy.ndarray, SpinTwoBodyIntegrals)): the integrals
+
+    Yields:
+        tuple(numpy.ndarray): the indices of a block of nonzero entries
+    """
+    if isinstance(tensor, np.ndarray):
+        flats = np.flatnonzero(tensor)
+        for block in range(0, len(flats), _MAPPING_BLOCK_SIZE):
+            yield np.unravel_index(flats[block:block + _MAPPING_BLOCK_SIZE], tensor.shape)
+        return
+    for first in range(tensor.shape[0]):
+        flats = np.flatnonzero(tensor.slab(first))
+        for block in range(0, len(flats), _MAPPING_BLOCK_SIZE):
+            others = np.unravel_index(flats[block:block + _MAPPING_BLOCK_SIZE],
+                                      tensor.shape[1:])
+            yield (np.full(len(others[0]), first),) + others
+
+
+def _representative_terms(tensor, indices, permutations, adjoint_permutations):
+    """
+    Groups the nonzero entries of an integral tensor by the fermionic operator they multiply.
+
+    Index permutations in ``permutations`` give the same fermionic operator and the ones in
+    ``adjoint_permutations`` its adjoint, so that only one entry of each group needs mapping:
+    the nonzero entry with the lowest flat index.
+
+    Args:
+        tensor (Union(numpy.ndarray, SpinTwoBodyIntegrals)): the integrals
+        indices (tuple(numpy.ndarray)): the indices of nonzero entries, of which the
+            representative ones are kept
+        permutations (list[Tuple]): index permutations, including the identity, giving the
+            same operator
+        adjoint_permutations (list[Tuple]): index permutations giving the adjoint operator
+
+    Returns:
+        tuple(list[numpy.ndarray], numpy.ndarray, numpy.ndarray): the indices of the
+        representative entries, the sum of the coefficients of the operator and the sum of the
+        coefficients of its adjoint, unless the adjoint is the operator itself.
+    """
+    shape = tensor.shape
+    group = [tuple(indices[axis] for axis in perm)
+             for perm in permutations + adjoint_permutations]
+    flats = [np.ravel_multi_index(perm_indices, shape) for perm_indices in group]
+    values = [_gather(tensor, *perm_indices) for perm_indices in group]
+    lowest = np.minimum.reduce([np.where(value != 0, flat, flats[0])
+                                for flat, value in zip(flats, values)])
+    keep = flats[0] == lowest
+
+    indices = [index[keep] for index in indices]
+    flats = [flat[keep] for flat in flats]
+    values = [value[keep] for value in values]
+    same, adjoint = slice(0, len(permutations)), slice(len(permutations), None)
+    coeffs = _distinct_sum(values[same], flats[same])
+    if not adjoint_permutations:
+        return indices, coeffs, np.zeros_like(coeffs)
+    adjoint_coeffs = _distinct_sum(values[adjoint], flats[adjoint])
+    # the permutations give either the same set of entries or disjoint ones
+    adjoint_coeffs[np.logical_or.reduce([flats[len(permutations)] == flat
+                                         for flat in flats[same]])] = 0
+    return indices, coeffs, adjoint_coeffs
+
+
+def _distinct_sum(values, flats):
+    """ Sums the values of each set of flat indices, counting repeated indices once. """
+    total = values[0].copy()
+    for pos, flat in enumerate(flats[1:], start=1):
+        repeated = np.logical_or.reduce([flat == other for other in flats[:pos]])
+        total += np.where(repeated, 0, values[pos])
+    return total
+
+
+def _mapped_products(images, factors, coeffs, adjoint_coeffs, norm):
+    """
+    Maps a block of products of creation and annihilation operators.
+
+    Args:
+        images (tuple): the mode images, as returned by ``_mode_images``
+        factors (list[Tuple]): the mode indices of each factor of the products, with -1 for
+            creation and 1 for annihilation operators
+        coeffs (numpy.ndarray): the coefficients of the products
+        adjoint_coeffs (numpy.ndarray): the coefficients of the adjoints of the products
+        norm (int): the normalization of the products of the mode images
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the packed X and Z parts of the
+        Pauli strings and their coefficients.
+    """
+    x_images, z_images, image_exponents = images
+    all_x, all_z, all_coeffs = [], [], []
+    for pairs in itertools.product(range(2), repeat=len(factors)):
+        (modes, sign), pair = factors[0], pairs[0]
+        x, z = x_images[modes, pair], z_images[modes, pair]
+        exponents = image_exponents[modes, pair] + sign * pair
+        for (modes, sign), pair in zip(factors[1:], pairs[1:]):
+            x, z, product_exponents = _multiply(x, z, x_images[modes, pair],
+                                                z_images[modes, pair])
+            exponents = exponents + product_exponents + image_exponents[modes, pair] + sign * pair
+        phases = _PHASES[exponents % 4]
+        all_x.append(x)
+        all_z.append(z)
+        all_coeffs.append((coeffs * phases + adjoint_coeffs * phases.conj()) / norm)
+    return np.concatenate(all_x), np.concatenate(all_z), np.concatenate(all_coeffs)
+
+
+_PHASES = np.array([1, 1j, -1, -1j])
+
+
+class _TermAccumulator:
+    """ Sums blocks of packed Pauli strings, merging equal strings by sorting. """
+
+    def __init__(self, num_words):
+        self._num_words = num_words
+        self._blocks = []
+        self._size = 0
+        self._reduced_size = 0
+
+    def add(self, x, z, coeffs):
+        """ Adds a block of terms. """
+        self._blocks.append(_reduce_terms(x, z, coeffs))
+        self._size += len(self._blocks[-1][2])
+        # bound the memory held by the blocks which may share Pauli strings
+        if self._size > 2 * self._reduced_size + 16 * _MAPPING_BLOCK_SIZE:
+            self.reduce()
+
+    def chop(self, threshold):
+        """ Removes the terms whose real and imaginary parts are both below the threshold. """
+        x, z, coeffs = self.reduce()
+        real = np.where(np.abs(coeffs.real) >= threshold, coeffs.real, 0)
+        imag = np.where(np.abs(coeffs.imag) >= threshold, coeffs.imag, 0)
+        coeffs = real + 1j * imag
+        keep = coeffs != 0
+        self._blocks = [(x[keep], z[keep], coeffs[keep])]
+        self._size = self._reduced_size = int(np.count_nonzero(keep))
+
+    def reduce(self):
+        """ Merges the blocks and returns the packed X and Z parts and the coefficients. """
+        if not self._blocks:
+            empty = np.zeros((0, self._num_words), dtype=np.uint64)
+            return empty, empty.copy(), np.zeros(0, dtype=complex)
+        if len(self._blocks) > 1:
+            x, z, coeffs = (np.concatenate(parts) for parts in zip(*self._blocks))
+            self._blocks = [_reduce_terms(x, z, coeffs)]
+        self._size = self._reduced_size = len(self._blocks[0][2])
+        return self._blocks[0]
+
+
+def _reduce_terms(x, z, coeffs):
+    """ Sums the coefficients of equal Pauli strings, returned sorted by their X and Z parts. """
+    coeffs = np.asarray(coeffs, dtype=complex)
+    if len(coeffs) == 0:
+        return x, z, coeffs
+    keys = np.hstack([x, z])
+    order = np.lexsort(keys.T[::-1])
+    keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], np.any(keys[1:] != keys[:-1], axis=1))))
+    num_words = x.shape[1]
+    return keys[starts, :num_words], keys[starts, num_words:], \
+        np.add.reduceat(coeffs[order], starts)
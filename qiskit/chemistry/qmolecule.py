@@ -12,7 +12,7 @@
 
 """ QMolecule """
 
-from typing import List
+from typing import List, Optional
 import os
 import logging
 import tempfile
@@ -21,6 +21,9 @@ import numpy
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=FutureWarning)
     import h5py
+from .qiskit_chemistry_error import QiskitChemistryError
+from .two_body_integrals import (TwoBodyIntegrals, PackedTwoBodyIntegrals,
+                                 CholeskyTwoBodyIntegrals, SpinTwoBodyIntegrals)
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +91,8 @@ class QMolecule:
         self.overlap = None  # v2
         self.eri = None  # v2
 
-        # 1 and 2 electron integrals in MO basis
+        # 1 and 2 electron integrals in MO basis, the 2 electron ones as dense arrays
+        # or TwoBodyIntegrals
         self.mo_onee_ints = None
         self.mo_onee_ints_b = None  # v2
         self.mo_eri_ints = None
@@ -118,8 +122,61 @@ class QMolecule:
     @property
     def two_body_integrals(self):
         """ Returns two body electron integrals. """
+        compact_integrals = self.compact_two_body_integrals
+        if compact_integrals is not None:
+            return compact_integrals.to_dense()
         return QMolecule.twoe_to_spin(self.mo_eri_ints, self.mo_eri_ints_bb, self.mo_eri_ints_ba)
 
+    @property
+    def compact_two_body_integrals(self) -> Optional[SpinTwoBodyIntegrals]:
+        """ Returns two body electron integrals computed on demand from the compact MO
+        integrals, or None if the MO integrals are dense arrays. """
+        if not isinstance(self.mo_eri_ints, TwoBodyIntegrals):
+            return None
+        return SpinTwoBodyIntegrals(self.mo_eri_ints, self.mo_eri_ints_bb, self.mo_eri_ints_ba)
+
+    def compress_two_body_integrals(self, kind: str = 'packed', threshold: float = 1e-10) -> None:
+        """
+        Replace the dense two electron integrals in MO basis by a compact representation.
+
+        Args:
+            kind: 'packed' to store the integrals by their 8-fold permutational symmetry,
+                4-fold for the beta-alpha ones, or 'cholesky' to store the factors of their
+                pivoted Cholesky decomposition.
+            threshold: the accuracy of the Cholesky decomposition
+
+        Raises:
+            QiskitChemistryError: invalid kind, or unrestricted integrals to decompose without
+                the integrals in AO basis
+        """
+        if self.mo_eri_ints is None or isinstance(self.mo_eri_ints, TwoBodyIntegrals):
+            return
+        unrestricted = self.mo_eri_ints_bb is not None and self.mo_eri_ints_ba is not None
+        if kind == 'packed':
+            self.mo_eri_ints = PackedTwoBodyIntegrals.from_dense(self.mo_eri_ints)
+            if unrestricted:
+                self.mo_eri_ints_bb = PackedTwoBodyIntegrals.from_dense(self.mo_eri_ints_bb)
+                self.mo_eri_ints_ba = PackedTwoBodyIntegrals.from_dense(self.mo_eri_ints_ba,
+                                                                        symmetry=4)
+        elif kind == 'cholesky':
+            if not unrestricted:
+                self.mo_eri_ints = CholeskyTwoBodyIntegrals.from_dense(self.mo_eri_ints,
+                                                                       threshold=threshold)
+            elif self.eri is not None and self.mo_coeff is not None \
+                    and self.mo_coeff_b is not None:
+                # the beta-alpha integrals need the same factors for both spins
+                ao_ints = CholeskyTwoBodyIntegrals.from_dense(self.eri, threshold=threshold)
+                self.mo_eri_ints = ao_ints.transform(self.mo_coeff)
+                self.mo_eri_ints_bb = ao_ints.transform(self.mo_coeff_b)
+                self.mo_eri_ints_ba = ao_ints.transform(self.mo_coeff_b, self.mo_coeff)
+            else:
+                raise QiskitChemistryError('The Cholesky decomposition of unrestricted '
+                                           'integrals needs the integrals in AO basis.')
+        else:
+            raise QiskitChemistryError('Unknown two body integral representation {}'.format(kind))
+        if not unrestricted:
+            self.mo_eri_ints_bb = self.mo_eri_ints_ba = None
+
     def has_dipole_integrals(self):
         """ Check if dipole integrals are present. """
         return self.x_dip_mo_ints is not None and \
@@ -190,6 +247,8 @@ class QMolecule:
 
             with h5py.File(self._filename, "r") as file:
                 def read_array(name):
+                    if isinstance(file[name], h5py.Group):
+                        return TwoBodyIntegrals.load(file[name])
                     _data = file[name][...]
                     if _data.dtype == numpy.bool and _data.size == 1 and not _data:
                         _data = None
@@ -289,6 +348,10 @@ class QMolecule:
 
         with h5py.File(file, "w") as file:
             def create_dataset(group, name, value):
+                if isinstance(value, TwoBodyIntegrals):
+                    value.save(group.create_group(name))
+                    return
+
                 def is_float(v):
                     if v is None:
                         return False
@@ -303,7 +366,9 @@ class QMolecule:
                         return False
 
                 if is_float(value):
-                    group.create_dataset(name, data=value, dtype="float64")
+                    # two body integrals are stored in chunks to be read in part
+                    chunks = True if numpy.ndim(value) == 4 else None
+                    group.create_dataset(name, data=value, dtype="float64", chunks=chunks)
                 else:
                     group.create_dataset(name, data=(value if value is not None else False))
 
@@ -398,7 +463,7 @@ class QMolecule:
         return numpy.dot(numpy.dot(numpy.transpose(moc), ints), moc)
 
     @staticmethod
-    def twoeints2mo(ints, moc):
+    def twoeints2mo(ints, moc, block_size=None, out=None):
         """Converts two-body integrals from AO to MO basis
 
         Returns two electron integrals in AO basis converted to given MO basis
@@ -406,26 +471,67 @@ class QMolecule:
         Args:
             ints (numpy.ndarray): N^2 two electron integrals in AO basis
             moc (numpy.ndarray): Molecular orbital coefficients
+            block_size (int): Number of MO indices of the first axis transformed at a time,
+                see :meth:`twoeints2mo_general`
+            out (numpy.ndarray): Optional array, e.g. a ``numpy.memmap`` or an ``h5py``
+                dataset, in which the MO integrals are stored
 
         Returns:
             numpy.ndarray: integrals in MO basis
         """
-        dim = ints.shape[0]
-        eri_mo = numpy.zeros((dim, dim, dim, dim))
+        return QMolecule.twoeints2mo_general(ints, moc, moc, moc, moc,
+                                             block_size=block_size, out=out)
+
+    @staticmethod
+    def twoeints2mo_general(ints, moc1, moc2, moc3, moc4, block_size=None, out=None):
+        """Converts two-body integrals with a different basis change on each index
 
-        for a_i in range(dim):
-            temp1 = numpy.einsum('i,i...->...', moc[:, a_i], ints)
-            for b_i in range(dim):
-                temp2 = numpy.einsum('j,j...->...', moc[:, b_i], temp1)
-                temp3 = numpy.einsum('kc,k...->...c', moc, temp2)
-                eri_mo[a_i, b_i, :, :] = numpy.einsum('ld,l...c->...cd', moc, temp3)
+        Computes ``einsum('pqrs,pi,qj,rk,sl->ijkl', ints, moc1, moc2, moc3, moc4)`` as a chain
+        of four ``tensordot`` contractions, one index at a time. The output is computed in
+        blocks of its first index so that, besides the input and output, only two temporaries
+        of ``block_size`` times N^3 elements are held. With ``out`` and ``ints`` given as
+        arrays on disk, e.g. ``numpy.memmap`` or ``h5py`` datasets, the transformation
+        runs out-of-core, the input being read in slabs of ``block_size`` along its first axis.
 
-        return eri_mo
+        Args:
+            ints (numpy.ndarray): N^4 two electron integrals
+            moc1 (numpy.ndarray): Coefficients of the first index
+            moc2 (numpy.ndarray): Coefficients of the second index
+            moc3 (numpy.ndarray): Coefficients of the third index
+            moc4 (numpy.ndarray): Coefficients of the fourth index
+            block_size (int): Number of indices of the first output axis computed at a time.
+                By default the blocks hold about 2^24 elements.
+            out (numpy.ndarray): Optional array in which the result is stored
 
-    @staticmethod
-    def twoeints2mo_general(ints, moc1, moc2, moc3, moc4):
-        """ twoeints2mo_general """
-        return numpy.einsum('pqrs,pi,qj,rk,sl->ijkl', ints, moc1, moc2, moc3, moc4)
+        Returns:
+            numpy.ndarray: the transformed integrals, ``out`` if given
+        """
+        shape = (moc1.shape[1], moc2.shape[1], moc3.shape[1], moc4.shape[1])
+        dtype = numpy.result_type(ints.dtype, moc1, moc2, moc3, moc4)
+        if out is None:
+            out = numpy.empty(shape, dtype=dtype)
+        if block_size is None:
+            block_size = max(1, _MAX_BLOCK_ELEMENTS // max(1, int(numpy.prod(ints.shape[1:]))))
+        in_memory = isinstance(ints, numpy.ndarray) and not isinstance(ints, numpy.memmap)
+
+        for start in range(0, shape[0], block_size):
+            stop = min(start + block_size, shape[0])
+            if in_memory:
+                temp = numpy.tensordot(moc1[:, start:stop], ints, axes=([0], [0]))
+            else:
+                # read the input in slabs of its first axis
+                temp = numpy.zeros((stop - start,) + ints.shape[1:], dtype=dtype)
+                for slab in range(0, ints.shape[0], block_size):
+                    temp += numpy.tensordot(moc1[slab:slab + block_size, start:stop],
+                                            numpy.asarray(ints[slab:slab + block_size]),
+                                            axes=([0], [0]))
+            # each contraction moves the transformed index last: (i, q, r, s) -> (i, r, s, j)
+            # -> (i, s, j, k) -> (i, j, k, l)
+            for moc in (moc2, moc3, moc4):
+                temp = numpy.tensordot(temp, moc, axes=([1], [0]))
+            out[start:stop] = temp
+
+        return out
 
     @staticmethod
     def onee_to_spin(mohij, mohij_b=None, threshold=1E-12):
@@ -451,22 +557,13 @@ class QMolecule:
 
         # One electron terms
         moh1_qubit = numpy.zeros([nspin_orbs, nspin_orbs])
-        for p in range(nspin_orbs):  # pylint: disable=invalid-name
-            for q in range(nspin_orbs):
-                spinp = int(p/norbs)
-                spinq = int(q/norbs)
-                if spinp % 2 != spinq % 2:
-                    continue
-                ints = mohij if spinp == 0 else mohij_b
-                orbp = int(p % norbs)
-                orbq = int(q % norbs)
-                if abs(ints[orbp, orbq]) > threshold:
-                    moh1_qubit[p, q] = ints[orbp, orbq]
+        moh1_qubit[:norbs, :norbs] = _chop(mohij, threshold)
+        moh1_qubit[norbs:, norbs:] = _chop(mohij_b, threshold)
 
         return moh1_qubit
 
     @staticmethod
-    def twoe_to_spin(mohijkl, mohijkl_bb=None, mohijkl_ba=None, threshold=1E-12):
+    def twoe_to_spin(mohijkl, mohijkl_bb=None, mohijkl_ba=None, threshold=1E-12, out=None):
         """Convert two-body MO integrals to spin orbital basis
 
         Takes two body integrals in molecular orbital basis and returns
@@ -478,6 +575,9 @@ class QMolecule:
             mohijkl_bb (numpy.ndarray): Two body orbitals in molecular basis (BetaBeta)
             mohijkl_ba (numpy.ndarray): Two body orbitals in molecular basis (BetaAlpha)
             threshold (float): Threshold value for assignments
+            out (numpy.ndarray): Optional array, e.g. a ``numpy.memmap`` or an ``h5py``
+                dataset, in which the spin orbital integrals are stored. The spin blocks are
+                then written one orbital at a time, without a full size temporary.
         Returns:
             numpy.ndarray: Two body integrals in spin orbitals
         """
@@ -506,32 +606,27 @@ class QMolecule:
         #            .
         #            .
 
-        # Two electron terms
-        moh2_qubit = numpy.zeros([nspin_orbs, nspin_orbs, nspin_orbs, nspin_orbs])
+        # Two electron terms, which are nonzero only if the spins of the first and last
+        # as well as of the second and third indices are equal
+        if out is None:
+            moh2_qubit = numpy.zeros([nspin_orbs, nspin_orbs, nspin_orbs, nspin_orbs])
+            for spinp, spinq, ints in [(0, 0, ints_aa), (0, 1, ints_ba),
+                                       (1, 0, ints_ab), (1, 1, ints_bb)]:
+                p_s = slice(spinp * norbs, (spinp + 1) * norbs)
+                q_r = slice(spinq * norbs, (spinq + 1) * norbs)
+                moh2_qubit[p_s, q_r, q_r, p_s] = -0.5 * _chop(ints, threshold)
+            return moh2_qubit
+
+        blocks = {(0, 0): ints_aa, (0, 1): ints_ba, (1, 0): ints_ab, (1, 1): ints_bb}
         for p in range(nspin_orbs):  # pylint: disable=invalid-name
-            for q in range(nspin_orbs):
-                for r in range(nspin_orbs):
-                    for s in range(nspin_orbs):  # pylint: disable=invalid-name
-                        spinp = int(p/norbs)
-                        spinq = int(q/norbs)
-                        spinr = int(r/norbs)
-                        spins = int(s/norbs)
-                        if spinp != spins:
-                            continue
-                        if spinq != spinr:
-                            continue
-                        if spinp == 0:
-                            ints = ints_aa if spinq == 0 else ints_ba
-                        else:
-                            ints = ints_ab if spinq == 0 else ints_bb
-                        orbp = int(p % norbs)
-                        orbq = int(q % norbs)
-                        orbr = int(r % norbs)
-                        orbs = int(s % norbs)
-                        if abs(ints[orbp, orbq, orbr, orbs]) > threshold:
-                            moh2_qubit[p, q, r, s] = -0.5*ints[orbp, orbq, orbr, orbs]
-
-        return moh2_qubit
+            spinp, orbp = divmod(p, norbs)
+            row = numpy.zeros([nspin_orbs, nspin_orbs, nspin_orbs])
+            for spinq in range(2):
+                q_r = slice(spinq * norbs, (spinq + 1) * norbs)
+                row[q_r, q_r, spinp * norbs:(spinp + 1) * norbs] = \
+                    -0.5 * _chop(blocks[spinp, spinq][orbp], threshold)
+            out[p] = row
+        return out
 
     symbols = [
         # pylint: disable=bad-option-value,bad-whitespace
@@ -664,3 +759,13 @@ class QMolecule:
             logger.info("Core orbitals list %s", self.core_orbitals)
         finally:
             numpy.set_printoptions(**opts)
+
+
+# the number of elements of the blocks of the two-body integral transformation
+_MAX_BLOCK_ELEMENTS = 2 ** 24
+
+
+def _chop(ints, threshold):
+    """ Returns the integrals with the values not above the threshold set to zero. """
+    ints = numpy.asarray(ints)
+    return numpy.where(numpy.abs(ints) > threshold, ints, 0)
@@ -0,0 +1,185 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" On-disk cache of the qubit operators of a transformation """
+
+from typing import Optional, List, Dict, Tuple, Any
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+from qiskit.quantum_info import Pauli
+from qiskit.aqua.operators import WeightedPauliOperator, Z2Symmetries
+from qiskit.aqua.utils import pack_bits, unpack_bits
+
+logger = logging.getLogger(__name__)
+
+# the version of the format of the files, part of their keys
+_FORMAT_VERSION = 1
+
+
+def operators_key(*values: Any) -> str:
+    """ Compute the key of the qubit operators transformed from the given values.
+
+    Args:
+        values: the inputs of the transformation, e.g. integrals and settings, made of
+            arrays, numbers, strings, lists, dictionaries and objects of those.
+
+    Returns:
+        The hex digest identifying the qubit operators.
+    """
+    digest = hashlib.sha256()
+    _update_digest(digest, (_FORMAT_VERSION,) + values)
+    return digest.hexdigest()
+
+
+def save_operators(file_name: str,
+                   operators: List[Optional[WeightedPauliOperator]],
+                   z2_symmetries: Z2Symmetries,
+                   metadata: Dict[str, Any]) -> None:
+    """ Store qubit operators, as packed Pauli tables and coefficient arrays.
+
+    Args:
+        file_name: the name of the file, written atomically.
+        operators: the operators, of which some may be None.
+        z2_symmetries: the symmetries the tapered operators are tapered with.
+        metadata: additional values, which can be serialized with JSON.
+    """
+    arrays = {}  # type: Dict[str, np.ndarray]
+    entries = []  # type: List[Optional[Tuple[str, int, bool]]]
+    for i, operator in enumerate(operators):
+        if operator is None:
+            entries.append(None)
+            continue
+        paulis = [pauli for _, pauli in operator.paulis]
+        arrays['x_{}'.format(i)], arrays['z_{}'.format(i)] = _pack_paulis(paulis,
+                                                                          operator.num_qubits)
+        arrays['coeffs_{}'.format(i)] = np.array([coeff for coeff, _ in operator.paulis],
+                                                 dtype=complex)
+        tapered = operator.z2_symmetries is not None and not operator.z2_symmetries.is_empty()
+        entries.append((operator.name, operator.num_qubits, tapered))
+
+    num_qubits = 0
+    if not z2_symmetries.is_empty():
+        num_qubits = z2_symmetries.symmetries[0].num_qubits
+        arrays['symmetries_x'], arrays['symmetries_z'] = \
+            _pack_paulis(z2_symmetries.symmetries, num_qubits)
+        arrays['sq_paulis_x'], arrays['sq_paulis_z'] = \
+            _pack_paulis(z2_symmetries.sq_paulis, num_qubits)
+    tapering_values = z2_symmetries.tapering_values
+    if tapering_values is not None:
+        tapering_values = [int(value) for value in tapering_values]
+    header = {'operators': entries,
+              'z2_symmetries': {'num_qubits': num_qubits,
+                                'sq_list': [int(i) for i in z2_symmetries.sq_list],
+                                'tapering_values': tapering_values},
+              'metadata': metadata}
+    arrays['header'] = np.array(json.dumps(header))
+
+    tmp_file_name = '{}.{}.tmp'.format(file_name, os.getpid())
+    try:
+        with open(tmp_file_name, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+        # atomic, so that concurrent processes never read a partially written file
+        os.replace(tmp_file_name, file_name)
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning('Failed to store qubit operators in %s: %s', file_name, ex)
+
+
+def load_operators(file_name: str) -> Optional[Tuple[List[Optional[WeightedPauliOperator]],
+                                                     Z2Symmetries, Dict[str, Any]]]:
+    """ Load qubit operators stored by :func:`save_operators`.
+
+    Args:
+        file_name: the name of the file.
+
+    Returns:
+        The operators, their symmetries and the metadata, or None if the file is missing or
+        cannot be read.
+    """
+    if not os.path.isfile(file_name):
+        return None
+    try:
+        with np.load(file_name, allow_pickle=False) as arrays:
+            header = json.loads(str(arrays['header']))
+            z2_header = header['z2_symmetries']
+            z2_symmetries = Z2Symmetries([], [], [])
+            if z2_header['num_qubits'] > 0:
+                z2_symmetries = Z2Symmetries(
+                    _unpack_paulis(arrays['symmetries_x'], arrays['symmetries_z'],
+                                   z2_header['num_qubits']),
+                    _unpack_paulis(arrays['sq_paulis_x'], arrays['sq_paulis_z'],
+                                   z2_header['num_qubits']),
+                    z2_header['sq_list'], z2_header['tapering_values'])
+
+            operators = []  # type: List[Optional[WeightedPauliOperator]]
+            for i, entry in enumerate(header['operators']):
+                if entry is None:
+                    operators.append(None)
+                    continue
+                name, num_qubits, tapered = entry
+                paulis = _unpack_paulis(arrays['x_{}'.format(i)], arrays['z_{}'.format(i)],
+                                        num_qubits)
+                operators.append(WeightedPauliOperator(
+                    paulis=[[coeff, pauli]
+                            for coeff, pauli in zip(arrays['coeffs_{}'.format(i)], paulis)],
+                    z2_symmetries=z2_symmetries.copy() if tapered else None,
+                    name=name))
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning('Failed to load cached qubit operators %s: %s', file_name, ex)
+        return None
+    return operators, z2_symmetries, header['metadata']
+
+
+def _pack_paulis(paulis: List[Pauli], num_qubits: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ Pack the X and Z parts of Pauli strings into uint64 words. """
+    x = np.zeros((len(paulis), num_qubits), dtype=bool)
+    z = np.zeros((len(paulis), num_qubits), dtype=bool)
+    for i, pauli in enumerate(paulis):
+        x[i] = pauli.x
+        z[i] = pauli.z
+    return pack_bits(x), pack_bits(z)
+
+
+def _unpack_paulis(x: np.ndarray, z: np.ndarray, num_qubits: int) -> List[Pauli]:
+    """ The Pauli strings of packed X and Z parts. """
+    x = unpack_bits(x, num_qubits)
+    z = unpack_bits(z, num_qubits)
+    return [Pauli((z_k, x_k)) for z_k, x_k in zip(z, x)]
+
+
+def _update_digest(digest: Any, value: Any) -> None:
+    """ Update a hash with a canonical encoding of the value. """
+    if value is None:
+        digest.update(b'N')
+    elif isinstance(value, np.ndarray):
+        digest.update('A{}{}'.format(value.dtype.str, value.shape).encode('utf-8'))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update('L{}'.format(len(value)).encode('utf-8'))
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update('D{}'.format(len(value)).encode('utf-8'))
+        for name in sorted(value):
+            _update_digest(digest, name)
+            _update_digest(digest, value[name])
+    elif isinstance(value, np.generic):
+        _update_digest(digest, value.item())
+    elif isinstance(value, (bool, int, float, complex, str)):
+        digest.update('S{}{!r}'.format(type(value).__name__, value).encode('utf-8'))
+    else:
+        # objects such as compressed two-body integrals
+        digest.update('O{}'.format(type(value).__qualname__).encode('utf-8'))
+        _update_digest(digest, vars(value))
@@ -18,6 +18,7 @@ The problem is described in a driver.
 from functools import partial
 from typing import Optional, List, Union, cast, Tuple, Dict, Any, Callable
 import logging
+import os
 from enum import Enum
 
 import numpy as np
@@ -33,6 +34,7 @@ from qiskit.chemistry.results import DipoleTuple, EigenstateResult, ElectronicSt
 from qiskit.chemistry.components.variational_forms import UCCSD
 
 from .transformation import Transformation
+from ._operator_cache import operators_key, save_operators, load_operators
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +52,12 @@ class FermionicQubitMappingType(Enum):
     BRAVYI_KITAEV = 'bravyi_kitaev'
 
 
+# the shifts of the energy and dipole moments, stored with the cached qubit operators
+_CACHED_SHIFTS = ('energy_shift', 'x_dipole_shift', 'y_dipole_shift', 'z_dipole_shift',
+                  'ph_energy_shift', 'ph_x_dipole_shift', 'ph_y_dipole_shift',
+                  'ph_z_dipole_shift')
+
+
 class FermionicTransformation(Transformation):
     """A transformation from a fermionic problem, represented by a driver, to a qubit operator."""
 
@@ -59,7 +67,8 @@ class FermionicTransformation(Transformation):
                  two_qubit_reduction: bool = True,
                  freeze_core: bool = False,
                  orbital_reduction: Optional[List[int]] = None,
-                 z2symmetry_reduction: Optional[Union[str, List[int]]] = None) -> None:
+                 z2symmetry_reduction: Optional[Union[str, List[int]]] = None,
+                 cache_dir: Optional[str] = None) -> None:
         """
         Args:
             transformation: full or particle_hole
@@ -82,6 +91,11 @@ class FermionicTransformation(Transformation):
                 symmetries found in the main operator if this operator commutes with the main
                 operator symmetry. If it does not then the operator will be discarded since no
                 meaningful measurement can take place.
+            cache_dir: Optional directory of an on-disk cache of the qubit operators, keyed on the
+                integrals of the molecule and the settings of the transformation, so that
+                transforming the same molecule again, e.g. in another process, skips the mapping
+                to qubit operators. The operators are stored as packed Pauli tables and arrays of
+                coefficients, together with the shifts and molecule information.
         Raises:
             QiskitChemistryError: Invalid symmetry reduction
         """
@@ -97,6 +111,9 @@ class FermionicTransformation(Transformation):
                 if z2symmetry_reduction != 'auto':
                     raise QiskitChemistryError('Invalid z2symmetry_reduction value')
         self._z2symmetry_reduction = z2symmetry_reduction
+        self._cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
         self._has_dipole_moments = False
         self._untapered_qubit_op = None
 
@@ -175,6 +192,13 @@ class FermionicTransformation(Transformation):
         self._nuclear_dipole_moment = qmolecule.nuclear_dipole_moment
         self._reverse_dipole_sign = qmolecule.reverse_dipole_sign
 
+        cache_key = None
+        if self._cache_dir is not None:
+            cache_key = self._cache_key(qmolecule, aux_operators)
+            cached = self._load_cached_operators(cache_key)
+            if cached is not None:
+                return cached
+
         core_list = qmolecule.core_orbitals if self._freeze_core else []
         reduce_list = self._orbital_reduction
 
@@ -237,7 +261,11 @@ class FermionicTransformation(Transformation):
         new_nel = [new_num_alpha, new_num_beta]
 
         # construct the fermionic operator
-        fer_op = FermionicOperator(h1=qmolecule.one_body_integrals, h2=qmolecule.two_body_integrals)
+        # compact integrals are reduced and mapped without the dense two body integrals
+        h_2 = qmolecule.compact_two_body_integrals
+        if h_2 is None:
+            h_2 = qmolecule.two_body_integrals
+        fer_op = FermionicOperator(h1=qmolecule.one_body_integrals, h2=h_2)
 
         # try to reduce it according to the freeze and remove list
         fer_op, self._energy_shift, did_shift = \
@@ -374,9 +402,79 @@ class FermionicTransformation(Transformation):
             qubit_op, aux_ops, z2symmetries = self._process_z2symmetry_reduction(qubit_op, aux_ops)
         self._molecule_info['z2_symmetries'] = z2symmetries
 
+        if cache_key is not None:
+            self._save_cached_operators(cache_key, qubit_op, aux_ops)
+
         logger.debug('Processing complete ready to run algorithm')
         return qubit_op, aux_ops
 
+    def _cache_key(self, qmolecule: QMolecule,
+                   aux_operators: Optional[List[FermionicOperator]]) -> str:
+        """
+        Args:
+            qmolecule: qmolecule
+            aux_operators: Additional ``FermionicOperator``s to map to a qubit operator.
+
+        Returns:
+            The key of the qubit operators in the cache.
+        """
+        settings = [self._transformation, self._qubit_mapping, self._two_qubit_reduction,
+                    self._freeze_core, self._orbital_reduction, self._z2symmetry_reduction]
+        integrals = [qmolecule.num_orbitals, qmolecule.num_alpha, qmolecule.num_beta,
+                     qmolecule.core_orbitals if self._freeze_core else None,
+                     qmolecule.mo_onee_ints, qmolecule.mo_onee_ints_b,
+                     qmolecule.mo_eri_ints, qmolecule.mo_eri_ints_bb, qmolecule.mo_eri_ints_ba,
+                     qmolecule.x_dip_mo_ints, qmolecule.x_dip_mo_ints_b,
+                     qmolecule.y_dip_mo_ints, qmolecule.y_dip_mo_ints_b,
+                     qmolecule.z_dip_mo_ints, qmolecule.z_dip_mo_ints_b]
+        aux_integrals = [(op.h1, op.h2, getattr(op, 'name', ''))
+                         for op in aux_operators or []]
+        return operators_key(type(self).__name__, settings, integrals, aux_integrals)
+
+    def _cache_file_name(self, cache_key: str) -> str:
+        return os.path.join(self._cache_dir, '{}.npz'.format(cache_key))
+
+    def _save_cached_operators(self, cache_key: str,
+                               qubit_op: WeightedPauliOperator,
+                               aux_ops: List[Optional[WeightedPauliOperator]]) -> None:
+        """Stores the qubit operators, and the values needed to interpret the results."""
+        metadata = {name: float(getattr(self, '_' + name)) for name in _CACHED_SHIFTS}
+        metadata['has_dipole_moments'] = bool(self._has_dipole_moments)
+        metadata['num_particles'] = [int(n) for n in self._molecule_info['num_particles']]
+        metadata['num_orbitals'] = int(self._molecule_info['num_orbitals'])
+        metadata['two_qubit_reduction'] = bool(self._molecule_info['two_qubit_reduction'])
+        # the untapered operator is only stored if it differs from the main one
+        untapered_qubit_op = self._untapered_qubit_op \
+            if self._untapered_qubit_op is not qubit_op else None
+        save_operators(self._cache_file_name(cache_key),
+                       [qubit_op, untapered_qubit_op] + aux_ops,
+                       self._molecule_info['z2_symmetries'], metadata)
+
+    def _load_cached_operators(self, cache_key: str) \
+            -> Optional[Tuple[WeightedPauliOperator, List[Optional[WeightedPauliOperator]]]]:
+        """Loads the qubit operators, and restores the values needed to interpret the results.
+
+        Returns:
+            (qubit operator, auxiliary operators), or None if they are not in the cache
+        """
+        file_name = self._cache_file_name(cache_key)
+        cached = load_operators(file_name)
+        if cached is None:
+            return None
+        operators, z2symmetries, metadata = cached
+        logger.info('Loaded the qubit operators from the cache: %s', file_name)
+
+        for name in _CACHED_SHIFTS:
+            setattr(self, '_' + name, metadata[name])
+        self._has_dipole_moments = metadata['has_dipole_moments']
+        self._molecule_info['num_particles'] = tuple(metadata['num_particles'])
+        self._molecule_info['num_orbitals'] = metadata['num_orbitals']
+        self._molecule_info['two_qubit_reduction'] = metadata['two_qubit_reduction']
+        self._molecule_info['z2_symmetries'] = z2symmetries
+        qubit_op = operators[0]
+        self._untapered_qubit_op = operators[1] if operators[1] is not None else qubit_op
+        return qubit_op, operators[2:]
+
     @property
     def untapered_qubit_op(self):
         """Getter for the untapered qubit operator"""
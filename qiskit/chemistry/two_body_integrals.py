@@ -0,0 +1,555 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Compact storage of two-electron integrals """
+
+from typing import Optional, Tuple
+from abc import ABC, abstractmethod
+import logging
+
+import numpy as np
+
+from .qiskit_chemistry_error import QiskitChemistryError
+
+logger = logging.getLogger(__name__)
+
+
+class TwoBodyIntegrals(ABC):
+    """
+    Two-electron integrals :math:`(ij|kl)` in chemists' notation, in a compact representation.
+
+    The integrals behave as a read-only N^4 tensor which is never held in memory as a whole:
+    single values are computed with :meth:`gather` and slices with a fixed index with
+    :meth:`slab`. :meth:`to_dense`, or ``numpy.asarray``, builds the dense tensor.
+    """
+
+    def __init__(self, num_orbitals: int) -> None:
+        self._num_orbitals = num_orbitals
+
+    @property
+    def num_orbitals(self) -> int:
+        """ Returns the number of orbitals. """
+        return self._num_orbitals
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        """ Returns the shape of the dense integrals. """
+        return (self._num_orbitals,) * 4
+
+    @property
+    def ndim(self) -> int:
+        """ Returns the number of indices, 4. """
+        return 4
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Returns the data type of the integrals. """
+        return np.dtype(float)
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """ Returns the number of bytes used to store the integrals. """
+        raise NotImplementedError
+
+    @abstractmethod
+    # pylint: disable=invalid-name
+    def gather(self, i: np.ndarray, j: np.ndarray, k: np.ndarray, l: np.ndarray) -> np.ndarray:
+        """
+        Compute the integrals :math:`(ij|kl)` at the given indices.
+
+        Args:
+            i: first indices
+            j: second indices
+            k: third indices
+            l: fourth indices
+
+        Returns:
+            The integrals, with the broadcast shape of the index arrays.
+        """
+        raise NotImplementedError
+
+    def slab(self, index: int, axis: int = 0) -> np.ndarray:
+        """
+        Compute the integrals with one index fixed.
+
+        Args:
+            index: the value of the fixed index
+            axis: the position of the fixed index
+
+        Returns:
+            The N^3 tensor of the integrals with the other indices, in order.
+        """
+        grid = list(np.ix_(*[np.arange(self._num_orbitals)] * 3))
+        grid.insert(axis, np.asarray(index))
+        return self.gather(*grid)  # pylint: disable=no-value-for-parameter
+
+    def to_dense(self) -> np.ndarray:
+        """ Returns the integrals as a dense N^4 tensor. """
+        dense = np.empty(self.shape, dtype=self.dtype)
+        for index in range(self._num_orbitals):
+            dense[index] = self.slab(index)
+        return dense
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype)
+
+    def __getitem__(self, key) -> np.ndarray:
+        if not isinstance(key, tuple) or len(key) != 4:
+            raise QiskitChemistryError('The integrals are indexed by four integers or '
+                                       'integer arrays.')
+        return self.gather(*key)
+
+    @abstractmethod
+    def select(self, orbitals: np.ndarray) -> 'TwoBodyIntegrals':
+        """
+        Restrict the integrals to a subset of the orbitals.
+
+        Args:
+            orbitals: the indices of the orbitals to keep, in their new order
+
+        Returns:
+            The integrals of the selected orbitals.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, group) -> None:
+        """
+        Save the integrals in chunked datasets of an HDF5 group.
+
+        Args:
+            group (h5py.Group): the group to save the integrals in
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def load(group) -> 'TwoBodyIntegrals':
+        """
+        Load integrals saved with :meth:`save`.
+
+        Args:
+            group (h5py.Group): the group the integrals were saved in
+
+        Returns:
+            The integrals.
+
+        Raises:
+            QiskitChemistryError: unknown representation
+        """
+        kind = group.attrs['kind']
+        if isinstance(kind, bytes):
+            kind = kind.decode('utf-8')
+        if kind == 'packed':
+            return PackedTwoBodyIntegrals(group['data'][...], int(group.attrs['num_orbitals']),
+                                          symmetry=int(group.attrs['symmetry']))
+        if kind == 'cholesky':
+            right_vectors = group['right_vectors'][...] if 'right_vectors' in group else None
+            return CholeskyTwoBodyIntegrals(group['vectors'][...], right_vectors)
+        raise QiskitChemistryError('Unknown two-body integral representation {}'.format(kind))
+
+
+def _pair_index(i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """ The index of the orbital pair (i, j) in a packed lower triangle. """
+    i, j = np.maximum(i, j), np.minimum(i, j)
+    return i * (i + 1) // 2 + j
+
+
+class PackedTwoBodyIntegrals(TwoBodyIntegrals):
+    """
+    Two-electron integrals of real orbitals stored by their permutational symmetry.
+
+    With ``symmetry=8``, integrals such as the ones of a restricted calculation, which are
+    invariant under :math:`i \\leftrightarrow j`, :math:`k \\leftrightarrow l` and
+    :math:`(ij) \\leftrightarrow (kl)`, are stored as the lower triangle of the matrix of
+    orbital pairs, about :math:`N^4/8` values. With ``symmetry=4`` the pairs :math:`(ij)` and
+    :math:`(kl)` are not exchangeable, as for the beta-alpha integrals of an unrestricted
+    calculation, and the full matrix of orbital pairs is stored. The packing is the one of
+    PySCF's ``ao2mo.restore``.
+    """
+
+    def __init__(self, data: np.ndarray, num_orbitals: int, symmetry: int = 8) -> None:
+        """
+        Args:
+            data: the packed integrals
+            num_orbitals: the number of orbitals
+            symmetry: 8 or 4, the permutational symmetry of the integrals
+
+        Raises:
+            QiskitChemistryError: invalid symmetry or data size
+        """
+        super().__init__(num_orbitals)
+        if symmetry not in (4, 8):
+            raise QiskitChemistryError('The symmetry must be 4 or 8, not {}.'.format(symmetry))
+        num_pairs = num_orbitals * (num_orbitals + 1) // 2
+        size = num_pairs * (num_pairs + 1) // 2 if symmetry == 8 else num_pairs ** 2
+        data = np.asarray(data, dtype=float).ravel()
+        if data.size != size:
+            raise QiskitChemistryError('{} packed integrals expected for {} orbitals with {}-fold '
+                                       'symmetry, not {}.'.format(size, num_orbitals, symmetry,
+                                                                  data.size))
+        self._data = data
+        self._symmetry = symmetry
+        self._num_pairs = num_pairs
+
+    @classmethod
+    def from_dense(cls, ints: np.ndarray, symmetry: int = 8) -> 'PackedTwoBodyIntegrals':
+        """
+        Pack dense integrals, which must have the given symmetry.
+
+        Args:
+            ints: the N^4 integrals
+            symmetry: 8 or 4, the permutational symmetry of the integrals
+
+        Returns:
+            The packed integrals.
+        """
+        num_orbitals = ints.shape[0]
+        rows, cols = np.tril_indices(num_orbitals)
+        if symmetry == 8:
+            pair_1, pair_2 = np.tril_indices(len(rows))
+        else:
+            pair_1, pair_2 = np.divmod(np.arange(len(rows) ** 2), len(rows))
+        data = np.asarray(ints)[rows[pair_1], cols[pair_1], rows[pair_2], cols[pair_2]]
+        return cls(data, num_orbitals, symmetry=symmetry)
+
+    @property
+    def data(self) -> np.ndarray:
+        """ Returns the packed integrals. """
+        return self._data
+
+    @property
+    def symmetry(self) -> int:
+        """ Returns the permutational symmetry of the integrals, 8 or 4. """
+        return self._symmetry
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def _packed_index(self, i, j, k, l):  # pylint: disable=invalid-name
+        pair_1 = _pair_index(np.asarray(i), np.asarray(j))
+        pair_2 = _pair_index(np.asarray(k), np.asarray(l))
+        if self._symmetry == 8:
+            return _pair_index(pair_1, pair_2)
+        return pair_1 * self._num_pairs + pair_2
+
+    def gather(self, i, j, k, l):  # pylint: disable=invalid-name
+        return self._data[self._packed_index(i, j, k, l)]
+
+    def to_dense(self) -> np.ndarray:
+        index = np.arange(self._num_orbitals)
+        pairs = _pair_index(index[:, None], index[None, :])
+        if self._symmetry == 8:
+            pair_matrix = self._data[_pair_index(np.arange(self._num_pairs)[:, None],
+                                                 np.arange(self._num_pairs)[None, :])]
+        else:
+            pair_matrix = self._data.reshape(self._num_pairs, self._num_pairs)
+        return pair_matrix[pairs[:, :, None, None], pairs[None, None, :, :]]
+
+    def select(self, orbitals):
+        orbitals = np.asarray(orbitals, dtype=int)
+        rows, cols = np.tril_indices(len(orbitals))
+        rows, cols = orbitals[rows], orbitals[cols]
+        if self._symmetry == 8:
+            pair_1, pair_2 = np.tril_indices(len(rows))
+        else:
+            pair_1, pair_2 = np.divmod(np.arange(len(rows) ** 2), len(rows))
+        data = self.gather(rows[pair_1], cols[pair_1], rows[pair_2], cols[pair_2])
+        return PackedTwoBodyIntegrals(data, len(orbitals), symmetry=self._symmetry)
+
+    def save(self, group):
+        group.attrs['kind'] = 'packed'
+        group.attrs['num_orbitals'] = self._num_orbitals
+        group.attrs['symmetry'] = self._symmetry
+        group.create_dataset('data', data=self._data, chunks=True)
+
+
+class CholeskyTwoBodyIntegrals(TwoBodyIntegrals):
+    """
+    Two-electron integrals factorized as :math:`(ij|kl) = \\sum_v L_{vij} R_{vkl}`.
+
+    Usually :math:`R = L`, for example from the pivoted Cholesky decomposition of the integrals
+    computed by :meth:`from_dense`, or from a density fitting. Factors of integrals in the
+    atomic orbital basis are changed to the molecular orbital basis with :meth:`transform`, at a
+    cost of :math:`O(N_v N^3)` and without building any N^4 tensor; different basis changes
+    of :math:`L` and :math:`R` give the beta-alpha integrals of an unrestricted calculation.
+    """
+
+    def __init__(self, vectors: np.ndarray, right_vectors: Optional[np.ndarray] = None) -> None:
+        """
+        Args:
+            vectors: the factors :math:`L`, of shape (num_vectors, N, N)
+            right_vectors: the factors :math:`R`, if different from :math:`L`
+
+        Raises:
+            QiskitChemistryError: invalid shapes of the factors
+        """
+        vectors = np.asarray(vectors, dtype=float)
+        if vectors.ndim != 3 or vectors.shape[1] != vectors.shape[2]:
+            raise QiskitChemistryError('The factors must have the shape (num_vectors, N, N), '
+                                       'not {}.'.format(vectors.shape))
+        if right_vectors is not None:
+            right_vectors = np.asarray(right_vectors, dtype=float)
+            if right_vectors.shape != vectors.shape:
+                raise QiskitChemistryError('The shapes of the factors differ: {} and {}.'.format(
+                    vectors.shape, right_vectors.shape))
+        super().__init__(vectors.shape[1])
+        self._vectors = vectors
+        self._right_vectors = right_vectors
+
+    @classmethod
+    def from_dense(cls, ints: np.ndarray, threshold: float = 1e-10,
+                   max_vectors: Optional[int] = None) -> 'CholeskyTwoBodyIntegrals':
+        """
+        Factorize dense integrals, which must have the symmetries of real two-electron
+        integrals, by a pivoted incomplete Cholesky decomposition.
+
+        Args:
+            ints: the N^4 integrals
+            threshold: the largest error of the diagonal integrals :math:`(ij|ij)`
+            max_vectors: the maximum number of factors, by default N^2
+
+        Returns:
+            The factorized integrals.
+        """
+        num_orbitals = ints.shape[0]
+        size = num_orbitals ** 2
+        matrix = np.asarray(ints).reshape(size, size)
+        max_vectors = size if max_vectors is None else min(max_vectors, size)
+        diagonal = np.diagonal(matrix).copy()
+        vectors = np.zeros((max_vectors, size))
+        num_vectors = 0
+        while num_vectors < max_vectors:
+            pivot = np.argmax(diagonal)
+            if diagonal[pivot] <= threshold:
+                break
+            vector = matrix[:, pivot] - vectors[:num_vectors, pivot] @ vectors[:num_vectors]
+            vectors[num_vectors] = vector / np.sqrt(diagonal[pivot])
+            diagonal -= vectors[num_vectors] ** 2
+            num_vectors += 1
+        logger.debug('Cholesky decomposition of %s orbitals with %s vectors',
+                     num_orbitals, num_vectors)
+        return cls(vectors[:num_vectors].reshape(num_vectors, num_orbitals, num_orbitals))
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """ Returns the factors :math:`L`. """
+        return self._vectors
+
+    @property
+    def right_vectors(self) -> np.ndarray:
+        """ Returns the factors :math:`R`. """
+        return self._vectors if self._right_vectors is None else self._right_vectors
+
+    @property
+    def num_vectors(self) -> int:
+        """ Returns the number of factors. """
+        return self._vectors.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self._vectors.nbytes + \
+            (self._right_vectors.nbytes if self._right_vectors is not None else 0)
+
+    def gather(self, i, j, k, l):  # pylint: disable=invalid-name
+        return np.sum(self._vectors[:, i, j] * self.right_vectors[:, k, l], axis=0)
+
+    def slab(self, index, axis=0):
+        if axis == 0:
+            return np.tensordot(self._vectors[:, index], self.right_vectors, axes=([0], [0]))
+        if axis == 1:
+            return np.tensordot(self._vectors[:, :, index], self.right_vectors, axes=([0], [0]))
+        if axis == 2:
+            return np.tensordot(self._vectors, self.right_vectors[:, index], axes=([0], [0]))
+        return np.tensordot(self._vectors, self.right_vectors[:, :, index], axes=([0], [0]))
+
+    def to_dense(self):
+        return np.tensordot(self._vectors, self.right_vectors, axes=([0], [0]))
+
+    def transform(self, coeffs: np.ndarray,
+                  right_coeffs: Optional[np.ndarray] = None) -> 'CholeskyTwoBodyIntegrals':
+        """
+        Change the basis of the orbitals, e.g. from atomic to molecular orbitals.
+
+        Args:
+            coeffs: the coefficients of the new orbitals, one per column, for :math:`L`
+            right_coeffs: the coefficients for :math:`R`, if different
+
+        Returns:
+            The integrals :math:`\\sum_{pqrs} C_{pi} C_{qj} C'_{rk} C'_{sl} (pq|rs)`.
+        """
+        vectors = np.einsum('vpq,pi,qj->vij', self._vectors, coeffs, coeffs, optimize=True)
+        if right_coeffs is None and self._right_vectors is None:
+            return CholeskyTwoBodyIntegrals(vectors)
+        right_coeffs = coeffs if right_coeffs is None else right_coeffs
+        right_vectors = np.einsum('vpq,pi,qj->vij', self.right_vectors, right_coeffs,
+                                  right_coeffs, optimize=True)
+        return CholeskyTwoBodyIntegrals(vectors, right_vectors)
+
+    def select(self, orbitals):
+        orbitals = np.asarray(orbitals, dtype=int)
+        vectors = self._vectors[:, orbitals][:, :, orbitals]
+        right_vectors = None
+        if self._right_vectors is not None:
+            right_vectors = self._right_vectors[:, orbitals][:, :, orbitals]
+        return CholeskyTwoBodyIntegrals(vectors, right_vectors)
+
+    def save(self, group):
+        group.attrs['kind'] = 'cholesky'
+        group.create_dataset('vectors', data=self._vectors, chunks=True)
+        if self._right_vectors is not None:
+            group.create_dataset('right_vectors', data=self._right_vectors, chunks=True)
+
+
+class SpinTwoBodyIntegrals:
+    """
+    The two-body integrals in spin orbitals, as built by
+    :meth:`~qiskit.chemistry.QMolecule.twoe_to_spin`, computed on demand from integrals in
+    molecular orbitals.
+
+    This is the ``h2`` tensor of a :class:`~qiskit.chemistry.FermionicOperator` without the
+    :math:`(2N)^4` memory: the values of the tensor are only formed for slices of a fixed
+    first index, and removing spin orbitals only records the ones which are left.
+    """
+
+    def __init__(self,
+                 ints: TwoBodyIntegrals,
+                 ints_bb: Optional[TwoBodyIntegrals] = None,
+                 ints_ba: Optional[TwoBodyIntegrals] = None,
+                 threshold: float = 1E-12,
+                 modes: Optional[np.ndarray] = None) -> None:
+        """
+        Args:
+            ints: the alpha-alpha integrals in molecular orbitals
+            ints_bb: the beta-beta integrals, for unrestricted orbitals
+            ints_ba: the beta-alpha integrals, for unrestricted orbitals
+            threshold: the integrals not above the threshold are set to zero
+            modes: the spin orbitals which are kept, all by default
+        """
+        if ints_bb is None or ints_ba is None:
+            ints_bb = ints_ba = None
+        self._ints = ints
+        self._ints_bb = ints_bb
+        self._ints_ba = ints_ba
+        self._threshold = threshold
+        num_modes = 2 * ints.num_orbitals
+        self._modes = np.arange(num_modes) if modes is None else np.asarray(modes, dtype=int)
+
+    @property
+    def modes(self) -> np.ndarray:
+        """ Returns the indices of the spin orbitals which are kept. """
+        return self._modes
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        """ Returns the shape of the dense integrals. """
+        return (len(self._modes),) * 4
+
+    @property
+    def ndim(self) -> int:
+        """ Returns the number of indices, 4. """
+        return 4
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Returns the data type of the integrals. """
+        return np.dtype(float)
+
+    def _blocks(self):
+        """ The integrals of each pair of spins of the first and second indices, with the
+        spin orbital index giving each molecular orbital index of the block. """
+        if self._ints_bb is None:
+            return [(0, 0, self._ints, (2, 1, 3, 0)), (0, 1, self._ints, (2, 1, 3, 0)),
+                    (1, 0, self._ints, (2, 1, 3, 0)), (1, 1, self._ints, (2, 1, 3, 0))]
+        return [(0, 0, self._ints, (2, 1, 3, 0)), (0, 1, self._ints_ba, (2, 1, 3, 0)),
+                (1, 0, self._ints_ba, (0, 3, 1, 2)), (1, 1, self._ints_bb, (2, 1, 3, 0))]
+
+    # pylint: disable=invalid-name
+    def gather(self, p: np.ndarray, q: np.ndarray, r: np.ndarray, s: np.ndarray) -> np.ndarray:
+        """
+        Compute the integrals at the given spin orbital indices.
+
+        Args:
+            p: first indices
+            q: second indices
+            r: third indices
+            s: fourth indices
+
+        Returns:
+            The integrals, with the broadcast shape of the index arrays.
+        """
+        num_orbitals = self._ints.num_orbitals
+        indices = np.broadcast_arrays(*[self._modes[np.asarray(index)] for index in (p, q, r, s)])
+        spins = [index // num_orbitals for index in indices]
+        orbitals = [index % num_orbitals for index in indices]
+        values = np.zeros(indices[0].shape)
+        allowed = (spins[0] == spins[3]) & (spins[1] == spins[2])
+        for spin_p, spin_q, ints, order in self._blocks():
+            mask = allowed & (spins[0] == spin_p) & (spins[1] == spin_q)
+            if np.any(mask):
+                values[mask] = ints.gather(*[orbitals[axis][mask] for axis in order])
+        return -0.5 * np.where(np.abs(values) > self._threshold, values, 0)
+
+    def slab(self, index: int) -> np.ndarray:
+        """
+        Compute the integrals with the first index fixed.
+
+        Args:
+            index: the value of the first index
+
+        Returns:
+            The tensor of the integrals with the other three indices.
+        """
+        num_orbitals = self._ints.num_orbitals
+        spin_p, orbital_p = divmod(int(self._modes[index]), num_orbitals)
+        full = np.zeros((2 * num_orbitals,) * 3)
+        p_block = slice(spin_p * num_orbitals, (spin_p + 1) * num_orbitals)
+        for spin, spin_q, ints, order in self._blocks():
+            if spin != spin_p:
+                continue
+            # the position of the fixed orbital in the block and the order of the others
+            axis = order.index(0)
+            values = ints.slab(orbital_p, axis=axis)
+            others = [order.index(position) for position in (1, 2, 3)]
+            others = [position - (position > axis) for position in others]
+            values = values.transpose(others)
+            q_block = slice(spin_q * num_orbitals, (spin_q + 1) * num_orbitals)
+            full[q_block, q_block, p_block] = -0.5 * np.where(np.abs(values) > self._threshold,
+                                                              values, 0)
+        return full[np.ix_(self._modes, self._modes, self._modes)]
+
+    def to_dense(self) -> np.ndarray:
+        """ Returns the integrals as a dense tensor. """
+        dense = np.empty(self.shape)
+        for index in range(len(self._modes)):
+            dense[index] = self.slab(index)
+        return dense
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype)
+
+    def select(self, modes: np.ndarray) -> 'SpinTwoBodyIntegrals':
+        """
+        Restrict the integrals to a subset of the spin orbitals.
+
+        Args:
+            modes: the indices of the spin orbitals to keep
+
+        Returns:
+            The integrals of the selected spin orbitals.
+        """
+        return SpinTwoBodyIntegrals(self._ints, self._ints_bb, self._ints_ba,
+                                    threshold=self._threshold,
+                                    modes=self._modes[np.asarray(modes, dtype=int)])
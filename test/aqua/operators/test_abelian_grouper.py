@@ -17,10 +17,14 @@ import unittest
 from itertools import combinations
 from test.aqua import QiskitAquaTestCase
 
+import numpy as np
 from ddt import ddt, data
 
+from qiskit.quantum_info import Pauli
 from qiskit.aqua import AquaError
-from qiskit.aqua.operators import (X, Y, Z, I, Zero, Plus, AbelianGrouper)
+from qiskit.aqua.operators import (X, Y, Z, I, Zero, Plus, AbelianGrouper, PauliOp,
+                                   PauliExpectation, StateFn, SummedOp)
+from qiskit.aqua.operators.converters import abelian_grouper
 
 
 @ddt
@@ -75,6 +79,46 @@ class TestAbelianGrouper(QiskitAquaTestCase):
             self.assertListEqual([str(op[0].primitive) for op in grouped_sum], ['X', 'Y', 'Z'])
             self.assertListEqual([op[0].coeff for op in grouped_sum], [1, 2, 3])
 
+    @data('greedy_color', 'largest_first', 'sorted_insertion')
+    def test_abelian_grouper_strategies(self, strategy):
+        """Abelian grouper strategies test"""
+        paulis = (I ^ I ^ X ^ X * 0.2) + \
+                 (Z ^ Z ^ X ^ X * 0.3) + \
+                 (Z ^ Z ^ Z ^ Z * 0.4) + \
+                 (X ^ X ^ Z ^ Z * 0.5) + \
+                 (X ^ X ^ X ^ X * 0.6) + \
+                 (I ^ X ^ X ^ X * 0.7)
+        grouped_sum = AbelianGrouper(strategy=strategy).convert(paulis)
+        self.assertEqual(len(grouped_sum.oplist), 4)
+        self.assertEqual(sum(len(group) for group in grouped_sum), 6)
+        for group in grouped_sum:
+            for op_1, op_2 in combinations(group, 2):
+                self.assertTrue(op_1.commutes(op_2))
+
+        state = (X ^ I ^ I ^ I) @ (Zero ^ 4)
+        expectation = PauliExpectation(grouping_strategy=strategy).convert(~StateFn(paulis) @ state)
+        self.assertAlmostEqual(expectation.eval(), -0.4)
+
+        with self.assertRaises(ValueError):
+            AbelianGrouper(strategy='unknown')
+
+    def test_commutation_graph_blocks(self):
+        """commutation graph computed in several blocks test"""
+        random.seed(1234)
+        paulis = SummedOp([PauliOp(Pauli.from_label(''.join(random.choices('IIXYZ', k=70))))
+                           for _ in range(40)])
+        mat = np.array([op.primitive.z + 2 * op.primitive.x for op in paulis], dtype=np.int8)
+        commutable = (((mat * mat[:, None]) * (mat - mat[:, None])) == 0).all(axis=2)
+        expected = list(zip(*np.where(np.triu(np.logical_not(commutable), k=1))))
+
+        block_size = abelian_grouper._BLOCK_SIZE
+        try:
+            abelian_grouper._BLOCK_SIZE = 50
+            edges = AbelianGrouper._commutation_graph(paulis)
+        finally:
+            abelian_grouper._BLOCK_SIZE = block_size
+        self.assertListEqual(sorted(edges), sorted(expected))
+
     def test_abelian_grouper_random(self):
         """Abelian grouper test with random paulis"""
         random.seed(1234)
@@ -0,0 +1,85 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test CircuitSampler """
+
+import unittest
+from unittest import mock
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from ddt import ddt, data
+from qiskit import BasicAer
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.operators import CircuitSampler, StateFn, PauliExpectation, X, Z, I
+
+
+@ddt
+class TestCircuitSampler(QiskitAquaTestCase):
+    """ Test CircuitSampler """
+
+    def setUp(self):
+        super().setUp()
+        self.ansatz = RealAmplitudes(2, reps=1)
+        values = np.random.default_rng(3).uniform(size=(3, self.ansatz.num_parameters))
+        self.params = dict(zip(self.ansatz.ordered_parameters, values.T.tolist()))
+
+    def _expectation(self, coeff=1., ansatz=None):
+        observable = (Z ^ I) + coeff * (X ^ X)
+        return PauliExpectation().convert(~StateFn(observable) @ StateFn(ansatz or self.ansatz))
+
+    @data('statevector_simulator', 'qasm_simulator')
+    def test_rebuilt_operator(self, backend):
+        """ rebuilt equal operator and shared transpiled circuits test """
+        quantum_instance = QuantumInstance(BasicAer.get_backend(backend), shots=1000,
+                                           seed_simulator=5, seed_transpiler=5)
+        sampler = CircuitSampler(quantum_instance)
+        with mock.patch.object(quantum_instance, 'transpile',
+                               wraps=quantum_instance.transpile) as transpile:
+            result = sampler.convert(self._expectation(), self.params).eval()
+            self.assertEqual(transpile.call_count, 1)
+            # an equal operator built again is neither reduced nor transpiled again
+            result_rebuilt = sampler.convert(self._expectation(), self.params).eval()
+            self.assertEqual(transpile.call_count, 1)
+            # another operator with the same circuits reuses the transpiled circuits
+            result_other = sampler.convert(self._expectation(coeff=2.), self.params).eval()
+            self.assertEqual(transpile.call_count, 1)
+
+        np.testing.assert_array_almost_equal(result_rebuilt, result)
+        reference = CircuitSampler(quantum_instance).convert(self._expectation(coeff=2.),
+                                                             self.params).eval()
+        np.testing.assert_array_almost_equal(result_other, reference, decimal=1)
+
+    def test_parameters_and_eviction(self):
+        """ operators with other parameters and cache eviction test """
+        backend = BasicAer.get_backend('statevector_simulator')
+        sampler = CircuitSampler(backend, cache_size=1)
+        result = sampler.convert(self._expectation(), self.params).eval()
+
+        # an equal ansatz with other Parameter instances is not mixed up with the first one
+        ansatz = RealAmplitudes(2, reps=1)
+        params = {param: self.params[old_param] for param, old_param
+                  in zip(ansatz.ordered_parameters, self.ansatz.ordered_parameters)}
+        result_other = sampler.convert(self._expectation(ansatz=ansatz), params).eval()
+        np.testing.assert_array_almost_equal(result_other, result)
+        self.assertEqual(len(sampler._operator_cache), 1)
+
+        result_again = sampler.convert(self._expectation(), self.params).eval()
+        np.testing.assert_array_almost_equal(result_again, result)
+
+        with self.assertRaises(ValueError):
+            CircuitSampler(backend, cache_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
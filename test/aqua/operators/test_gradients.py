@@ -28,7 +28,7 @@ except ImportError:
     _HAS_JAX = False
 
 from qiskit import QuantumCircuit, QuantumRegister, BasicAer
-from qiskit.aqua import QuantumInstance
+from qiskit.aqua import QuantumInstance, AquaError
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.algorithms import VQE
 from qiskit.aqua.components.optimizers import CG
@@ -895,6 +895,94 @@ class TestGradients(QiskitAquaTestCase):
             result = prob_grad(value)
             np.testing.assert_array_almost_equal(result, correct_values[i], decimal=1)
 
+    @data('param_shift', 'fin_diff')
+    def test_gradient_wrapper_bound_shifts(self, method):
+        """Test the gradient wrapper binding the shifted parameters to a single circuit
+
+        <H> = 0.5 sin(a) sin(b) cos(ab) - cos(a)
+        d<H>/da = 0.5 cos(a) sin(b) cos(ab) - 0.5 b sin(a) sin(b) sin(ab) + sin(a)
+        d<H>/db = 0.5 sin(a) cos(b) cos(ab) - 0.5 a sin(a) sin(b) sin(ab)
+        """
+        ham = 0.5 * (X ^ Y) - (I ^ Z)
+        a = Parameter('a')
+        b = Parameter('b')
+
+        qc = QuantumCircuit(2)
+        qc.rx(a, 0)
+        qc.ry(b, 1)
+        qc.rz(a * b, 1)
+        op = ~StateFn(ham) @ CircuitStateFn(primitive=qc, coeff=1.)
+
+        q_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        num_transpiled = []
+        transpile = q_instance.transpile
+
+        def count_transpiled(circuits):
+            num_transpiled.append(len(circuits) if isinstance(circuits, list) else 1)
+            return transpile(circuits)
+
+        q_instance.transpile = count_transpiled
+        state_grad = Gradient(grad_method=method).gradient_wrapper(operator=op,
+                                                                   bind_params=[a, b],
+                                                                   backend=q_instance)
+        for value_a, value_b in [(np.pi / 4, np.pi / 3), (0.3, -1.2)]:
+            sin_a, cos_a = np.sin(value_a), np.cos(value_a)
+            sin_b, cos_b = np.sin(value_b), np.cos(value_b)
+            sin_ab, cos_ab = np.sin(value_a * value_b), np.cos(value_a * value_b)
+            correct_value = [0.5 * cos_a * sin_b * cos_ab - 0.5 * value_b * sin_a * sin_b * sin_ab
+                             + sin_a,
+                             0.5 * sin_a * cos_b * cos_ab - 0.5 * value_a * sin_a * sin_b * sin_ab]
+            np.testing.assert_array_almost_equal(state_grad([value_a, value_b]), correct_value,
+                                                 decimal=5)
+        # one circuit per Pauli measurement basis, transpiled once for all the shifts
+        self.assertEqual(sum(num_transpiled), 2)
+
+    def test_adjoint_gradient(self):
+        """Test the adjoint gradient against the parameter shift gradient"""
+        a = Parameter('a')
+        b = Parameter('b')
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.p(a, 0)
+        qc.u(a, b, 2 * a, 1)
+        qc.crx(b, 0, 2)
+        qc.rzz(a * b, 1, 2)
+        qc.ry(0.3, 1)
+        ham = (Z ^ X ^ I) + 0.5 * (I ^ Z ^ Y) - 0.7 * (X ^ I ^ X)
+        op = 1.5 * ~StateFn(ham) @ CircuitStateFn(primitive=qc, coeff=0.8)
+
+        value_dict = {a: 0.3, b: -0.9}
+        correct_values = Gradient('param_shift').convert(op, [a, b]) \
+            .assign_parameters(value_dict).eval()
+        adjoint_grad = Gradient('adjoint').convert(op, [a, b])
+        np.testing.assert_array_almost_equal(adjoint_grad.assign_parameters(value_dict).eval(),
+                                             np.real(correct_values))
+        self.assertAlmostEqual(
+            Gradient('adjoint').convert(op, b).assign_parameters(value_dict).eval(),
+            np.real(correct_values[1]))
+        # several parameterizations are evaluated separately
+        grads = adjoint_grad.assign_parameters({a: [0.3, 0.3], b: [-0.9, -0.9]}).eval()
+        np.testing.assert_array_almost_equal(grads, np.real([correct_values] * 2))
+
+        with self.assertRaises(AquaError):
+            adjoint_grad.assign_parameters({a: 0.3}).eval()
+
+        with self.assertRaises(AquaError):
+            Gradient('adjoint').convert(CircuitStateFn(qc), [a, b])
+
+    def test_vqe_adjoint(self):
+        """Test VQE with the adjoint gradient"""
+        h2_hamiltonian = -1.05 * (I ^ I) + 0.39 * (I ^ Z) - 0.39 * (Z ^ I) \
+            - 0.01 * (Z ^ Z) + 0.18 * (X ^ X)
+        h2_energy = -1.84049984  # the lowest eigenvalue
+        wavefunction = RealAmplitudes(2, reps=1)
+        q_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        vqe = VQE(h2_hamiltonian, wavefunction, optimizer=CG(maxiter=20),
+                  gradient=Gradient(grad_method='adjoint'),
+                  initial_point=np.array([0.1, 0.2, 0.3, 0.4]))
+        result = vqe.run(q_instance)
+        np.testing.assert_almost_equal(result['optimal_value'], h2_energy, decimal=6)
+
     def test_vqe(self):
         """Test VQE with gradients"""
         method = 'lin_comb'
@@ -13,6 +13,7 @@
 """ Test PauliSumOp """
 
 import unittest
+from unittest.mock import patch
 from test.aqua import QiskitAquaTestCase
 
 import numpy as np
@@ -165,10 +166,36 @@ class TestPauliSumOp(QiskitAquaTestCase):
         """ eval test """
         target0 = (2 * (X ^ Y ^ Z) + 3 * (X ^ X ^ Z)).eval("000")
         target1 = (2 * (X ^ Y ^ Z) + 3 * (X ^ X ^ Z)).eval(Zero ^ 3)
-        expected = DictStateFn({"011": (2 + 3j)})
+        expected = DictStateFn({"110": (3 + 2j)})
         self.assertEqual(target0, expected)
         self.assertEqual(target1, expected)
 
+    def test_eval_dict_state_fn(self):
+        """ eval and expectation on DictStateFn test """
+        rng = np.random.default_rng(11)
+        num_qubits = 5
+        labels = ["".join(rng.choice(list("IXYZ"), num_qubits)) for _ in range(30)]
+        labels += ["IIIII", "ZIZIZ"]
+        coeffs = rng.normal(size=len(labels)) + 0.5j * rng.normal(size=len(labels))
+        pauli_sum = PauliSumOp(SparsePauliOp.from_list(list(zip(labels, coeffs))), coeff=0.5)
+        indices = rng.choice(2 ** num_qubits, size=10, replace=False)
+        state = DictStateFn.from_sparse_arrays(
+            indices, rng.normal(size=10) + 1j * rng.normal(size=10), num_qubits, coeff=2.0
+        )
+        vec = state.to_matrix()
+        matrix = pauli_sum.to_matrix()
+
+        np.testing.assert_array_almost_equal(pauli_sum.eval(state).to_matrix(), matrix @ vec)
+        with patch.object(DictStateFn, "_sparse_arrays", return_value=None):
+            dict_result = pauli_sum.eval(DictStateFn(state.primitive, coeff=2.0))
+            dict_result = DictStateFn(dict_result.primitive, coeff=dict_result.coeff)
+        np.testing.assert_array_almost_equal(dict_result.to_matrix(), matrix @ vec)
+
+        measurement = ~OperatorStateFn(pauli_sum)
+        expectation = measurement.eval(state)
+        self.assertAlmostEqual(expectation, np.conj(vec) @ measurement.primitive.to_matrix() @ vec)
+        self.assertAlmostEqual(expectation, (~state).eval(measurement.primitive.eval(state)))
+
     def test_exp_i(self):
         """ exp_i test """
         # TODO: add tests when special methods are added
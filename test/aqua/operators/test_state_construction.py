@@ -20,8 +20,10 @@ from qiskit import QuantumCircuit, BasicAer, execute
 from qiskit.circuit import ParameterVector
 from qiskit.quantum_info import Statevector
 
+from qiskit.aqua import AquaError
 from qiskit.aqua.operators import (StateFn, Zero, One, Plus, Minus, PrimitiveOp,
-                                   SummedOp, H, I, Z, X, Y, CX, CircuitStateFn, DictToCircuitSum)
+                                   SummedOp, H, I, Z, X, Y, CX, CircuitStateFn, DictToCircuitSum,
+                                   DictStateFn, VectorStateFn)
 
 
 # pylint: disable=invalid-name
@@ -207,6 +209,56 @@ class TestStateConstruction(QiskitAquaTestCase):
         self.assertEqual(bound.coeff, 0.3)
         self.assertEqual(bound.primitive.coeff, 0.2)
 
+    def test_dict_sparse_arrays(self):
+        """ Test the sparse array representation of DictStateFn """
+        sfn = DictStateFn.from_sparse_arrays([5, 0, 3, 5], [1, 2j, 3, 4], num_qubits=3)
+        self.assertDictEqual(sfn.primitive, {'000': 2j, '011': 3, '101': 5})
+        self.assertEqual(sfn.num_qubits, 3)
+        indices, values = DictStateFn({'101': 5, '000': 2j, '011': 3}).to_sparse_arrays()
+        np.testing.assert_array_equal(indices, [0, 3, 5])
+        np.testing.assert_array_equal(values, [2j, 3, 5])
+
+        # bitstrings which are not pure binary keep the dict representation
+        sfn = DictStateFn.from_bitstrings(['01 1', '11 0'], [0.5, 0.5])
+        self.assertDictEqual(sfn.primitive, {'01 1': 0.5, '11 0': 0.5})
+        with self.assertRaises(AquaError):
+            sfn.to_sparse_arrays()
+        with self.assertRaises(ValueError):
+            DictStateFn.from_sparse_arrays([8], [1], num_qubits=3)
+
+    def test_dict_sparse_arrays_ops(self):
+        """ Test the vectorized DictStateFn operations against the dense vectors """
+        rng = np.random.default_rng(7)
+        num_qubits = 5
+        indices = rng.choice(2 ** num_qubits, size=12, replace=False)
+        values = rng.normal(size=12) + 1j * rng.normal(size=12)
+        sfn = DictStateFn.from_sparse_arrays(indices, values, num_qubits, coeff=0.5)
+        other = DictStateFn({format(i, '05b'): 1. for i in range(0, 32, 3)})
+        vec = sfn.to_matrix()
+        other_vec = other.to_matrix()
+
+        np.testing.assert_array_almost_equal((sfn + other).to_matrix(), vec + other_vec)
+        self.assertAlmostEqual(sfn.adjoint().eval(other), np.dot(np.conj(vec), other_vec))
+        self.assertAlmostEqual(VectorStateFn(vec).adjoint().eval(other),
+                               np.dot(np.conj(vec), other_vec))
+        self.assertAlmostEqual(other.adjoint().eval(VectorStateFn(vec)), np.sum(vec[::3]))
+        np.testing.assert_array_almost_equal((sfn ^ other).to_matrix(), np.kron(vec, other_vec))
+        np.testing.assert_array_almost_equal(sfn.to_spmatrix().toarray()[0], vec)
+
+        perm = [2, 0, 4, 1, 3]
+        permuted = sfn.permute(perm)
+        expected = DictStateFn({''.join(key[perm.index(i)] for i in range(num_qubits)): value
+                                for key, value in sfn.primitive.items()}, coeff=0.5)
+        np.testing.assert_array_almost_equal(permuted.to_matrix(), expected.to_matrix())
+
+        for op in [X ^ Y ^ Z ^ I ^ Y, Z ^ Z ^ I ^ X ^ Y, I ^ 5]:
+            np.testing.assert_array_almost_equal(op.eval(sfn).to_matrix(),
+                                                 op.to_matrix() @ vec)
+
+        samples = sfn.sample(shots=100)
+        self.assertAlmostEqual(sum(samples.values()), 1)
+        self.assertTrue(set(samples).issubset(sfn.primitive))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,7 +18,7 @@ import numpy as np
 from ddt import ddt, idata, data, unpack
 from qiskit import QuantumRegister, QuantumCircuit, BasicAer
 from qiskit.circuit.library import QFT, GroverOperator
-from qiskit.aqua import QuantumInstance
+from qiskit.aqua import QuantumInstance, AquaError
 from qiskit.aqua.algorithms import (AmplitudeEstimation, MaximumLikelihoodAmplitudeEstimation,
                                     IterativeAmplitudeEstimation)
 
@@ -441,5 +441,61 @@ class TestSineIntegral(QiskitAquaTestCase):
         self.assertTrue(confint[0] <= result.estimation <= confint[1])
 
 
+@ddt
+class TestMaximumLikelihoodEstimation(QiskitAquaTestCase):
+    """Tests of the vectorized maximum likelihood estimation of MLAE."""
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(12)
+        self.schedule = [0, 1, 2, 4, 8]
+        factors = 2 * np.array(self.schedule) + 1
+        thetas = np.arcsin(np.sqrt(rng.uniform(0.01, 0.99, size=10)))
+        self.all_hits = np.full((10, len(self.schedule)), 100.)
+        self.one_hits = rng.binomial(100, np.sin(np.outer(thetas, factors)) ** 2).astype(float)
+
+    def _loglikelihood(self, theta, one_hits, all_hits):
+        loglik = 0
+        for i, k in enumerate(self.schedule):
+            loglik += np.log(np.sin((2 * k + 1) * theta) ** 2) * one_hits[i]
+            loglik += np.log(np.cos((2 * k + 1) * theta) ** 2) * (all_hits[i] - one_hits[i])
+        return loglik
+
+    @data(1000, 10000)
+    def test_mle(self, likelihood_evals):
+        """ batched MLE test """
+        thetas = MaximumLikelihoodAmplitudeEstimation.compute_mle(
+            self.one_hits, self.all_hits, self.schedule, likelihood_evals)
+        self.assertEqual(thetas.shape, (10,))
+        grid = np.linspace(1e-15, np.pi / 2 - 1e-15, 100000)
+        for theta, one_hits, all_hits in zip(thetas, self.one_hits, self.all_hits):
+            single = MaximumLikelihoodAmplitudeEstimation.compute_mle(
+                one_hits, all_hits, self.schedule, likelihood_evals)
+            self.assertAlmostEqual(single, theta)
+            # the refined maximum is above the maximum of a finer grid
+            self.assertGreaterEqual(self._loglikelihood(theta, one_hits, all_hits) + 1e-9,
+                                    np.max(self._loglikelihood(grid, one_hits, all_hits)))
+
+    def test_likelihood_ratio_confint(self):
+        """ batched likelihood ratio confidence interval test """
+        alpha, likelihood_evals = 0.05, 5000
+        thetas = MaximumLikelihoodAmplitudeEstimation.compute_mle(
+            self.one_hits, self.all_hits, self.schedule, likelihood_evals)
+        confints = MaximumLikelihoodAmplitudeEstimation.compute_likelihood_ratio_confint(
+            self.one_hits, self.all_hits, self.schedule, alpha, likelihood_evals)
+        self.assertEqual(confints.shape, (10, 2))
+        grid = np.linspace(1e-15, np.pi / 2 - 1e-15, likelihood_evals)
+        for theta, confint, one_hits, all_hits in zip(thetas, confints, self.one_hits,
+                                                      self.all_hits):
+            threshold = self._loglikelihood(theta, one_hits, all_hits) - 3.841458820694124 / 2
+            above = grid[self._loglikelihood(grid, one_hits, all_hits) >= threshold]
+            np.testing.assert_array_equal(confint, [np.min(above), np.max(above)])
+            self.assertTrue(confint[0] <= theta <= confint[1])
+
+        with self.assertRaises(AquaError):
+            MaximumLikelihoodAmplitudeEstimation.compute_mle(self.one_hits, self.all_hits,
+                                                             self.schedule[1:])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test asynchronous and pipelined execution """
+
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from qiskit import BasicAer, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.utils import run_circuits
+from qiskit.aqua.operators import CircuitSampler, StateFn, CircuitStateFn, Z
+
+
+class TestExecuteAsync(QiskitAquaTestCase):
+    """ Test asynchronous and pipelined execution """
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = []
+        for i in range(5):
+            circuit = QuantumCircuit(2, name='circuit{}'.format(i))
+            circuit.ry(0.3 * i, 0)
+            circuit.cx(0, 1)
+            circuit.measure_all()
+            self.circuits.append(circuit)
+        self.quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'),
+                                                seed_simulator=7, seed_transpiler=7)
+        self._max_circuits_per_job = run_circuits.MAX_CIRCUITS_PER_JOB
+
+    def tearDown(self):
+        super().tearDown()
+        run_circuits.MAX_CIRCUITS_PER_JOB = self._max_circuits_per_job
+
+    def test_execute_async(self):
+        """ the future returns the same result as execute """
+        expected = self.quantum_instance.execute(self.circuits)
+        future = self.quantum_instance.execute_async(self.circuits)
+        result = future.result()
+        for circuit in self.circuits:
+            self.assertDictEqual(result.get_counts(circuit), expected.get_counts(circuit))
+
+    def test_result_callback(self):
+        """ the partial results of split jobs are streamed """
+        run_circuits.MAX_CIRCUITS_PER_JOB = 2
+        partial_results = []
+        result = self.quantum_instance.execute(
+            self.circuits, result_callback=lambda i, res: partial_results.append((i, res)))
+        self.assertListEqual([i for i, _ in partial_results], [0, 2, 4])
+        self.assertEqual(len(result.results), 5)
+        for start, partial in partial_results:
+            for k in range(len(partial.results)):
+                self.assertDictEqual(partial.get_counts(k), result.get_counts(start + k))
+
+    def test_sampler_with_split_jobs(self):
+        """ circuit sampler post-processes split jobs as they finish """
+        theta = Parameter('θ')
+        circuit = QuantumCircuit(1)
+        circuit.ry(theta, 0)
+        expectation = ~StateFn(Z) @ CircuitStateFn(circuit)
+        values = [0.0, 0.5, 1.0, 1.5, 2.0]
+
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        expected = CircuitSampler(quantum_instance).convert(expectation,
+                                                            params={theta: values}).eval()
+        run_circuits.MAX_CIRCUITS_PER_JOB = 2
+        sampled = CircuitSampler(quantum_instance).convert(expectation,
+                                                           params={theta: values}).eval()
+        np.testing.assert_array_almost_equal(sampled, expected)
+        np.testing.assert_array_almost_equal(sampled, np.cos(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
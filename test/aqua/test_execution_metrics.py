@@ -0,0 +1,134 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Execution Metrics """
+
+import copy
+import pickle
+import unittest
+from unittest import mock
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.providers import JobStatus
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.operators import CircuitSampler, StateFn, PauliExpectation, Z, I
+from qiskit.aqua.utils import ExecutionMetrics, TranspilationCache
+from qiskit.aqua.utils.run_circuits import _wait_for_jobs
+
+
+class TestExecutionMetrics(QiskitAquaTestCase):
+    """ Test Execution Metrics """
+
+    def test_records_and_summary(self):
+        """ records, aggregates and callback test """
+        records = []
+        metrics = ExecutionMetrics(callback=records.append, max_records=2)
+        metrics.record('transpile', 0.5, circuits=2, cache_hits=1)
+        metrics.record('transpile', 1.5, circuits=3, cache_hits=0)
+        with metrics.measure('assemble', circuits=1) as counters:
+            counters['circuits'] = 4
+        with self.assertRaises(ValueError):
+            with metrics.measure('assemble'):
+                raise ValueError()
+
+        self.assertEqual([record['stage'] for record in metrics.records],
+                         ['transpile', 'assemble'])
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[2]['circuits'], 4)
+        summary = metrics.summary()
+        self.assertEqual(summary['transpile']['count'], 2)
+        self.assertAlmostEqual(summary['transpile']['total_time'], 2.)
+        self.assertAlmostEqual(summary['transpile']['max_time'], 1.5)
+        self.assertEqual(summary['transpile']['circuits'], 5)
+        self.assertEqual(summary['transpile']['cache_hits'], 1)
+        self.assertEqual(summary['assemble']['count'], 1)
+
+        # a failing callback does not fail the execution
+        metrics.callback = mock.Mock(side_effect=RuntimeError())
+        metrics.record('bind', 0.1)
+        metrics.reset()
+        self.assertEqual(metrics.summary(), {})
+        self.assertEqual(metrics.records, [])
+
+    def test_pickle(self):
+        """ pickled metrics, e.g. of a quantum instance sent to a process pool, test """
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        quantum_instance.metrics.record('transpile', 0.5, circuits=2)
+        metrics = pickle.loads(pickle.dumps(quantum_instance)).metrics
+        self.assertEqual(metrics.summary(), quantum_instance.metrics.summary())
+        metrics.record('transpile', 1.5, circuits=3)
+        self.assertEqual(metrics.summary()['transpile']['count'], 2)
+
+    def test_deepcopy(self):
+        """ metrics of a copied quantum instance, e.g. by the qEOM, test """
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        quantum_instance.metrics.record('transpile', 0.5, circuits=2)
+        copied = copy.deepcopy(quantum_instance)
+        self.assertEqual(copied.metrics.summary(), quantum_instance.metrics.summary())
+        copied.metrics.record('transpile', 1.5, circuits=3)
+        self.assertEqual(quantum_instance.metrics.summary()['transpile']['count'], 1)
+
+    def test_circuit_sampler_stages(self):
+        """ stages of the circuit sampling test """
+        records = []
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=100,
+                                           seed_simulator=2, seed_transpiler=2,
+                                           transpilation_cache=TranspilationCache(),
+                                           metrics=ExecutionMetrics(callback=records.append))
+        ansatz = RealAmplitudes(2, reps=1)
+        operator = PauliExpectation().convert(~StateFn((Z ^ I) + (I ^ Z)) @ StateFn(ansatz))
+        values = np.random.default_rng(2).uniform(size=(3, ansatz.num_parameters))
+        params = dict(zip(ansatz.ordered_parameters, values.T.tolist()))
+        sampler = CircuitSampler(quantum_instance)
+        sampler.convert(operator, params)
+        sampler.convert(operator, params)
+
+        summary = quantum_instance.metrics.summary()
+        self.assertEqual(set(summary), {'transpile', 'bind', 'assemble', 'submit', 'execution',
+                                        'post_processing'})
+        self.assertEqual(summary['transpile']['count'], 1)
+        self.assertEqual(summary['transpile']['cache_misses'], 1)
+        self.assertEqual(summary['bind']['circuits'], 6)
+        self.assertEqual(summary['execution']['count'], 2)
+        self.assertEqual(summary['execution']['circuits'], 6)
+        self.assertEqual(summary['execution']['shots'], 600)
+        self.assertEqual(summary['post_processing']['circuits'], 6)
+        self.assertEqual(len(records), sum(stage['count'] for stage in summary.values()))
+        self.assertTrue(all(record['duration'] >= 0 for record in records))
+
+        quantum_instance.reset_execution_results()
+        self.assertEqual(quantum_instance.metrics.summary(), {})
+
+    def test_queue_and_execution(self):
+        """ queue wait and execution of polled jobs test """
+        job = mock.Mock()
+        job.status.side_effect = [JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.DONE]
+        job.queue_position.return_value = 1
+        job.result.return_value.success = True
+        qobj = mock.Mock()
+        qobj.experiments = [None] * 3
+        qobj.config.shots = 10
+        metrics = ExecutionMetrics()
+        results = _wait_for_jobs([job], ['job_0'], [0], None, {'wait': 0.01}, {}, {}, False,
+                                 None, None, metrics, [qobj], [0.])
+        self.assertEqual(results, [job.result.return_value])
+        summary = metrics.summary()
+        self.assertEqual(summary['queue']['count'], 1)
+        self.assertEqual(summary['execution']['circuits'], 3)
+        self.assertEqual(summary['execution']['shots'], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Measurement Error Mitigator """
+
+import os
+import copy
+import tempfile
+import unittest
+from unittest import mock
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from ddt import ddt, data
+from qiskit import BasicAer, QuantumCircuit
+from qiskit.result import Result
+from qiskit.ignis.mitigation.measurement import CompleteMeasFitter
+from qiskit.aqua import QuantumInstance, AquaError
+from qiskit.aqua.utils.measurement_error_mitigation import MeasurementErrorMitigator
+from qiskit.aqua.utils.run_circuits import run_qobj
+
+
+@ddt
+class TestMeasurementErrorMitigator(QiskitAquaTestCase):
+    """ Test Measurement Error Mitigator """
+
+    def setUp(self):
+        super().setUp()
+        self.rng = np.random.default_rng(7)
+        self.qubits = [0, 2, 3]
+        labels = [format(i, '03b') for i in range(8)]
+        cal_matrix = np.eye(8) + self.rng.uniform(0, 0.05, size=(8, 8))
+        self.fitter = CompleteMeasFitter(None, labels, qubit_list=self.qubits)
+        self.fitter.cal_matrix = cal_matrix / cal_matrix.sum(axis=0)
+
+    def _result(self, num_bits, counts_list):
+        results = [{'shots': 1000, 'success': True,
+                    'header': {'memory_slots': num_bits, 'creg_sizes': [['c', num_bits]]},
+                    'data': {'counts': {hex(value): count for value, count in enumerate(counts)
+                                        if count}}}
+                   for counts in counts_list]
+        return Result.from_dict({'backend_name': 'test', 'backend_version': '0.1',
+                                 'qobj_id': 'id', 'job_id': 'id', 'success': True,
+                                 'results': results})
+
+    @data('least_squares', 'pseudo_inverse')
+    def test_apply(self, method):
+        """ vectorized mitigation test """
+        fitter = self.fitter.subset_fitter([3, 0])
+        cal_matrix = fitter.cal_matrix
+        # physical counts, and counts whose inverse has negative counts
+        counts = [np.round(cal_matrix.dot(self.rng.multinomial(1000, [0.4, 0.3, 0.2, 0.1])))
+                  for _ in range(3)]
+        counts.append(np.array([0., 0., 0., 1000.]))
+        result = self._result(2, counts)
+        expected = fitter.filter.apply(copy.deepcopy(result), method)
+
+        mitigator = MeasurementErrorMitigator('test', method=method)
+        mitigator.add_fitter(self.qubits, 1000, self.fitter)
+        with mock.patch.object(CompleteMeasFitter, 'filter',
+                               new_callable=mock.PropertyMock,
+                               return_value=fitter.filter) as filter_:
+            mitigator.apply(result, [0, 3], {'3_0': [0, 1, 2, 3]}, 1000)
+        # the filter of the fitter only mitigates the counts with negative counts
+        self.assertEqual(filter_.call_count, 1 if method == 'least_squares' else 0)
+
+        for i in range(4):
+            actual, expected_counts = result.get_counts(i), expected.get_counts(i)
+            np.testing.assert_allclose([actual.get(label, 0) for label in fitter.state_labels],
+                                       [expected_counts.get(label, 0)
+                                        for label in fitter.state_labels], atol=0.1)
+
+        with self.assertRaises(AquaError):
+            mitigator.apply(result, [0, 1], {'0_1': [0]}, 1000)
+
+    def test_subset_fitter(self):
+        """ fitters of subsets of the calibrated qubits test """
+        mitigator = MeasurementErrorMitigator('test')
+        mitigator.add_fitter(self.qubits, 1000, self.fitter, timestamp=1.)
+        for qubits in [[2], [3, 0], [0, 3], [3, 2, 0]]:
+            fitter, timestamp = mitigator.get_fitter(qubits, 1000)
+            expected = self.fitter.subset_fitter(qubits)
+            self.assertEqual(timestamp, 1.)
+            self.assertEqual(fitter.state_labels, expected.state_labels)
+            np.testing.assert_array_almost_equal(fitter.cal_matrix, expected.cal_matrix)
+            # the fitter is derived once
+            self.assertIs(mitigator.get_fitter(qubits, 1000)[0], fitter)
+
+        self.assertEqual(mitigator.get_fitter([0, 1], 1000), (None, 0.))
+        self.assertEqual(mitigator.get_fitter([0, 2], 100), (None, 0.))
+
+    def test_save_load(self):
+        """ calibration matrix file test """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'cals.json')
+            mitigator = MeasurementErrorMitigator('test', file_name=file_name)
+            mitigator.add_fitter(self.qubits, 1000, self.fitter, timestamp=5.)
+            other = MeasurementErrorMitigator('other', file_name=file_name)
+            other.add_fitter([1], 100, self.fitter.subset_fitter([0]), timestamp=6.)
+
+            loaded = MeasurementErrorMitigator('test', file_name=file_name)
+            self.assertEqual(list(loaded.cal_matrices()), ['0_2_3_1000'])
+            cal_matrix, timestamp = loaded.cal_matrices()['0_2_3_1000']
+            np.testing.assert_array_almost_equal(cal_matrix, self.fitter.cal_matrix)
+            self.assertEqual(timestamp, 5.)
+            loaded_other = MeasurementErrorMitigator('other', file_name=file_name)
+            self.assertEqual(list(loaded_other.cal_matrices()), ['1_100'])
+
+    def test_quantum_instance(self):
+        """ quantum instance with a calibration matrix file test """
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'cals.json')
+            counts = []
+            for _ in range(2):
+                quantum_instance = QuantumInstance(
+                    BasicAer.get_backend('qasm_simulator'), shots=1000, seed_simulator=5,
+                    seed_transpiler=5, measurement_error_mitigation_cls=CompleteMeasFitter,
+                    cals_matrix_file=file_name)
+                with mock.patch('qiskit.aqua.utils.run_circuits.run_qobj',
+                                wraps=run_qobj) as run:
+                    counts.append(quantum_instance.execute(circuit).get_counts(0))
+                cal_matrix, _ = quantum_instance.cals_matrix([0, 1])
+                np.testing.assert_array_almost_equal(cal_matrix, np.eye(4))
+                # the calibration circuits only run in the first instance
+                self.assertEqual(len(run.call_args[0][0].experiments),
+                                 5 if len(counts) == 1 else 1)
+            # the noiseless counts are not changed
+            self.assertEqual(set(counts[0]), {'00', '11'})
+            self.assertEqual(sum(counts[1].values()), 1000)
+            self.assertIsNone(quantum_instance.cals_matrix([0, 3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test NumPy Statevector Simulator """
+
+import unittest
+from unittest import mock
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from qiskit import BasicAer, QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import QFT, RealAmplitudes
+from qiskit.quantum_info import Statevector
+from qiskit.aqua import QuantumInstance, AquaError, aqua_globals
+from qiskit.aqua.algorithms import VQE
+from qiskit.aqua.components.optimizers import COBYLA
+from qiskit.aqua.operators import CircuitSampler, StateFn, X, Z, I
+from qiskit.aqua.utils import NumPyStatevectorSimulator
+
+
+class TestNumPyStatevectorSimulator(QiskitAquaTestCase):
+    """ Test NumPy Statevector Simulator """
+
+    def setUp(self):
+        super().setUp()
+        self.backend = BasicAer.get_backend('statevector_simulator')
+        alpha, beta = Parameter('alpha'), Parameter('beta')
+        circuit = QuantumCircuit(4)
+        circuit.h(0)
+        circuit.rz(alpha, 0)
+        circuit.rx(2 * beta, 1)
+        circuit.cx(0, 3)
+        circuit.crx(alpha + beta, 2, 1)
+        circuit.u(alpha, beta, 0.3, 2)
+        circuit.ry(alpha * beta, 0)
+        circuit.swap(1, 3)
+        circuit.ccx(0, 1, 2)
+        circuit.append(QFT(2), [3, 0])
+        circuit.rzz(alpha, 1, 2)
+        circuit.global_phase = alpha / 3
+        self.circuit = circuit
+        self.bindings = [{alpha: 0.1 * i, beta: 0.2 - 0.3 * i} for i in range(5)]
+
+    def test_statevectors(self):
+        """ simulated statevectors test """
+        simulator = NumPyStatevectorSimulator()
+        for circuit in [self.circuit, transpile(self.circuit, self.backend)]:
+            statevectors = simulator.run(circuit, self.bindings)[0]
+            self.assertEqual(statevectors.shape, (5, 16))
+            for statevector, binding in zip(statevectors, self.bindings):
+                np.testing.assert_array_almost_equal(
+                    statevector, Statevector(circuit.assign_parameters(binding)).data)
+
+        with self.assertRaises(AquaError):
+            simulator.run(self.circuit, [{self.circuit.parameters[0]: 0.}])
+
+    def test_batches_and_initial_statevector(self):
+        """ batches of bindings and initial statevector test """
+        initial_statevector = np.arange(16) + 1j
+        initial_statevector /= np.linalg.norm(initial_statevector)
+        statevectors = NumPyStatevectorSimulator(max_amplitudes=32).run(
+            [self.circuit], self.bindings, initial_statevector)[0]
+        self.assertEqual(statevectors.shape, (5, 16))
+        for statevector, binding in zip(statevectors, self.bindings):
+            reference = Statevector(initial_statevector.copy()).evolve(
+                self.circuit.assign_parameters(binding))
+            np.testing.assert_array_almost_equal(statevector, reference.data)
+
+    def test_circuit_sampler(self):
+        """ circuit sampler with the NumPy statevector simulation test """
+        ansatz = RealAmplitudes(3, reps=2)
+        operator = ~StateFn((Z ^ Z ^ I) + 0.5 * (X ^ I ^ X)) @ StateFn(ansatz)
+        values = np.random.default_rng(5).uniform(size=(4, ansatz.num_parameters))
+        params = dict(zip(ansatz.ordered_parameters, values.T.tolist()))
+        reference = CircuitSampler(self.backend).convert(operator, params).eval()
+
+        quantum_instance = QuantumInstance(self.backend, numpy_statevector=True)
+        sampler = CircuitSampler(quantum_instance)
+        with mock.patch.object(QuantumInstance, 'execute') as execute:
+            result = sampler.convert(operator, params).eval()
+            result_again = sampler.convert(operator, params).eval()
+        execute.assert_not_called()
+        np.testing.assert_array_almost_equal(result, reference)
+        np.testing.assert_array_almost_equal(result_again, reference)
+
+    def test_vqe(self):
+        """ VQE with the NumPy statevector simulation test """
+        aqua_globals.random_seed = 10
+        hamiltonian = (-1.052373245772859 * I ^ I) + (0.39793742484318045 * I ^ Z) \
+            - (0.39793742484318045 * Z ^ I) - (0.01128010425623538 * Z ^ Z) \
+            + (0.18093119978423156 * X ^ X)
+        results = []
+        for numpy_statevector in [False, True]:
+            vqe = VQE(hamiltonian, RealAmplitudes(2, reps=1), COBYLA(maxiter=40),
+                      initial_point=[0.1, 0.2, 0.3, 0.4],
+                      quantum_instance=QuantumInstance(self.backend,
+                                                       numpy_statevector=numpy_statevector))
+            results.append(vqe.run())
+        self.assertAlmostEqual(results[1].eigenvalue.real, results[0].eigenvalue.real, places=8)
+
+    def test_requires_statevector_backend(self):
+        """ NumPy statevector simulation on a qasm backend test """
+        with self.assertRaises(AquaError):
+            QuantumInstance(BasicAer.get_backend('qasm_simulator'), numpy_statevector=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test of MultiStart optimizer """
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from ddt import ddt, data
+from qiskit import BasicAer
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance, aqua_globals
+from qiskit.aqua.algorithms import VQE
+from qiskit.aqua.components.optimizers import MultiStart, COBYLA, L_BFGS_B, SPSA
+from qiskit.aqua.operators import X, Z, I
+
+
+def _double_well(x):
+    """ An objective function with a local minimum at -1 and the global one at 1 """
+    points = np.reshape(x, (-1, 2))
+    values = np.sum((points ** 2 - 1) ** 2 - 0.3 * points, axis=1)
+    return values if len(values) > 1 else values[0]
+
+
+class _RecordingObjective:
+    """ An objective function recording the number of points of its calls """
+
+    def __init__(self):
+        self.call_sizes = []
+
+    def __call__(self, x):
+        self.call_sizes.append(len(np.reshape(x, (-1, 2))))
+        return _double_well(x)
+
+
+@ddt
+class TestOptimizerMultiStart(QiskitAquaTestCase):
+    """ Test MultiStart optimizer """
+
+    def setUp(self):
+        super().setUp()
+        aqua_globals.random_seed = 50
+        self.initial_point = np.array([-1., -1.])
+
+    def test_best_start(self):
+        """ best of the starts test """
+        optimizer = MultiStart(L_BFGS_B(), num_starts=6)
+        sol, opt, nfev = optimizer.optimize(2, _double_well, initial_point=self.initial_point)
+        # the given initial point converges to the local minimum
+        self.assertLess(optimizer.start_results[0][0][0], 0)
+        self.assertLess(opt, optimizer.start_results[0][1])
+        self.assertEqual(opt, min(result[1] for result in optimizer.start_results))
+        self.assertAlmostEqual(_double_well(sol), opt)
+        self.assertEqual(nfev, sum(result[2] for result in optimizer.start_results))
+        self.assertEqual(len(optimizer.start_results), 6)
+
+    @data(COBYLA(maxiter=200), SPSA(maxiter=50))
+    def test_deterministic(self, inner):
+        """ results independent of the number of workers test """
+        results = []
+        for max_workers in [1, 2, 4]:
+            aqua_globals.random_seed = 50
+            optimizer = MultiStart(inner, num_starts=4, max_workers=max_workers)
+            optimizer.optimize(2, _double_well, initial_point=self.initial_point)
+            results.append(optimizer.start_results)
+        for other in results[1:]:
+            for result, expected in zip(other, results[0]):
+                np.testing.assert_array_almost_equal(result[0], expected[0])
+                self.assertAlmostEqual(result[1], expected[1])
+
+    @data((4, [8] * 20 + [4]), (2, ([4] * 20 + [2]) * 2))
+    def test_grouped_evaluations(self, config):
+        """ evaluations of the starts gathered in grouped calls test """
+        max_workers, call_sizes = config
+        objective = _RecordingObjective()
+        optimizer = MultiStart(SPSA(maxiter=20, skip_calibration=True), num_starts=4,
+                               max_workers=max_workers, gather_timeout=10)
+        optimizer.set_max_evals_grouped(8)
+        _, _, nfev = optimizer.optimize(2, objective, initial_point=self.initial_point)
+        self.assertEqual(sum(objective.call_sizes), nfev)
+        # each call gathers the 2 evaluations of an iteration of all the running starts
+        self.assertListEqual(objective.call_sizes, call_sizes)
+
+    def test_stochastic_objective(self):
+        """ objective function drawing from aqua_globals random test """
+        def noisy_double_well(x):
+            values = _double_well(x)
+            return values + 0.01 * aqua_globals.random.normal(size=np.shape(values))
+
+        results = []
+        for _ in range(2):
+            aqua_globals.random_seed = 50
+            optimizer = MultiStart(SPSA(maxiter=20, skip_calibration=True), num_starts=4,
+                                   gather_timeout=10)
+            optimizer.set_max_evals_grouped(8)
+            results.append(optimizer.optimize(2, noisy_double_well,
+                                              initial_point=self.initial_point))
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        self.assertEqual(results[0][1], results[1][1])
+
+    def test_early_termination(self):
+        """ starts terminated early test """
+        optimizer = MultiStart(SPSA(maxiter=100), num_starts=4, max_workers=1,
+                               termination_threshold=0.1, termination_patience=10)
+        _, opt, _ = optimizer.optimize(2, _double_well, initial_point=self.initial_point)
+        terminated = [result for result in optimizer.start_results if result[3]]
+        self.assertTrue(terminated)
+        self.assertLess(len(terminated), 4)
+        self.assertLessEqual(opt, min(result[1] for result in terminated))
+        for result in terminated:
+            # the best point of a start terminated early is returned
+            self.assertAlmostEqual(_double_well(result[0]), result[1])
+
+    def test_process_pool(self):
+        """ starts run on a process pool test """
+        results = []
+        for executor in [None, ProcessPoolExecutor(max_workers=2)]:
+            aqua_globals.random_seed = 50
+            optimizer = MultiStart(COBYLA(maxiter=200), num_starts=4, executor=executor)
+            results.append(optimizer.optimize(2, _double_well, initial_point=self.initial_point))
+            if executor is not None:
+                executor.shutdown()
+        np.testing.assert_array_almost_equal(results[0][0], results[1][0])
+        self.assertAlmostEqual(results[0][1], results[1][1])
+
+    def test_vqe(self):
+        """ VQE with multi-start test """
+        hamiltonian = (Z ^ Z ^ I) + (I ^ X ^ X) - 0.5 * (X ^ I ^ Z)
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                           seed_simulator=50, seed_transpiler=50)
+        optimizer = MultiStart(COBYLA(maxiter=300), num_starts=3)
+        result = VQE(hamiltonian, RealAmplitudes(3, reps=2), optimizer,
+                     quantum_instance=quantum_instance).run()
+        expected = min(np.linalg.eigvalsh(hamiltonian.to_matrix()))
+        self.assertAlmostEqual(result.eigenvalue.real, expected, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
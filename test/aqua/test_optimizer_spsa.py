@@ -0,0 +1,101 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test of SPSA optimizer """
+
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from ddt import ddt, data, unpack
+from qiskit.aqua import aqua_globals
+from qiskit.aqua.components.optimizers import SPSA
+
+
+class _Quadratic:
+    """ A quadratic objective function evaluating groups of points, recording the sizes of the
+    groups """
+
+    def __init__(self, weights):
+        self.weights = np.asarray(weights, dtype=float)
+        self.group_sizes = []
+
+    def __call__(self, x):
+        points = np.reshape(x, (-1, len(self.weights)))
+        self.group_sizes.append(len(points))
+        values = np.sum(self.weights * (points - 1) ** 2, axis=1)
+        return values if len(values) > 1 else values[0]
+
+
+@ddt
+class TestOptimizerSPSA(QiskitAquaTestCase):
+    """ Test SPSA optimizer """
+
+    def setUp(self):
+        super().setUp()
+        aqua_globals.random_seed = 50
+        self.initial_point = np.array([0.3, -0.5, 0.8])
+
+    @data((1, False), (3, False), (1, True), (2, True))
+    @unpack
+    def test_grouped_evaluations(self, resamplings, second_order):
+        """ evaluations of an iteration grouped in a single call test """
+        results = []
+        for max_evals_grouped in [1, 100]:
+            aqua_globals.random_seed = 50
+            objective = _Quadratic([1, 2, 3])
+            optimizer = SPSA(maxiter=50, resamplings=resamplings, second_order=second_order)
+            optimizer.set_max_evals_grouped(max_evals_grouped)
+            results.append(optimizer.optimize(3, objective, initial_point=self.initial_point))
+            points_per_iteration = resamplings * (4 if second_order else 2)
+            if max_evals_grouped > 1:
+                # a call for the calibration, per iteration, and for the final value
+                self.assertEqual(objective.group_sizes,
+                                 [20] + [points_per_iteration] * 50 + [1])
+            else:
+                self.assertEqual(len(objective.group_sizes), 20 + points_per_iteration * 50 + 1)
+        np.testing.assert_array_almost_equal(results[0][0], results[1][0])
+        self.assertAlmostEqual(results[0][1], results[1][1])
+
+    def test_second_order(self):
+        """ 2-SPSA on an ill-conditioned objective function test """
+        initial_value = _Quadratic([1, 10, 100])(self.initial_point)
+        values = []
+        for second_order in [False, True]:
+            aqua_globals.random_seed = 50
+            optimizer = SPSA(maxiter=200, second_order=second_order, resamplings=2, c0=0.5,
+                             skip_calibration=True)
+            optimizer.set_max_evals_grouped(8)
+            _, value, _ = optimizer.optimize(3, _Quadratic([1, 10, 100]),
+                                             initial_point=self.initial_point)
+            values.append(value)
+        # the step size is too large for the steep directions without the Hessian
+        self.assertGreater(values[0], initial_value)
+        self.assertLess(values[1], initial_value / 10)
+
+    def test_blocking(self):
+        """ blocking of the updates increasing the objective function test """
+        initial_value = _Quadratic([1, 2, 3])(self.initial_point)
+        values = []
+        for blocking in [False, True]:
+            aqua_globals.random_seed = 50
+            # a too large step size makes the updates diverge
+            optimizer = SPSA(maxiter=20, c0=5, skip_calibration=True, blocking=blocking)
+            _, value, _ = optimizer.optimize(3, _Quadratic([1, 2, 3]),
+                                             initial_point=self.initial_point)
+            values.append(value)
+        self.assertGreater(values[0], initial_value)
+        self.assertLessEqual(values[1], initial_value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Qobj Template """
+
+import unittest
+from unittest import mock
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from ddt import ddt, data
+from qiskit import BasicAer, QuantumCircuit, QuantumRegister, ClassicalRegister, assemble
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance, AquaError
+from qiskit.aqua.operators import CircuitSampler, StateFn, PauliExpectation, X, Z, I
+from qiskit.aqua.utils import QobjTemplate
+
+
+@ddt
+class TestQobjTemplate(QiskitAquaTestCase):
+    """ Test Qobj Template """
+
+    def setUp(self):
+        super().setUp()
+        self.alpha, self.beta = Parameter('alpha'), Parameter('beta')
+        qreg, creg = QuantumRegister(2), ClassicalRegister(2)
+        circuit = QuantumCircuit(qreg, creg)
+        circuit.rx(self.alpha, 0)
+        circuit.measure(0, 0)
+        circuit.u(2 * self.beta, self.alpha * self.beta, 0.1, 1).c_if(creg, 1)
+        circuit.barrier()
+        circuit.rz(self.alpha + 1, 1)
+        circuit.measure(1, 1)
+        circuit.global_phase = self.beta / 2
+        fixed = QuantumCircuit(1, 1)
+        fixed.h(0)
+        fixed.measure(0, 0)
+        self.circuits = [circuit, fixed]
+        self.bindings = [{self.alpha: 0.1 * i, self.beta: 1 - 0.2 * i} for i in range(4)]
+
+    def test_bind(self):
+        """ bound experiments test """
+        template = QobjTemplate(self.circuits, assemble, self.bindings[0])
+        self.assertEqual(template.parameters, {self.alpha, self.beta})
+        qobj = template.bind(self.bindings)
+        reference = assemble([circuit.assign_parameters(binding) if circuit.parameters
+                              else circuit
+                              for circuit in self.circuits for binding in self.bindings])
+        self.assertEqual(len(qobj.experiments), len(reference.experiments))
+        self.assertNotEqual(qobj.qobj_id, template.qobj.qobj_id)
+        for experiment, expected in zip(qobj.experiments, reference.experiments):
+            self.assertAlmostEqual(experiment.header.global_phase % (2 * np.pi),
+                                   expected.header.global_phase % (2 * np.pi))
+            self.assertEqual([inst.name for inst in experiment.instructions],
+                             [inst.name for inst in expected.instructions])
+            for inst, expected_inst in zip(experiment.instructions, expected.instructions):
+                np.testing.assert_array_almost_equal(
+                    [float(param) for param in getattr(inst, 'params', [])],
+                    [float(param) for param in getattr(expected_inst, 'params', [])])
+
+        with self.assertRaises(AquaError):
+            template.bind([{self.alpha: 0.}])
+        with self.assertRaises(AquaError):
+            QobjTemplate(self.circuits, assemble, {self.alpha: 0.})
+
+    @data('qasm_simulator', 'statevector_simulator')
+    def test_circuit_sampler(self, backend):
+        """ circuit sampler with a Qobj template test """
+        ansatz = RealAmplitudes(2, reps=1)
+        operator = PauliExpectation().convert(~StateFn((Z ^ I) + (X ^ X)) @ StateFn(ansatz))
+        values = np.random.default_rng(4).uniform(size=(5, ansatz.num_parameters))
+        params = dict(zip(ansatz.ordered_parameters, values.T.tolist()))
+
+        results = []
+        for template_side_effect in [None, AquaError('no template')]:
+            quantum_instance = QuantumInstance(BasicAer.get_backend(backend), shots=1000,
+                                               seed_simulator=3, seed_transpiler=3)
+            with mock.patch('qiskit.aqua.operators.converters.circuit_sampler.QobjTemplate',
+                            wraps=QobjTemplate, side_effect=template_side_effect):
+                sampler = CircuitSampler(quantum_instance)
+                sampler.convert(operator, params)
+                with mock.patch.object(quantum_instance, 'assemble',
+                                       wraps=quantum_instance.assemble) as assemble_circuits:
+                    results.append(sampler.convert(operator, params).eval())
+            if template_side_effect is None:
+                # the circuits are not assembled again
+                assemble_circuits.assert_not_called()
+            else:
+                assemble_circuits.assert_called_once()
+        np.testing.assert_array_almost_equal(results[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,8 @@
 """ Test QSVM """
 
 import os
+import tempfile
+from unittest import mock
 from test.aqua import QiskitAquaTestCase
 
 import numpy as np
@@ -25,6 +27,8 @@ from qiskit.aqua.components.multiclass_extensions import (ErrorCorrectingCode,
                                                           AllPairs,
                                                           OneAgainstRest)
 from qiskit.aqua.algorithms import QSVM
+from qiskit.aqua.algorithms.classifiers.qsvm._qsvm_kernel_cache import _feature_map_key
+from qiskit.aqua.components.feature_maps import RawFeatureVector
 from qiskit.aqua.utils import split_dataset_to_data_and_labels, optimize_svm
 from qiskit.ml.datasets import ad_hoc_data
 
@@ -104,7 +108,8 @@ class TestQSVM(QiskitAquaTestCase):
 
         Also tests saving and loading models."""
         data_preparation = self.data_preparation
-        svm = QSVM(data_preparation, self.training_data, self.testing_data, None, lambda2=0)
+        svm = QSVM(data_preparation, self.training_data, self.testing_data, None, lambda2=0,
+                   kernel_cache=True)
 
         file_path = self.get_resource_path('qsvm_test.npz')
         try:
@@ -125,7 +130,7 @@ class TestQSVM(QiskitAquaTestCase):
 
             self.assertTrue(os.path.exists(file_path))
 
-            loaded_svm = QSVM(data_preparation)
+            loaded_svm = QSVM(data_preparation, kernel_cache=True)
             loaded_svm.load_model(file_path)
 
             np.testing.assert_array_almost_equal(loaded_svm.ret['svm']['support_vectors'],
@@ -141,6 +146,8 @@ class TestQSVM(QiskitAquaTestCase):
 
             np.testing.assert_array_almost_equal(loaded_svm.ret['kernel_matrix_testing'],
                                                  self.ref_kernel_testing['statevector'], decimal=4)
+            # the statevectors of the training and testing data are saved with the model
+            self.assertEqual(loaded_svm.kernel_cache.size, 5)
         except MissingOptionalLibraryError as ex:
             self.skipTest(str(ex))
         finally:
@@ -274,3 +281,158 @@ class TestQSVM(QiskitAquaTestCase):
         np.testing.assert_array_almost_equal(alpha, expected_alpha)
         np.testing.assert_array_almost_equal(b, expected_b)
         np.testing.assert_array_equal(support, expected_support)
+
+    @data('qasm', 'statevector')
+    def test_kernel_matrix_blocks(self, simulator):
+        """ Test the kernel matrix computed in blocks by a pool of quantum instances. """
+        quantum_instance = self.qasm_simulator if simulator == 'qasm' \
+            else self.statevector_simulator
+        training_data = np.concatenate(list(self.training_data.values()))
+        testing_data = np.concatenate(list(self.testing_data.values()))
+        kernel_matrix = QSVM.get_kernel_matrix(quantum_instance, self.data_preparation,
+                                               training_data)
+        if simulator == 'qasm':
+            np.testing.assert_array_almost_equal(kernel_matrix, self.ref_kernel_training,
+                                                 decimal=1)
+        kernel_matrix_testing = QSVM.get_kernel_matrix(quantum_instance, self.data_preparation,
+                                                       testing_data, training_data)
+        np.testing.assert_array_almost_equal(kernel_matrix_testing,
+                                             self.ref_kernel_testing[simulator], decimal=1)
+
+        # BasicAer backends are not thread safe, each quantum instance needs its own
+        backend = quantum_instance.backend
+        pool = [quantum_instance,
+                QuantumInstance(type(backend)(provider=backend.provider()), shots=self.shots,
+                                seed_simulator=self.random_seed,
+                                seed_transpiler=self.random_seed)]
+        np.testing.assert_array_almost_equal(
+            QSVM.get_kernel_matrix(pool, self.data_preparation, training_data, block_size=3),
+            kernel_matrix)
+        np.testing.assert_array_almost_equal(
+            QSVM.get_kernel_matrix(pool, self.data_preparation, testing_data, training_data,
+                                   block_size=1),
+            kernel_matrix_testing)
+
+        # quantum instances with other transpilation settings get their own circuits
+        pool[1] = QuantumInstance(type(backend)(provider=backend.provider()), shots=self.shots,
+                                  seed_simulator=self.random_seed,
+                                  seed_transpiler=self.random_seed,
+                                  basis_gates=['u1', 'u2', 'u3', 'cx'], coupling_map=[[0, 1]])
+        with mock.patch.object(QuantumInstance, 'transpile',
+                               side_effect=QuantumInstance.transpile, autospec=True) as transpile:
+            np.testing.assert_array_almost_equal(
+                QSVM.get_kernel_matrix(pool, self.data_preparation, testing_data,
+                                       training_data, block_size=1),
+                kernel_matrix_testing)
+        self.assertEqual(transpile.call_count, 2)
+        self.assertEqual([call[0][0] for call in transpile.call_args_list], pool)
+
+    def test_kernel_matrix_resume(self):
+        """ Test resuming a kernel matrix computation from a file. """
+        training_data = np.concatenate(list(self.training_data.values()))
+        kernel_matrix = QSVM.get_kernel_matrix(self.qasm_simulator, self.data_preparation,
+                                               training_data, enforce_psd=False)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'kernel.npy')
+            partial_matrix = np.lib.format.open_memmap(file_path, mode='w+', dtype=float,
+                                                       shape=kernel_matrix.shape)
+            partial_matrix[...] = np.nan
+            # a block which was computed and one computed in part
+            partial_matrix[:2, 2:] = partial_matrix[2:, :2] = 0.5
+            partial_matrix[0, 1] = partial_matrix[1, 0] = 0.5
+            del partial_matrix
+            result = QSVM.get_kernel_matrix(self.qasm_simulator, self.data_preparation,
+                                            training_data, enforce_psd=False, block_size=2,
+                                            out=file_path)
+            np.testing.assert_array_equal(result[:2, 2:], 0.5)
+            np.testing.assert_array_equal(result[[0, 1], [1, 0]], 0.5)
+            np.testing.assert_array_equal(np.diag(result), 1.)
+            np.testing.assert_array_almost_equal(result[2:, 2:], kernel_matrix[2:, 2:])
+            del result
+            np.testing.assert_array_equal(np.load(file_path)[2:, :2], 0.5)
+
+    @data('qasm', 'statevector')
+    def test_kernel_cache(self, simulator):
+        """ Test the kernel entries of the data points seen before are not computed again. """
+        quantum_instance = self.qasm_simulator if simulator == 'qasm' \
+            else self.statevector_simulator
+        training_data = np.concatenate(list(self.training_data.values()))
+        testing_data = np.concatenate(list(self.testing_data.values()))
+        svm = QSVM(self.data_preparation, quantum_instance=quantum_instance, kernel_cache=True)
+        num_circuits = []
+
+        def execute(circuits, **kwargs):
+            num_circuits.append(len(circuits))
+            return QuantumInstance.execute(quantum_instance, circuits, **kwargs)
+
+        with mock.patch.object(quantum_instance, 'execute', side_effect=execute):
+            kernel_matrix = svm.construct_kernel_matrix(training_data[:3])
+            np.testing.assert_array_almost_equal(
+                kernel_matrix,
+                QSVM.get_kernel_matrix(quantum_instance, self.data_preparation,
+                                       training_data[:3]))
+            num_circuits.clear()
+            np.testing.assert_array_almost_equal(svm.construct_kernel_matrix(training_data[:3]),
+                                                 kernel_matrix)
+            self.assertEqual(sum(num_circuits), 0)
+
+            # one more training data point, only its row is computed
+            kernel_matrix = svm.construct_kernel_matrix(training_data)
+            self.assertEqual(sum(num_circuits), 1 if simulator == 'statevector' else 3)
+            np.testing.assert_array_almost_equal(
+                kernel_matrix,
+                QSVM.get_kernel_matrix(quantum_instance, self.data_preparation, training_data))
+            num_circuits.clear()
+            kernel_matrix_testing = svm.construct_kernel_matrix(testing_data, training_data)
+            self.assertEqual(sum(num_circuits), 2 if simulator == 'statevector' else 8)
+            np.testing.assert_array_almost_equal(kernel_matrix_testing,
+                                                 self.ref_kernel_testing[simulator], decimal=1)
+
+        # only the statevectors are kept with a statevector simulator
+        cache = svm.kernel_cache.to_dict()
+        self.assertEqual('kernel_cache_kernel' in cache, simulator == 'qasm')
+        self.assertEqual('kernel_cache_statevectors' in cache, simulator == 'statevector')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'cache.npz')
+            np.savez(file_path, **cache)
+            loaded_svm = QSVM(self.data_preparation, quantum_instance=quantum_instance,
+                              kernel_cache=True)
+            loaded_svm.kernel_cache.from_dict(np.load(file_path))
+        with mock.patch.object(quantum_instance, 'execute') as execute_mock:
+            np.testing.assert_array_almost_equal(
+                loaded_svm.construct_kernel_matrix(testing_data, training_data),
+                kernel_matrix_testing)
+            execute_mock.assert_not_called()
+
+        # another feature map invalidates the cache
+        other_svm = QSVM(ZZFeatureMap(feature_dimension=2, reps=1),
+                         quantum_instance=quantum_instance, kernel_cache=True)
+        other_svm.kernel_cache = loaded_svm.kernel_cache
+        other_svm.construct_kernel_matrix(testing_data, training_data)
+        self.assertEqual(other_svm.kernel_cache.size, 6)
+
+    def test_kernel_cache_context(self):
+        """ Test the kernel cache is not shared by other feature maps or quantum instances. """
+        def context(feature_map, **kwargs):
+            svm = QSVM(feature_map, kernel_cache=True)
+            svm.construct_kernel_matrix(np.array([[0.5, 1.]]),
+                                        quantum_instance=QuantumInstance(
+                                            BasicAer.get_backend('qasm_simulator'), **kwargs))
+            return svm.kernel_cache._context
+
+        reference = context(self.data_preparation, shots=1024)
+        self.assertEqual(context(ZZFeatureMap(feature_dimension=2, reps=2), shots=1024),
+                         reference)
+        self.assertNotEqual(context(ZZFeatureMap(feature_dimension=2, reps=2,
+                                                 entanglement='full', insert_barriers=True),
+                                    shots=1024), reference)
+        self.assertNotEqual(context(self.data_preparation, shots=2048), reference)
+        self.assertNotEqual(context(self.data_preparation, shots=1024,
+                                    coupling_map=[[1, 0]]), reference)
+        self.assertNotEqual(context(self.data_preparation, shots=1024, basis_gates=['u3', 'cx']),
+                            reference)
+
+        # legacy feature maps are identified by their settings
+        keys = {_feature_map_key(RawFeatureVector(feature_dimension))
+                for feature_dimension in [2, 2, 4]}
+        self.assertEqual(len(keys), 2)
@@ -0,0 +1,125 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Transpilation Cache """
+
+import os
+import tempfile
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+from qiskit import BasicAer, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.utils import TranspilationCache
+
+
+class TestTranspilationCache(QiskitAquaTestCase):
+    """ Test Transpilation Cache """
+
+    def setUp(self):
+        super().setUp()
+        self.backend = BasicAer.get_backend('qasm_simulator')
+
+    def _instance(self, cache, **kwargs):
+        return QuantumInstance(self.backend, seed_transpiler=50, seed_simulator=50,
+                               transpilation_cache=cache, **kwargs)
+
+    def test_hits_and_misses(self):
+        """ repeated transpilation of equivalent circuits hits the cache """
+        cache = TranspilationCache()
+        quantum_instance = self._instance(cache)
+        circuit = RealAmplitudes(3, reps=2)
+        circuit.measure_all()
+        first = quantum_instance.transpile(circuit)[0]
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        # same structure, new Parameter instances
+        other = RealAmplitudes(3, reps=2)
+        other.measure_all()
+        other.name = 'other'
+        second = quantum_instance.transpile(other)[0]
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second.name, 'other')
+        self.assertEqual(set(second.parameters), set(other.parameters))
+        self.assertEqual(second.count_ops(), first.count_ops())
+
+        # the cached circuit binds and runs like a freshly transpiled one
+        values = dict(zip(other.parameters, [0.1 * i for i in range(other.num_parameters)]))
+        reference = self._instance(None).transpile(other)[0].assign_parameters(values)
+        counts = quantum_instance.execute(second.assign_parameters(values),
+                                          had_transpiled=True).get_counts()
+        ref_counts = self._instance(None).execute(reference, had_transpiled=True).get_counts()
+        self.assertDictEqual(counts, ref_counts)
+
+    def test_settings_are_part_of_key(self):
+        """ different transpile settings do not share entries """
+        cache = TranspilationCache()
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        self._instance(cache).transpile(circuit)
+        self._instance(cache, optimization_level=0).transpile(circuit)
+        self._instance(cache, coupling_map=[[1, 0]]).transpile(circuit)
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+        # different parameter expressions are different circuits
+        theta = Parameter('θ')
+        circuit_a = QuantumCircuit(1)
+        circuit_a.ry(theta, 0)
+        circuit_b = QuantumCircuit(1)
+        circuit_b.ry(2 * theta, 0)
+        quantum_instance = self._instance(cache)
+        quantum_instance.transpile([circuit_a, circuit_b])
+        self.assertEqual((cache.hits, cache.misses), (0, 5))
+
+    def test_lru_eviction(self):
+        """ the in-memory tier evicts the least recently used entries """
+        cache = TranspilationCache(max_size=2)
+        quantum_instance = self._instance(cache)
+        circuits = []
+        for i in range(3):
+            circuit = QuantumCircuit(1)
+            for _ in range(i + 1):
+                circuit.x(0)
+            circuits.append(circuit)
+        quantum_instance.transpile(circuits[0])
+        quantum_instance.transpile(circuits[1])
+        quantum_instance.transpile(circuits[0])
+        quantum_instance.transpile(circuits[2])
+        self.assertEqual(len(cache), 2)
+        quantum_instance.transpile(circuits[0])
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        quantum_instance.transpile(circuits[1])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_disk_tier(self):
+        """ a new cache reuses the entries written to disk """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            circuit = RealAmplitudes(2, reps=1)
+            circuit.measure_all()
+            self._instance(TranspilationCache(cache_dir=cache_dir)).transpile(circuit)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            cache = TranspilationCache(cache_dir=cache_dir)
+            transpiled = self._instance(cache).transpile(circuit)[0]
+            self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (1, 1, 0))
+            self.assertEqual(set(transpiled.parameters), set(circuit.parameters))
+
+            cache.clear(disk=True)
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(len(os.listdir(cache_dir)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" AbelianGrouper grouping of the terms of Pauli sums """
+
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp
+from qiskit.aqua.operators import PauliSumOp, AbelianGrouper
+
+
+class AbelianGrouperBench:
+    params = ([12, 40], [200, 2000], ['greedy_color', 'largest_first', 'sorted_insertion'])
+    param_names = ['num_qubits', 'num_terms', 'strategy']
+    timeout = 600
+
+    def setup(self, num_qubits, num_terms, strategy):
+        rng = np.random.default_rng(num_terms)
+        labels = [''.join(rng.choice(list('IXYZ'), num_qubits)) for _ in range(num_terms)]
+        self.operator = PauliSumOp(SparsePauliOp.from_list(
+            list(zip(labels, rng.normal(size=num_terms)))))
+        self.grouper = AbelianGrouper(strategy=strategy)
+
+    def time_convert(self, *_):
+        self.grouper.convert(self.operator)
+
+    def peakmem_convert(self, *_):
+        self.grouper.convert(self.operator)
@@ -0,0 +1,45 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Adjoint gradients compared with parameter shift gradients """
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import EfficientSU2
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.operators import StateFn, X, Z, I
+from qiskit.aqua.operators.gradients import Gradient
+
+
+class AdjointGradientBench:
+    params = [[4, 8], ['adjoint', 'param_shift']]
+    param_names = ['num_qubits', 'grad_method']
+    timeout = 1200
+
+    def setup(self, num_qubits, grad_method):
+        ansatz = EfficientSU2(num_qubits, reps=2)
+        hamiltonian = (Z ^ Z ^ (I ^ (num_qubits - 2))) + (X ^ num_qubits)
+        self.operator = ~StateFn(hamiltonian) @ StateFn(ansatz)
+        self.params = ansatz.ordered_parameters
+        self.values = np.random.default_rng(num_qubits).uniform(0, np.pi, len(self.params))
+        self.quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        self.gradient = Gradient(grad_method=grad_method)
+
+    def time_gradient(self, _, __):
+        self.gradient.gradient_wrapper(self.operator, self.params,
+                                       backend=self.quantum_instance)(self.values)
+
+    def peakmem_gradient(self, _, __):
+        self.gradient.gradient_wrapper(self.operator, self.params,
+                                       backend=self.quantum_instance)(self.values)
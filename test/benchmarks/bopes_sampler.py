@@ -0,0 +1,58 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Sampling of a dissociation curve """
+
+from functools import partial
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.algorithms import VQE, NumPyMinimumEigensolver
+from qiskit.aqua.components.optimizers import SLSQP
+from qiskit.chemistry.algorithms.ground_state_solvers import GroundStateEigensolver
+from qiskit.chemistry.algorithms.pes_samplers import BOPESSampler, PolynomialExtrapolator
+from qiskit.chemistry.drivers import Molecule, PySCFDriver
+from qiskit.chemistry.transformations import FermionicTransformation
+from qiskit.circuit.library import RealAmplitudes
+
+
+class BOPESSamplerBench:
+    params = [1, 4]
+    param_names = ['max_workers']
+    timeout = 600
+
+    def setup(self, max_workers):
+        dof = partial(Molecule.absolute_distance, atom_pair=(1, 0))
+        molecule = Molecule(geometry=[['H', [0., 0., 0.]], ['H', [1., 0., 0.]]],
+                            degrees_of_freedom=[dof])
+        self.driver = PySCFDriver(molecule=molecule)
+        self.points = list(np.linspace(0.4, 3., 50))
+        solver = VQE(var_form=RealAmplitudes(4, reps=1), optimizer=SLSQP(maxiter=200),
+                     quantum_instance=QuantumInstance(
+                         BasicAer.get_backend('statevector_simulator')))
+        self.sampler = BOPESSampler(GroundStateEigensolver(FermionicTransformation(), solver),
+                                    extrapolator=PolynomialExtrapolator(degree=1),
+                                    max_workers=max_workers,
+                                    cache_transformations=True)
+
+    def time_sample(self, _):
+        self.sampler.clear_cache()
+        self.sampler.sample(self.driver, self.points)
+
+    def time_sample_cached(self, _):
+        # the points sampled again with another solver, without the driver and transformation
+        self.sampler.sample(self.driver, self.points)
+        self.sampler.gss.solver = NumPyMinimumEigensolver()
+        self.sampler.sample(self.driver, self.points)
@@ -0,0 +1,61 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" CircuitSampler conversion of expectation values on BasicAer backends """
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import EfficientSU2
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.operators import CircuitSampler, PauliExpectation, StateFn, X, Z, I
+
+
+class CircuitSamplerBench:
+    params = ([4, 8], [1, 20], ['qasm_simulator', 'statevector_simulator'])
+    param_names = ['num_qubits', 'num_bindings', 'backend']
+    timeout = 600
+
+    def setup(self, num_qubits, num_bindings, backend):
+        ansatz = EfficientSU2(num_qubits, reps=2)
+        hamiltonian = (Z ^ Z ^ (I ^ (num_qubits - 2))) + (X ^ num_qubits) \
+            + 0.5 * (I ^ (num_qubits - 1) ^ Z)
+        self.hamiltonian, self.ansatz = hamiltonian, ansatz
+        self.operator = self._build_operator()
+        values = np.random.default_rng(num_qubits).uniform(
+            0, np.pi, (num_bindings, ansatz.num_parameters))
+        self.params = dict(zip(ansatz.ordered_parameters, values.T.tolist()))
+        self.quantum_instance = QuantumInstance(BasicAer.get_backend(backend), shots=1024,
+                                                seed_simulator=7, seed_transpiler=7)
+        self.sampler = CircuitSampler(self.quantum_instance)
+        # transpile the circuits once, as in an optimization loop
+        self.sampler.convert(self.operator, self.params)
+
+    def _build_operator(self):
+        return PauliExpectation().convert(~StateFn(self.hamiltonian) @ StateFn(self.ansatz))
+
+    def time_convert(self, *_):
+        self.sampler.convert(self.operator, self.params)
+
+    def time_convert_and_eval(self, *_):
+        self.sampler.convert(self.operator, self.params).eval()
+
+    def time_first_convert(self, *_):
+        CircuitSampler(self.quantum_instance).convert(self.operator, self.params)
+
+    def time_convert_rebuilt_operator(self, *_):
+        # an equal operator built again, as done by the algorithms for the auxiliary operators
+        self.sampler.convert(self._build_operator(), self.params)
+
+    def peakmem_convert(self, *_):
+        self.sampler.convert(self.operator, self.params)
@@ -0,0 +1,64 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Dumping and parsing of synthetic FCIDump files """
+
+import os
+import tempfile
+
+import numpy as np
+from qiskit.chemistry import QMolecule
+from qiskit.chemistry.drivers import FCIDumpDriver
+
+
+def _random_qmolecule(num_orbitals, seed):
+    """ Random integrals with the symmetries of real molecular integrals """
+    rng = np.random.default_rng(seed)
+    qmolecule = QMolecule()
+    qmolecule.num_orbitals = num_orbitals
+    qmolecule.num_alpha = qmolecule.num_beta = num_orbitals // 2
+    qmolecule.multiplicity = 1
+    qmolecule.nuclear_repulsion_energy = 1.
+    h1 = rng.normal(size=(num_orbitals, num_orbitals))
+    qmolecule.mo_onee_ints = h1 + h1.T
+    h2 = rng.normal(size=(num_orbitals,) * 4)
+    h2 = h2 + h2.transpose(1, 0, 2, 3)
+    h2 = h2 + h2.transpose(0, 1, 3, 2)
+    qmolecule.mo_eri_ints = h2 + h2.transpose(2, 3, 0, 1)
+    return qmolecule
+
+
+class FCIDumpBench:
+    params = [10, 20, 40]
+    param_names = ['num_orbitals']
+    timeout = 600
+
+    def setup(self, num_orbitals):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.tmp_dir.name, 'bench.fcidump')
+        self.qmolecule = _random_qmolecule(num_orbitals, 5)
+        FCIDumpDriver.dump(self.qmolecule, self.file_name)
+
+    def teardown(self, _):
+        self.tmp_dir.cleanup()
+
+    def time_dump(self, _):
+        FCIDumpDriver.dump(self.qmolecule, self.file_name + '.dump')
+
+    def time_parse(self, _):
+        FCIDumpDriver(self.file_name).run()
+
+    def track_file_size(self, _):
+        # the size in bytes of the file of the symmetry unique integrals
+        return os.path.getsize(self.file_name)
@@ -0,0 +1,85 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" FermionicOperator mapping of molecular integrals """
+
+import itertools
+
+import numpy as np
+from qiskit.chemistry import (FermionicOperator, QMolecule, PackedTwoBodyIntegrals,
+                              SpinTwoBodyIntegrals)
+
+
+def _random_integrals(num_modes, seed):
+    """ Random integrals with the symmetries of real molecular integrals in spin orbitals """
+    rng = np.random.default_rng(seed)
+    num_orbitals = num_modes // 2
+    h1 = rng.normal(size=(num_orbitals, num_orbitals))
+    h1 = h1 + h1.T
+    h2 = rng.normal(size=(num_orbitals,) * 4)
+    for perm in [(1, 0, 2, 3), (0, 1, 3, 2), (2, 3, 0, 1)]:
+        h2 = h2 + h2.transpose(perm)
+    # block spin format, with the spin conserving blocks only
+    spin_h1 = np.kron(np.eye(2), h1)
+    spin_h2 = np.zeros((num_modes,) * 4)
+    for spin_1, spin_2 in itertools.product([0, num_orbitals], repeat=2):
+        spin_h2[spin_1:spin_1 + num_orbitals, spin_1:spin_1 + num_orbitals,
+                spin_2:spin_2 + num_orbitals, spin_2:spin_2 + num_orbitals] = h2
+    return spin_h1, spin_h2
+
+
+class FermionicMappingBench:
+    # 8 modes for H2 in 6-31G, 14 for H2O and 20 for N2 in STO-3G
+    params = ([8, 14, 20], ['jordan_wigner', 'parity', 'bravyi_kitaev'])
+    param_names = ['num_modes', 'map_type']
+    timeout = 1200
+
+    def setup(self, num_modes, _):
+        h1, h2 = _random_integrals(num_modes, seed=num_modes)
+        self.fer_op = FermionicOperator(h1, h2)
+
+    def time_to_pauli_sum_op(self, _, map_type):
+        self.fer_op.to_pauli_sum_op(map_type)
+
+    def time_mapping(self, _, map_type):
+        self.fer_op.mapping(map_type)
+
+    def peakmem_to_pauli_sum_op(self, _, map_type):
+        self.fer_op.to_pauli_sum_op(map_type)
+
+
+class CompactFermionicMappingBench:
+    params = ([10, 20], ['dense', 'packed'])
+    param_names = ['num_orbitals', 'storage']
+    timeout = 1200
+
+    def setup(self, num_orbitals, storage):
+        rng = np.random.default_rng(num_orbitals)
+        h1 = rng.normal(size=(num_orbitals, num_orbitals))
+        self.h1 = QMolecule.onee_to_spin(h1 + h1.T)
+        h2 = rng.normal(size=(num_orbitals,) * 4)
+        for perm in [(1, 0, 2, 3), (0, 1, 3, 2), (2, 3, 0, 1)]:
+            h2 = h2 + h2.transpose(perm)
+        if storage == 'dense':
+            self.h2 = QMolecule.twoe_to_spin(h2)
+        else:
+            self.h2 = SpinTwoBodyIntegrals(PackedTwoBodyIntegrals.from_dense(h2))
+
+    def time_freeze_and_map(self, _, __):
+        fer_op, _ = FermionicOperator(self.h1, self.h2).fermion_mode_freezing([0])
+        fer_op.to_pauli_sum_op('jordan_wigner')
+
+    def peakmem_freeze_and_map(self, _, __):
+        fer_op, _ = FermionicOperator(self.h1, self.h2).fermion_mode_freezing([0])
+        fer_op.to_pauli_sum_op('jordan_wigner')
@@ -0,0 +1,63 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" On-disk cache of the qubit operators of FermionicTransformation """
+
+import os
+import tempfile
+
+import numpy as np
+from qiskit.chemistry import QMolecule
+from qiskit.chemistry.transformations import FermionicTransformation
+
+
+def _random_qmolecule(num_orbitals, seed):
+    """ Random integrals with the symmetries of real molecular integrals """
+    rng = np.random.default_rng(seed)
+    qmolecule = QMolecule()
+    qmolecule.num_orbitals = num_orbitals
+    qmolecule.num_alpha = qmolecule.num_beta = num_orbitals // 2
+    qmolecule.nuclear_repulsion_energy = 1.
+    h1 = rng.normal(size=(num_orbitals, num_orbitals))
+    qmolecule.mo_onee_ints = h1 + h1.T
+    h2 = rng.normal(size=(num_orbitals,) * 4)
+    for perm in [(1, 0, 2, 3), (0, 1, 3, 2), (2, 3, 0, 1)]:
+        h2 = h2 + h2.transpose(perm)
+    qmolecule.mo_eri_ints = h2
+    return qmolecule
+
+
+class FermionicTransformationCacheBench:
+    params = [4, 6, 8]
+    param_names = ['num_orbitals']
+    timeout = 600
+
+    def setup(self, num_orbitals):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.qmolecule = _random_qmolecule(num_orbitals, 7)
+        FermionicTransformation(cache_dir=self.tmp_dir.name)._do_transform(self.qmolecule)
+
+    def teardown(self, _):
+        self.tmp_dir.cleanup()
+
+    def time_transform(self, _):
+        FermionicTransformation()._do_transform(self.qmolecule)
+
+    def time_cached_transform(self, _):
+        FermionicTransformation(cache_dir=self.tmp_dir.name)._do_transform(self.qmolecule)
+
+    def track_file_size(self, _):
+        # the size in bytes of the cached main and auxiliary operators
+        return sum(os.path.getsize(os.path.join(self.tmp_dir.name, name))
+                   for name in os.listdir(self.tmp_dir.name))
@@ -0,0 +1,129 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Two-body integral transformations of QMolecule and FermionicOperator """
+
+import os
+import tempfile
+
+import numpy as np
+from qiskit.chemistry import QMolecule, FermionicOperator
+
+
+def _loop_twoeints2mo(ints, moc):
+    """ The former transformation, looping over the first two MO indices, kept as reference """
+    dim = ints.shape[0]
+    eri_mo = np.zeros((dim, dim, dim, dim))
+    for a_i in range(dim):
+        temp1 = np.einsum('i,i...->...', moc[:, a_i], ints)
+        for b_i in range(dim):
+            temp2 = np.einsum('j,j...->...', moc[:, b_i], temp1)
+            temp3 = np.einsum('kc,k...->...c', moc, temp2)
+            eri_mo[a_i, b_i, :, :] = np.einsum('ld,l...c->...cd', moc, temp3)
+    return eri_mo
+
+
+def _loop_twoe_to_spin(mohijkl, threshold=1E-12):
+    """ The former conversion to spin orbitals, looping over them, kept as reference """
+    ints = np.einsum('ijkl->ljik', mohijkl)
+    norbs = mohijkl.shape[0]
+    nspin_orbs = 2 * norbs
+    moh2_qubit = np.zeros([nspin_orbs, nspin_orbs, nspin_orbs, nspin_orbs])
+    for p in range(nspin_orbs):
+        for q in range(nspin_orbs):
+            for r in range(nspin_orbs):
+                for s in range(nspin_orbs):
+                    if p // norbs != s // norbs or q // norbs != r // norbs:
+                        continue
+                    value = ints[p % norbs, q % norbs, r % norbs, s % norbs]
+                    if abs(value) > threshold:
+                        moh2_qubit[p, q, r, s] = -0.5 * value
+    return moh2_qubit
+
+
+class _RandomIntegrals:
+    """ Random integrals and orbitals of the given number of orbitals """
+
+    def setup(self, num_orbitals):
+        rng = np.random.default_rng(num_orbitals)
+        self.ints = rng.normal(size=(num_orbitals,) * 4)
+        self.moc = np.linalg.qr(rng.normal(size=(num_orbitals, num_orbitals)))[0]
+        self.fer_op = FermionicOperator(h1=self.moc, h2=self.ints)
+
+
+class IntegralTransformBench(_RandomIntegrals):
+    params = [10, 30, 60]
+    param_names = ['num_orbitals']
+    timeout = 1200
+
+    def time_twoeints2mo(self, _):
+        QMolecule.twoeints2mo(self.ints, self.moc)
+
+    def time_h2_transform(self, _):
+        self.fer_op._h2_transform(self.moc)
+
+
+class SpinIntegralTransformBench(_RandomIntegrals):
+    # the spin orbital integrals of 60 orbitals do not fit in memory, and the loop over the
+    # first two MO indices takes too long
+    params = [10, 30]
+    param_names = ['num_orbitals']
+    timeout = 1200
+
+    def time_twoe_to_spin(self, _):
+        QMolecule.twoe_to_spin(self.ints)
+
+    def time_loop_twoeints2mo(self, _):
+        _loop_twoeints2mo(self.ints, self.moc)
+
+
+class LoopSpinIntegralBench(_RandomIntegrals):
+    # the former conversion to spin orbitals loops over all of them
+    params = [10]
+    param_names = ['num_orbitals']
+    timeout = 1200
+
+    def time_loop_twoe_to_spin(self, _):
+        _loop_twoe_to_spin(self.ints)
+
+
+class OutOfCoreIntegralTransformBench:
+    params = [60, 100]
+    param_names = ['num_orbitals']
+    timeout = 1200
+
+    def setup(self, num_orbitals):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        shape = (num_orbitals,) * 4
+        ints = np.lib.format.open_memmap(os.path.join(self.tmp_dir.name, 'ints.npy'),
+                                         mode='w+', dtype=float, shape=shape)
+        rng = np.random.default_rng(num_orbitals)
+        for i in range(num_orbitals):
+            ints[i] = rng.normal(size=shape[1:])
+        ints.flush()
+        del ints
+        self.ints = np.load(os.path.join(self.tmp_dir.name, 'ints.npy'), mmap_mode='r')
+        self.out = np.lib.format.open_memmap(os.path.join(self.tmp_dir.name, 'mo_ints.npy'),
+                                             mode='w+', dtype=float, shape=shape)
+        self.moc = np.linalg.qr(rng.normal(size=(num_orbitals, num_orbitals)))[0]
+
+    def teardown(self, _):
+        del self.ints, self.out
+        self.tmp_dir.cleanup()
+
+    def time_twoeints2mo(self, _):
+        QMolecule.twoeints2mo(self.ints, self.moc, out=self.out)
+
+    def peakmem_twoeints2mo(self, _):
+        QMolecule.twoeints2mo(self.ints, self.moc, out=self.out)
@@ -0,0 +1,57 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Measurement error mitigation of results, vectorized and with the filter of the fitter """
+
+import numpy as np
+from qiskit.result import Result
+from qiskit.ignis.mitigation.measurement import CompleteMeasFitter
+from qiskit.aqua.utils.measurement_error_mitigation import MeasurementErrorMitigator
+
+
+class MeasurementErrorMitigationBench:
+    params = ([3, 6], [10, 100])
+    param_names = ['num_qubits', 'num_circuits']
+    timeout = 600
+
+    def setup(self, num_qubits, num_circuits):
+        rng = np.random.default_rng(num_qubits)
+        dim = 2 ** num_qubits
+        cal_matrix = np.eye(dim) + rng.uniform(0, 0.02, (dim, dim))
+        self.qubits = list(range(num_qubits))
+        self.fitter = CompleteMeasFitter(None, [format(i, '0{}b'.format(num_qubits))
+                                                for i in range(dim)], qubit_list=self.qubits)
+        self.fitter.cal_matrix = cal_matrix / cal_matrix.sum(axis=0)
+        self.mitigator = MeasurementErrorMitigator('bench')
+        self.mitigator.add_fitter(self.qubits, 8192, self.fitter)
+        self.qubit_mappings = {'_'.join(map(str, self.qubits)): list(range(num_circuits))}
+        probabilities = rng.dirichlet(np.ones(dim), num_circuits)
+        self.result_dict = {
+            'backend_name': 'bench', 'backend_version': '0.1', 'qobj_id': 'id', 'job_id': 'id',
+            'success': True,
+            'results': [{'shots': 8192, 'success': True,
+                         'header': {'memory_slots': num_qubits,
+                                    'creg_sizes': [['c', num_qubits]]},
+                         'data': {'counts': {hex(value): int(count) for value, count
+                                             in enumerate(self.fitter.cal_matrix.dot(
+                                                 rng.multinomial(8192, probs)))
+                                             if count}}}
+                        for probs in probabilities]}
+
+    def time_mitigator_apply(self, *_):
+        self.mitigator.apply(Result.from_dict(self.result_dict), self.qubits,
+                             self.qubit_mappings, 8192)
+
+    def time_filter_apply(self, *_):
+        self.fitter.filter.apply(Result.from_dict(self.result_dict), 'least_squares')
@@ -0,0 +1,42 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Maximum likelihood estimation and likelihood ratio confidence intervals of MLAE """
+
+import numpy as np
+from qiskit.aqua.algorithms import MaximumLikelihoodAmplitudeEstimation
+
+
+class MLAEBench:
+    params = ([3, 6, 9], [1, 100])
+    param_names = ['num_oracle_circuits', 'num_problems']
+    timeout = 600
+
+    def setup(self, num_oracle_circuits, num_problems):
+        rng = np.random.default_rng(5)
+        self.schedule = [0] + [2 ** j for j in range(num_oracle_circuits)]
+        # the default number of grid points of MLAE
+        self.likelihood_evals = max(10000, int(np.pi / 2 * 1000 * 2 ** num_oracle_circuits))
+        thetas = np.arcsin(np.sqrt(rng.uniform(size=num_problems)))
+        probabilities = np.sin(np.outer(thetas, 2 * np.array(self.schedule) + 1)) ** 2
+        self.one_hits = rng.binomial(1000, probabilities).astype(float)
+        self.all_hits = np.full_like(self.one_hits, 1000)
+
+    def time_mle(self, *_):
+        MaximumLikelihoodAmplitudeEstimation.compute_mle(
+            self.one_hits, self.all_hits, self.schedule, self.likelihood_evals)
+
+    def time_likelihood_ratio_confint(self, *_):
+        MaximumLikelihoodAmplitudeEstimation.compute_likelihood_ratio_confint(
+            self.one_hits, self.all_hits, self.schedule, 0.05, self.likelihood_evals)
@@ -0,0 +1,50 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" VQE with SPSA run from several initial points, on one worker or at the same time """
+
+from qiskit import BasicAer
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance, aqua_globals
+from qiskit.aqua.algorithms import VQE
+from qiskit.aqua.components.optimizers import SPSA, MultiStart
+from qiskit.aqua.operators import X, Z, I
+
+
+class MultiStartBench:
+    params = ([1, 4], [1, 8])
+    param_names = ['max_workers', 'max_evals_grouped']
+    timeout = 600
+
+    def setup(self, max_workers, max_evals_grouped):
+        self.max_workers = max_workers
+        self.max_evals_grouped = max_evals_grouped
+        self.hamiltonian = (Z ^ Z ^ I ^ I) + (I ^ X ^ X ^ I) - 0.5 * (I ^ I ^ Z ^ Z)
+        self.ansatz = RealAmplitudes(4, reps=2)
+
+    def _run_vqe(self):
+        aqua_globals.random_seed = 7
+        optimizer = MultiStart(SPSA(maxiter=20), num_starts=4, max_workers=self.max_workers)
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=1024,
+                                           seed_simulator=7, seed_transpiler=7)
+        VQE(self.hamiltonian, self.ansatz, optimizer, max_evals_grouped=self.max_evals_grouped,
+            quantum_instance=quantum_instance).run()
+        return quantum_instance
+
+    def time_vqe(self, *_):
+        self._run_vqe()
+
+    def track_jobs(self, *_):
+        # the starts running at the same time share their jobs
+        return self._run_vqe().metrics.summary()['submit']['jobs']
@@ -0,0 +1,43 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Circuit sampling with the NumPy statevector simulation """
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import EfficientSU2
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.operators import CircuitSampler, StateFn, X, Z, I
+
+
+class NumPyStatevectorSamplerBench:
+    params = [[4, 10], [1, 20], [False, True]]
+    param_names = ['num_qubits', 'num_bindings', 'numpy_statevector']
+    timeout = 600
+
+    def setup(self, num_qubits, num_bindings, numpy_statevector):
+        ansatz = EfficientSU2(num_qubits, reps=2)
+        hamiltonian = (Z ^ Z ^ (I ^ (num_qubits - 2))) + (X ^ num_qubits)
+        self.operator = ~StateFn(hamiltonian) @ StateFn(ansatz)
+        values = np.random.default_rng(num_qubits).uniform(
+            0, np.pi, (num_bindings, ansatz.num_parameters))
+        self.params = dict(zip(ansatz.ordered_parameters, values.T.tolist()))
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                           numpy_statevector=numpy_statevector)
+        self.sampler = CircuitSampler(quantum_instance)
+        # transpile the circuits once, as in an optimization loop
+        self.sampler.convert(self.operator, self.params)
+
+    def time_sample(self, _, __, ___):
+        self.sampler.convert(self.operator, self.params).eval()
@@ -0,0 +1,54 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Parameter shift gradients evaluated with a backend """
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import EfficientSU2
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.operators import StateFn, X, Z, I
+from qiskit.aqua.operators.gradients import Gradient, DerivativeBase
+
+
+class ParamShiftGradientBench:
+    params = [[1, 3], ['statevector_simulator', 'qasm_simulator']]
+    param_names = ['reps', 'backend']
+    timeout = 1200
+
+    def setup(self, reps, backend):
+        ansatz = EfficientSU2(3, reps=reps)
+        hamiltonian = (Z ^ Z ^ I) + (I ^ X ^ X) - 0.5 * (Z ^ I ^ I)
+        self.operator = ~StateFn(hamiltonian) @ StateFn(ansatz)
+        self.params = ansatz.ordered_parameters
+        self.values = np.random.default_rng(reps).uniform(0, np.pi, len(self.params))
+        self.quantum_instance = QuantumInstance(BasicAer.get_backend(backend), shots=1024,
+                                                seed_simulator=42, seed_transpiler=42)
+        self.gradient = Gradient(grad_method='param_shift')
+
+    def time_bound_shifts(self, _, __):
+        self.gradient.gradient_wrapper(self.operator, self.params,
+                                       backend=self.quantum_instance)(self.values)
+
+    def time_shifted_copies(self, _, __):
+        DerivativeBase.gradient_wrapper(self.gradient, self.operator, self.params,
+                                        backend=self.quantum_instance)(self.values)
+
+    def peakmem_bound_shifts(self, _, __):
+        self.gradient.gradient_wrapper(self.operator, self.params,
+                                       backend=self.quantum_instance)(self.values)
+
+    def peakmem_shifted_copies(self, _, __):
+        DerivativeBase.gradient_wrapper(self.gradient, self.operator, self.params,
+                                        backend=self.quantum_instance)(self.values)
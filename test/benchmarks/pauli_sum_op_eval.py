@@ -0,0 +1,89 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" PauliSumOp evaluation on measured DictStateFns """
+
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp
+from qiskit.aqua.operators import PauliSumOp, DictStateFn, OperatorStateFn
+
+
+def _random_pauli_sum(num_qubits, num_terms, diagonal, seed):
+    rng = np.random.default_rng(seed)
+    letters = list('IZ') if diagonal else list('IXYZ')
+    labels = [''.join(rng.choice(letters, num_qubits)) for _ in range(num_terms)]
+    return PauliSumOp(SparsePauliOp.from_list(list(zip(labels, rng.normal(size=num_terms)))))
+
+
+def _random_counts_state(num_qubits, num_outcomes, seed):
+    rng = np.random.default_rng(seed)
+    outcomes = np.unique(rng.integers(2 ** num_qubits, size=num_outcomes, dtype=np.uint64))
+    probabilities = rng.random(len(outcomes))
+    probabilities /= probabilities.sum()
+    return {format(outcome, '0{}b'.format(num_qubits)): np.sqrt(p)
+            for outcome, p in zip(outcomes.tolist(), probabilities)}
+
+
+def _per_bitstring_eval(pauli_sum, state):
+    """ The former per-bitstring evaluation, kept as reference """
+    new_dict = {}
+    x_bits = pauli_sum.primitive.table.X[:, ::-1]
+    z_bits = pauli_sum.primitive.table.Z[:, ::-1]
+    coeffs = pauli_sum.primitive.coeffs
+    for bstr, v in state.items():
+        bitstr = np.asarray(list(bstr)).astype(int).astype(bool)
+        new_b_str = np.logical_xor(bitstr, x_bits)
+        new_str = [''.join(map(str, 1 * bs)) for bs in new_b_str]
+        z_factor = np.product(1 - 2 * np.logical_and(bitstr, z_bits), axis=1)
+        y_factor = np.product(np.sqrt(1 - 2 * np.logical_and(x_bits, z_bits) + 0j), axis=1)
+        for i, n_str in enumerate(new_str):
+            new_dict[n_str] = (v * z_factor[i] * y_factor[i] * coeffs[i]) + new_dict.get(n_str, 0)
+    return new_dict
+
+
+class PauliSumOpEvalBench:
+    params = ([12, 40], [100, 2000], [100, 2000], [True, False])
+    param_names = ['num_qubits', 'num_terms', 'num_outcomes', 'diagonal']
+    timeout = 600
+
+    def setup(self, num_qubits, num_terms, num_outcomes, diagonal):
+        self.pauli_sum = _random_pauli_sum(num_qubits, num_terms, diagonal, seed=num_terms)
+        self.measurement = ~OperatorStateFn(self.pauli_sum)
+        self.counts = _random_counts_state(num_qubits, num_outcomes, seed=num_outcomes)
+        self.state = DictStateFn(self.counts)
+        # build the packed representation once, as done for the sampled states
+        self.state.to_sparse_arrays()
+
+    def time_eval(self, *_):
+        self.pauli_sum.eval(self.state)
+
+    def time_expectation(self, *_):
+        self.measurement.eval(self.state)
+
+    def peakmem_eval(self, *_):
+        self.pauli_sum.eval(self.state)
+
+
+class PerBitstringEvalBench:
+    # the former evaluation is too slow for more terms and outcomes
+    params = ([12, 40], [100], [100], [True, False])
+    param_names = ['num_qubits', 'num_terms', 'num_outcomes', 'diagonal']
+    timeout = 600
+
+    def setup(self, num_qubits, num_terms, num_outcomes, diagonal):
+        self.pauli_sum = _random_pauli_sum(num_qubits, num_terms, diagonal, seed=num_terms)
+        self.counts = _random_counts_state(num_qubits, num_outcomes, seed=num_outcomes)
+
+    def time_per_bitstring_eval(self, *_):
+        _per_bitstring_eval(self.pauli_sum, self.counts)
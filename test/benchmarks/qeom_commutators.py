@@ -0,0 +1,75 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Commutators of the qEOM matrix elements """
+
+import itertools
+
+import numpy as np
+from qiskit.aqua.operators import commutator
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.algorithms.eigen_solvers.q_equation_of_motion import QEquationOfMotion
+from qiskit.chemistry.algorithms._eom_operators import EomCommutators
+
+
+def _random_hamiltonian(num_modes, seed):
+    """ A qubit Hamiltonian of random integrals with the symmetries of molecular integrals """
+    rng = np.random.default_rng(seed)
+    num_orbitals = num_modes // 2
+    h1 = rng.normal(size=(num_orbitals, num_orbitals))
+    h2 = rng.normal(size=(num_orbitals,) * 4)
+    for perm in [(1, 0, 2, 3), (0, 1, 3, 2), (2, 3, 0, 1)]:
+        h2 = h2 + h2.transpose(perm)
+    spin_h2 = np.zeros((num_modes,) * 4)
+    for spin_1, spin_2 in itertools.product([0, num_orbitals], repeat=2):
+        spin_h2[spin_1:spin_1 + num_orbitals, spin_1:spin_1 + num_orbitals,
+                spin_2:spin_2 + num_orbitals, spin_2:spin_2 + num_orbitals] = h2
+    return FermionicOperator(np.kron(np.eye(2), h1 + h1.T), spin_h2).mapping('jordan_wigner')
+
+
+class _ExcitationPairs:
+    """ The Hamiltonian, hopping operators and pairs of excitations of random integrals """
+
+    def setup(self, num_modes):
+        self.hamiltonian = _random_hamiltonian(num_modes, seed=num_modes)
+        qeom = QEquationOfMotion(self.hamiltonian, num_modes, [1, 1], 'jordan_wigner')
+        excitations = qeom._de_list + qeom._se_list
+        self.hopping_ops, _ = qeom.build_hopping_operators(excitations)
+        keys = ['_'.join(str(x) for x in excitation) for excitation in excitations]
+        self.pairs = [(keys[m], keys[n]) for m, n in zip(*np.triu_indices(len(keys)))]
+
+
+class QEOMCommutatorsBench(_ExcitationPairs):
+    # the number of pairs of excitations grows as the fourth power of the number of modes
+    params = [8, 10]
+    param_names = ['num_modes']
+    timeout = 1200
+
+    def time_commutators(self, _):
+        commutators = EomCommutators(self.hamiltonian, self.hopping_ops)
+        for left, right in self.pairs:
+            commutators.commutators(left, right)
+
+
+class PerPairCommutatorsBench(_ExcitationPairs):
+    # the former computation with operator arithmetic is too slow for more modes
+    params = [8]
+    param_names = ['num_modes']
+    timeout = 1200
+
+    def time_per_pair_commutators(self, _):
+        # for the first 2 pairs
+        for left, right in self.pairs[:2]:
+            commutator(self.hopping_ops[left], self.hamiltonian, self.hopping_ops[right])
+            commutator(self.hopping_ops[left], self.hopping_ops[right])
@@ -0,0 +1,45 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" Binding of transpiled circuits with a Qobj template, and by binding and assembling them """
+
+import numpy as np
+from qiskit import BasicAer, transpile, assemble
+from qiskit.circuit.library import EfficientSU2
+from qiskit.aqua.utils import QobjTemplate
+
+
+class QobjTemplateBench:
+    params = ([4, 12], [10, 1000])
+    param_names = ['num_qubits', 'num_bindings']
+    timeout = 600
+
+    def setup(self, num_qubits, num_bindings):
+        ansatz = EfficientSU2(num_qubits, reps=3)
+        ansatz.measure_all()
+        self.circuit = transpile(ansatz, BasicAer.get_backend('qasm_simulator'),
+                                 seed_transpiler=7)
+        values = np.random.default_rng(num_qubits).uniform(
+            0, np.pi, (num_bindings, ansatz.num_parameters))
+        self.bindings = [dict(zip(ansatz.ordered_parameters, binding)) for binding in values]
+        self.template = QobjTemplate([self.circuit], assemble, self.bindings[0])
+
+    def time_bind_template(self, *_):
+        self.template.bind(self.bindings)
+
+    def time_bind_and_assemble(self, *_):
+        assemble([self.circuit.assign_parameters(binding) for binding in self.bindings])
+
+    def time_build_template(self, *_):
+        QobjTemplate([self.circuit], assemble, self.bindings[0])
@@ -0,0 +1,125 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" QSVM kernel matrix computation """
+
+import os
+import tempfile
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import ZZFeatureMap
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.algorithms import QSVM
+
+
+def _pairwise_overlaps(states):
+    """ The former pairwise overlaps of the statevectors, kept as reference """
+    mat = np.ones((len(states), len(states)))
+    for i, j in zip(*np.triu_indices(len(states), k=1)):
+        tmp = np.vdot(states[i], states[j])
+        mat[i, j] = mat[j, i] = np.vdot(tmp, tmp).real
+    return mat
+
+
+class StatevectorKernelBench:
+    params = [100, 400, 1600]
+    param_names = ['num_samples']
+    timeout = 1200
+
+    def setup(self, num_samples):
+        rng = np.random.default_rng(num_samples)
+        self.data = rng.uniform(0, 2 * np.pi, size=(num_samples, 3))
+        self.feature_map = ZZFeatureMap(3, reps=2)
+        self.quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def teardown(self, _):
+        self.tmp_dir.cleanup()
+
+    def time_kernel_matrix(self, _):
+        QSVM.get_kernel_matrix(self.quantum_instance, self.feature_map, self.data)
+
+    def peakmem_kernel_matrix_to_file(self, _):
+        QSVM.get_kernel_matrix(self.quantum_instance, self.feature_map, self.data,
+                               block_size=100,
+                               out=os.path.join(self.tmp_dir.name, 'kernel.npy'))
+
+
+class _RandomStates:
+    """ Random statevectors of 3 qubits """
+
+    def setup(self, num_samples):
+        rng = np.random.default_rng(num_samples)
+        states = rng.normal(size=(num_samples, 8)) + 1j * rng.normal(size=(num_samples, 8))
+        self.states = states / np.linalg.norm(states, axis=1)[:, None]
+
+
+class BlockOverlapsBench(_RandomStates):
+    params = [100, 400, 1600]
+    param_names = ['num_samples']
+
+    def time_block_overlaps(self, _):
+        return np.abs(self.states.conj() @ self.states.T) ** 2
+
+
+class PairwiseOverlapsBench(_RandomStates):
+    # the former pairwise overlaps are too slow for more samples
+    params = [100, 400]
+    param_names = ['num_samples']
+
+    def time_pairwise_overlaps(self, _):
+        _pairwise_overlaps(self.states)
+
+
+class QasmKernelBench:
+    params = ([20, 40], [1, 4])
+    param_names = ['num_samples', 'num_workers']
+    timeout = 1200
+
+    def setup(self, num_samples, num_workers):
+        rng = np.random.default_rng(num_samples)
+        self.data = rng.uniform(0, 2 * np.pi, size=(num_samples, 2))
+        self.feature_map = ZZFeatureMap(2, reps=2)
+        backend = BasicAer.get_backend('qasm_simulator')
+        # BasicAer backends are not thread safe
+        self.pool = [QuantumInstance(type(backend)(provider=backend.provider()), shots=1024,
+                                     seed_simulator=42, seed_transpiler=42)
+                     for _ in range(num_workers)]
+
+    def time_kernel_matrix(self, _, __):
+        QSVM.get_kernel_matrix(self.pool, self.feature_map, self.data, block_size=10)
+
+
+class CachedKernelBench:
+    params = [[20, 40], ['qasm_simulator', 'statevector_simulator']]
+    param_names = ['num_samples', 'backend']
+    timeout = 1200
+
+    def setup(self, num_samples, backend):
+        rng = np.random.default_rng(num_samples)
+        self.data = rng.uniform(0, 2 * np.pi, size=(num_samples, 2))
+        self.new_data = rng.uniform(0, 2 * np.pi, size=(2, 2))
+        self.qsvm = QSVM(ZZFeatureMap(2, reps=2),
+                         quantum_instance=QuantumInstance(BasicAer.get_backend(backend),
+                                                          shots=1024, seed_simulator=42,
+                                                          seed_transpiler=42),
+                         kernel_cache=True)
+        self.qsvm.construct_kernel_matrix(self.data)
+
+    def time_add_training_data(self, _, __):
+        self.qsvm.construct_kernel_matrix(np.concatenate((self.data, self.new_data)))
+
+    def time_predict_kernel_matrix(self, _, __):
+        self.qsvm.construct_kernel_matrix(self.new_data, self.data)
@@ -0,0 +1,68 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" QuadraticProgram conversions to QUBO and Ising Hamiltonians """
+
+import numpy as np
+from qiskit.optimization import QuadraticProgram
+from qiskit.optimization.converters import (QuadraticProgramToQubo, IntegerToBinary,
+                                            LinearEqualityToPenalty)
+
+
+def _random_program(num_variables, seed):
+    """ A dense quadratic program with binary and integer variables and a few constraints. """
+    rng = np.random.default_rng(seed)
+    program = QuadraticProgram('random')
+    num_integers = num_variables // 5
+    for i in range(num_variables - num_integers):
+        program.binary_var('x{}'.format(i))
+    for i in range(num_integers):
+        program.integer_var(lowerbound=0, upperbound=3, name='y{}'.format(i))
+    quadratic = np.triu(rng.integers(-5, 5, size=(num_variables, num_variables)))
+    program.minimize(linear=rng.integers(-5, 5, size=num_variables).tolist(),
+                     quadratic=quadratic.tolist())
+    for j in range(3):
+        coefficients = rng.integers(0, 3, size=num_variables)
+        program.linear_constraint(coefficients.tolist(), '==', int(coefficients.sum() // 2),
+                                  name='c{}'.format(j))
+    return program
+
+
+class QuadraticProgramBench:
+    params = [10, 30, 60]
+    param_names = ['num_variables']
+    timeout = 600
+
+    def setup(self, num_variables):
+        self.program = _random_program(num_variables, seed=num_variables)
+        self.qubo = QuadraticProgramToQubo().convert(self.program)
+        self.hamiltonian, self.offset = self.qubo.to_ising()
+
+    def time_integer_to_binary(self, _):
+        IntegerToBinary().convert(self.program)
+
+    def time_linear_equality_to_penalty(self, _):
+        LinearEqualityToPenalty().convert(IntegerToBinary().convert(self.program))
+
+    def time_to_qubo(self, _):
+        QuadraticProgramToQubo().convert(self.program)
+
+    def time_to_ising(self, _):
+        self.qubo.to_ising()
+
+    def time_from_ising(self, _):
+        QuadraticProgram().from_ising(self.hamiltonian, self.offset)
+
+    def peakmem_to_qubo_and_ising(self, _):
+        QuadraticProgramToQubo().convert(self.program).to_ising()
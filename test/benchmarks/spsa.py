@@ -0,0 +1,52 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+""" VQE with SPSA on the BasicAer qasm simulator, with the evaluations grouped or not """
+
+from qiskit import BasicAer
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance, aqua_globals
+from qiskit.aqua.algorithms import VQE
+from qiskit.aqua.components.optimizers import SPSA
+from qiskit.aqua.operators import X, Z, I
+
+
+class SPSABench:
+    params = ([1, 8], [1, 4], [False, True])
+    param_names = ['max_evals_grouped', 'resamplings', 'second_order']
+    timeout = 600
+
+    def setup(self, max_evals_grouped, resamplings, second_order):
+        self.max_evals_grouped = max_evals_grouped
+        self.resamplings = resamplings
+        self.second_order = second_order
+        self.hamiltonian = (Z ^ Z ^ I ^ I) + (I ^ X ^ X ^ I) - 0.5 * (I ^ I ^ Z ^ Z)
+        self.ansatz = RealAmplitudes(4, reps=2)
+
+    def _run_vqe(self):
+        aqua_globals.random_seed = 7
+        optimizer = SPSA(maxiter=20, resamplings=self.resamplings,
+                         second_order=self.second_order)
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=1024,
+                                           seed_simulator=7, seed_transpiler=7)
+        VQE(self.hamiltonian, self.ansatz, optimizer, max_evals_grouped=self.max_evals_grouped,
+            quantum_instance=quantum_instance).run()
+        return quantum_instance
+
+    def time_vqe(self, *_):
+        self._run_vqe()
+
+    def track_jobs(self, *_):
+        # the jobs submitted to the backend, each costing a queuing latency on a device
+        return self._run_vqe().metrics.summary()['submit']['jobs']
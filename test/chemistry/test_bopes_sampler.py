@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2020.
+# (C) Copyright IBM 2020, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -13,16 +13,18 @@
 """Tests of BOPES Sampler."""
 
 import unittest
+from unittest import mock
 from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from qiskit import BasicAer
 from qiskit.aqua import QuantumInstance
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.algorithms import VQE, NumPyMinimumEigensolver
-from qiskit.aqua.components.optimizers import AQGD
+from qiskit.aqua.components.optimizers import AQGD, SLSQP
 from qiskit.aqua.operators import PauliExpectation
-from qiskit.chemistry.algorithms.pes_samplers.bopes_sampler import BOPESSampler
+from qiskit.chemistry.algorithms.pes_samplers import BOPESSampler, PolynomialExtrapolator
 from qiskit.chemistry.circuit.library import HartreeFock
 from qiskit.chemistry.drivers import Molecule, PySCFDriver
 from qiskit.chemistry.algorithms.ground_state_solvers import GroundStateEigensolver
@@ -135,6 +137,63 @@ class TestBOPES(unittest.TestCase):
         np.testing.assert_array_almost_equal([pot.alpha, pot.r_0], [2.235, 0.720], decimal=3)
         np.testing.assert_array_almost_equal([pot.d_e, pot.m_shift], [0.2107, -1.1419], decimal=3)
 
+    def test_parallel_bopes_sampler(self):
+        """Test BOPES Sampler evaluating points at the same time, and its cache"""
+        dof = partial(Molecule.absolute_distance, atom_pair=(1, 0))
+        m = Molecule(geometry=[['H', [0., 0., 0.]],
+                               ['H', [1., 0., 0.]]],
+                     degrees_of_freedom=[dof])
+        driver = PySCFDriver(molecule=m)
+        points = [0.5, 0.7, 0.9, 1.1, 1.3, 1.5]
+
+        exact_gss = GroundStateEigensolver(FermionicTransformation(), NumPyMinimumEigensolver())
+        expected = BOPESSampler(exact_gss).sample(driver, points)
+
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        solver = VQE(var_form=RealAmplitudes(4, reps=1),
+                     optimizer=SLSQP(maxiter=200),
+                     quantum_instance=quantum_instance)
+        # the points are evaluated in waves of 1, 1, 2 and 2 points, all of them bootstrapped
+        # from finished points
+        sampler = BOPESSampler(GroundStateEigensolver(FermionicTransformation(), solver),
+                               extrapolator=PolynomialExtrapolator(degree=1),
+                               max_workers=2,
+                               cache_transformations=True)
+        result = sampler.sample(driver, points)
+
+        np.testing.assert_array_almost_equal(result.points, points)
+        np.testing.assert_array_almost_equal(result.energies, expected.energies, decimal=4)
+
+        # the cached points sampled with another solver
+        sampler.gss.solver = NumPyMinimumEigensolver()
+        with mock.patch.object(PySCFDriver, 'run') as run:
+            result = sampler.sample(driver, points)
+        run.assert_not_called()
+        np.testing.assert_array_almost_equal(result.energies, expected.energies)
+
+    def test_thread_executor_bopes_sampler(self):
+        """Test BOPES Sampler with a thread pool evaluates the points in order"""
+        dof = partial(Molecule.absolute_distance, atom_pair=(1, 0))
+        m = Molecule(geometry=[['H', [0., 0., 0.]],
+                               ['H', [1., 0., 0.]]],
+                     degrees_of_freedom=[dof])
+        driver = PySCFDriver(molecule=m)
+        points = [0.5, 0.7, 0.9, 1.1, 1.3, 1.5]
+
+        energies = []
+        for _ in range(2):
+            aqua_globals.random_seed = 50
+            solver = VQE(var_form=RealAmplitudes(4, reps=1),
+                         optimizer=SLSQP(maxiter=200),
+                         quantum_instance=QuantumInstance(
+                             BasicAer.get_backend('statevector_simulator')))
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                sampler = BOPESSampler(GroundStateEigensolver(FermionicTransformation(), solver),
+                                       extrapolator=PolynomialExtrapolator(degree=1),
+                                       max_workers=2, executor=executor)
+                energies.append(sampler.sample(driver, points).energies)
+        np.testing.assert_array_equal(energies[0], energies[1])
+
 
 if __name__ == "__main__":
     unittest.main()
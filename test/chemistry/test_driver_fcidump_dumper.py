@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2020.
+# (C) Copyright IBM 2020, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,12 +12,15 @@
 
 """ Test Driver FCIDump Dumping """
 
+import os
 import tempfile
 import unittest
+from unittest import mock
 from abc import ABC, abstractmethod
 from test.chemistry import QiskitChemistryTestCase
 import numpy as np
-from qiskit.chemistry import QiskitChemistryError
+from ddt import ddt, data
+from qiskit.chemistry import QiskitChemistryError, QMolecule
 from qiskit.chemistry.drivers import FCIDumpDriver, PySCFDriver, UnitsType
 
 
@@ -129,5 +132,89 @@ class TestDriverFCIDumpDumpH2(QiskitChemistryTestCase, BaseTestDriverFCIDumpDump
             self.skipTest('PYSCF driver does not appear to be installed.')
 
 
+@ddt
+class TestDriverFCIDumpRoundTrip(QiskitChemistryTestCase):
+    """FCIDump dumping and parsing round trip tests."""
+
+    def setUp(self):
+        super().setUp()
+        self.rng = np.random.default_rng(11)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.tmp_dir.name, 'test.fcidump')
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp_dir.cleanup()
+
+    def _symmetric_eri(self, norb, mixed=False):
+        eri = self.rng.normal(size=(norb,) * 4)
+        eri = eri + eri.transpose(1, 0, 2, 3)
+        eri = eri + eri.transpose(0, 1, 3, 2)
+        if not mixed:
+            eri = eri + eri.transpose(2, 3, 0, 1)
+        eri[np.abs(eri) < 0.5] = 0.
+        return eri
+
+    def _qmolecule(self, norb, unrestricted):
+        qmolecule = QMolecule()
+        qmolecule.num_orbitals = norb
+        qmolecule.num_alpha = qmolecule.num_beta = 2
+        qmolecule.multiplicity = 1
+        qmolecule.nuclear_repulsion_energy = 1.25
+        onee = self.rng.normal(size=(norb, norb))
+        qmolecule.mo_onee_ints = onee + onee.T
+        qmolecule.mo_eri_ints = self._symmetric_eri(norb)
+        if unrestricted:
+            onee = self.rng.normal(size=(norb, norb))
+            qmolecule.mo_onee_ints_b = onee + onee.T
+            qmolecule.mo_eri_ints_ba = self._symmetric_eri(norb, mixed=True)
+            qmolecule.mo_eri_ints_bb = self._symmetric_eri(norb)
+        return qmolecule
+
+    @data(False, True)
+    def test_round_trip(self, unrestricted):
+        """ dumped and parsed integrals test """
+        qmolecule = self._qmolecule(4, unrestricted)
+        FCIDumpDriver.dump(qmolecule, self.file_name)
+        # the integrals are read and written in several chunks
+        with mock.patch('qiskit.chemistry.drivers.fcidumpd.parser._CHUNK_SIZE', 100), \
+                mock.patch('qiskit.chemistry.drivers.fcidumpd.dumper._CHUNK_SIZE', 7):
+            FCIDumpDriver.dump(qmolecule, self.file_name + '.chunked')
+            parsed = FCIDumpDriver(self.file_name + '.chunked').run()
+        with open(self.file_name) as file, open(self.file_name + '.chunked') as chunked:
+            self.assertEqual(file.read(), chunked.read())
+
+        self.assertAlmostEqual(parsed.nuclear_repulsion_energy, 1.25)
+        for name in ['mo_onee_ints', 'mo_onee_ints_b', 'mo_eri_ints', 'mo_eri_ints_ba',
+                     'mo_eri_ints_bb']:
+            expected = getattr(qmolecule, name)
+            if expected is None:
+                self.assertIsNone(getattr(parsed, name))
+            else:
+                np.testing.assert_array_almost_equal(getattr(parsed, name), expected)
+
+    def test_symmetric_elements(self):
+        """ dumped symmetry unique integrals test """
+        qmolecule = self._qmolecule(3, False)
+        FCIDumpDriver.dump(qmolecule, self.file_name)
+        with open(self.file_name) as file:
+            indices = [tuple(int(i) for i in line.split()[1:]) for line in file.readlines()[4:]]
+        # a single element of each set of the 8 symmetric 2-electron integrals
+        eri = qmolecule.mo_eri_ints
+        unique = {min([(i, a, j, b), (a, i, j, b), (i, a, b, j), (a, i, b, j),
+                       (j, b, i, a), (b, j, i, a), (j, b, a, i), (b, j, a, i)])
+                  for i, a, j, b in zip(*np.nonzero(eri))}
+        self.assertEqual(sorted(index for index in indices if index[2]),
+                         sorted(tuple(e + 1 for e in elem) for elem in unique))
+
+    def test_invalid_indices(self):
+        """ invalid integral indices test """
+        for line in [' 1.0   1   3   0   0', ' 1.0   1   1   1   5', ' 1.0   1   1', ' x 1 1 1 1']:
+            with open(self.file_name, 'w') as file:
+                file.write('&FCI NORB=2,NELEC=2,\n&END\n 1.0   1   1   1   1\n' + line + '\n')
+            with self.assertRaises(QiskitChemistryError):
+                FCIDumpDriver(self.file_name).run()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,7 +16,10 @@ import copy
 import unittest
 from test.chemistry import QiskitChemistryTestCase
 import numpy as np
+from ddt import ddt, data
+from qiskit.quantum_info import Pauli
 from qiskit.aqua.utils import random_unitary
+from qiskit.aqua.operators import WeightedPauliOperator, PauliSumOp
 from qiskit.aqua.operators.legacy import op_converter
 from qiskit.chemistry import FermionicOperator, QiskitChemistryError
 from qiskit.chemistry.drivers import PySCFDriver, UnitsType
@@ -54,6 +57,87 @@ def h2_transform_slow(h2_, unitary_matrix):
     return temp_ret
 
 
+def one_body_mapping_slow(h1_ij_aij, threshold):
+    """
+    Subroutine for one body mapping.
+
+    Args:
+        h1_ij_aij (tuple): value of h1 at index (i,j), pauli at index i, pauli at index j
+        threshold (float): threshold to remove a pauli
+
+    Returns:
+        WeightedPauliOperator: Operator for those paulis
+    """
+    h1_ij, a_i, a_j = h1_ij_aij
+    pauli_list = []
+    for alpha in range(2):
+        for beta in range(2):
+            pauli_prod = Pauli.sgn_prod(a_i[alpha], a_j[beta])
+            coeff = h1_ij / 4 * pauli_prod[1] * np.power(-1j, alpha) * np.power(1j, beta)
+            pauli_term = [coeff, pauli_prod[0]]
+            if np.absolute(pauli_term[0]) > threshold:
+                pauli_list.append(pauli_term)
+    return WeightedPauliOperator(paulis=pauli_list)
+
+
+def two_body_mapping_slow(h2_ijkm_a_ijkm, threshold):
+    """
+    Subroutine for two body mapping. We use the chemists notation
+    for the two-body term, h2(i,j,k,m) adag_i adag_k a_m a_j.
+
+    Args:
+        h2_ijkm_a_ijkm (tuple): value of h2 at index (i,j,k,m),
+                                pauli at index i, pauli at index j,
+                                pauli at index k, pauli at index m
+        threshold (float): threshold to remove a pauli
+
+    Returns:
+        WeightedPauliOperator: Operator for those paulis
+    """
+    h2_ijkm, a_i, a_j, a_k, a_m = h2_ijkm_a_ijkm
+    pauli_list = []
+    for alpha in range(2):
+        for beta in range(2):
+            for gamma in range(2):
+                for delta in range(2):
+                    pauli_prod_1 = Pauli.sgn_prod(a_i[alpha], a_k[beta])
+                    pauli_prod_2 = Pauli.sgn_prod(pauli_prod_1[0], a_m[gamma])
+                    pauli_prod_3 = Pauli.sgn_prod(pauli_prod_2[0], a_j[delta])
+
+                    phase1 = pauli_prod_1[1] * pauli_prod_2[1] * pauli_prod_3[1]
+                    phase2 = np.power(-1j, alpha + beta) * np.power(1j, gamma + delta)
+                    pauli_term = [h2_ijkm / 16 * phase1 * phase2, pauli_prod_3[0]]
+                    if np.absolute(pauli_term[0]) > threshold:
+                        pauli_list.append(pauli_term)
+    return WeightedPauliOperator(paulis=pauli_list)
+
+
+def mapping_slow(fer_op, map_type, threshold=1e-8):
+    """
+    Map the fermionic operator term by term, mapping each nonzero integral on its own.
+
+    Args:
+        fer_op (FermionicOperator): the fermionic operator
+        map_type (str): "jordan_wigner", "parity" or "bravyi_kitaev"
+        threshold (float): threshold for Pauli simplification
+    Returns:
+        WeightedPauliOperator: the qubit operator
+    """
+    a_list = {'jordan_wigner': fer_op._jordan_wigner_mode,
+              'parity': fer_op._parity_mode,
+              'bravyi_kitaev': fer_op._bravyi_kitaev_mode}[map_type](fer_op.modes)
+    qubit_op = WeightedPauliOperator(paulis=[])
+    for i, j in zip(*np.nonzero(fer_op.h1)):
+        qubit_op += one_body_mapping_slow(
+            (fer_op.h1[i, j], a_list[i], a_list[j]), threshold)
+    qubit_op.chop(threshold)
+    for i, j, k, m in zip(*np.nonzero(fer_op.h2)):
+        qubit_op += two_body_mapping_slow(
+            (fer_op.h2[i, j, k, m], a_list[i], a_list[j], a_list[k], a_list[m]), threshold)
+    qubit_op.chop(threshold)
+    return qubit_op
+
+
 class TestFermionicOperator(QiskitChemistryTestCase):
     """Fermionic Operator tests."""
 
@@ -88,8 +172,10 @@ class TestFermionicOperator(QiskitChemistryTestCase):
         h1_nonzeros = np.count_nonzero(reference_fer_op.h1 - target_fer_op.h1)
         self.assertEqual(h1_nonzeros, 0, "there are differences between h1 transformation")
 
-        h2_nonzeros = np.count_nonzero(reference_fer_op.h2 - target_fer_op.h2)
-        self.assertEqual(h2_nonzeros, 0, "there are differences between h2 transformation")
+        # the contraction order differs, so the values agree up to rounding
+        np.testing.assert_array_almost_equal(reference_fer_op.h2, target_fer_op.h2, decimal=12,
+                                             err_msg="there are differences between h2 "
+                                                     "transformation")
 
     def test_freezing_core(self):
         """ freezing core test """
@@ -147,5 +233,44 @@ class TestFermionicOperator(QiskitChemistryTestCase):
         self.assertEqual(overlapped_spectrum, jw_eigs.size // 2)
 
 
+@ddt
+class TestFermionicOperatorMapping(QiskitChemistryTestCase):
+    """Fermionic Operator mapping tests."""
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(7)
+        num_modes = 5
+        h_1 = rng.normal(size=(num_modes,) * 2) + 1j * rng.normal(size=(num_modes,) * 2)
+        h_2 = rng.normal(size=(num_modes,) * 4)
+        # sparse and without the symmetries of molecular integrals
+        h_2[rng.random(h_2.shape) < 0.6] = 0
+        self.fer_op = FermionicOperator(h1=h_1, h2=h_2, ph_trans_shift=0.5)
+
+    @data('jordan_wigner', 'parity', 'bravyi_kitaev')
+    def test_mapping(self, map_type):
+        """ vectorized mapping test """
+        reference = mapping_slow(self.fer_op, map_type)
+        reference += WeightedPauliOperator(paulis=[[0.5, Pauli('I' * self.fer_op.modes)]])
+        qubit_op = self.fer_op.mapping(map_type)
+        self.assertEqual(len(qubit_op.paulis), len(reference.paulis))
+        self.assertTrue((qubit_op - reference).chop(1e-12).is_empty())
+
+        pauli_sum_op = self.fer_op.to_pauli_sum_op(map_type)
+        self.assertIsInstance(pauli_sum_op, PauliSumOp)
+        np.testing.assert_array_almost_equal(pauli_sum_op.to_matrix(),
+                                             reference.to_opflow().to_matrix())
+
+    def test_mapping_hermitian(self):
+        """ mapping of hermitian integrals gives real coefficients """
+        h_1 = self.fer_op.h1 + self.fer_op.h1.conj().T
+        h_2 = self.fer_op.h2 + self.fer_op.h2.transpose(1, 0, 3, 2)
+        fer_op = FermionicOperator(h1=h_1, h2=h_2)
+        pauli_sum_op = fer_op.to_pauli_sum_op('jordan_wigner')
+        np.testing.assert_array_almost_equal(pauli_sum_op.primitive.coeffs.imag, 0)
+        difference = fer_op.mapping('jordan_wigner') - mapping_slow(fer_op, 'jordan_wigner')
+        self.assertTrue(difference.chop(1e-12).is_empty())
+
+
 if __name__ == '__main__':
     unittest.main()
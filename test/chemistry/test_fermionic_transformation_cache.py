@@ -0,0 +1,125 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test of the on-disk cache of the qubit operators of Fermionic Transformation """
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from test.chemistry import QiskitChemistryTestCase
+
+import numpy as np
+from ddt import ddt, data
+from qiskit.aqua.algorithms import NumPyMinimumEigensolver
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.algorithms import GroundStateEigensolver
+from qiskit.chemistry.drivers import HDF5Driver
+from qiskit.chemistry.transformations import (FermionicTransformation,
+                                              FermionicTransformationType,
+                                              FermionicQubitMappingType)
+
+
+@ddt
+class TestFermionicTransformationCache(QiskitChemistryTestCase):
+    """ Test of the on-disk cache of the qubit operators of Fermionic Transformation """
+
+    def setUp(self):
+        super().setUp()
+        self.driver = HDF5Driver(self.get_resource_path('test_oovqe_lih.hdf5'))
+        self.qmolecule = self.driver.run()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self._cache_dir.name
+
+    def tearDown(self):
+        super().tearDown()
+        self._cache_dir.cleanup()
+
+    @data({},
+          {'freeze_core': True, 'orbital_reduction': [-3, -2], 'z2symmetry_reduction': 'auto'},
+          {'transformation': FermionicTransformationType.PARTICLE_HOLE,
+           'qubit_mapping': FermionicQubitMappingType.JORDAN_WIGNER, 'freeze_core': True})
+    def test_cached_operators(self, settings):
+        """ qubit operators loaded from the cache test """
+        expected = FermionicTransformation(cache_dir=self.cache_dir, **settings)
+        qubit_op, aux_ops = expected._do_transform(self.qmolecule)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        transformation = FermionicTransformation(cache_dir=self.cache_dir, **settings)
+        with mock.patch.object(FermionicTransformation, '_map_fermionic_operator_to_qubit') \
+                as mapping:
+            cached_qubit_op, cached_aux_ops = transformation._do_transform(self.qmolecule)
+        mapping.assert_not_called()
+
+        self.assertEqual(cached_qubit_op, qubit_op)
+        self.assertEqual(cached_qubit_op.name, qubit_op.name)
+        self.assertEqual(len(cached_aux_ops), len(aux_ops))
+        for cached_aux_op, aux_op in zip(cached_aux_ops, aux_ops):
+            self.assertEqual(cached_aux_op, aux_op)
+        self.assertEqual(transformation.untapered_qubit_op, expected.untapered_qubit_op)
+        for name in ['_energy_shift', '_ph_energy_shift', '_z_dipole_shift',
+                     '_ph_z_dipole_shift', '_has_dipole_moments']:
+            self.assertAlmostEqual(getattr(transformation, name), getattr(expected, name))
+
+        info = dict(transformation.molecule_info)
+        expected_info = dict(expected.molecule_info)
+        z2_symmetries = info.pop('z2_symmetries')
+        expected_z2_symmetries = expected_info.pop('z2_symmetries')
+        self.assertEqual(info, expected_info)
+        self.assertEqual(z2_symmetries.symmetries, expected_z2_symmetries.symmetries)
+        self.assertEqual(z2_symmetries.sq_paulis, expected_z2_symmetries.sq_paulis)
+        self.assertListEqual(list(z2_symmetries.sq_list), list(expected_z2_symmetries.sq_list))
+        self.assertEqual(z2_symmetries.tapering_values, expected_z2_symmetries.tapering_values)
+
+    def test_interpreted_result(self):
+        """ ground state of the cached qubit operators test """
+        settings = {'freeze_core': True, 'z2symmetry_reduction': 'auto'}
+        solver = NumPyMinimumEigensolver()
+        expected = GroundStateEigensolver(FermionicTransformation(**settings),
+                                          solver).solve(self.driver)
+        for _ in range(2):
+            result = GroundStateEigensolver(
+                FermionicTransformation(cache_dir=self.cache_dir, **settings),
+                solver).solve(self.driver)
+            np.testing.assert_array_almost_equal(result.total_energies, expected.total_energies)
+            np.testing.assert_array_almost_equal(result.spin, expected.spin)
+            np.testing.assert_array_almost_equal(result.num_particles, expected.num_particles)
+
+    def test_cache_keys(self):
+        """ operators transformed with other settings or integrals are not shared test """
+        FermionicTransformation(cache_dir=self.cache_dir).transform(self.driver)
+        FermionicTransformation(cache_dir=self.cache_dir, freeze_core=True).transform(self.driver)
+        FermionicTransformation(cache_dir=self.cache_dir).transform(
+            self.driver, [FermionicOperator(np.eye(12))])
+        self.qmolecule.mo_onee_ints = self.qmolecule.mo_onee_ints * 1.01
+        FermionicTransformation(cache_dir=self.cache_dir)._do_transform(self.qmolecule)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+
+        # the same operators again
+        FermionicTransformation(cache_dir=self.cache_dir).transform(self.driver)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+
+    def test_invalid_file(self):
+        """ operators transformed again when their file cannot be read test """
+        expected, _ = FermionicTransformation(cache_dir=self.cache_dir)._do_transform(
+            self.qmolecule)
+        file_name = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(file_name, 'wb') as file:
+            file.write(b'invalid')
+        with self.assertLogs('qiskit.chemistry.transformations', level='WARNING'):
+            qubit_op, _ = FermionicTransformation(cache_dir=self.cache_dir)._do_transform(
+                self.qmolecule)
+        self.assertEqual(qubit_op, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
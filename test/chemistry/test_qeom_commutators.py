@@ -0,0 +1,127 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test of the qEOM commutators and their evaluation """
+
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+
+import numpy as np
+from ddt import ddt, data, unpack
+from qiskit import BasicAer, QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.quantum_info import Pauli, Statevector
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.algorithms import NumPyMinimumEigensolver, NumPyEigensolver
+from qiskit.aqua.operators import (WeightedPauliOperator, Z2Symmetries,
+                                   TPBGroupedWeightedPauliOperator, commutator)
+from qiskit.aqua.operators.legacy import op_converter
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.drivers import HDF5Driver
+from qiskit.chemistry.transformations import (FermionicTransformation,
+                                              FermionicQubitMappingType)
+from qiskit.chemistry.algorithms import GroundStateEigensolver, QEOM
+from qiskit.chemistry.algorithms.eigen_solvers.q_equation_of_motion import QEquationOfMotion
+from qiskit.chemistry.algorithms._eom_operators import EomCommutators, evaluate_operators
+
+
+@ddt
+class TestQEOMCommutators(QiskitChemistryTestCase):
+    """ Test of the qEOM commutators and their evaluation """
+
+    def setUp(self):
+        super().setUp()
+        self.driver = HDF5Driver(self.get_resource_path('test_driver_hdf5.hdf5'))
+        molecule = self.driver.run()
+        self.qubit_op = FermionicOperator(molecule.one_body_integrals,
+                                          molecule.two_body_integrals).mapping('jordan_wigner')
+        self.qeom = QEquationOfMotion(self.qubit_op, 4, [1, 1], 'jordan_wigner')
+        self.excitations = self.qeom._de_list + self.qeom._se_list
+        self.hopping_ops, _ = self.qeom.build_hopping_operators(self.excitations)
+
+    def _assert_operators_equal(self, actual, expected):
+        if expected.is_empty():
+            self.assertIsNone(actual)
+            return
+        difference = actual - expected
+        difference.chop(1e-10)
+        self.assertTrue(difference.is_empty())
+
+    @data((False, False), (True, False), (False, True))
+    @unpack
+    def test_commutators(self, sign, tapered):
+        """ commutators on packed arrays test """
+        z2_symmetries = Z2Symmetries([], [], [])
+        if tapered:
+            z2_symmetries = Z2Symmetries.find_Z2_symmetries(self.qubit_op)
+            z2_symmetries = z2_symmetries.taper(self.qubit_op)[5].z2_symmetries
+        commutators = EomCommutators(self.qubit_op, self.hopping_ops, sign, z2_symmetries)
+        keys = list(self.hopping_ops)
+        # a double and a single excitation against all the others
+        for left in [keys[0], keys[-1]]:
+            for right in keys:
+                double, single = commutators.commutators(left, right)
+                expected = [commutator(self.hopping_ops[left], self.qubit_op,
+                                       self.hopping_ops[right], sign=sign),
+                            commutator(self.hopping_ops[left], self.hopping_ops[right])]
+                if tapered:
+                    expected = [z2_symmetries.taper(op) if not op.is_empty() else op
+                                for op in expected]
+                self._assert_operators_equal(double, expected[0])
+                self._assert_operators_equal(single, expected[1])
+
+    def test_evaluate_operators(self):
+        """ operators evaluated with a single set of measurements test """
+        rng = np.random.default_rng(5)
+        operators = [WeightedPauliOperator(
+            [[complex(*rng.normal(size=2)), Pauli.from_label(''.join(rng.choice(list('IXYZ'), 3)))]
+             for _ in range(6)]) for _ in range(4)]
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.append(RealAmplitudes(3, reps=1).assign_parameters(
+            rng.uniform(0, np.pi, 6)).to_instruction(), qr)
+        statevector = Statevector(circuit).data
+        expected = [op.evaluate_with_statevector(statevector)[0] for op in operators]
+
+        means, stds = evaluate_operators(operators + [None], statevector)
+        np.testing.assert_array_almost_equal(means, expected + [0])
+        np.testing.assert_array_equal(stds, 0)
+
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        means, _ = evaluate_operators(operators, circuit, quantum_instance)
+        np.testing.assert_array_almost_equal(means, expected)
+
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=8192,
+                                           seed_simulator=5, seed_transpiler=5)
+        means, stds = evaluate_operators(operators, circuit, quantum_instance)
+        for op, std in zip(operators, stds):
+            grouped = op_converter.to_tpb_grouped_weighted_pauli_operator(
+                op, TPBGroupedWeightedPauliOperator.sorted_grouping)
+            result = quantum_instance.execute(grouped.construct_evaluation_circuit(circuit, False))
+            _, expected_std = grouped.evaluate_with_result(result, False)
+            self.assertAlmostEqual(np.abs(std), np.abs(expected_std), delta=0.1 * np.abs(std))
+        np.testing.assert_allclose(means, expected, atol=0.1)
+
+    def test_qeom(self):
+        """ qEOM excited states test """
+        solver = GroundStateEigensolver(FermionicTransformation(), NumPyMinimumEigensolver())
+        result = QEOM(solver, 'sd').solve(self.driver)
+        # the states of two particles, all of which are in the reduced space of the parity mapping
+        qubit_op, _ = FermionicTransformation(
+            qubit_mapping=FermionicQubitMappingType.PARITY,
+            two_qubit_reduction=True).transform(self.driver)
+        expected = NumPyEigensolver(qubit_op, k=4).run().eigenvalues.real
+        np.testing.assert_array_almost_equal(result.computed_energies, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
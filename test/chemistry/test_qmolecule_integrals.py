@@ -0,0 +1,149 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test QMolecule integral transformations """
+
+import os
+import tempfile
+import unittest
+import warnings
+from test.chemistry import QiskitChemistryTestCase
+import numpy as np
+from qiskit.aqua.utils import random_unitary
+from qiskit.chemistry import QMolecule, FermionicOperator
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    import h5py
+
+
+def twoeints2mo_slow(ints, moc):
+    """
+    Converts two-body integrals from AO to MO basis.
+    #MARK: The former implementation, looping over the first two MO indices.
+    """
+    dim = ints.shape[0]
+    eri_mo = np.zeros((dim, dim, dim, dim))
+    for a_i in range(dim):
+        temp1 = np.einsum('i,i...->...', moc[:, a_i], ints)
+        for b_i in range(dim):
+            temp2 = np.einsum('j,j...->...', moc[:, b_i], temp1)
+            temp3 = np.einsum('kc,k...->...c', moc, temp2)
+            eri_mo[a_i, b_i, :, :] = np.einsum('ld,l...c->...cd', moc, temp3)
+    return eri_mo
+
+
+def twoe_to_spin_slow(mohijkl, mohijkl_bb, mohijkl_ba, threshold=1E-12):
+    """
+    Converts two-body MO integrals to spin orbital basis.
+    #MARK: The former implementation, looping over the spin orbitals.
+    """
+    ints_aa = np.einsum('ijkl->ljik', mohijkl)
+    ints_bb = np.einsum('ijkl->ljik', mohijkl_bb)
+    ints_ba = np.einsum('ijkl->ljik', mohijkl_ba)
+    ints_ab = np.einsum('ijkl->ljik', mohijkl_ba.transpose())
+    norbs = mohijkl.shape[0]
+    nspin_orbs = 2 * norbs
+    moh2_qubit = np.zeros([nspin_orbs, nspin_orbs, nspin_orbs, nspin_orbs])
+    for p in range(nspin_orbs):  # pylint: disable=invalid-name
+        for q in range(nspin_orbs):
+            for r in range(nspin_orbs):
+                for s in range(nspin_orbs):  # pylint: disable=invalid-name
+                    spinp, spinq, spinr, spins = p // norbs, q // norbs, r // norbs, s // norbs
+                    if spinp != spins or spinq != spinr:
+                        continue
+                    if spinp == 0:
+                        ints = ints_aa if spinq == 0 else ints_ba
+                    else:
+                        ints = ints_ab if spinq == 0 else ints_bb
+                    value = ints[p % norbs, q % norbs, r % norbs, s % norbs]
+                    if abs(value) > threshold:
+                        moh2_qubit[p, q, r, s] = -0.5 * value
+    return moh2_qubit
+
+
+class TestQMoleculeIntegrals(QiskitChemistryTestCase):
+    """ QMolecule integral transformation tests """
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(11)
+        self.num_orbitals = 5
+        self.ints = rng.normal(size=(self.num_orbitals,) * 4)
+        self.moc = rng.normal(size=(self.num_orbitals, self.num_orbitals))
+
+    def test_twoeints2mo(self):
+        """ two-body integral transformation test """
+        reference = twoeints2mo_slow(self.ints, self.moc)
+        np.testing.assert_array_almost_equal(QMolecule.twoeints2mo(self.ints, self.moc),
+                                             reference, decimal=12)
+        np.testing.assert_array_almost_equal(
+            QMolecule.twoeints2mo(self.ints, self.moc, block_size=2), reference, decimal=12)
+
+        moc_b = np.roll(self.moc, 1, axis=1)
+        np.testing.assert_array_almost_equal(
+            QMolecule.twoeints2mo_general(self.ints, moc_b, moc_b, self.moc, self.moc,
+                                          block_size=3),
+            np.einsum('pqrs,pi,qj,rk,sl->ijkl', self.ints, moc_b, moc_b, self.moc, self.moc),
+            decimal=12)
+
+    def test_twoeints2mo_out_of_core(self):
+        """ two-body integral transformation of integrals on disk test """
+        reference = twoeints2mo_slow(self.ints, self.moc)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with h5py.File(os.path.join(tmp_dir, 'ints.hdf5'), 'w') as file:
+                ints = file.create_dataset('ints', data=self.ints)
+                out = file.create_dataset('mo_ints', shape=self.ints.shape, dtype=float)
+                ret = QMolecule.twoeints2mo(ints, self.moc, block_size=2, out=out)
+                self.assertIs(ret, out)
+                np.testing.assert_array_almost_equal(out[()], reference, decimal=12)
+
+    def test_to_spin(self):
+        """ conversion to spin orbitals test """
+        ints_bb = np.roll(self.ints, 1, axis=0)
+        ints_ba = np.roll(self.ints, 1, axis=2)
+        # values at the threshold are dropped
+        ints_bb[0, 0, 0, 0] = 1e-12
+        reference = twoe_to_spin_slow(self.ints, ints_bb, ints_ba)
+        np.testing.assert_array_equal(QMolecule.twoe_to_spin(self.ints, ints_bb, ints_ba),
+                                      reference)
+        out = np.full(reference.shape, np.nan)
+        QMolecule.twoe_to_spin(self.ints, ints_bb, ints_ba, out=out)
+        np.testing.assert_array_equal(out, reference)
+        # with the symmetries of real integrals, all spin blocks are the alpha-alpha one
+        ints = self.ints + self.ints.transpose()
+        np.testing.assert_array_equal(QMolecule.twoe_to_spin(ints),
+                                      twoe_to_spin_slow(ints, ints, ints))
+
+        h_1 = self.moc + 2e-12
+        h_1[0, 1] = 1e-12
+        h_1_b = self.moc.T
+        moh1 = QMolecule.onee_to_spin(h_1, h_1_b)
+        np.testing.assert_array_equal(moh1[:self.num_orbitals, :self.num_orbitals],
+                                      np.where(np.abs(h_1) > 1e-12, h_1, 0))
+        np.testing.assert_array_equal(moh1[self.num_orbitals:, self.num_orbitals:], h_1_b)
+        self.assertEqual(np.count_nonzero(moh1[:self.num_orbitals, self.num_orbitals:]), 0)
+        self.assertEqual(np.count_nonzero(moh1[self.num_orbitals:, :self.num_orbitals]), 0)
+
+    def test_h2_transform(self):
+        """ fermionic operator basis transformation test """
+        unitary_matrix = random_unitary(self.num_orbitals)
+        fer_op = FermionicOperator(h1=self.moc, h2=self.ints)
+        fer_op.transform(unitary_matrix)
+        np.testing.assert_array_almost_equal(
+            fer_op.h2,
+            np.einsum('pqrs,pi,qj,rk,sl->ijkl', self.ints, unitary_matrix.conj(),
+                      unitary_matrix, unitary_matrix.conj(), unitary_matrix),
+            decimal=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test compact two body integrals """
+
+import os
+import tempfile
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+import numpy as np
+from ddt import ddt, data
+from qiskit.chemistry import (QMolecule, FermionicOperator, QiskitChemistryError,
+                              PackedTwoBodyIntegrals, CholeskyTwoBodyIntegrals,
+                              SpinTwoBodyIntegrals)
+from qiskit.chemistry.core import TransformationType, QubitMappingType
+from qiskit.chemistry.drivers import HDF5Driver
+from qiskit.chemistry.transformations import FermionicTransformation
+
+
+@ddt
+class TestTwoBodyIntegrals(QiskitChemistryTestCase):
+    """ Compact two body integrals tests """
+
+    def setUp(self):
+        super().setUp()
+        self.lih = QMolecule(self.get_resource_path('test_oovqe_lih.hdf5'))
+        self.lih.load()
+        self.h4_uhf = QMolecule(self.get_resource_path('test_oovqe_h4_uhf.hdf5'))
+        self.h4_uhf.load()
+
+    def test_packed(self):
+        """ packed integrals test """
+        ints = self.lih.mo_eri_ints
+        packed = PackedTwoBodyIntegrals.from_dense(ints)
+        self.assertLess(packed.nbytes, ints.nbytes / 4)
+        np.testing.assert_array_almost_equal(packed.to_dense(), ints)
+        np.testing.assert_array_almost_equal(packed[1, 2, 3, 0], ints[1, 2, 3, 0])
+        orbitals = [4, 0, 2]
+        np.testing.assert_array_almost_equal(np.asarray(packed.select(orbitals)),
+                                             ints[np.ix_(orbitals, orbitals, orbitals, orbitals)])
+        for axis in range(4):
+            np.testing.assert_array_almost_equal(packed.slab(3, axis=axis),
+                                                 np.moveaxis(ints, axis, 0)[3])
+
+        ints_ba = self.h4_uhf.mo_eri_ints_ba
+        packed = PackedTwoBodyIntegrals.from_dense(ints_ba, symmetry=4)
+        np.testing.assert_array_almost_equal(packed.to_dense(), ints_ba)
+        with self.assertRaises(QiskitChemistryError):
+            PackedTwoBodyIntegrals(packed.data, 4, symmetry=8)
+
+    def test_cholesky(self):
+        """ Cholesky decomposed integrals test """
+        ints = self.lih.mo_eri_ints
+        cholesky = CholeskyTwoBodyIntegrals.from_dense(ints, threshold=1e-12)
+        self.assertLessEqual(cholesky.num_vectors, 21)
+        np.testing.assert_array_almost_equal(cholesky.to_dense(), ints, decimal=10)
+        for axis in range(4):
+            np.testing.assert_array_almost_equal(cholesky.slab(3, axis=axis),
+                                                 np.moveaxis(ints, axis, 0)[3], decimal=10)
+
+        molecule = self.h4_uhf
+        ao_ints = CholeskyTwoBodyIntegrals.from_dense(molecule.eri, threshold=1e-12)
+        np.testing.assert_array_almost_equal(
+            np.asarray(ao_ints.transform(molecule.mo_coeff_b, molecule.mo_coeff)),
+            molecule.mo_eri_ints_ba, decimal=10)
+
+    def test_spin_integrals(self):
+        """ spin orbital integrals test """
+        molecule = self.h4_uhf
+        reference = molecule.two_body_integrals
+        molecule.compress_two_body_integrals('packed')
+        spin_ints = molecule.compact_two_body_integrals
+        self.assertIsInstance(spin_ints, SpinTwoBodyIntegrals)
+        np.testing.assert_array_almost_equal(spin_ints.to_dense(), reference)
+        np.testing.assert_array_almost_equal(molecule.two_body_integrals, reference)
+        modes = [1, 2, 5, 7]
+        np.testing.assert_array_almost_equal(spin_ints.select(modes).to_dense(),
+                                             reference[np.ix_(modes, modes, modes, modes)])
+
+    @data('packed', 'cholesky')
+    def test_save_load(self, kind):
+        """ save and load compact integrals test """
+        molecule = self.h4_uhf
+        reference = molecule.two_body_integrals
+        molecule.compress_two_body_integrals(kind, threshold=1e-12)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'h4.hdf5')
+            molecule.save(file_name)
+            loaded = QMolecule(file_name)
+            loaded.load()
+        self.assertIsInstance(loaded.mo_eri_ints, type(molecule.mo_eri_ints))
+        self.assertIsInstance(loaded.mo_eri_ints_ba, type(molecule.mo_eri_ints_ba))
+        np.testing.assert_array_almost_equal(loaded.two_body_integrals, reference, decimal=10)
+
+    def test_freezing(self):
+        """ mode freezing and elimination of compact integrals test """
+        molecule = self.lih
+        h_1 = molecule.one_body_integrals
+        dense = FermionicOperator(h_1, molecule.two_body_integrals)
+        molecule.compress_two_body_integrals('packed')
+        compact = FermionicOperator(h_1, molecule.compact_two_body_integrals)
+        dense, dense_shift = dense.fermion_mode_freezing([0, 6])
+        compact, compact_shift = compact.fermion_mode_freezing([0, 6])
+        self.assertAlmostEqual(compact_shift, dense_shift, places=12)
+        np.testing.assert_array_almost_equal(compact.h1, dense.h1, decimal=12)
+        np.testing.assert_array_almost_equal(np.asarray(compact.h2), dense.h2)
+        dense = dense.fermion_mode_elimination(np.array([3, 4, 8, 9]))
+        compact = compact.fermion_mode_elimination(np.array([3, 4, 8, 9]))
+        self.assertIsInstance(compact.h2, SpinTwoBodyIntegrals)
+        np.testing.assert_array_almost_equal(np.asarray(compact.h2), dense.h2)
+
+    @data(('test_oovqe_lih.hdf5', 'packed', QubitMappingType.PARITY),
+          ('test_oovqe_lih.hdf5', 'cholesky', QubitMappingType.BRAVYI_KITAEV),
+          ('test_oovqe_h4_uhf.hdf5', 'packed', QubitMappingType.JORDAN_WIGNER),
+          ('test_oovqe_h4_uhf.hdf5', 'cholesky', QubitMappingType.PARITY))
+    def test_fermionic_transformation(self, config):
+        """ fermionic transformation of compact integrals test """
+        file_name, kind, qubit_mapping = config
+        orbital_reduction = [-2] if file_name == 'test_oovqe_lih.hdf5' else []
+        transformation = FermionicTransformation(transformation=TransformationType.FULL,
+                                                 qubit_mapping=qubit_mapping,
+                                                 two_qubit_reduction=False,
+                                                 freeze_core=True,
+                                                 orbital_reduction=orbital_reduction)
+        driver = HDF5Driver(self.get_resource_path(file_name))
+        reference, _ = transformation.transform(driver)
+
+        molecule = driver.run()
+        molecule.compress_two_body_integrals(kind, threshold=1e-12)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            molecule.save(os.path.join(tmp_dir, file_name))
+            qubit_op, _ = transformation.transform(HDF5Driver(os.path.join(tmp_dir, file_name)))
+        np.testing.assert_array_almost_equal(qubit_op.to_matrix(), reference.to_matrix(),
+                                             decimal=8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2018, 2020.
+# (C) Copyright IBM 2018, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -113,7 +113,7 @@ class TestEuropeanCallOption(QiskitFinanceTestCase):
         ['statevector', MaximumLikelihoodAmplitudeEstimation(5),
          {'estimation': 0.16330976193204114}],
         ['qasm', MaximumLikelihoodAmplitudeEstimation(3),
-         {'estimation': 0.09784548904622023}],
+         {'estimation': 0.09800594287128224}],
     ])
     @unpack
     def test_expected_value(self, simulator, a_e, expect):